@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Migration script to move the JSON registries and run summaries to the SQLite catalog.
+
+Registry entries keep their IDs. Set ``storage.catalog`` to ``"sqlite"`` in
+the config afterwards to use the catalog.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend src to path
+backend_src = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(backend_src))
+
+from saed.core.batches import BatchRegistry
+from saed.core.catalog import get_catalog
+from saed.core.config.settings import get_absolute_path, load_config
+from saed.core.labels import LabelsRegistry
+from saed.core.ontology import OntologyRegistry
+from saed.core.table import TableRegistry
+
+
+def main():
+    """Run the migration."""
+    parser = argparse.ArgumentParser(description="Migrate registries and runs to the SQLite catalog")
+    parser.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="Skip confirmation prompts (for automated setup)",
+    )
+    args = parser.parse_args()
+
+    config = load_config()
+    catalog_path = get_absolute_path(config.paths.catalog)
+
+    print(f"Catalog: {catalog_path}")
+
+    # Check if the catalog already has entries
+    if catalog_path.exists():
+        print(f"Catalog already exists at {catalog_path}")
+        if args.non_interactive:
+            print("Replacing its registry entries (non-interactive mode)...")
+        else:
+            response = input("Replace its registry entries? (y/N): ").strip().lower()
+            if response != "y":
+                print("Aborted.")
+                return
+
+    catalog = get_catalog(catalog_path)
+    registries = [
+        ("tables", TableRegistry, config.paths.tables),
+        ("ontologies", OntologyRegistry, config.paths.ontologies),
+        ("labels", LabelsRegistry, config.paths.labels),
+        ("batches", BatchRegistry, config.paths.batches),
+    ]
+
+    print("\nMigration completed:")
+    for name, registry_cls, path in registries:
+        directory = get_absolute_path(path)
+        source = registry_cls.load(directory)
+        target = registry_cls.load(directory, catalog_path)
+        count = target.replace_entries(source)
+        print(f"  {name}: {count} entries")
+
+    runs_dir = get_absolute_path(config.paths.runs)
+    catalog.sync_runs(runs_dir)
+    print(f"  runs: {len(catalog.list_runs())} runs")
+
+    print('\nSet "storage": {"catalog": "sqlite"} in the config to use the catalog.')
+
+
+if __name__ == "__main__":
+    main()
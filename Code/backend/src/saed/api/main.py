@@ -9,7 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from saed.api.routes import batches, config, evaluations, labels, llm, ontologies, runs, tables
 from saed.core.batches import BatchRegistry
-from saed.core.config.settings import get_absolute_path, load_config
+from saed.core.config.settings import get_absolute_path, get_catalog_path, get_config
 from saed.core.labels import LabelsRegistry
 from saed.core.ontology import OntologyRegistry
 from saed.core.table import TableRegistry
@@ -20,12 +20,14 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize registries on startup."""
-    cfg = load_config()
+    cfg = get_config()
 
     # Sync table registry
     tables_dir = get_absolute_path(cfg.paths.tables)
     if tables_dir.exists():
-        table_registry = TableRegistry.load(tables_dir)
+        table_registry = TableRegistry.load(
+            tables_dir, cfg.storage.table_format, get_catalog_path(cfg)
+        )
         result = table_registry.sync_with_directory()
         logger.info(
             f"Table registry synced: {len(result['added'])} added, "
@@ -35,7 +37,7 @@ async def lifespan(app: FastAPI):
     # Sync ontology registry
     ontologies_dir = get_absolute_path(cfg.paths.ontologies)
     if ontologies_dir.exists():
-        ontology_registry = OntologyRegistry.load(ontologies_dir)
+        ontology_registry = OntologyRegistry.load(ontologies_dir, get_catalog_path(cfg))
         result = ontology_registry.sync_with_directory()
         logger.info(
             f"Ontology registry synced: {len(result['added'])} added, "
@@ -45,7 +47,7 @@ async def lifespan(app: FastAPI):
     # Sync labels registry
     labels_dir = get_absolute_path(cfg.paths.labels)
     if labels_dir.exists():
-        labels_registry = LabelsRegistry.load(labels_dir)
+        labels_registry = LabelsRegistry.load(labels_dir, get_catalog_path(cfg))
         result = labels_registry.sync_with_directory()
         logger.info(
             f"Labels registry synced: {len(result['added'])} added, "
@@ -55,15 +57,20 @@ async def lifespan(app: FastAPI):
     # Sync batches registry
     batches_dir = get_absolute_path(cfg.paths.batches)
     batches_dir.mkdir(parents=True, exist_ok=True)
-    batch_registry = BatchRegistry.load(batches_dir)
+    batch_registry = BatchRegistry.load(batches_dir, get_catalog_path(cfg))
     result = batch_registry.sync_with_directory()
     logger.info(
         f"Batch registry synced: {len(result['added'])} added, "
         f"{len(result['removed'])} removed"
     )
 
+    # Resume queued runs and start the run workers
+    runs.start_run_workers()
+
     yield
 
+    await runs.stop_run_workers()
+
 
 app = FastAPI(
     title="SAED API",
@@ -6,9 +6,11 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 
+from saed.api.uploads import UploadError, stage_upload
 from saed.core.batches import BatchRegistry, load_batch_file
 from saed.core.batches.loader import get_batch_preview, validate_batch_file
-from saed.core.config.settings import get_absolute_path, load_config
+from saed.core.config.settings import get_absolute_path, get_catalog_path, get_config
+from saed.core.utils.traces import TraceCodecError, read_trace_file
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +19,7 @@ router = APIRouter()
 
 def get_batches_dir() -> Path:
     """Get the batches directory path."""
-    config = load_config()
+    config = get_config()
     return get_absolute_path(config.paths.batches)
 
 
@@ -25,7 +27,7 @@ def get_registry() -> BatchRegistry:
     """Get or create the batch registry."""
     batches_dir = get_batches_dir()
     batches_dir.mkdir(parents=True, exist_ok=True)
-    return BatchRegistry.load(batches_dir)
+    return BatchRegistry.load(batches_dir, get_catalog_path())
 
 
 @router.get("")
@@ -74,22 +76,19 @@ async def upload_batch(file: Annotated[UploadFile, File()]) -> dict[str, Any]:
     batches_dir = get_batches_dir()
     batches_dir.mkdir(parents=True, exist_ok=True)
 
-    file_path = batches_dir / file.filename
-    content = await file.read()
-
-    # Write file
-    with open(file_path, "wb") as f:
-        f.write(content)
+    try:
+        staged = await stage_upload(file, batches_dir / file.filename)
+    except UploadError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
 
-    # Validate by loading
+    # Validate by loading (compressed batch files are decoded transparently)
     try:
-        import json
-        data = json.loads(content.decode("utf-8"))
+        data = read_trace_file(staged.path, expand=False)
 
         # Validate structure
         errors = validate_batch_file(data)
         if errors:
-            file_path.unlink()
+            staged.discard()
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid batch file: {', '.join(errors)}",
@@ -97,13 +96,17 @@ async def upload_batch(file: Annotated[UploadFile, File()]) -> dict[str, Any]:
 
     except HTTPException:
         raise
+    except TraceCodecError as e:
+        staged.discard()
+        raise HTTPException(status_code=400, detail=str(e)) from None
     except Exception as e:
-        file_path.unlink()
+        staged.discard()
         raise HTTPException(status_code=400, detail=f"Invalid JSON file: {e}") from None
+    staged.commit()
 
     # Register
     registry = get_registry()
-    entry = registry.register(file.filename)
+    entry = registry.register(file.filename, file_hash=staged.file_hash)
 
     logger.info(f"Uploaded batch {entry.id} ({file.filename}) with {entry.total_columns} columns")
 
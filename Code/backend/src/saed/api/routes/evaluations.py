@@ -1,6 +1,5 @@
 """Evaluation routes for computing metrics on batch results."""
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -9,9 +8,12 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from saed.core.config.settings import get_absolute_path, load_config
-from saed.core.evaluator import node_level_f1_precision_recall, path_level_f1_precision_recall
-from saed.core.labels import LabelsRegistry, load_labels_file, parse_labels_to_paths, paths_to_string
+from saed.core.batches import load_batch_file
+from saed.core.catalog import get_catalog
+from saed.core.config.settings import get_absolute_path, get_catalog_path, get_config
+from saed.core.evaluator import evaluate_columns
+from saed.core.labels import LabelsRegistry, paths_to_string
+from saed.core.utils.files import compute_file_hash
 
 logger = logging.getLogger(__name__)
 
@@ -20,65 +22,14 @@ router = APIRouter()
 
 def get_labels_dir() -> Path:
     """Get the labels directory path."""
-    config = load_config()
+    config = get_config()
     return get_absolute_path(config.paths.labels)
 
 
 def get_labels_registry() -> LabelsRegistry:
     """Get or create the labels registry."""
     labels_dir = get_labels_dir()
-    return LabelsRegistry.load(labels_dir)
-
-
-def compute_column_metrics(
-    pred_paths: list[list[str]], gt_paths: list[list[str]]
-) -> dict[str, float]:
-    """Compute path-level and node-level metrics for a single column."""
-    # Path-level metrics
-    pred_set = {tuple(p) for p in pred_paths}
-    gt_set = {tuple(p) for p in gt_paths}
-
-    path_tp = len(pred_set.intersection(gt_set))
-    path_fp = len(pred_set - gt_set)
-    path_fn = len(gt_set - pred_set)
-
-    path_precision = path_tp / (path_tp + path_fp) if (path_tp + path_fp) > 0 else 0.0
-    path_recall = path_tp / (path_tp + path_fn) if (path_tp + path_fn) > 0 else 0.0
-    path_f1 = (
-        2 * (path_precision * path_recall) / (path_precision + path_recall)
-        if (path_precision + path_recall) > 0
-        else 0.0
-    )
-
-    # Node-level metrics
-    pred_nodes = set()
-    for path in pred_paths:
-        pred_nodes.update(path)
-
-    gt_nodes = set()
-    for path in gt_paths:
-        gt_nodes.update(path)
-
-    node_tp = len(pred_nodes.intersection(gt_nodes))
-    node_fp = len(pred_nodes - gt_nodes)
-    node_fn = len(gt_nodes - pred_nodes)
-
-    node_precision = node_tp / (node_tp + node_fp) if (node_tp + node_fp) > 0 else 0.0
-    node_recall = node_tp / (node_tp + node_fn) if (node_tp + node_fn) > 0 else 0.0
-    node_f1 = (
-        2 * (node_precision * node_recall) / (node_precision + node_recall)
-        if (node_precision + node_recall) > 0
-        else 0.0
-    )
-
-    return {
-        "path_precision": round(path_precision, 4),
-        "path_recall": round(path_recall, 4),
-        "path_f1": round(path_f1, 4),
-        "node_precision": round(node_precision, 4),
-        "node_recall": round(node_recall, 4),
-        "node_f1": round(node_f1, 4),
-    }
+    return LabelsRegistry.load(labels_dir, get_catalog_path())
 
 
 class EvaluateRequest(BaseModel):
@@ -99,9 +50,11 @@ class CompareRequest(BaseModel):
 async def run_evaluation(request: EvaluateRequest) -> dict[str, Any]:
     """Run evaluation on a batch result file.
 
-    Returns full evaluation results including per-column metrics.
+    Returns full evaluation results including per-column metrics. With the
+    SQLite catalog, results are stored and reused while neither the batch
+    nor the labels file changes.
     """
-    config = load_config()
+    config = get_config()
     batches_dir = get_absolute_path(config.paths.batches)
 
     # Resolve batch file path
@@ -111,16 +64,6 @@ async def run_evaluation(request: EvaluateRequest) -> dict[str, Any]:
     if not batch_path.exists():
         raise HTTPException(status_code=404, detail=f"Batch file not found: {request.batch_path}")
 
-    # Load batch data
-    try:
-        with open(batch_path, encoding="utf-8") as f:
-            batch_data = json.load(f)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error reading batch file: {e}") from None
-
-    run_id = batch_data.get("run_id", batch_path.stem)
-    batch_config = batch_data.get("config", {})
-
     # Resolve labels file
     labels_dir = get_labels_dir()
     labels_registry = get_labels_registry()
@@ -134,9 +77,29 @@ async def run_evaluation(request: EvaluateRequest) -> dict[str, Any]:
         if not labels_path.exists():
             raise HTTPException(status_code=404, detail=f"Labels file not found: {request.labels_id}")
 
-    # Load labels
+    # Reuse the stored result of the same batch and labels contents
+    catalog_path = get_catalog_path(config)
+    labels_hash = None
+    if catalog_path is not None:
+        catalog = get_catalog(catalog_path)
+        batch_hash = compute_file_hash(batch_path)
+        labels_hash = compute_file_hash(labels_path)
+        cached = catalog.find_evaluation(batch_hash, labels_hash)
+        if cached is not None:
+            return {**cached, "labels_id": labels_path.name}
+
+    # Load batch data
+    try:
+        batch_data = load_batch_file(batch_path)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error reading batch file: {e}") from None
+
+    run_id = batch_data.get("run_id", batch_path.stem)
+    batch_config = batch_data.get("config", {})
+
+    # Load labels, parsed once per file content
     try:
-        df_labels = load_labels_file(labels_path)
+        labels_index = labels_registry.get_index(labels_path, labels_hash)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading labels file: {e}") from None
 
@@ -161,20 +124,12 @@ async def run_evaluation(request: EvaluateRequest) -> dict[str, Any]:
             pred_paths = col_data.get("final_paths", [])
 
             # Get ground truth for this column
-            mask = (df_labels["table_id"] == table_id) & (
-                (df_labels["column_id"] == col_idx) | (df_labels["column_name"] == column_name)
-            )
+            gt_paths = labels_index.match(table_id, col_idx, column_name)
 
-            if not mask.any():
+            if gt_paths is None:
                 skipped_columns += 1
                 continue
 
-            label_row = df_labels[mask].iloc[0]
-            gt_paths = parse_labels_to_paths(label_row)
-
-            # Compute column metrics
-            metrics = compute_column_metrics(pred_paths, gt_paths)
-
             eval_columns.append({
                 "table_id": table_id,
                 "table_name": table_name,
@@ -182,23 +137,21 @@ async def run_evaluation(request: EvaluateRequest) -> dict[str, Any]:
                 "column_name": column_name,
                 "pred_paths": pred_paths,
                 "gt_paths": gt_paths,
-                **metrics,
             })
             evaluated_columns += 1
 
     if not eval_columns:
         raise HTTPException(status_code=400, detail="No columns could be matched with ground truth")
 
-    # Compute aggregate metrics
-    eval_data_for_metrics = [
-        {"pred_paths": c["pred_paths"], "gt_paths": c["gt_paths"]}
-        for c in eval_columns
-    ]
-
-    path_metrics = path_level_f1_precision_recall(eval_data_for_metrics)
-    node_metrics = node_level_f1_precision_recall(eval_data_for_metrics)
+    # Compute column and aggregate metrics in one pass
+    evaluation = evaluate_columns(
+        ((c["pred_paths"], c["gt_paths"]) for c in eval_columns),
+        [c["table_id"] for c in eval_columns],
+    )
+    for col, metrics in zip(eval_columns, evaluation.column_metrics(), strict=True):
+        col.update(metrics)
 
-    return {
+    result = {
         "run_id": run_id,
         "evaluated_at": datetime.now().isoformat(),
         "labels_id": labels_path.name,
@@ -217,24 +170,9 @@ async def run_evaluation(request: EvaluateRequest) -> dict[str, Any]:
             "evaluated_columns": evaluated_columns,
             "skipped_columns": skipped_columns,
         },
-        "metrics": {
-            "path_level": {
-                "macro_precision": round(path_metrics[0], 4),
-                "macro_recall": round(path_metrics[1], 4),
-                "macro_f1": round(path_metrics[2], 4),
-                "micro_precision": round(path_metrics[3], 4),
-                "micro_recall": round(path_metrics[4], 4),
-                "micro_f1": round(path_metrics[5], 4),
-            },
-            "node_level": {
-                "macro_precision": round(node_metrics[0], 4),
-                "macro_recall": round(node_metrics[1], 4),
-                "macro_f1": round(node_metrics[2], 4),
-                "micro_precision": round(node_metrics[3], 4),
-                "micro_recall": round(node_metrics[4], 4),
-                "micro_f1": round(node_metrics[5], 4),
-            },
-        },
+        "metrics": evaluation.metrics(),
+        "level_metrics": evaluation.level_metrics(),
+        "table_metrics": evaluation.table_metrics(),
         "performance": {
             "total_time_ms": batch_data.get("summary", {}).get("total_time_ms", 0),
             "avg_time_per_column_ms": (
@@ -246,6 +184,9 @@ async def run_evaluation(request: EvaluateRequest) -> dict[str, Any]:
         },
         "columns": eval_columns,
     }
+    if catalog_path is not None:
+        catalog.record_evaluation(batch_hash, labels_hash, result)
+    return result
 
 
 @router.post("/compare")
@@ -6,7 +6,8 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 
-from saed.core.config.settings import get_absolute_path, load_config
+from saed.api.uploads import CsvHeaderValidator, UploadError, stage_upload
+from saed.core.config.settings import get_absolute_path, get_catalog_path, get_config
 from saed.core.labels import LabelsRegistry, load_labels_file
 
 logger = logging.getLogger(__name__)
@@ -16,14 +17,14 @@ router = APIRouter()
 
 def get_labels_dir() -> Path:
     """Get the labels directory path."""
-    config = load_config()
+    config = get_config()
     return get_absolute_path(config.paths.labels)
 
 
 def get_registry() -> LabelsRegistry:
     """Get or create the labels registry."""
     labels_dir = get_labels_dir()
-    return LabelsRegistry.load(labels_dir)
+    return LabelsRegistry.load(labels_dir, get_catalog_path())
 
 
 @router.get("")
@@ -61,38 +62,27 @@ async def upload_labels(file: Annotated[UploadFile, File()]) -> dict[str, Any]:
     labels_dir = get_labels_dir()
     labels_dir.mkdir(parents=True, exist_ok=True)
 
-    file_path = labels_dir / file.filename
-    content = await file.read()
-
-    # Write file
-    with open(file_path, "wb") as f:
-        f.write(content)
-
-    # Validate by loading
+    # Stream to disk, checking the required columns in the header on the way
+    validator = CsvHeaderValidator(required_columns=["table_id", "column_id", "column_name"])
     try:
-        df = load_labels_file(file_path)
+        staged = await stage_upload(file, labels_dir / file.filename, validator)
+    except UploadError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
 
-        # Check required columns
-        required_cols = ["table_id", "column_id", "column_name"]
-        missing = [c for c in required_cols if c not in df.columns]
-        if missing:
-            file_path.unlink()
-            raise HTTPException(
-                status_code=400,
-                detail=f"Missing required columns: {', '.join(missing)}",
-            )
-
-    except HTTPException:
-        raise
+    # Validate the rows by loading
+    try:
+        load_labels_file(staged.path)
     except Exception as e:
-        file_path.unlink()
+        staged.discard()
         raise HTTPException(status_code=400, detail=f"Invalid CSV file: {e}") from None
+    staged.commit()
 
     # Register
     registry = get_registry()
     entry = registry.register(
         file.filename,
         name=file.filename.replace(".csv", "").replace("_", " ").title(),
+        file_hash=staged.file_hash,
     )
 
     logger.info(f"Uploaded labels {entry.id} ({file.filename}) with {entry.total_columns} columns")
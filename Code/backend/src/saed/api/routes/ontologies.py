@@ -12,7 +12,8 @@ from saed.api.schemas import (
     OntologyNode,
     OntologyTree,
 )
-from saed.core.config.settings import get_absolute_path, load_config
+from saed.api.uploads import UploadError, XmlValidator, stage_upload
+from saed.core.config.settings import get_absolute_path, get_catalog_path, get_config
 from saed.core.ontology import (
     OntologyCache,
     OntologyDAG,
@@ -28,14 +29,14 @@ router = APIRouter()
 
 def get_ontologies_dir() -> Path:
     """Get the ontologies directory path."""
-    config = load_config()
+    config = get_config()
     return get_absolute_path(config.paths.ontologies)
 
 
 def get_registry() -> OntologyRegistry:
     """Get or create the ontology registry."""
     ontologies_dir = get_ontologies_dir()
-    return OntologyRegistry.load(ontologies_dir)
+    return OntologyRegistry.load(ontologies_dir, get_catalog_path())
 
 
 def get_cache() -> OntologyCache:
@@ -176,7 +177,11 @@ async def list_ontologies():
 
 @router.post("")
 async def upload_ontology(file: Annotated[UploadFile, File()]):
-    """Upload a new ontology file."""
+    """Upload a new ontology file.
+
+    The upload is streamed to disk and checked for well-formed XML on the
+    way; it only replaces an existing file once the ontology validated.
+    """
     if not file.filename:
         raise HTTPException(status_code=400, detail="Filename is required")
 
@@ -186,26 +191,27 @@ async def upload_ontology(file: Annotated[UploadFile, File()]):
     ontologies_dir = get_ontologies_dir()
     ontologies_dir.mkdir(parents=True, exist_ok=True)
 
-    file_path = ontologies_dir / file.filename
-    content = await file.read()
-
-    # Write file temporarily
-    with open(file_path, "wb") as f:
-        f.write(content)
+    try:
+        staged = await stage_upload(file, ontologies_dir / file.filename, XmlValidator())
+    except UploadError as e:
+        logger.warning(f"Invalid ontology upload {file.filename}: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid ontology: {e}") from None
 
     # Validate ontology using validator
-    result = validate_ontology(file_path)
+    result = validate_ontology(staged.path)
 
     if not result.valid:
-        file_path.unlink()  # Remove invalid file
+        staged.discard()  # Remove invalid file
         errors = "; ".join(result.errors)
         logger.warning(f"Invalid ontology upload {file.filename}: {errors}")
         raise HTTPException(status_code=400, detail=f"Invalid ontology: {errors}")
 
     if result.class_count == 0:
-        file_path.unlink()
+        staged.discard()
         raise HTTPException(status_code=400, detail="Ontology has no class definitions")
 
+    file_path = staged.commit()
+
     # Register and cache
     registry = get_registry()
     cache = get_cache()
@@ -216,6 +222,7 @@ async def upload_ontology(file: Annotated[UploadFile, File()]):
     entry = registry.register(
         file.filename,
         class_count=len(dag.nodes),
+        file_hash=staged.file_hash,
     )
 
     tree = cache.build_from_dag(dag, entry.file_hash)
@@ -3,12 +3,13 @@
 import asyncio
 import json
 import logging
+import uuid
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
 from saed.api.schemas import (
@@ -28,44 +29,135 @@ from saed.api.schemas import (
     RunSummary,
     VoteSummary,
 )
-from saed.core.config.settings import EDMOptions, get_absolute_path, load_config
-from saed.core.executor import RunExecutor
+from saed.api.streams import RunStreamHub, ThreadSafeEventBridge, parse_last_event_id
+from saed.api.workers import RunWorkerPool
+from saed.core.catalog import get_catalog, run_summary
+from saed.core.config.settings import (
+    EDMOptions,
+    get_absolute_path,
+    get_catalog_path,
+    get_config,
+    load_config,
+)
+from saed.core.executor import (
+    CancellationToken,
+    RunCancelled,
+    RunCheckpoint,
+    RunExecutor,
+    checkpoint_path,
+)
+from saed.core.jobs import Job, JobQueue
 from saed.core.ontology import OntologyDAG, OntologyRegistry
-from saed.core.table import TableRegistry
+from saed.core.table import TableRegistry, render_table_markdown
+from saed.core.utils.traces import TraceCodecError, read_trace_file, write_trace_file
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Store for active SSE connections (run_id -> list of queues)
-active_streams: dict[str, list[asyncio.Queue]] = {}
+# Broadcast hub for SSE connections (one channel per run)
+stream_hub = RunStreamHub()
+
+# Persistent run queue and the worker pool draining it (created on first use)
+_job_queue: JobQueue | None = None
+_worker_pool: RunWorkerPool | None = None
+
+# Cancellation tokens of the runs executing in this process
+_run_tokens: dict[str, CancellationToken] = {}
 
 
 def get_runs_dir() -> Path:
     """Get the runs directory path."""
-    config = load_config()
+    config = get_config()
     return get_absolute_path(config.paths.runs)
 
 
 def get_tables_dir() -> Path:
     """Get the tables directory path."""
-    config = load_config()
+    config = get_config()
     return get_absolute_path(config.paths.tables)
 
 
 def get_ontologies_dir() -> Path:
     """Get the ontologies directory path."""
-    config = load_config()
+    config = get_config()
     return get_absolute_path(config.paths.ontologies)
 
 
+def get_job_queue() -> JobQueue:
+    """Get the persistent run queue (stored next to the run files)."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue(get_runs_dir() / "jobs.sqlite3")
+    return _job_queue
+
+
+def get_worker_pool() -> RunWorkerPool:
+    """Get the run worker pool, starting it on the current event loop if needed."""
+    global _worker_pool
+    if _worker_pool is None:
+        queue_config = get_config().queue
+        _worker_pool = RunWorkerPool(
+            get_job_queue(),
+            _execute_job,
+            workers=queue_config.workers,
+            provider_limits=queue_config.provider_concurrency,
+            default_provider_limit=queue_config.default_provider_concurrency,
+            lease_seconds=queue_config.lease_seconds,
+            cancel_handler=cancel_local_run,
+        )
+    if not _worker_pool.running:
+        _worker_pool.start()
+    return _worker_pool
+
+
+def cancel_local_run(run_id: str) -> bool:
+    """Signal a run executing in this process to stop.
+
+    Returns:
+        True if the run was executing here
+    """
+    token = _run_tokens.get(run_id)
+    if token is None:
+        return False
+    token.cancel()
+    return True
+
+
+def start_run_workers() -> None:
+    """Recover jobs whose owner process died and start the workers.
+
+    Only jobs with an expired lease are requeued, so runs executed by sibling
+    API processes sharing the queue are not started twice.
+    """
+    lease_seconds = get_config().queue.lease_seconds
+    for run_id in get_job_queue().requeue_stale(lease_seconds):
+        try:
+            run_data = load_run(run_id)
+        except HTTPException:
+            continue
+        run_data["status"] = "pending"
+        save_run(run_id, run_data)
+        logger.info(f"Requeued interrupted run {run_id}")
+    get_worker_pool()
+
+
+async def stop_run_workers() -> None:
+    """Stop the worker pool; running jobs are returned to the queue."""
+    if _worker_pool is not None:
+        await _worker_pool.stop()
+
+
 def get_table_registry() -> TableRegistry:
     """Get the table registry."""
-    return TableRegistry.load(get_tables_dir())
+    config = get_config()
+    return TableRegistry.load(
+        get_absolute_path(config.paths.tables), config.storage.table_format, get_catalog_path(config)
+    )
 
 
 def get_ontology_registry() -> OntologyRegistry:
     """Get the ontology registry."""
-    return OntologyRegistry.load(get_ontologies_dir())
+    return OntologyRegistry.load(get_ontologies_dir(), get_catalog_path())
 
 
 def resolve_table_id(table_id: str) -> tuple[str, Path, str]:
@@ -132,6 +224,11 @@ def resolve_ontology_id(ontology_id: str) -> tuple[str, Path, str]:
     raise HTTPException(status_code=404, detail=f"Ontology not found: {ontology_id}")
 
 
+def get_checkpoint_path(run_id: str) -> Path:
+    """Get the progress checkpoint path of a run."""
+    return checkpoint_path(get_runs_dir(), run_id)
+
+
 def load_run(run_id: str) -> dict[str, Any]:
     """Load a run from JSON file."""
     runs_dir = get_runs_dir()
@@ -140,8 +237,10 @@ def load_run(run_id: str) -> dict[str, Any]:
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Run not found")
 
-    with open(file_path) as f:
-        return json.load(f)
+    try:
+        return read_trace_file(file_path)
+    except TraceCodecError as e:
+        raise HTTPException(status_code=501, detail=f"Cannot read run {run_id}: {e}") from None
 
 
 def save_run(run_id: str, data: dict[str, Any]) -> None:
@@ -150,8 +249,30 @@ def save_run(run_id: str, data: dict[str, Any]) -> None:
     runs_dir.mkdir(parents=True, exist_ok=True)
 
     file_path = runs_dir / f"{run_id}.json"
-    with open(file_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    config = get_config()
+    write_trace_file(
+        file_path,
+        data,
+        intern=config.storage.trace_interning,
+        compression=config.storage.trace_compression,
+    )
+
+
+def _run_list_item(summary: dict[str, Any]) -> RunListItem:
+    """Create a run list item from a run summary (see :func:`run_summary`)."""
+    table_id = summary["table_id"]
+    evaluation = summary["evaluation"]
+    return RunListItem(
+        run_id=summary["run_id"],
+        table_id=table_id,
+        table_name=table_id.rsplit(".", 1)[0] if table_id else "",
+        mode=summary["mode"],
+        prompt_type=summary["prompt_type"],
+        column_count=summary["column_count"],
+        status=summary["status"],
+        created_at=datetime.fromisoformat(summary["created_at"]),
+        evaluation=EvaluationMetrics(**evaluation) if evaluation else None,
+    )
 
 
 @router.get("", response_model=RunListResponse)
@@ -160,69 +281,69 @@ async def list_runs():
     runs_dir = get_runs_dir()
     runs = []
 
-    if runs_dir.exists():
+    catalog_path = get_catalog_path()
+    if catalog_path is not None:
+        # Only run files changed since the last listing are read
+        catalog = get_catalog(catalog_path)
+        await asyncio.to_thread(catalog.sync_runs, runs_dir)
+        summaries = await asyncio.to_thread(catalog.list_runs)
+    elif runs_dir.exists():
+        summaries = []
         for file in sorted(runs_dir.glob("*.json"), reverse=True):
             try:
-                with open(file) as f:
-                    data = json.load(f)
-
-                # Get table name
-                table_id = data.get("config", {}).get("table_id", "")
-                table_name = table_id.rsplit(".", 1)[0] if table_id else ""
-
-                evaluation = None
-                if data.get("evaluation"):
-                    evaluation = EvaluationMetrics(**data["evaluation"])
-
-                runs.append(
-                    RunListItem(
-                        run_id=data["run_id"],
-                        table_id=table_id,
-                        table_name=table_name,
-                        mode=data.get("config", {}).get("mode", "single"),
-                        prompt_type=data.get("config", {}).get("prompt_type", "cot"),
-                        column_count=len(data.get("config", {}).get("columns", [])),
-                        status=data.get("status", "unknown"),
-                        created_at=datetime.fromisoformat(data["created_at"]),
-                        evaluation=evaluation,
-                    )
-                )
+                summaries.append(run_summary(read_trace_file(file, expand=False)))
             except Exception:
                 continue
+    else:
+        summaries = []
+
+    for summary in summaries:
+        try:
+            runs.append(_run_list_item(summary))
+        except Exception:
+            continue
 
     return RunListResponse(runs=runs)
 
 
 async def emit_sse_event(run_id: str, event_type: str, data: dict[str, Any]) -> None:
     """Emit an SSE event to all connected clients for a run."""
-    if run_id not in active_streams:
-        return
+    stream_hub.publish(run_id, event_type, data)
 
-    event_data = json.dumps(data, default=str)
-    message = f"event: {event_type}\ndata: {event_data}\n\n"
 
-    # Send to all connected queues
-    for queue in active_streams[run_id]:
-        try:
-            await queue.put(message)
-        except Exception:
-            pass  # Queue might be full or closed
+def sse_callback_sync(run_id: str) -> ThreadSafeEventBridge:
+    """Create a synchronous SSE callback for the RunExecutor.
 
+    Must be called from the server's event loop. The returned callback may
+    then be invoked from any thread, e.g. when running ``execute_column`` via
+    ``asyncio.to_thread``.
+    """
+    return ThreadSafeEventBridge(stream_hub, run_id)
 
-def sse_callback_sync(run_id: str):
-    """Create a synchronous SSE callback for the RunExecutor."""
-    loop = asyncio.new_event_loop()
 
-    def callback(event_type: str, data: dict[str, Any]) -> None:
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(emit_sse_event(run_id, event_type, data))
+async def execute_run_background(
+    run_id: str, request: CreateRunRequest, provider: str | None = None
+) -> str:
+    """Execute the annotation run in background.
 
-    return callback
+    Columns and BFS selections recorded in the run's checkpoint by an earlier,
+    interrupted attempt are reused instead of calling the LLM again. The run
+    stops between LLM requests once :func:`cancel_run` is called; completed
+    work is saved with status ``cancelled``.
 
+    Args:
+        run_id: Run to execute
+        request: Run request with resolved table/ontology filenames
+        provider: LLM provider fixed at submission time (defaults to the active one)
 
-async def execute_run_background(run_id: str, request: CreateRunRequest) -> None:
-    """Execute the annotation run in background."""
+    Returns:
+        Final run status ("completed", "partial", "failed" or "cancelled")
+    """
     config = load_config()
+    if provider:
+        config.llm.active_provider = provider
+    cancel_token = CancellationToken()
+    _run_tokens[run_id] = cancel_token
 
     # Update status to running
     run_data = load_run(run_id)
@@ -230,15 +351,22 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
     save_run(run_id, run_data)
 
     await emit_sse_event(run_id, "run_start", {"run_id": run_id, "status": "running"})
+    sse_callback = sse_callback_sync(run_id)
 
     try:
         # Resolve and load table (handles both ID and filename, respects category subdirectories)
-        _, table_path, table_filename = resolve_table_id(request.table_id)
-        df = pd.read_csv(table_path)
+        table_registry_id, table_path, table_filename = resolve_table_id(request.table_id)
         table_name = table_filename.rsplit(".", 1)[0]
 
-        # Build table markdown (k rows)
-        table_markdown = df.head(request.k).to_markdown(index=False)
+        # Markdown preview of each column, sampled without loading the table
+        table_entry = get_table_registry().get(table_registry_id)
+        render_preview = partial(
+            render_table_markdown,
+            table_path,
+            request.k,
+            file_hash=table_entry.file_hash if table_entry else "",
+            **config.defaults.sampling.model_dump(),
+        )
 
         # Resolve and load ontology
         _, ontology_path, _ = resolve_ontology_id(request.ontology_id)
@@ -253,10 +381,9 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
         if request.edm_options:
             edm_options = EDMOptions(**request.edm_options)
 
-        # Create executor with async SSE callback
-        async def sse_callback(event_type: str, data: dict[str, Any]) -> None:
-            await emit_sse_event(run_id, event_type, data)
+        checkpoint = await asyncio.to_thread(RunCheckpoint, get_checkpoint_path(run_id))
 
+        # Create executor; columns run in a worker thread and stream through the bridge
         executor = RunExecutor(
             config=config,
             mode=request.mode,
@@ -264,7 +391,8 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
             edm_options=edm_options,
             max_depth=request.max_depth,
             k=request.k,
-            async_sse_callback=sse_callback,
+            sse_callback=sse_callback,
+            cancel_token=cancel_token,
         )
 
         # Execute for each column
@@ -272,8 +400,13 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
         completed_count = 0
         failed_count = 0
         partial_count = 0
+        cancelled = False
 
         for idx, column_name in enumerate(request.columns):
+            if cancel_token.cancelled:
+                cancelled = True
+                break
+
             # Emit column start event
             await emit_sse_event(
                 run_id,
@@ -286,23 +419,37 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
                 },
             )
 
-            # Execute column annotation (async for non-blocking LLM calls)
-            column_result = await executor.execute_column_async(
-                table_name=table_name,
-                table_markdown=table_markdown,
-                column_name=column_name,
-                ontology_dag=ontology_dag,
-                run_id=run_id,
-            )
-
-            # Convert to dict for storage
-            column_dict = _column_result_to_dict(column_result)
+            column_dict = checkpoint.completed_column(column_name)
+            if column_dict is None:
+                # Execute column annotation off the event loop
+                try:
+                    table_markdown = await asyncio.to_thread(render_preview, column=column_name)
+                    column_result = await asyncio.to_thread(
+                        executor.execute_column,
+                        table_name=table_name,
+                        table_markdown=table_markdown,
+                        column_name=column_name,
+                        ontology_dag=ontology_dag,
+                        run_id=run_id,
+                        selection_cache=checkpoint.selections(column_name),
+                        on_selection=partial(checkpoint.record_selection, column_name),
+                    )
+                except RunCancelled as e:
+                    if e.partial and e.partial.steps:
+                        columns_results.append(_column_result_to_dict(e.partial))
+                    cancelled = True
+                    break
+
+                # Convert to dict for storage
+                column_dict = _column_result_to_dict(column_result)
+                await asyncio.to_thread(checkpoint.record_column, column_name, column_dict)
             columns_results.append(column_dict)
+            column_status = column_dict["status"]
 
             # Update counts
-            if column_result.status == "completed":
+            if column_status == "completed":
                 completed_count += 1
-            elif column_result.status == "failed":
+            elif column_status == "failed":
                 failed_count += 1
             else:
                 partial_count += 1
@@ -314,8 +461,8 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
                 {
                     "run_id": run_id,
                     "column_name": column_name,
-                    "final_paths": column_result.final_paths,
-                    "status": column_result.status,
+                    "final_paths": column_dict["final_paths"],
+                    "status": column_status,
                 },
             )
 
@@ -331,15 +478,22 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
             save_run(run_id, run_data)
 
         # Determine final status
-        if failed_count == len(request.columns):
+        if cancelled:
+            final_status = "cancelled"
+            logger.info(f"Run {run_id} cancelled after {len(columns_results)} columns")
+        elif failed_count == len(request.columns):
             final_status = "failed"
         elif failed_count > 0 or partial_count > 0:
             final_status = "partial"
         else:
             final_status = "completed"
 
-        # Save final result
-        run_data = load_run(run_id)
+        # Save final result (the run may have been deleted while cancelling)
+        try:
+            run_data = load_run(run_id)
+        except HTTPException:
+            stream_hub.close(run_id, "Run was deleted", recoverable=False)
+            return final_status
         run_data["status"] = final_status
         run_data["completed_at"] = datetime.now().isoformat()
         run_data["columns"] = columns_results
@@ -350,6 +504,8 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
             "partial_columns": partial_count,
         }
         save_run(run_id, run_data)
+        if final_status == "completed":
+            checkpoint.remove()
 
         # Emit run complete event
         await emit_sse_event(
@@ -361,6 +517,12 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
                 "summary": run_data["summary"],
             },
         )
+        return final_status
+
+    except asyncio.CancelledError:
+        # Worker shutdown: stop the executor thread; the job is requeued
+        cancel_token.cancel()
+        raise
 
     except Exception as e:
         logger.exception(f"Run {run_id} failed: {e}")
@@ -375,6 +537,30 @@ async def execute_run_background(run_id: str, request: CreateRunRequest) -> None
             "error",
             {"run_id": run_id, "error": str(e), "recoverable": False},
         )
+        return "failed"
+
+    finally:
+        _run_tokens.pop(run_id, None)
+        # Release the run's stream on every exit, e.g. a worker shutdown (the
+        # job is requeued) that ends without run_complete
+        sse_callback.close()
+        stream_hub.close(run_id, "Run interrupted")
+
+
+async def _execute_job(job: Job) -> str | None:
+    """Run a queued job (worker pool handler).
+
+    Returns:
+        Final run status, or None if the run was deleted while queued
+    """
+    try:
+        load_run(job.run_id)
+    except HTTPException:
+        logger.warning(f"Skipping job {job.id}: run {job.run_id} no longer exists")
+        return None
+    return await execute_run_background(
+        job.run_id, CreateRunRequest(**job.payload), provider=job.provider
+    )
 
 
 def _column_result_to_dict(result) -> dict[str, Any]:
@@ -406,12 +592,14 @@ def _column_result_to_dict(result) -> dict[str, Any]:
                 "input_tokens": step.llm_response.input_tokens,
                 "output_tokens": step.llm_response.output_tokens,
                 "total_tokens": step.llm_response.total_tokens,
+                "provider": step.llm_response.provider,
             }
 
         if step.edm_result:
             step_dict["edm_result"] = {
                 "consensus_threshold": step.edm_result.consensus_threshold,
                 "total_agents": step.edm_result.total_agents,
+                "seed": step.edm_result.seed,
                 "votes_summary": [
                     {
                         "class_name": v.class_name,
@@ -447,6 +635,7 @@ def _column_result_to_dict(result) -> dict[str, Any]:
                                 "input_tokens": a.llm_response.input_tokens,
                                 "output_tokens": a.llm_response.output_tokens,
                                 "total_tokens": a.llm_response.total_tokens,
+                                "provider": a.llm_response.provider,
                             }
                             if a.llm_response
                             else None
@@ -468,10 +657,22 @@ def _column_result_to_dict(result) -> dict[str, Any]:
 
 
 @router.post("", response_model=CreateRunResponse)
-async def create_run(request: CreateRunRequest, background_tasks: BackgroundTasks):
-    """Create and start a new annotation run."""
-    # Generate run ID
-    run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+async def create_run(request: CreateRunRequest):
+    """Create a new annotation run and queue it for execution."""
+    config = get_config()
+    job_queue = get_job_queue()
+
+    # Admission control: reject bursts beyond the queue capacity
+    queued = await asyncio.to_thread(job_queue.count, "queued")
+    if queued >= config.queue.max_queued:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Run queue is full ({queued} runs waiting), try again later",
+        )
+
+    # Generate run ID (suffix keeps IDs unique for submissions within one second)
+    run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+    provider = config.llm.active_provider
 
     # Resolve and validate table exists (handles both hash ID and filename)
     table_registry_id, table_path, table_filename = resolve_table_id(request.table_id)
@@ -500,6 +701,7 @@ async def create_run(request: CreateRunRequest, background_tasks: BackgroundTask
             "max_depth": request.max_depth,
             "k": request.k,
             "edm_options": request.edm_options,
+            "provider": provider,
         },
         "columns": [],
         "summary": None,
@@ -519,10 +721,19 @@ async def create_run(request: CreateRunRequest, background_tasks: BackgroundTask
         max_depth=request.max_depth,
         k=request.k,
         edm_options=request.edm_options,
+        priority=request.priority,
     )
 
-    # Start background execution with resolved filenames
-    background_tasks.add_task(execute_run_background, run_id, resolved_request)
+    # Queue execution with resolved filenames; a worker picks it up when a
+    # slot for the provider is free and runs it with that same provider
+    await asyncio.to_thread(
+        job_queue.enqueue,
+        run_id,
+        resolved_request.model_dump(),
+        provider,
+        request.priority,
+    )
+    get_worker_pool().notify()
 
     return CreateRunResponse(run_id=run_id, status="pending")
 
@@ -551,6 +762,7 @@ def _parse_step_from_dict(step_data: dict[str, Any]) -> BFSStep:
             input_tokens=resp_data.get("input_tokens"),
             output_tokens=resp_data.get("output_tokens"),
             total_tokens=resp_data.get("total_tokens"),
+            provider=resp_data.get("provider"),
         )
 
     # Parse EDM result
@@ -587,6 +799,7 @@ def _parse_step_from_dict(step_data: dict[str, Any]) -> BFSStep:
                     input_tokens=a["llm_response"].get("input_tokens"),
                     output_tokens=a["llm_response"].get("output_tokens"),
                     total_tokens=a["llm_response"].get("total_tokens"),
+                    provider=a["llm_response"].get("provider"),
                 )
             agents.append(
                 AgentResult(
@@ -605,6 +818,7 @@ def _parse_step_from_dict(step_data: dict[str, Any]) -> BFSStep:
             total_agents=edm_data["total_agents"],
             votes_summary=votes_summary,
             agents=agents,
+            seed=edm_data.get("seed"),
         )
 
     return BFSStep(
@@ -668,15 +882,97 @@ async def delete_run(run_id: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Run not found")
 
+    job_queue = get_job_queue()
+    await asyncio.to_thread(job_queue.discard, run_id)
+    # Stop a running execution instead of letting it spend tokens on a deleted run
+    cancel_local_run(run_id)
+    await asyncio.to_thread(job_queue.request_cancel, run_id)
     file_path.unlink()
+    get_checkpoint_path(run_id).unlink(missing_ok=True)
     return {"message": "Run deleted successfully"}
 
 
+@router.post("/{run_id}/cancel")
+async def cancel_run(run_id: str):
+    """Cancel a queued or running run.
+
+    A queued run is cancelled immediately. A running run stops before its next
+    LLM request; the columns and steps finished so far are saved with status
+    ``cancelled`` and can be continued later via ``POST /{run_id}/resume``.
+    """
+    data = load_run(run_id)
+    status = data.get("status")
+    if status not in ("pending", "running"):
+        raise HTTPException(status_code=409, detail=f"Run {run_id} is not active ({status})")
+
+    job_queue = get_job_queue()
+    if await asyncio.to_thread(job_queue.discard, run_id):
+        # Not started yet: nothing to interrupt
+        data["status"] = "cancelled"
+        data["completed_at"] = datetime.now().isoformat()
+        save_run(run_id, data)
+        await emit_sse_event(
+            run_id,
+            "run_complete",
+            {"run_id": run_id, "status": "cancelled", "summary": data.get("summary")},
+        )
+        return {"run_id": run_id, "status": "cancelled"}
+
+    # Running here or in a sibling process (which sees the flag on its next heartbeat)
+    cancel_local_run(run_id)
+    await asyncio.to_thread(job_queue.request_cancel, run_id)
+    logger.info(f"Cancellation requested for run {run_id}")
+    return {"run_id": run_id, "status": "cancelling"}
+
+
+@router.post("/{run_id}/resume", response_model=CreateRunResponse)
+async def resume_run(run_id: str):
+    """Queue an interrupted run again.
+
+    Completed columns and successful BFS steps recorded in the run's checkpoint
+    are kept; only the remaining work is sent to the LLM.
+    """
+    data = load_run(run_id)
+    status = data.get("status")
+    if status in ("pending", "running"):
+        raise HTTPException(status_code=409, detail=f"Run {run_id} is already {status}")
+    if status == "completed":
+        raise HTTPException(status_code=409, detail=f"Run {run_id} already completed")
+
+    run_config = data["config"]
+    request = CreateRunRequest(
+        table_id=run_config["table_id"],
+        ontology_id=run_config["ontology_id"],
+        columns=run_config["columns"],
+        mode=run_config["mode"],
+        prompt_type=run_config["prompt_type"],
+        max_depth=run_config["max_depth"],
+        k=run_config["k"],
+        edm_options=run_config.get("edm_options"),
+    )
+    provider = run_config.get("provider") or get_config().llm.active_provider
+
+    data["status"] = "pending"
+    data["error"] = None
+    data["completed_at"] = None
+    save_run(run_id, data)
+
+    await asyncio.to_thread(
+        get_job_queue().enqueue, run_id, request.model_dump(), provider, request.priority
+    )
+    get_worker_pool().notify()
+    logger.info(f"Resuming run {run_id}")
+
+    return CreateRunResponse(run_id=run_id, status="pending")
+
+
 @router.get("/{run_id}/stream")
-async def stream_run(run_id: str):
+async def stream_run(run_id: str, request: Request):
     """Stream run progress via Server-Sent Events.
 
     This endpoint provides real-time updates for a running annotation task.
+    Events carry ids; a client reconnecting with a ``Last-Event-ID`` header
+    receives the buffered events it missed instead of only new ones.
 
     Events:
     - run_start: Run has started
@@ -692,13 +988,9 @@ async def stream_run(run_id: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Run not found")
 
-    # Create queue for this client
-    queue: asyncio.Queue = asyncio.Queue()
-
-    # Register queue
-    if run_id not in active_streams:
-        active_streams[run_id] = []
-    active_streams[run_id].append(queue)
+    # Register client (replays missed events when reconnecting)
+    last_event_id = parse_last_event_id(request.headers.get("last-event-id"))
+    subscriber = stream_hub.subscribe(run_id, last_event_id)
 
     async def event_generator():
         try:
@@ -710,31 +1002,27 @@ async def stream_run(run_id: str):
             current_status = data.get("status", "unknown")
 
             # If already completed, send final state and close
-            if current_status in ("completed", "failed", "partial"):
+            if current_status in ("completed", "failed", "partial", "cancelled"):
                 yield f"event: run_complete\ndata: {json.dumps({'run_id': run_id, 'status': current_status, 'summary': data.get('summary')})}\n\n"
                 return
 
-            # Stream events from queue
+            # Stream events from the hub
             while True:
-                try:
-                    # Wait for events with timeout
-                    message = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield message
+                message = await subscriber.get(timeout=30.0)
+                if message is None:
+                    # Send heartbeat to keep connection alive
+                    yield ": heartbeat\n\n"
+                    continue
 
-                    # Check if run is complete
-                    if "run_complete" in message or "error" in message:
-                        break
+                yield message.text
 
-                except asyncio.TimeoutError:
-                    # Send heartbeat to keep connection alive
-                    yield f": heartbeat\n\n"
+                # Check if run is complete
+                if message.is_terminal:
+                    break
 
         finally:
-            # Cleanup: remove queue from active streams
-            if run_id in active_streams and queue in active_streams[run_id]:
-                active_streams[run_id].remove(queue)
-                if not active_streams[run_id]:
-                    del active_streams[run_id]
+            # Cleanup: detach this client from the hub
+            stream_hub.unsubscribe(run_id, subscriber)
 
     return StreamingResponse(
         event_generator(),
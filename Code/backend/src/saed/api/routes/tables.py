@@ -8,24 +8,31 @@ import pandas as pd
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 
 from saed.api.schemas import TableInfo, TableListResponse, TablePreview
-from saed.core.config.settings import get_absolute_path, load_config
-from saed.core.table import TableRegistry
+from saed.api.uploads import CsvHeaderValidator, UploadError, stage_upload
+from saed.core.config.settings import get_absolute_path, get_catalog_path, get_config
+from saed.core.table import TableRegistry, read_row_window
+from saed.core.table.profile import profile_csv
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Largest row window returned by one preview request
+MAX_PREVIEW_ROWS = 1000
+
 
 def get_tables_dir() -> Path:
     """Get the tables directory path."""
-    config = load_config()
+    config = get_config()
     return get_absolute_path(config.paths.tables)
 
 
 def get_registry() -> TableRegistry:
     """Get or create the table registry."""
-    tables_dir = get_tables_dir()
-    return TableRegistry.load(tables_dir)
+    config = get_config()
+    return TableRegistry.load(
+        get_absolute_path(config.paths.tables), config.storage.table_format, get_catalog_path(config)
+    )
 
 
 def resolve_table_id(table_id: str) -> tuple[str, Path, str]:
@@ -99,6 +106,7 @@ async def list_tables(
                 row_count=entry.row_count,
                 column_count=entry.column_count,
                 category=entry.category,
+                column_stats=entry.column_stats,
             )
         )
 
@@ -110,7 +118,12 @@ async def upload_table(
     file: Annotated[UploadFile, File()],
     category: Annotated[str, Query(description="Category subdirectory")] = "default",
 ):
-    """Upload a new CSV table."""
+    """Upload a new CSV table.
+
+    The upload is streamed to disk and its header checked on the way; the
+    rows are validated by profiling the staged file, before it replaces an
+    existing table of the same name.
+    """
     if not file.filename or not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are allowed")
 
@@ -121,24 +134,25 @@ async def upload_table(
 
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    file_path = target_dir / file.filename
-    content = await file.read()
-
-    with open(file_path, "wb") as f:
-        f.write(content)
+    try:
+        staged = await stage_upload(file, target_dir / file.filename, CsvHeaderValidator())
+    except UploadError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid CSV file: {e}") from None
 
-    # Validate CSV
+    # Profiling the CSV validates its rows; registration reuses the profile
     try:
-        pd.read_csv(file_path)
-    except Exception as e:
-        file_path.unlink()  # Remove invalid file
+        profile = profile_csv(staged.path)
+    except ValueError as e:
+        staged.discard()
         raise HTTPException(status_code=400, detail=f"Invalid CSV file: {e}") from None
+    staged.commit()
 
-    # Register in registry
     registry = get_registry()
     entry = registry.register(
         filename=file.filename,
         category=category,
+        file_hash=staged.file_hash,
+        profile=profile,
     )
 
     logger.info(f"Uploaded table {entry.id} ({file.filename}) to {category}")
@@ -154,34 +168,56 @@ async def upload_table(
 
 
 @router.get("/{table_id}", response_model=TablePreview)
-async def get_table(table_id: str, limit: int = 10):
-    """Get table details and preview."""
+async def get_table(
+    table_id: str,
+    limit: Annotated[int, Query(ge=0, le=MAX_PREVIEW_ROWS)] = 10,
+    offset: Annotated[int, Query(ge=0)] = 0,
+):
+    """Get table details and a window of ``limit`` rows starting at ``offset``.
+
+    Only the requested rows are parsed: the registry's row index locates the
+    window with one seek, and the row count comes from the registry.
+    """
     registry_id, file_path, category = resolve_table_id(table_id)
     registry = get_registry()
     entry = registry.get(registry_id)
 
-    if not file_path.exists():
+    if entry is None or not file_path.exists():
         raise HTTPException(status_code=404, detail="Table not found")
 
     try:
-        df = pd.read_csv(file_path)
-        preview_df = df.head(limit)
+        # Cheap stat check; re-profiles and re-indexes the table if it changed
+        if not registry.is_cache_valid(entry.id):
+            entry = registry.update(entry.id)
+
+        window = read_row_window(
+            file_path,
+            entry.columns,
+            offset,
+            limit,
+            index=registry.get_row_index(entry),
+        )
 
         return TablePreview(
-            id=entry.id if entry else table_id,
-            name=entry.name if entry else file_path.stem,
-            columns=df.columns.tolist(),
-            rows=preview_df.to_dict(orient="records"),
-            total_rows=len(df),
+            id=entry.id,
+            name=entry.name,
+            columns=entry.columns,
+            rows=window.to_dict(orient="records"),
+            total_rows=entry.row_count,
+            offset=offset,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading table: {e}") from None
 
 
 @router.get("/{table_id}/preview")
-async def preview_table(table_id: str, rows: int = 5):
+async def preview_table(
+    table_id: str,
+    rows: Annotated[int, Query(ge=0, le=MAX_PREVIEW_ROWS)] = 5,
+    offset: Annotated[int, Query(ge=0)] = 0,
+):
     """Get table preview with specified number of rows."""
-    return await get_table(table_id, limit=rows)
+    return await get_table(table_id, limit=rows, offset=offset)
 
 
 @router.put("/{table_id}")
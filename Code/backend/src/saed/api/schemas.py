@@ -18,6 +18,7 @@ class TableInfo(BaseModel):
     row_count: int
     column_count: int | None = None
     category: str | None = None
+    column_stats: dict[str, dict[str, Any]] | None = None  # Column -> ColumnStats
 
 
 class TablePreview(BaseModel):
@@ -28,6 +29,7 @@ class TablePreview(BaseModel):
     columns: list[str]
     rows: list[dict[str, Any]]
     total_rows: int
+    offset: int = 0  # Row number of the first row in ``rows``
 
 
 class TableListResponse(BaseModel):
@@ -121,6 +123,7 @@ class LLMResponse(BaseModel):
     input_tokens: int | None = None  # Input tokens used
     output_tokens: int | None = None  # Output tokens generated
     total_tokens: int | None = None  # Total tokens used
+    provider: str | None = None  # Provider that answered (may be a fallback)
 
 
 # ============== EDM (Ensemble Decision Making) Schemas ==============
@@ -155,6 +158,7 @@ class EDMResult(BaseModel):
     total_agents: int
     votes_summary: list[VoteSummary]  # Summary for each class that got votes
     agents: list[AgentResult]  # Detailed info for each agent
+    seed: int | None = None  # Seed of the class-to-agent assignment
 
 
 # ============== BFS Step Schemas ==============
@@ -252,6 +256,7 @@ class CreateRunRequest(BaseModel):
     max_depth: int = 3
     k: int = 5
     edm_options: dict[str, Any] | None = None
+    priority: int = 0  # Higher priority runs are dequeued first
 
 
 class CreateRunResponse(BaseModel):
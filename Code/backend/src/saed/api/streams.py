@@ -0,0 +1,249 @@
+"""Broadcast hub for run progress Server-Sent Events.
+
+Each event is serialized once and fanned out to every subscriber of a run.
+Subscribers get bounded buffers: when a client falls behind, superseded
+``step`` events are dropped first so one stalled browser tab can neither grow
+memory without limit nor slow down the producer. Every event carries an
+``id`` and the last events of each run are kept in a ring buffer, so clients
+reconnecting with ``Last-Event-ID`` replay only what they missed.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Events that end a stream; never dropped from a subscriber buffer
+TERMINAL_EVENTS = frozenset({"run_complete", "error"})
+
+# Events that may be dropped when a subscriber falls behind
+COALESCIBLE_EVENTS = frozenset({"step"})
+
+
+@dataclass(frozen=True)
+class SSEMessage:
+    """A serialized SSE event."""
+
+    id: int
+    event: str
+    text: str  # Wire format, including the trailing blank line
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.event in TERMINAL_EVENTS
+
+
+class StreamSubscriber:
+    """Bounded event buffer for one connected client."""
+
+    def __init__(self, max_buffer: int) -> None:
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self._buffer: deque[SSEMessage] = deque()
+        self._ready = asyncio.Event()
+
+    def push(self, message: SSEMessage) -> None:
+        """Queue a message, dropping older non-terminal ones if the buffer is full."""
+        if len(self._buffer) >= self.max_buffer:
+            self._drop_one()
+        self._buffer.append(message)
+        self._ready.set()
+
+    def _drop_one(self) -> None:
+        # Prefer superseded progress events, then the oldest non-terminal event
+        for candidates in (COALESCIBLE_EVENTS, None):
+            for i, queued in enumerate(self._buffer):
+                if queued.is_terminal:
+                    continue
+                if candidates is None or queued.event in candidates:
+                    del self._buffer[i]
+                    self.dropped += 1
+                    return
+
+    async def get(self, timeout: float) -> SSEMessage | None:
+        """Wait for the next message.
+
+        Returns:
+            The next message, or None if nothing arrived within ``timeout``.
+        """
+        if not self._buffer:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except TimeoutError:
+                return None
+        return self._buffer.popleft()
+
+
+@dataclass
+class _RunChannel:
+    history: deque[SSEMessage]
+    subscribers: set[StreamSubscriber] = field(default_factory=set)
+    next_id: int = 1
+    finished: bool = False
+
+
+class RunStreamHub:
+    """Per-run event broadcaster with replay support.
+
+    ``publish`` is synchronous and never blocks, so it must be called from the
+    event loop thread that serves the SSE connections.
+    """
+
+    def __init__(self, history_size: int = 512, max_client_buffer: int = 256) -> None:
+        self.history_size = history_size
+        self.max_client_buffer = max_client_buffer
+        self._channels: dict[str, _RunChannel] = {}
+
+    def _channel(self, run_id: str) -> _RunChannel:
+        channel = self._channels.get(run_id)
+        if channel is None:
+            channel = _RunChannel(history=deque(maxlen=self.history_size))
+            self._channels[run_id] = channel
+        return channel
+
+    def publish(self, run_id: str, event_type: str, data: dict[str, Any]) -> SSEMessage:
+        """Serialize an event once and deliver it to all subscribers of a run."""
+        return self.publish_serialized(run_id, event_type, serialize_event_data(data))
+
+    def publish_serialized(self, run_id: str, event_type: str, event_data: str) -> SSEMessage:
+        """Deliver an event whose payload is already JSON-encoded."""
+        channel = self._channel(run_id)
+        message = SSEMessage(
+            id=channel.next_id,
+            event=event_type,
+            text=f"id: {channel.next_id}\nevent: {event_type}\ndata: {event_data}\n\n",
+        )
+        channel.next_id += 1
+        channel.history.append(message)
+
+        for subscriber in channel.subscribers:
+            subscriber.push(message)
+
+        if message.is_terminal:
+            channel.finished = True
+            if not channel.subscribers:
+                del self._channels[run_id]
+        return message
+
+    def subscribe(self, run_id: str, last_event_id: int | None = None) -> StreamSubscriber:
+        """Register a client, replaying buffered events newer than ``last_event_id``."""
+        channel = self._channel(run_id)
+        subscriber = StreamSubscriber(self.max_client_buffer)
+        if last_event_id is not None:
+            for message in channel.history:
+                if message.id > last_event_id:
+                    subscriber.push(message)
+        channel.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, run_id: str, subscriber: StreamSubscriber) -> None:
+        """Remove a client; forget the run once nobody listens and nothing is left to replay."""
+        channel = self._channels.get(run_id)
+        if channel is None:
+            return
+        channel.subscribers.discard(subscriber)
+        if subscriber.dropped:
+            logger.info(f"SSE client for {run_id} dropped {subscriber.dropped} events")
+        if not channel.subscribers and (channel.finished or not channel.history):
+            del self._channels[run_id]
+
+    def close(self, run_id: str, error: str, recoverable: bool = True) -> None:
+        """End a run's stream if no terminal event was published.
+
+        Connected clients receive an ``error`` event and disconnect, and the
+        run's buffered events are released once they left.
+
+        Args:
+            run_id: Run whose stream ends
+            error: Reason shown to the clients
+            recoverable: Whether the run may continue later (e.g. requeued)
+        """
+        channel = self._channels.get(run_id)
+        if channel is not None and not channel.finished:
+            self.publish(
+                run_id, "error", {"run_id": run_id, "error": error, "recoverable": recoverable}
+            )
+
+    def has_subscribers(self, run_id: str) -> bool:
+        channel = self._channels.get(run_id)
+        return bool(channel and channel.subscribers)
+
+
+class ThreadSafeEventBridge:
+    """SSE callback for synchronous executors running off the event loop.
+
+    Calls from any thread are queued and handed to the loop with a single
+    ``call_soon_threadsafe`` per batch, so a ``RunExecutor.execute_column``
+    running in a worker thread streams live progress without blocking (or
+    owning) an event loop. Payloads are serialized in the calling thread, so
+    the producer may keep mutating its data after the call returns. Must be
+    created on the loop thread.
+    """
+
+    def __init__(
+        self,
+        hub: RunStreamHub,
+        run_id: str,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self.hub = hub
+        self.run_id = run_id
+        self._loop = loop or asyncio.get_running_loop()
+        self._lock = threading.Lock()
+        self._pending: list[tuple[str, str]] = []
+        self._flush_scheduled = False
+        self._closed = False
+
+    def __call__(self, event_type: str, data: dict[str, Any]) -> None:
+        event_data = serialize_event_data(data)
+        with self._lock:
+            if self._closed:
+                return
+            self._pending.append((event_type, event_data))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        try:
+            self._loop.call_soon_threadsafe(self._flush)
+        except RuntimeError:
+            # Loop already closed (server shutting down); nobody is listening
+            logger.debug(f"Dropping SSE event for {self.run_id}: event loop closed")
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._flush_scheduled = False
+        for event_type, event_data in batch:
+            self.hub.publish_serialized(self.run_id, event_type, event_data)
+
+    def close(self) -> None:
+        """Publish the queued events and drop any later ones.
+
+        Must be called on the loop thread. A producer thread still winding
+        down after its run ended can then no longer reopen the run's stream.
+        """
+        self._flush()
+        with self._lock:
+            self._closed = True
+
+
+def serialize_event_data(data: dict[str, Any]) -> str:
+    """Encode an event payload for the SSE ``data`` field."""
+    return json.dumps(data, default=str)
+
+
+def parse_last_event_id(value: str | None) -> int | None:
+    """Parse a ``Last-Event-ID`` header value, ignoring malformed input."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
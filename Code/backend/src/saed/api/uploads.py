@@ -0,0 +1,201 @@
+"""Streamed file uploads, hashed and validated while they are written.
+
+An upload is copied from the request in chunks to a temporary file in a
+hidden ``.uploads`` directory next to its target, so memory stays at one
+chunk however large the file is. The content hash and a format check are
+computed from the same chunks, and the file is only moved into place
+(atomically, with :func:`os.replace`) once it passed validation: an invalid
+upload never replaces an existing file, and registry syncs never see a
+partial one.
+"""
+
+import asyncio
+import csv
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from xml.parsers import expat
+
+from fastapi import UploadFile
+
+from saed.core.utils.files import format_file_hash
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the request at a time
+UPLOAD_CHUNK_BYTES = 1 << 20
+
+# Longest CSV header row accepted
+MAX_HEADER_BYTES = 1 << 20
+
+# Directory (next to the target) of uploads being received
+STAGING_DIR = ".uploads"
+
+
+class UploadError(ValueError):
+    """An upload is not a valid file of the expected format."""
+
+
+class UploadValidator:
+    """Checks the format of an upload from its chunks, in order.
+
+    Subclasses raise :class:`UploadError` from :meth:`feed` as soon as the
+    content is known to be invalid, or from :meth:`close` at the end.
+    """
+
+    def feed(self, chunk: bytes) -> None:
+        """Check the next chunk of the upload."""
+
+    def close(self) -> None:
+        """Finish the check after the last chunk."""
+
+
+class CsvHeaderValidator(UploadValidator):
+    """Sniffs the header row of a CSV upload.
+
+    Only the header is parsed: it must be UTF-8 text with at least one
+    named column and contain ``required_columns``. The rows are validated
+    when the file is profiled on registration.
+    """
+
+    def __init__(self, required_columns: Iterable[str] = ()) -> None:
+        self.required_columns = list(required_columns)
+        self.columns: list[str] | None = None
+        self._head = bytearray()
+        self._scanned = 0  # End of the last complete line in _head
+        self._quotes = 0  # Quotes before _scanned
+
+    def feed(self, chunk: bytes) -> None:
+        if self.columns is not None:
+            return
+        self._head += chunk
+        # The header ends at the first newline outside double quotes
+        while (position := self._head.find(b"\n", self._scanned)) != -1:
+            self._quotes += self._head.count(b'"', self._scanned, position)
+            self._scanned = position + 1
+            if self._quotes % 2:
+                continue  # Newline inside a quoted column name
+            record = bytes(self._head[:position])
+            if record.strip():
+                self._parse(record)
+                self._head.clear()
+                return
+            # Blank lines before the header are skipped, as pandas does
+            del self._head[: self._scanned]
+            self._scanned = 0
+        if len(self._head) > MAX_HEADER_BYTES:
+            raise UploadError(f"Header row is longer than {MAX_HEADER_BYTES} bytes")
+
+    def close(self) -> None:
+        if self.columns is None:
+            self._parse(bytes(self._head).strip())
+
+    def _parse(self, header: bytes) -> None:
+        try:
+            text = header.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise UploadError("File is not UTF-8 text") from None
+        columns = next(csv.reader([text.rstrip("\r")]), [])
+        if not any(c.strip() for c in columns):
+            raise UploadError("File has no header row")
+        missing = [c for c in self.required_columns if c not in columns]
+        if missing:
+            raise UploadError(f"Missing required columns: {', '.join(missing)}")
+        self.columns = columns
+
+
+class XmlValidator(UploadValidator):
+    """Checks that an upload is well-formed XML, as RDF/XML files are.
+
+    The document is parsed incrementally by expat without building a tree.
+    """
+
+    def __init__(self) -> None:
+        self._parser = expat.ParserCreate()
+
+    def feed(self, chunk: bytes) -> None:
+        self._parse(chunk, final=False)
+
+    def close(self) -> None:
+        self._parse(b"", final=True)
+
+    def _parse(self, data: bytes, final: bool) -> None:
+        try:
+            self._parser.Parse(data, final)
+        except expat.ExpatError as e:
+            raise UploadError(f"Malformed XML: {e}") from None
+
+
+@dataclass
+class StagedUpload:
+    """An upload received into a temporary file, not yet in place."""
+
+    path: Path  # Temporary file
+    target: Path
+    file_hash: str
+    size: int
+
+    def commit(self) -> Path:
+        """Atomically move the upload to its target, replacing any existing file."""
+        os.replace(self.path, self.target)
+        logger.debug(f"Stored upload {self.target.name} ({self.size} bytes)")
+        return self.target
+
+    def discard(self) -> None:
+        """Delete the upload."""
+        self.path.unlink(missing_ok=True)
+
+
+async def stage_upload(
+    file: UploadFile,
+    target: Path,
+    validator: UploadValidator | None = None,
+    chunk_bytes: int = UPLOAD_CHUNK_BYTES,
+) -> StagedUpload:
+    """Receive an upload in chunks, hashing and validating it in the same pass.
+
+    Each chunk is hashed, validated and written in a worker thread, so large
+    uploads do not block the event loop.
+
+    Args:
+        file: Uploaded file
+        target: Path the upload is meant for (see :meth:`StagedUpload.commit`)
+        validator: Format check of the content
+        chunk_bytes: Bytes read at a time
+
+    Returns:
+        The staged upload, to be committed or discarded by the caller
+
+    Raises:
+        UploadError: If the validator rejects the content (nothing is kept)
+    """
+    staging_dir = target.parent / STAGING_DIR
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    # Same filesystem as the target, so the final move is an atomic rename
+    fd, tmp_name = tempfile.mkstemp(dir=staging_dir, suffix=f"-{target.name}")
+    path = Path(tmp_name)
+    sha256 = hashlib.sha256()
+    size = 0
+
+    def consume(out, chunk: bytes) -> None:
+        sha256.update(chunk)
+        if validator is not None:
+            validator.feed(chunk)
+        out.write(chunk)
+
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await file.read(chunk_bytes):
+                await asyncio.to_thread(consume, out, chunk)
+                size += len(chunk)
+        if validator is not None:
+            validator.close()
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
+    return StagedUpload(path=path, target=target, file_hash=format_file_hash(sha256), size=size)
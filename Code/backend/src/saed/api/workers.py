@@ -0,0 +1,150 @@
+"""Worker pool that executes queued annotation runs inside the API process."""
+
+import asyncio
+import contextlib
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
+
+from saed.core.jobs import Job, JobQueue
+
+logger = logging.getLogger(__name__)
+
+# Handler returns the final run status ("completed", "partial", "failed", ...)
+JobHandler = Callable[[Job], Awaitable[str | None]]
+
+# Called with a run ID when cancellation of a running job was requested
+CancelHandler = Callable[[str], None]
+
+# Run statuses that mark the job itself as failed / cancelled
+_FAILED_STATUSES = frozenset({"failed"})
+_CANCELLED_STATUSES = frozenset({"cancelled"})
+
+
+class RunWorkerPool:
+    """Fixed number of worker coroutines draining a :class:`JobQueue`.
+
+    Each provider has a concurrency quota; jobs for a saturated provider stay
+    queued while other providers' jobs proceed. Workers wake up immediately on
+    :meth:`notify` and otherwise poll, so jobs enqueued by other processes
+    sharing the database are picked up as well. Leases of running jobs are
+    renewed every ``lease_seconds / 3``; expired leases of any process are
+    requeued. Cancellation requests recorded in the queue (possibly by another
+    process) are picked up with each lease renewal and passed to
+    ``cancel_handler``. All SQLite access happens in worker threads, off the
+    event loop.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler: JobHandler,
+        workers: int = 2,
+        provider_limits: dict[str, int] | None = None,
+        default_provider_limit: int = 2,
+        poll_interval: float = 2.0,
+        lease_seconds: float = 60.0,
+        cancel_handler: CancelHandler | None = None,
+    ) -> None:
+        self.queue = queue
+        self.handler = handler
+        self.cancel_handler = cancel_handler
+        self.workers = max(1, workers)
+        self.provider_limits = provider_limits or {}
+        self.default_provider_limit = default_provider_limit
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self._active: Counter[str] = Counter()
+        self._running_jobs: dict[int, Job] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._claim_lock = asyncio.Lock()
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Spawn the worker coroutines on the running event loop."""
+        if self._tasks:
+            return
+        self._stopping = False
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"run-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._lease_keeper(), name="run-lease-keeper"))
+        logger.info(f"Started {self.workers} run workers")
+
+    async def stop(self) -> None:
+        """Stop all workers; interrupted jobs go back to the queue."""
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers (call after enqueueing a job)."""
+        self._wakeup.set()
+
+    def _limit(self, provider: str) -> int:
+        return self.provider_limits.get(provider, self.default_provider_limit)
+
+    def _saturated_providers(self) -> set[str]:
+        return {p for p, n in self._active.items() if n >= self._limit(p)}
+
+    async def _lease_keeper(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                cancelled = await asyncio.to_thread(self.queue.heartbeat, list(self._running_jobs))
+                if self.cancel_handler:
+                    for run_id in cancelled:
+                        self.cancel_handler(run_id)
+                if await asyncio.to_thread(self.queue.requeue_stale, self.lease_seconds):
+                    self.notify()
+            except Exception as e:
+                logger.warning(f"Job lease maintenance failed: {e}")
+
+    async def _worker(self, index: int) -> None:
+        # wait_for may swallow a cancellation that races its timeout (Python < 3.12),
+        # so workers also check the stop flag
+        while not self._stopping:
+            # Claims are serialized so quotas see every slot taken by this process
+            async with self._claim_lock:
+                job = await asyncio.to_thread(self.queue.claim, self._saturated_providers())
+                if job is not None:
+                    self._active[job.provider] += 1
+                    self._running_jobs[job.id] = job
+            if job is None:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                continue
+
+            logger.info(f"Worker {index} running job {job.id} (run {job.run_id})")
+            try:
+                run_status = await self.handler(job)
+            except asyncio.CancelledError:
+                if self._stopping:
+                    await asyncio.shield(asyncio.to_thread(self.queue.release, job.id))
+                else:
+                    await asyncio.shield(asyncio.to_thread(self.queue.finish, job.id, "cancelled"))
+                raise
+            except Exception as e:
+                logger.exception(f"Job {job.id} (run {job.run_id}) crashed: {e}")
+                await asyncio.to_thread(self.queue.finish, job.id, "failed", str(e))
+            else:
+                if run_status in _FAILED_STATUSES:
+                    job_status = "failed"
+                elif run_status in _CANCELLED_STATUSES:
+                    job_status = "cancelled"
+                else:
+                    job_status = "done"
+                await asyncio.to_thread(self.queue.finish, job.id, job_status)
+            finally:
+                self._active[job.provider] -= 1
+                self._running_jobs.pop(job.id, None)
+                self.notify()
@@ -4,26 +4,35 @@ from __future__ import annotations
 
 import argparse
 import fnmatch
-import json
 import sys
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
 import yaml
 
+from saed.cli.interrupt import EXIT_INTERRUPTED, cancel_on_interrupt
 from saed.core.config.settings import (
     SUPPORTED_PROVIDERS,
     Config,
     get_absolute_path,
+    get_catalog_path,
     get_provider_model,
     load_config,
 )
-from saed.core.executor import ColumnResultDetail, RunExecutor
+from saed.core.executor import (
+    CancellationToken,
+    ColumnResultDetail,
+    RunCancelled,
+    RunCheckpoint,
+    RunExecutor,
+    checkpoint_path,
+)
 from saed.core.ontology import OntologyDAG, OntologyRegistry
-from saed.core.table import TableRegistry
+from saed.core.table import TableRegistry, render_table_markdown
+from saed.core.utils.traces import read_trace_file, write_trace_file
 
 
 class BatchTerminalPrinter:
@@ -241,12 +250,14 @@ def column_result_to_dict(result: ColumnResultDetail) -> dict[str, Any]:
                 "input_tokens": step.llm_response.input_tokens,
                 "output_tokens": step.llm_response.output_tokens,
                 "total_tokens": step.llm_response.total_tokens,
+                "provider": step.llm_response.provider,
             }
 
         if step.edm_result:
             step_dict["edm_result"] = {
                 "consensus_threshold": step.edm_result.consensus_threshold,
                 "total_agents": step.edm_result.total_agents,
+                "seed": step.edm_result.seed,
                 "votes_summary": [
                     {
                         "class_name": v.class_name,
@@ -284,6 +295,7 @@ def column_result_to_dict(result: ColumnResultDetail) -> dict[str, Any]:
                                 "input_tokens": a.llm_response.input_tokens,
                                 "output_tokens": a.llm_response.output_tokens,
                                 "total_tokens": a.llm_response.total_tokens,
+                                "provider": a.llm_response.provider,
                             }
                             if a.llm_response
                             else None
@@ -310,6 +322,191 @@ def load_batch_config(config_path: Path) -> dict[str, Any]:
         return yaml.safe_load(f)
 
 
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse a ``--shard i/N`` value (1-based shard index).
+
+    Raises:
+        ValueError: If the value is malformed or out of range
+    """
+    try:
+        index_str, count_str = value.split("/")
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/N (e.g. 2/4)") from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and {count}")
+    return index, count
+
+
+# Subdirectory of the output directory holding shard files, so run listings
+# (which read the top level only) do not show them as separate runs
+SHARDS_DIR = "shards"
+
+
+def shard_file_name(run_id: str, shard: tuple[int, int]) -> str:
+    """Name of a shard's partial batch file (without extension)."""
+    return f"{run_id}.shard-{shard[0]}-of-{shard[1]}"
+
+
+def resolve_plan(
+    expanded_tasks: list[tuple[str, list[str]]], registry: TableRegistry
+) -> list[tuple[str, list[str]]]:
+    """Resolve tasks to (table filename, columns), expanding "all columns".
+
+    Unknown tables are dropped, as the batch loop would skip them anyway.
+    """
+    plan = []
+    for table_id, columns in expanded_tasks:
+        entry = registry.get(table_id) or registry.get_by_filename(table_id)
+        if entry:
+            plan.append((entry.filename, columns or list(entry.columns)))
+    return plan
+
+
+def partition_units(costs: list[float], shard_count: int) -> list[int]:
+    """Assign work units to shards, balancing the estimated cost.
+
+    Longest-processing-time-first greedy assignment; ties are broken by unit
+    and shard index, so every host computes the same partition.
+
+    Returns:
+        Zero-based shard index of each unit
+    """
+    loads = [0.0] * shard_count
+    assignment = [0] * len(costs)
+    for unit in sorted(range(len(costs)), key=lambda i: (-costs[i], i)):
+        shard = min(range(shard_count), key=lambda s: (loads[s], s))
+        assignment[unit] = shard
+        loads[shard] += costs[unit]
+    return assignment
+
+
+def select_shard(
+    plan: list[tuple[str, list[str]]],
+    table_widths: dict[str, int],
+    ontology_breadth: int,
+    shard: tuple[int, int],
+) -> list[tuple[str, list[str]]]:
+    """Keep the (table, column) units of one shard, in plan order.
+
+    A column's cost is estimated as table width x ontology breadth: the prompt
+    carries every column of the sample rows and the first BFS level offers
+    every top-level class.
+    """
+    units = [(table, column) for table, columns in plan for column in columns]
+    costs = [max(table_widths.get(table, 1), 1) * max(ontology_breadth, 1) for table, _ in units]
+    assignment = partition_units(costs, shard[1])
+
+    selected: list[tuple[str, list[str]]] = []
+    unit_idx = 0
+    for table, columns in plan:
+        mine = []
+        for column in columns:
+            if assignment[unit_idx] == shard[0] - 1:
+                mine.append(column)
+            unit_idx += 1
+        if mine:
+            selected.append((table, mine))
+    return selected
+
+
+def compute_table_status(completed: int, total: int, cancelled: bool = False) -> str:
+    """Status of a table from its completed column count."""
+    if cancelled and completed < total:
+        return "cancelled"
+    if completed == total:
+        return "completed"
+    if completed == 0:
+        return "failed"
+    return "partial"
+
+
+def build_table_result(
+    table_run_id: str,
+    batch_config: dict[str, Any],
+    table: dict[str, Any],
+    columns: list[str],
+    columns_results: list[dict[str, Any]],
+    status: str,
+    time_ms: int,
+    tokens: int,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build a single-table run file and its entry in the batch summary.
+
+    Args:
+        table_run_id: Run ID of the single-table file
+        batch_config: The batch's ``config`` section
+        table: ``table_id`` (filename), ``table_registry_id`` and ``table_name``
+        columns: Columns the table was annotated on
+        columns_results: Column results in column order
+        status: Table status (see :func:`compute_table_status`)
+        time_ms: Time spent on the table
+        tokens: Tokens spent on the table
+
+    Returns:
+        Tuple of (table run result, batch ``tables`` entry)
+    """
+    completed = sum(1 for c in columns_results if c["status"] == "completed")
+    table_result = {
+        "run_id": table_run_id,
+        "created_at": datetime.now().isoformat(),
+        "completed_at": datetime.now().isoformat(),
+        "status": status,
+        "config": {
+            "table_id": table["table_id"],
+            "table_registry_id": table["table_registry_id"],
+            "ontology_id": batch_config["ontology_id"],
+            "ontology_registry_id": batch_config["ontology_registry_id"],
+            "columns": columns,
+            "mode": batch_config["mode"],
+            "prompt_type": batch_config["prompt_type"],
+            "max_depth": batch_config["max_depth"],
+            "k": batch_config["k"],
+            "edm_options": batch_config["edm_options"],
+            "provider": batch_config["provider"],
+            "model": batch_config["model"],
+        },
+        "columns": columns_results,
+        "summary": {
+            "total_columns": len(columns),
+            "completed_columns": completed,
+            "failed_columns": len(columns) - completed,
+            "partial_columns": 0,
+            "total_time_ms": time_ms,
+            "total_tokens": tokens,
+            "total_input_tokens": 0,  # Not tracked per-table currently
+            "total_output_tokens": 0,
+        },
+        "evaluation": None,
+        "error": None,
+    }
+    batch_entry = {
+        "table_id": table["table_id"],
+        "table_registry_id": table["table_registry_id"],
+        "table_name": table["table_name"],
+        "run_file": f"{table_run_id}.json",
+        "columns": columns_results,
+        "summary": {
+            "total_columns": len(columns),
+            "completed_columns": completed,
+            "total_time_ms": time_ms,
+            "total_tokens": tokens,
+        },
+    }
+    return table_result, batch_entry
+
+
+def compute_batch_status(completed_tables: int, total_tables: int, cancelled: bool = False) -> str:
+    """Status of a batch from its completed table count."""
+    if cancelled:
+        return "cancelled"
+    if completed_tables == 0:
+        return "failed"
+    if completed_tables < total_tables:
+        return "partial"
+    return "completed"
+
+
 def run_batch(
     config: Config,
     tasks: list[dict[str, Any]],
@@ -320,9 +517,21 @@ def run_batch(
     k: int,
     output_dir: Path,
     verbose: bool = True,
+    run_id: str | None = None,
+    cancel_token: CancellationToken | None = None,
+    shard: tuple[int, int] | None = None,
+    batch_id: str | None = None,
 ) -> dict[str, Any]:
     """Run batch annotation on multiple tables.
 
+    Progress is checkpointed to ``output_dir/checkpoints/{run_id}.jsonl`` after
+    every BFS step; resuming skips completed columns and successful steps.
+
+    With ``shard=(i, N)`` only the i-th of N cost-balanced partitions of the
+    (table, column) units is annotated and a partial batch file
+    ``shards/{run_id}.shard-i-of-N.json`` is written instead of the per-table files;
+    :func:`merge_shards` combines the N partial files.
+
     Args:
         config: Application config
         tasks: List of task dicts with 'table' and 'columns' keys
@@ -333,18 +542,30 @@ def run_batch(
         k: Number of sample rows
         output_dir: Output directory
         verbose: Show detailed output
+        run_id: Resume this interrupted batch (same output directory and settings)
+        cancel_token: Stops the batch before its next LLM request; the partial
+            results are saved with status ``cancelled``
+        shard: Annotate only this (1-based index, count) shard
+        batch_id: Batch ID suffix (default: current timestamp); all shards of
+            a batch must use the same one
 
     Returns:
         Batch result dictionary
+
+    Raises:
+        ValueError: If a resumed batch has no checkpoint or different settings,
+            or a shard has no batch ID
     """
     # Load registries
     tables_dir = get_absolute_path(config.paths.tables)
     ontologies_dir = get_absolute_path(config.paths.ontologies)
 
-    table_registry = TableRegistry.load(tables_dir)
+    table_registry = TableRegistry.load(
+        tables_dir, config.storage.table_format, get_catalog_path(config)
+    )
     table_registry.sync_with_directory()
 
-    ontology_registry = OntologyRegistry.load(ontologies_dir)
+    ontology_registry = OntologyRegistry.load(ontologies_dir, get_catalog_path(config))
     ontology_registry.sync_with_directory()
 
     # Resolve ontology
@@ -369,6 +590,20 @@ def run_batch(
             else:
                 expanded_tasks.append((table_id, columns_spec))
 
+    # Keep only this shard's (table, column) units
+    plan = None
+    if shard is not None:
+        if batch_id is None and run_id is None:
+            raise ValueError("Sharded batches need a --batch-id shared by all shards")
+        plan = resolve_plan(expanded_tasks, table_registry)
+        table_widths = {}
+        for table_filename, _ in plan:
+            entry = table_registry.get_by_filename(table_filename)
+            table_widths[table_filename] = len(entry.columns) if entry else 1
+        ontology_breadth = len(ontology_dag.edges_subclassof.get(ontology_dag.root, []))
+        expanded_tasks = select_shard(plan, table_widths, ontology_breadth, shard)
+        print(f"Shard {shard[0]}/{shard[1]}: {len(expanded_tasks)} of {len(plan)} tables")
+
     # Count total columns
     total_columns = 0
     for table_id, columns in expanded_tasks:
@@ -401,10 +636,34 @@ def run_batch(
     )
 
     # Create run ID and ensure output directory exists
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_id = f"batch_{timestamp}"
+    resuming = run_id is not None
+    if run_id is None:
+        timestamp = batch_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        run_id = f"batch_{timestamp}"
+    else:
+        timestamp = run_id.removeprefix("batch_")
+    output_name = shard_file_name(run_id, shard) if shard else run_id
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Record batch settings; a resumed batch must use the same ones
+    checkpoint = RunCheckpoint(checkpoint_path(output_dir, output_name))
+    settings = {
+        "ontology_id": ontology_filename,
+        "mode": mode,
+        "prompt_type": prompt_type,
+        "max_depth": max_depth,
+        "k": k,
+        "provider": provider,
+        "model": model,
+    }
+    if resuming:
+        if checkpoint.header is None:
+            raise ValueError(f"No checkpoint for batch {run_id} in {output_dir}")
+        changed = [key for key, value in settings.items() if checkpoint.header.get(key) != value]
+        if changed:
+            raise ValueError(f"Cannot resume {run_id}: settings changed ({', '.join(changed)})")
+    checkpoint.write_header({"created_at": datetime.now().isoformat(), **settings})
+
     # Create EDM options if needed
     edm_options = None
     edm_options_dict = None
@@ -414,9 +673,24 @@ def run_batch(
             "classes_per_agent": edm_options.classes_per_agent,
             "agents_per_class": edm_options.agents_per_class,
             "consensus_threshold": edm_options.consensus_threshold,
+            "seed": edm_options.seed,
+            "token_budget": edm_options.token_budget,
         }
 
+    batch_config = {
+        "ontology_id": ontology_filename,
+        "ontology_registry_id": ontology_registry_id,
+        "mode": mode,
+        "prompt_type": prompt_type,
+        "max_depth": max_depth,
+        "k": k,
+        "edm_options": edm_options_dict,
+        "provider": provider,
+        "model": model,
+    }
+
     # Create executor (no callback for batch - we handle output manually)
+    cancel_token = cancel_token or CancellationToken()
     executor = RunExecutor(
         config=config,
         mode=mode,
@@ -424,6 +698,7 @@ def run_batch(
         edm_options=edm_options,
         max_depth=max_depth,
         k=k,
+        cancel_token=cancel_token,
     )
 
     # Execute batch
@@ -433,6 +708,8 @@ def run_batch(
     completed_tables = 0
 
     for table_idx, (table_id, columns_spec) in enumerate(expanded_tasks, start=1):
+        if cancel_token.cancelled:
+            break
         try:
             table_registry_id, table_filename, table_name, table_path, all_columns, _ = resolve_table(
                 table_id, table_registry, tables_dir
@@ -447,9 +724,15 @@ def run_batch(
             table_idx, len(expanded_tasks), table_filename, table_name, len(columns)
         )
 
-        # Load table
-        df = pd.read_csv(table_path)
-        table_markdown = df.head(k).to_markdown(index=False)
+        # Markdown preview of each column, sampled without loading the table
+        table_entry = table_registry.get(table_registry_id)
+        render_preview = partial(
+            render_table_markdown,
+            table_path,
+            k,
+            file_hash=table_entry.file_hash if table_entry else "",
+            **config.defaults.sampling.model_dump(),
+        )
 
         # Process each column
         columns_results: list[dict[str, Any]] = []
@@ -458,18 +741,31 @@ def run_batch(
         table_time_ms = 0
 
         for col_idx, column_name in enumerate(columns, start=1):
+            if cancel_token.cancelled:
+                break
             col_start = time.time()
-
-            result = executor.execute_column(
-                table_name=table_name,
-                table_markdown=table_markdown,
-                column_name=column_name,
-                ontology_dag=ontology_dag,
-                run_id=run_id,
-            )
+            checkpoint_key = f"{table_filename}/{column_name}"
+
+            result_dict = checkpoint.completed_column(checkpoint_key)
+            if result_dict is None:
+                try:
+                    result = executor.execute_column(
+                        table_name=table_name,
+                        table_markdown=render_preview(column=column_name),
+                        column_name=column_name,
+                        ontology_dag=ontology_dag,
+                        run_id=run_id,
+                        selection_cache=checkpoint.selections(checkpoint_key),
+                        on_selection=partial(checkpoint.record_selection, checkpoint_key),
+                    )
+                except RunCancelled as e:
+                    if e.partial and e.partial.steps:
+                        columns_results.append(column_result_to_dict(e.partial))
+                    break
+                result_dict = column_result_to_dict(result)
+                checkpoint.record_column(checkpoint_key, result_dict)
 
             col_time_ms = int((time.time() - col_start) * 1000)
-            result_dict = column_result_to_dict(result)
             columns_results.append(result_dict)
 
             # Calculate tokens for this column
@@ -481,108 +777,63 @@ def run_batch(
             table_tokens += col_tokens
             table_time_ms += col_time_ms
 
-            if result.status == "completed":
+            if result_dict["status"] == "completed":
                 table_completed += 1
                 total_completed_columns += 1
 
             printer.print_column_progress(
-                col_idx, len(columns), column_name, result.status, col_time_ms, col_tokens
+                col_idx, len(columns), column_name, result_dict["status"], col_time_ms, col_tokens
             )
 
         printer.print_table_complete(table_completed, len(columns), table_time_ms, table_tokens)
 
         # Determine table status
-        if table_completed == len(columns):
-            table_status = "completed"
+        table_status = compute_table_status(table_completed, len(columns), cancel_token.cancelled)
+        if table_status == "completed":
             completed_tables += 1
-        elif table_completed == 0:
-            table_status = "failed"
-        else:
-            table_status = "partial"
 
         # Build single-table result (API-compatible format)
         table_run_id = f"run_{timestamp}_{table_filename.replace('.csv', '')}"
-        table_result = {
-            "run_id": table_run_id,
-            "created_at": datetime.now().isoformat(),
-            "completed_at": datetime.now().isoformat(),
-            "status": table_status,
-            "config": {
+        table_result, table_entry = build_table_result(
+            table_run_id,
+            batch_config,
+            {
                 "table_id": table_filename,
                 "table_registry_id": table_registry_id,
-                "ontology_id": ontology_filename,
-                "ontology_registry_id": ontology_registry_id,
-                "columns": columns,
-                "mode": mode,
-                "prompt_type": prompt_type,
-                "max_depth": max_depth,
-                "k": k,
-                "edm_options": edm_options_dict,
-                "provider": provider,
-                "model": model,
+                "table_name": table_name,
             },
-            "columns": columns_results,
-            "summary": {
-                "total_columns": len(columns),
-                "completed_columns": table_completed,
-                "failed_columns": len(columns) - table_completed,
-                "partial_columns": 0,
-                "total_time_ms": table_time_ms,
-                "total_tokens": table_tokens,
-                "total_input_tokens": 0,  # Not tracked per-table currently
-                "total_output_tokens": 0,
-            },
-            "evaluation": None,
-            "error": None,
-        }
+            columns,
+            columns_results,
+            table_status,
+            table_time_ms,
+            table_tokens,
+        )
 
-        # Save individual table result (frontend-compatible format)
-        table_output_path = output_dir / f"{table_run_id}.json"
-        with open(table_output_path, "w") as f:
-            json.dump(table_result, f, indent=2, default=str)
+        # Save individual table result (frontend-compatible format); shards
+        # only hold part of a table, so merge_shards writes their table files
+        if shard is None:
+            write_trace_file(
+                output_dir / f"{table_run_id}.json",
+                table_result,
+                intern=config.storage.trace_interning,
+                compression=config.storage.trace_compression,
+            )
 
         # Add to tables_results for batch summary
-        tables_results.append({
-            "table_id": table_filename,
-            "table_registry_id": table_registry_id,
-            "table_name": table_name,
-            "run_file": f"{table_run_id}.json",
-            "columns": columns_results,
-            "summary": {
-                "total_columns": len(columns),
-                "completed_columns": table_completed,
-                "total_time_ms": table_time_ms,
-                "total_tokens": table_tokens,
-            },
-        })
+        tables_results.append(table_entry)
 
     elapsed_time = time.time() - start_time
 
     # Determine final status
-    if completed_tables == 0:
-        final_status = "failed"
-    elif completed_tables < len(expanded_tasks):
-        final_status = "partial"
-    else:
-        final_status = "completed"
+    final_status = compute_batch_status(completed_tables, len(expanded_tasks), cancel_token.cancelled)
 
     # Build batch summary result
     result = {
         "run_id": run_id,
-        "created_at": datetime.now().isoformat(),
+        "created_at": checkpoint.header["created_at"],
         "completed_at": datetime.now().isoformat(),
         "status": final_status,
-        "config": {
-            "ontology_id": ontology_filename,
-            "ontology_registry_id": ontology_registry_id,
-            "mode": mode,
-            "prompt_type": prompt_type,
-            "max_depth": max_depth,
-            "k": k,
-            "edm_options": edm_options_dict,
-            "provider": provider,
-            "model": model,
-        },
+        "config": batch_config,
         "tables": tables_results,
         "summary": {
             "total_tables": len(expanded_tasks),
@@ -597,11 +848,21 @@ def run_batch(
         "evaluation": None,
         "error": None,
     }
-
-    # Save result (flat format: output_dir/{run_id}.json)
-    output_path = output_dir / f"{run_id}.json"
-    with open(output_path, "w") as f:
-        json.dump(result, f, indent=2, default=str)
+    if shard is not None:
+        result["shard"] = {"index": shard[0], "count": shard[1], "plan": plan}
+
+    # Save result (flat format: output_dir/{run_id}.json, or the shard's file)
+    result_dir = output_dir / SHARDS_DIR if shard else output_dir
+    result_dir.mkdir(parents=True, exist_ok=True)
+    output_path = result_dir / f"{output_name}.json"
+    write_trace_file(
+        output_path,
+        result,
+        intern=config.storage.trace_interning,
+        compression=config.storage.trace_compression,
+    )
+    if final_status == "completed":
+        checkpoint.remove()
 
     printer.print_batch_summary(
         len(expanded_tasks),
@@ -611,10 +872,129 @@ def run_batch(
         elapsed_time,
         output_path,
     )
+    if final_status == "cancelled":
+        shard_arg = f" --shard {shard[0]}/{shard[1]}" if shard else ""
+        print(f"  Batch cancelled; continue with --resume {run_id}{shard_arg}")
 
     return result
 
 
+def merge_shards(
+    shard_paths: list[Path], output_dir: Path, config: Config
+) -> dict[str, Any]:
+    """Combine the partial files of a sharded batch into one batch result.
+
+    Writes the per-table run files and ``{run_id}.json`` exactly as a
+    single-host run of the whole plan would. Timing fields are the sum of the
+    shards' times, not the wall-clock time of the parallel run.
+
+    Args:
+        shard_paths: Partial batch files, one per shard (any order)
+        output_dir: Directory for the merged files
+        config: Application configuration (trace storage options)
+
+    Returns:
+        Merged batch result dictionary
+
+    Raises:
+        ValueError: If the files are not the complete set of shards of one batch
+    """
+    shards = [read_trace_file(path) for path in shard_paths]
+    for path, shard in zip(shard_paths, shards, strict=True):
+        if "shard" not in shard:
+            raise ValueError(f"{path} is not a shard result")
+
+    first = shards[0]
+    run_id = first["run_id"]
+    count = first["shard"]["count"]
+    for shard in shards:
+        if shard["run_id"] != run_id or shard["shard"]["count"] != count:
+            raise ValueError("Shard files belong to different batches")
+        if shard["config"] != first["config"] or shard["shard"]["plan"] != first["shard"]["plan"]:
+            raise ValueError(f"Shard {shard['shard']['index']} ran with different settings")
+    indices = sorted(shard["shard"]["index"] for shard in shards)
+    if indices != list(range(1, count + 1)):
+        raise ValueError(f"Expected shards 1..{count}, got {indices}")
+
+    # Collect every shard's table entries by table filename
+    entries: dict[str, list[dict[str, Any]]] = {}
+    for shard in shards:
+        for entry in shard["tables"]:
+            entries.setdefault(entry["table_id"], []).append(entry)
+
+    cancelled = any(shard["status"] == "cancelled" for shard in shards)
+    timestamp = run_id.removeprefix("batch_")
+    batch_config = first["config"]
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tables_results: list[dict[str, Any]] = []
+    completed_tables = 0
+    total_columns = 0
+    completed_columns = 0
+    for table_filename, columns in first["shard"]["plan"]:
+        parts = entries.get(table_filename)
+        if not parts:
+            continue
+        by_column = {c["column_name"]: c for part in parts for c in part["columns"]}
+        columns_results = [by_column[c] for c in columns if c in by_column]
+        completed = sum(1 for c in columns_results if c["status"] == "completed")
+        status = compute_table_status(completed, len(columns), cancelled)
+        if status == "completed":
+            completed_tables += 1
+        total_columns += len(columns)
+        completed_columns += completed
+
+        table_run_id = f"run_{timestamp}_{table_filename.replace('.csv', '')}"
+        table_result, table_entry = build_table_result(
+            table_run_id,
+            batch_config,
+            parts[0],
+            columns,
+            columns_results,
+            status,
+            sum(part["summary"]["total_time_ms"] for part in parts),
+            sum(part["summary"]["total_tokens"] for part in parts),
+        )
+        write_trace_file(
+            output_dir / f"{table_run_id}.json",
+            table_result,
+            intern=config.storage.trace_interning,
+            compression=config.storage.trace_compression,
+        )
+        tables_results.append(table_entry)
+
+    def total(key: str) -> int:
+        return sum(shard["summary"][key] for shard in shards)
+
+    result = {
+        "run_id": run_id,
+        "created_at": min(shard["created_at"] for shard in shards),
+        "completed_at": max(shard["completed_at"] for shard in shards),
+        "status": compute_batch_status(completed_tables, len(tables_results), cancelled),
+        "config": batch_config,
+        "tables": tables_results,
+        "summary": {
+            "total_tables": len(tables_results),
+            "completed_tables": completed_tables,
+            "total_columns": total_columns,
+            "completed_columns": completed_columns,
+            "total_time_ms": total("total_time_ms"),
+            "total_tokens": total("total_tokens"),
+            "total_input_tokens": total("total_input_tokens"),
+            "total_output_tokens": total("total_output_tokens"),
+        },
+        "evaluation": None,
+        "error": None,
+    }
+    write_trace_file(
+        output_dir / f"{run_id}.json",
+        result,
+        intern=config.storage.trace_interning,
+        compression=config.storage.trace_compression,
+    )
+    return result
+
+
 def cmd_config(args: argparse.Namespace) -> None:
     """Handle 'config' subcommand."""
     config_path = Path(args.config_file)
@@ -657,24 +1037,35 @@ def cmd_config(args: argparse.Namespace) -> None:
     else:
         output_dir = config_path.parent
 
+    cancel_token = CancellationToken()
     try:
-        run_batch(
-            config=app_config,
-            tasks=tasks,
-            ontology_id=ontology_id,
-            mode=mode,
-            prompt_type=prompt_type,
-            max_depth=max_depth,
-            k=k,
-            output_dir=output_dir,
-            verbose=not args.quiet,
-        )
+        with cancel_on_interrupt(cancel_token):
+            result = run_batch(
+                config=app_config,
+                tasks=tasks,
+                ontology_id=ontology_id,
+                mode=mode,
+                prompt_type=prompt_type,
+                max_depth=max_depth,
+                k=k,
+                output_dir=output_dir,
+                verbose=not args.quiet,
+                run_id=args.resume,
+                cancel_token=cancel_token,
+                shard=args.shard,
+                batch_id=args.batch_id,
+            )
+    except KeyboardInterrupt:
+        print("\nAborted", file=sys.stderr)
+        sys.exit(EXIT_INTERRUPTED)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    if result["status"] == "cancelled":
+        sys.exit(EXIT_INTERRUPTED)
 
 
 def cmd_run(args: argparse.Namespace) -> None:
@@ -690,7 +1081,9 @@ def cmd_run(args: argparse.Namespace) -> None:
 
     # Build tasks from command line
     tables_dir = get_absolute_path(app_config.paths.tables)
-    table_registry = TableRegistry.load(tables_dir)
+    table_registry = TableRegistry.load(
+        tables_dir, app_config.storage.table_format, get_catalog_path(app_config)
+    )
     table_registry.sync_with_directory()
 
     tasks = []
@@ -727,24 +1120,85 @@ def cmd_run(args: argparse.Namespace) -> None:
     else:
         output_dir = get_absolute_path(app_config.paths.runs)
 
+    cancel_token = CancellationToken()
     try:
-        run_batch(
-            config=app_config,
-            tasks=tasks,
-            ontology_id=args.ontology,
-            mode=mode,
-            prompt_type=prompt_type,
-            max_depth=max_depth,
-            k=k,
-            output_dir=output_dir,
-            verbose=not args.quiet,
-        )
+        with cancel_on_interrupt(cancel_token):
+            result = run_batch(
+                config=app_config,
+                tasks=tasks,
+                ontology_id=args.ontology,
+                mode=mode,
+                prompt_type=prompt_type,
+                max_depth=max_depth,
+                k=k,
+                output_dir=output_dir,
+                verbose=not args.quiet,
+                run_id=args.resume,
+                cancel_token=cancel_token,
+                shard=args.shard,
+                batch_id=args.batch_id,
+            )
+    except KeyboardInterrupt:
+        print("\nAborted", file=sys.stderr)
+        sys.exit(EXIT_INTERRUPTED)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    if result["status"] == "cancelled":
+        sys.exit(EXIT_INTERRUPTED)
+
+
+def cmd_merge(args: argparse.Namespace) -> None:
+    """Handle 'merge' subcommand."""
+    shard_paths = [Path(path) for path in args.shard_files]
+    missing = [path for path in shard_paths if not path.exists()]
+    if missing:
+        print(f"Error: Shard file not found: {missing[0]}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+    else:
+        # Next to the shards directory the shard files were written to
+        output_dir = shard_paths[0].parent
+        if output_dir.name == SHARDS_DIR:
+            output_dir = output_dir.parent
+    try:
+        result = merge_shards(shard_paths, output_dir, load_config())
+    except (ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    summary = result["summary"]
+    print(f"Merged {len(shard_paths)} shards into {output_dir / (result['run_id'] + '.json')}")
+    print(f"  Tables: {summary['completed_tables']}/{summary['total_tables']} completed")
+    print(f"  Columns: {summary['completed_columns']}/{summary['total_columns']} completed")
+
+
+def shard_arg(value: str) -> tuple[int, int]:
+    """argparse type for ``--shard i/N``."""
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def add_shard_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --shard / --batch-id options to a subcommand."""
+    parser.add_argument(
+        "--shard",
+        type=shard_arg,
+        metavar="I/N",
+        help="Annotate only the I-th of N cost-balanced shards (combine with 'merge')",
+    )
+    parser.add_argument(
+        "--batch-id",
+        type=str,
+        help="Batch ID shared by all shards (run ID becomes batch_<ID>)",
+    )
 
 
 def main() -> None:
@@ -778,6 +1232,14 @@ Example config file (batch.yaml):
 
 Example usage:
   saed-run-batch config experiments/exp001/batch.yaml
+
+  # Resume an interrupted batch
+  saed-run-batch config experiments/exp001/batch.yaml --resume batch_20250101_120000
+
+  # Split across two machines, then merge the shard files
+  saed-run-batch config batch.yaml --shard 1/2 --batch-id exp001   # host A
+  saed-run-batch config batch.yaml --shard 2/2 --batch-id exp001   # host B
+  saed-run-batch merge shards/batch_exp001.shard-*-of-2.json
         """,
     )
     config_parser.add_argument(
@@ -806,6 +1268,13 @@ Example usage:
         action="store_true",
         help="Suppress detailed output",
     )
+    config_parser.add_argument(
+        "--resume",
+        type=str,
+        metavar="RUN_ID",
+        help="Resume an interrupted batch, skipping completed columns and steps",
+    )
+    add_shard_arguments(config_parser)
 
     # 'run' subcommand
     run_parser = subparsers.add_parser(
@@ -896,6 +1365,35 @@ Examples:
         action="store_true",
         help="Suppress detailed output",
     )
+    run_parser.add_argument(
+        "--resume",
+        type=str,
+        metavar="RUN_ID",
+        help="Resume an interrupted batch, skipping completed columns and steps",
+    )
+    add_shard_arguments(run_parser)
+
+    # 'merge' subcommand
+    merge_parser = subparsers.add_parser(
+        "merge",
+        help="Combine the shard files of a sharded batch",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Example usage:
+  saed-run-batch merge runs/shards/batch_exp001.shard-1-of-2.json runs/shards/batch_exp001.shard-2-of-2.json
+        """,
+    )
+    merge_parser.add_argument(
+        "shard_files",
+        type=str,
+        nargs="+",
+        help="Shard result files (batch_<ID>.shard-I-of-N.json), one per shard",
+    )
+    merge_parser.add_argument(
+        "--output-dir",
+        type=str,
+        help="Output directory (default: the one the first shard file was written to)",
+    )
 
     args = parser.parse_args()
 
@@ -903,6 +1401,8 @@ Examples:
         cmd_config(args)
     elif args.command == "run":
         cmd_run(args)
+    elif args.command == "merge":
+        cmd_merge(args)
     else:
         parser.print_help()
         sys.exit(1)
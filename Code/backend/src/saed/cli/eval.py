@@ -7,69 +7,10 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from saed.core.config.settings import get_absolute_path, load_config
-from saed.core.evaluator import node_level_f1_precision_recall, path_level_f1_precision_recall
-from saed.core.labels import LabelsRegistry, load_labels_file, parse_labels_to_paths, paths_to_string
-
-
-def compute_column_metrics(
-    pred_paths: list[list[str]], gt_paths: list[list[str]]
-) -> dict[str, float]:
-    """Compute path-level and node-level metrics for a single column.
-
-    Args:
-        pred_paths: List of predicted paths
-        gt_paths: List of ground truth paths
-
-    Returns:
-        Dict with path_precision, path_recall, path_f1,
-        node_precision, node_recall, node_f1
-    """
-    # Path-level metrics
-    pred_set = {tuple(p) for p in pred_paths}
-    gt_set = {tuple(p) for p in gt_paths}
-
-    path_tp = len(pred_set.intersection(gt_set))
-    path_fp = len(pred_set - gt_set)
-    path_fn = len(gt_set - pred_set)
-
-    path_precision = path_tp / (path_tp + path_fp) if (path_tp + path_fp) > 0 else 0.0
-    path_recall = path_tp / (path_tp + path_fn) if (path_tp + path_fn) > 0 else 0.0
-    path_f1 = (
-        2 * (path_precision * path_recall) / (path_precision + path_recall)
-        if (path_precision + path_recall) > 0
-        else 0.0
-    )
-
-    # Node-level metrics
-    pred_nodes = set()
-    for path in pred_paths:
-        pred_nodes.update(path)
-
-    gt_nodes = set()
-    for path in gt_paths:
-        gt_nodes.update(path)
-
-    node_tp = len(pred_nodes.intersection(gt_nodes))
-    node_fp = len(pred_nodes - gt_nodes)
-    node_fn = len(gt_nodes - pred_nodes)
-
-    node_precision = node_tp / (node_tp + node_fp) if (node_tp + node_fp) > 0 else 0.0
-    node_recall = node_tp / (node_tp + node_fn) if (node_tp + node_fn) > 0 else 0.0
-    node_f1 = (
-        2 * (node_precision * node_recall) / (node_precision + node_recall)
-        if (node_precision + node_recall) > 0
-        else 0.0
-    )
-
-    return {
-        "path_precision": round(path_precision, 4),
-        "path_recall": round(path_recall, 4),
-        "path_f1": round(path_f1, 4),
-        "node_precision": round(node_precision, 4),
-        "node_recall": round(node_recall, 4),
-        "node_f1": round(node_f1, 4),
-    }
+from saed.core.batches import load_batch_file
+from saed.core.config.settings import get_absolute_path, get_catalog_path, load_config
+from saed.core.evaluator import evaluate_columns
+from saed.core.labels import LabelsRegistry, paths_to_string
 
 
 def print_metrics(
@@ -147,8 +88,7 @@ Examples:
         sys.exit(1)
 
     # Load batch data
-    with open(batch_path, encoding="utf-8") as f:
-        batch_data = json.load(f)
+    batch_data = load_batch_file(batch_path)
 
     run_id = batch_data.get("run_id", batch_path.stem)
     batch_config = batch_data.get("config", {})
@@ -157,7 +97,7 @@ Examples:
         print(f"Evaluating: {run_id}")
 
     # Resolve labels file
-    labels_registry = LabelsRegistry.load(labels_dir)
+    labels_registry = LabelsRegistry.load(labels_dir, get_catalog_path(config))
     labels_path = labels_registry.get_file_path(args.labels)
 
     if labels_path is None:
@@ -173,7 +113,7 @@ Examples:
         print(f"  Labels: {labels_path.name}")
 
     # Load labels
-    df_labels = load_labels_file(labels_path)
+    labels_index = labels_registry.get_index(labels_path)
 
     # Build evaluation data from batch
     eval_columns = []
@@ -197,22 +137,14 @@ Examples:
             pred_paths = col_data.get("final_paths", [])
 
             # Get ground truth for this column
-            mask = (df_labels["table_id"] == table_id) & (
-                (df_labels["column_id"] == col_idx) | (df_labels["column_name"] == column_name)
-            )
+            gt_paths = labels_index.match(table_id, col_idx, column_name)
 
-            if not mask.any():
+            if gt_paths is None:
                 skipped_columns += 1
                 if not args.quiet:
                     print(f"  Warning: No labels for {table_id}:{column_name}")
                 continue
 
-            label_row = df_labels[mask].iloc[0]
-            gt_paths = parse_labels_to_paths(label_row)
-
-            # Compute column metrics
-            metrics = compute_column_metrics(pred_paths, gt_paths)
-
             eval_columns.append({
                 "table_id": table_id,
                 "table_name": table_name,
@@ -220,7 +152,6 @@ Examples:
                 "column_name": column_name,
                 "pred_paths": pred_paths,
                 "gt_paths": gt_paths,
-                **metrics,
             })
             evaluated_columns += 1
 
@@ -231,20 +162,19 @@ Examples:
     if not args.quiet:
         print(f"  Columns: {evaluated_columns} evaluated, {skipped_columns} skipped")
 
-    # Compute aggregate metrics
-    eval_data_for_metrics = [
-        {"pred_paths": c["pred_paths"], "gt_paths": c["gt_paths"]}
-        for c in eval_columns
-    ]
-
-    path_metrics = path_level_f1_precision_recall(eval_data_for_metrics)
-    node_metrics = node_level_f1_precision_recall(eval_data_for_metrics)
+    # Compute column and aggregate metrics in one pass
+    evaluation = evaluate_columns(
+        ((c["pred_paths"], c["gt_paths"]) for c in eval_columns),
+        [c["table_id"] for c in eval_columns],
+    )
+    for col, metrics in zip(eval_columns, evaluation.column_metrics(), strict=True):
+        col.update(metrics)
 
     # Print results
     if not args.quiet:
         print("\nMetrics:")
-        print_metrics("Path-Level", *path_metrics)
-        print_metrics("Node-Level", *node_metrics)
+        print_metrics("Path-Level", *evaluation.path.summary())
+        print_metrics("Node-Level", *evaluation.node.summary())
 
     # Determine output directory
     if args.output_dir:
@@ -276,24 +206,9 @@ Examples:
             "evaluated_columns": evaluated_columns,
             "skipped_columns": skipped_columns,
         },
-        "metrics": {
-            "path_level": {
-                "macro_precision": round(path_metrics[0], 4),
-                "macro_recall": round(path_metrics[1], 4),
-                "macro_f1": round(path_metrics[2], 4),
-                "micro_precision": round(path_metrics[3], 4),
-                "micro_recall": round(path_metrics[4], 4),
-                "micro_f1": round(path_metrics[5], 4),
-            },
-            "node_level": {
-                "macro_precision": round(node_metrics[0], 4),
-                "macro_recall": round(node_metrics[1], 4),
-                "macro_f1": round(node_metrics[2], 4),
-                "micro_precision": round(node_metrics[3], 4),
-                "micro_recall": round(node_metrics[4], 4),
-                "micro_f1": round(node_metrics[5], 4),
-            },
-        },
+        "metrics": evaluation.metrics(),
+        "level_metrics": evaluation.level_metrics(),
+        "table_metrics": evaluation.table_metrics(),
         "performance": {
             "total_time_ms": batch_data.get("summary", {}).get("total_time_ms", 0),
             "avg_time_per_column_ms": (
@@ -372,8 +287,8 @@ Examples:
     # Return summary for programmatic use
     return {
         "run_id": run_id,
-        "path_macro_f1": path_metrics[2],
-        "node_macro_f1": node_metrics[2],
+        "path_macro_f1": evaluation.path.summary()[2],
+        "node_macro_f1": evaluation.node.summary()[2],
         "evaluated_columns": evaluated_columns,
         "output_files": [str(f) for f in output_files],
     }
@@ -0,0 +1,41 @@
+"""Ctrl-C handling shared by the annotation CLIs."""
+
+from __future__ import annotations
+
+import signal
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from saed.core.executor import CancellationToken
+
+# Exit status of a run stopped with Ctrl-C (128 + SIGINT)
+EXIT_INTERRUPTED = 130
+
+
+@contextmanager
+def cancel_on_interrupt(token: CancellationToken) -> Iterator[None]:
+    """Turn the first Ctrl-C into a cooperative cancellation of ``token``.
+
+    The executor then stops before its next LLM request and the caller saves
+    the partial results. A second Ctrl-C raises KeyboardInterrupt as usual.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def handle_sigint(signum, frame) -> None:
+        if token.cancelled:
+            raise KeyboardInterrupt
+        token.cancel()
+        print(
+            "\nCancelling after the current LLM request (press Ctrl-C again to abort)...",
+            file=sys.stderr,
+        )
+
+    previous = signal.signal(signal.SIGINT, handle_sigint)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous)
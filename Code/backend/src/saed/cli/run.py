@@ -3,25 +3,33 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
-
+from saed.cli.interrupt import EXIT_INTERRUPTED, cancel_on_interrupt
 from saed.core.config.settings import (
     SUPPORTED_PROVIDERS,
     Config,
     get_absolute_path,
+    get_catalog_path,
     get_provider_model,
     load_config,
 )
-from saed.core.executor import ColumnResultDetail, RunExecutor
+from saed.core.executor import (
+    CancellationToken,
+    ColumnResultDetail,
+    RunCancelled,
+    RunCheckpoint,
+    RunExecutor,
+    checkpoint_path,
+)
 from saed.core.ontology import OntologyDAG, OntologyRegistry
-from saed.core.table import TableRegistry
+from saed.core.table import TableRegistry, render_table_markdown
+from saed.core.utils.traces import write_trace_file
 
 
 class TerminalPrinter:
@@ -238,12 +246,14 @@ def column_result_to_dict(result: ColumnResultDetail) -> dict[str, Any]:
                 "input_tokens": step.llm_response.input_tokens,
                 "output_tokens": step.llm_response.output_tokens,
                 "total_tokens": step.llm_response.total_tokens,
+                "provider": step.llm_response.provider,
             }
 
         if step.edm_result:
             step_dict["edm_result"] = {
                 "consensus_threshold": step.edm_result.consensus_threshold,
                 "total_agents": step.edm_result.total_agents,
+                "seed": step.edm_result.seed,
                 "votes_summary": [
                     {
                         "class_name": v.class_name,
@@ -281,6 +291,7 @@ def column_result_to_dict(result: ColumnResultDetail) -> dict[str, Any]:
                                 "input_tokens": a.llm_response.input_tokens,
                                 "output_tokens": a.llm_response.output_tokens,
                                 "total_tokens": a.llm_response.total_tokens,
+                                "provider": a.llm_response.provider,
                             }
                             if a.llm_response
                             else None
@@ -312,9 +323,19 @@ def run_single_table(
     k: int,
     output_dir: Path,
     verbose: bool = True,
+    run_id: str | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> dict[str, Any]:
     """Run annotation on a single table.
 
+    Progress is checkpointed to ``output_dir/checkpoints/{run_id}.jsonl`` after
+    every BFS step, and the checkpoint is removed once all columns complete.
+
+    Args:
+        run_id: Resume this interrupted run instead of starting a new one
+        cancel_token: Stops the run before its next LLM request; the partial
+            result is saved with status ``cancelled``
+
     Returns:
         Run result dictionary
     """
@@ -322,10 +343,12 @@ def run_single_table(
     tables_dir = get_absolute_path(config.paths.tables)
     ontologies_dir = get_absolute_path(config.paths.ontologies)
 
-    table_registry = TableRegistry.load(tables_dir)
+    table_registry = TableRegistry.load(
+        tables_dir, config.storage.table_format, get_catalog_path(config)
+    )
     table_registry.sync_with_directory()
 
-    ontology_registry = OntologyRegistry.load(ontologies_dir)
+    ontology_registry = OntologyRegistry.load(ontologies_dir, get_catalog_path(config))
     ontology_registry.sync_with_directory()
 
     # Resolve table and ontology
@@ -344,9 +367,15 @@ def run_single_table(
     ontology_dag = OntologyDAG(str(ontology_path))
     ontology_dag.build_dag()
 
-    # Load table and create markdown preview
-    df = pd.read_csv(table_path)
-    table_markdown = df.head(k).to_markdown(index=False)
+    # Markdown preview of each column, sampled without loading the table
+    table_entry = table_registry.get(table_registry_id)
+    render_preview = partial(
+        render_table_markdown,
+        table_path,
+        k,
+        file_hash=table_entry.file_hash if table_entry else "",
+        **config.defaults.sampling.model_dump(),
+    )
 
     # Get provider and model info
     provider = config.llm.active_provider
@@ -372,10 +401,26 @@ def run_single_table(
     )
 
     # Create run ID and ensure output directory exists
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_id = f"run_{timestamp}"
+    if run_id is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        run_id = f"run_{timestamp}"
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Record run parameters so an interrupted run can be resumed
+    checkpoint = RunCheckpoint(checkpoint_path(output_dir, run_id))
+    checkpoint.write_header({
+        "created_at": datetime.now().isoformat(),
+        "table_id": table_filename,
+        "ontology_id": ontology_filename,
+        "columns": columns,
+        "mode": mode,
+        "prompt_type": prompt_type,
+        "max_depth": max_depth,
+        "k": k,
+        "provider": provider,
+        "model": model,
+    })
+
     # Create SSE callback for terminal output
     def terminal_callback(event_type: str, data: dict[str, Any]) -> None:
         if event_type == "step":
@@ -387,6 +432,7 @@ def run_single_table(
         edm_options = config.defaults.edm_options
 
     # Create executor
+    cancel_token = cancel_token or CancellationToken()
     executor = RunExecutor(
         config=config,
         mode=mode,
@@ -395,6 +441,7 @@ def run_single_table(
         max_depth=max_depth,
         k=k,
         sse_callback=terminal_callback,
+        cancel_token=cancel_token,
     )
 
     # Execute annotation for each column
@@ -404,29 +451,50 @@ def run_single_table(
     failed_count = 0
 
     for idx, column_name in enumerate(columns, start=1):
+        if cancel_token.cancelled:
+            break
         printer.print_column_start(idx, len(columns), column_name)
 
-        result = executor.execute_column(
-            table_name=table_name,
-            table_markdown=table_markdown,
-            column_name=column_name,
-            ontology_dag=ontology_dag,
-            run_id=run_id,
-        )
-
-        columns_results.append(column_result_to_dict(result))
-
-        if result.status == "completed":
+        column_dict = checkpoint.completed_column(column_name)
+        if column_dict is not None:
+            # Completed by an earlier attempt: replay it from the checkpoint
+            for step in column_dict["steps"]:
+                printer.print_step(step)
+        else:
+            try:
+                result = executor.execute_column(
+                    table_name=table_name,
+                    table_markdown=render_preview(column=column_name),
+                    column_name=column_name,
+                    ontology_dag=ontology_dag,
+                    run_id=run_id,
+                    selection_cache=checkpoint.selections(column_name),
+                    on_selection=partial(checkpoint.record_selection, column_name),
+                )
+            except RunCancelled as e:
+                if e.partial and e.partial.steps:
+                    columns_results.append(column_result_to_dict(e.partial))
+                break
+            column_dict = column_result_to_dict(result)
+            checkpoint.record_column(column_name, column_dict)
+
+        columns_results.append(column_dict)
+
+        if column_dict["status"] == "completed":
             completed_count += 1
         else:
             failed_count += 1
 
-        printer.print_column_complete(column_name, result.final_paths, result.status)
+        printer.print_column_complete(
+            column_name, column_dict["final_paths"], column_dict["status"]
+        )
 
     elapsed_time = time.time() - start_time
 
     # Determine final status
-    if failed_count == len(columns):
+    if cancel_token.cancelled:
+        final_status = "cancelled"
+    elif failed_count == len(columns):
         final_status = "failed"
     elif failed_count > 0:
         final_status = "partial"
@@ -440,12 +508,14 @@ def run_single_table(
             "classes_per_agent": edm_options.classes_per_agent,
             "agents_per_class": edm_options.agents_per_class,
             "consensus_threshold": edm_options.consensus_threshold,
+            "seed": edm_options.seed,
+            "token_budget": edm_options.token_budget,
         }
 
     # Build result (matching API format)
     result = {
         "run_id": run_id,
-        "created_at": datetime.now().isoformat(),
+        "created_at": checkpoint.header["created_at"],
         "completed_at": datetime.now().isoformat(),
         "status": final_status,
         "config": {
@@ -479,10 +549,18 @@ def run_single_table(
 
     # Save result (flat format: output_dir/{run_id}.json)
     output_path = output_dir / f"{run_id}.json"
-    with open(output_path, "w") as f:
-        json.dump(result, f, indent=2, default=str)
+    write_trace_file(
+        output_path,
+        result,
+        intern=config.storage.trace_interning,
+        compression=config.storage.trace_compression,
+    )
+    if final_status == "completed":
+        checkpoint.remove()
 
     printer.print_summary(len(columns), completed_count, elapsed_time, output_path)
+    if final_status == "cancelled":
+        print(f"  Run cancelled; continue with: saed-run --resume {run_id}")
 
     return result
 
@@ -505,19 +583,20 @@ Examples:
 
   # Use EDM mode with custom parameters
   saed-run --table 28.csv --ontology BEO.rdf --all-columns --mode edm --max-depth 4
+
+  # Resume an interrupted run (same --output-dir as the original run)
+  saed-run --resume run_20250101_120000
         """,
     )
 
     parser.add_argument(
         "--table",
         type=str,
-        required=True,
         help="Table filename or registry ID (e.g., 28.csv)",
     )
     parser.add_argument(
         "--ontology",
         type=str,
-        required=True,
         help="Ontology filename or registry ID (e.g., BEO.rdf)",
     )
     parser.add_argument(
@@ -574,9 +653,62 @@ Examples:
         action="store_true",
         help="Suppress detailed step output",
     )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        metavar="RUN_ID",
+        help="Resume an interrupted run, skipping completed columns and steps",
+    )
 
     args = parser.parse_args()
 
+    # Load configuration
+    config = load_config()
+
+    # Determine output directory
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+    else:
+        output_dir = get_absolute_path(config.paths.runs)
+
+    if args.resume:
+        checkpoint = RunCheckpoint(checkpoint_path(output_dir, args.resume))
+        header = checkpoint.header
+        if header is None:
+            parser.error(f"No checkpoint for run {args.resume} in {output_dir}")
+        config.llm.active_provider = header["provider"]
+        provider_config = getattr(config.llm.providers, header["provider"])
+        provider_config.default_model = header["model"]
+        cancel_token = CancellationToken()
+        try:
+            with cancel_on_interrupt(cancel_token):
+                result = run_single_table(
+                    config=config,
+                    table_id=header["table_id"],
+                    ontology_id=header["ontology_id"],
+                    columns=header["columns"],
+                    mode=header["mode"],
+                    prompt_type=header["prompt_type"],
+                    max_depth=header["max_depth"],
+                    k=header["k"],
+                    output_dir=output_dir,
+                    verbose=not args.quiet,
+                    run_id=args.resume,
+                    cancel_token=cancel_token,
+                )
+        except KeyboardInterrupt:
+            print("\nAborted", file=sys.stderr)
+            sys.exit(EXIT_INTERRUPTED)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if result["status"] == "cancelled":
+            sys.exit(EXIT_INTERRUPTED)
+        return
+
+    if not args.table or not args.ontology:
+        parser.error("--table and --ontology are required")
+
     # Validate column specification
     if not args.columns and not args.all_columns:
         parser.error("Must specify --columns or --all-columns")
@@ -584,9 +716,6 @@ Examples:
     if args.columns and args.all_columns:
         parser.error("Cannot specify both --columns and --all-columns")
 
-    # Load configuration
-    config = load_config()
-
     # Apply provider/model overrides
     if args.provider:
         config.llm.active_provider = args.provider
@@ -600,32 +729,34 @@ Examples:
     max_depth = args.max_depth or config.defaults.max_depth
     k = args.k or config.defaults.k
 
-    # Determine output directory
-    if args.output_dir:
-        output_dir = Path(args.output_dir)
-    else:
-        output_dir = get_absolute_path(config.paths.runs)
-
-    # Run annotation
+    # Run annotation (first Ctrl-C cancels gracefully and saves partial results)
+    cancel_token = CancellationToken()
     try:
-        run_single_table(
-            config=config,
-            table_id=args.table,
-            ontology_id=args.ontology,
-            columns=args.columns or [],  # Empty list means all columns
-            mode=mode,
-            prompt_type=prompt_type,
-            max_depth=max_depth,
-            k=k,
-            output_dir=output_dir,
-            verbose=not args.quiet,
-        )
+        with cancel_on_interrupt(cancel_token):
+            result = run_single_table(
+                config=config,
+                table_id=args.table,
+                ontology_id=args.ontology,
+                columns=args.columns or [],  # Empty list means all columns
+                mode=mode,
+                prompt_type=prompt_type,
+                max_depth=max_depth,
+                k=k,
+                output_dir=output_dir,
+                verbose=not args.quiet,
+                cancel_token=cancel_token,
+            )
+    except KeyboardInterrupt:
+        print("\nAborted", file=sys.stderr)
+        sys.exit(EXIT_INTERRUPTED)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    if result["status"] == "cancelled":
+        sys.exit(EXIT_INTERRUPTED)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,19 @@
 """Batch file loader utilities."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+from saed.core.utils.traces import read_trace_file
+
 logger = logging.getLogger(__name__)
 
 
 def load_batch_file(file_path: Path) -> dict[str, Any]:
     """Load a batch JSON file.
 
+    Compressed and fragment-interned batch files are decoded transparently.
+
     Args:
         file_path: Path to the batch JSON file
 
@@ -24,8 +27,7 @@ def load_batch_file(file_path: Path) -> dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f"Batch file not found: {file_path}")
 
-    with open(file_path, encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_trace_file(file_path)
 
     logger.debug(f"Loaded batch file: {file_path}")
     return data
@@ -1,13 +1,16 @@
 """Batch registry for managing experiment batch result files."""
 
-import hashlib
-import json
 import logging
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
+
+from saed.core.catalog import get_catalog
+from saed.core.utils.files import compute_file_hash
+from saed.core.utils.registry_store import SharedRegistry
+from saed.core.utils.traces import read_trace_file
 
 logger = logging.getLogger(__name__)
 
@@ -73,43 +76,39 @@ class BatchEntry:
 
 
 @dataclass
-class BatchRegistry:
-    """Registry for managing experiment batch result files."""
+class BatchRegistry(SharedRegistry):
+    """Registry for managing experiment batch result files.
+
+    Shared per batches directory within a process; see :class:`SharedRegistry`.
+    """
+
+    _entry_type: ClassVar[type] = BatchEntry
+    _entries_field: ClassVar[str] = "batches"
 
     batches: dict[str, BatchEntry] = field(default_factory=dict)
     _registry_path: Path | None = field(default=None, repr=False)
     _batches_dir: Path | None = field(default=None, repr=False)
 
     @classmethod
-    def load(cls, batches_dir: Path) -> "BatchRegistry":
-        """Load registry from JSON file or create new one."""
-        registry_path = batches_dir / "registry.json"
-        registry = cls(_registry_path=registry_path, _batches_dir=batches_dir)
-
-        if registry_path.exists():
-            try:
-                with open(registry_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                for entry_data in data.get("batches", []):
-                    entry = BatchEntry.from_dict(entry_data)
-                    registry.batches[entry.id] = entry
-                logger.debug(f"Loaded batch registry with {len(registry.batches)} entries")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to load batch registry: {e}, creating new one")
+    def load(cls, batches_dir: Path, catalog: Path | None = None) -> "BatchRegistry":
+        """Get the registry of a directory, loading it from its JSON file.
 
-        return registry
+        The registry is kept in memory and only reloaded when its file (or
+        its catalog entries) changed.
 
-    def save(self) -> None:
-        """Save registry to JSON file."""
-        if self._registry_path is None:
-            raise ValueError("Registry path not set")
-
-        data = {"batches": [entry.to_dict() for entry in self.batches.values()]}
+        Args:
+            batches_dir: Directory of the batches files and the registry file
+            catalog: SQLite catalog to store the entries in instead of the file
+        """
+        store = get_catalog(catalog).store("batches") if catalog else None
+        return cls._shared(batches_dir / "registry.json", store, _batches_dir=batches_dir)
 
-        with open(self._registry_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _load_data(self, data: dict) -> None:
+        entries = [BatchEntry.from_dict(entry_data) for entry_data in data.get("batches", [])]
+        self.batches = {entry.id: entry for entry in entries}
 
-        logger.debug(f"Saved batch registry with {len(self.batches)} entries")
+    def _dump_data(self) -> dict:
+        return {"batches": [entry.to_dict() for entry in self.batches.values()]}
 
     def generate_id(self) -> str:
         """Generate a short unique ID for the batch file."""
@@ -120,11 +119,7 @@ class BatchRegistry:
 
     def compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA256 hash of file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return f"sha256:{sha256.hexdigest()[:16]}"
+        return compute_file_hash(file_path)
 
     def _extract_metadata(self, file_path: Path) -> dict[str, Any]:
         """Extract metadata from batch JSON file.
@@ -133,8 +128,7 @@ class BatchRegistry:
             Dict with run_id, config, total_tables, total_columns, completed_columns
         """
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_trace_file(file_path, expand=False)
 
             run_id = data.get("run_id", "")
             config_data = data.get("config", {})
@@ -165,6 +159,7 @@ class BatchRegistry:
         name: str = "",
         description: str = "",
         custom_id: str | None = None,
+        file_hash: str | None = None,
     ) -> BatchEntry:
         """Register a new batch file.
 
@@ -173,6 +168,7 @@ class BatchRegistry:
             name: Display name
             description: Description
             custom_id: Optional custom ID
+            file_hash: Content hash, if already computed (e.g. while uploading)
 
         Returns:
             The created BatchEntry
@@ -184,11 +180,9 @@ class BatchRegistry:
         if not file_path.exists():
             raise FileNotFoundError(f"Batch file not found: {filename}")
 
-        # Generate or use custom ID
-        id_ = custom_id if custom_id else self.generate_id()
-
         # Compute file hash and extract metadata
-        file_hash = self.compute_file_hash(file_path)
+        if file_hash is None:
+            file_hash = self.compute_file_hash(file_path)
         metadata = self._extract_metadata(file_path)
 
         # Generate name from config if not provided
@@ -206,22 +200,26 @@ class BatchRegistry:
         # Use file's created_at or current time
         created_at = metadata["created_at"] or datetime.now().isoformat()
 
-        entry = BatchEntry(
-            id=id_,
-            filename=filename,
-            name=name,
-            description=description,
-            run_id=metadata["run_id"],
-            total_tables=metadata["total_tables"],
-            total_columns=metadata["total_columns"],
-            completed_columns=metadata["completed_columns"],
-            config=metadata["config"],
-            file_hash=file_hash,
-            created_at=created_at,
-        )
-
-        self.batches[id_] = entry
-        self.save()
+        with self._transaction():
+            # Generate or use custom ID
+            id_ = custom_id if custom_id else self.generate_id()
+
+            entry = BatchEntry(
+                id=id_,
+                filename=filename,
+                name=name,
+                description=description,
+                run_id=metadata["run_id"],
+                total_tables=metadata["total_tables"],
+                total_columns=metadata["total_columns"],
+                completed_columns=metadata["completed_columns"],
+                config=metadata["config"],
+                file_hash=file_hash,
+                created_at=created_at,
+            )
+
+            self.batches[id_] = entry
+            self.save()
 
         logger.info(f"Registered batch: {id_} -> {filename}")
         return entry
@@ -235,12 +233,13 @@ class BatchRegistry:
         Returns:
             True if removed, False if not found
         """
-        if id_ in self.batches:
+        with self._transaction():
+            if id_ not in self.batches:
+                return False
             del self.batches[id_]
             self.save()
-            logger.info(f"Unregistered batch: {id_}")
-            return True
-        return False
+        logger.info(f"Unregistered batch: {id_}")
+        return True
 
     def get(self, id_: str) -> BatchEntry | None:
         """Get batch entry by ID."""
@@ -248,10 +247,8 @@ class BatchRegistry:
 
     def get_by_filename(self, filename: str) -> BatchEntry | None:
         """Get batch entry by filename."""
-        for entry in self.batches.values():
-            if entry.filename == filename:
-                return entry
-        return None
+        entries = self._lookup("filename", filename)
+        return entries[0] if entries else None
 
     def list_all(self) -> list[BatchEntry]:
         """List all registered batches."""
@@ -295,6 +292,10 @@ class BatchRegistry:
         if self._batches_dir is None:
             raise ValueError("Batches directory not set")
 
+        with self._transaction():
+            return self._sync_with_directory()
+
+    def _sync_with_directory(self) -> dict[str, list[str]]:
         result = {"added": [], "removed": []}
 
         # Get all JSON files (excluding registry.json)
@@ -0,0 +1,5 @@
+"""Optional SQLite catalog of registries, runs and evaluations."""
+
+from saed.core.catalog.catalog import Catalog, CatalogStore, get_catalog, run_summary
+
+__all__ = ["Catalog", "CatalogStore", "get_catalog", "run_summary"]
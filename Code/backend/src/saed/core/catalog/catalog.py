@@ -0,0 +1,486 @@
+"""Embedded SQLite catalog of registered files, runs and evaluations.
+
+An optional backend (``storage.catalog = "sqlite"``) for the data that is
+otherwise spread over the ``registry.json`` files and the ``runs/``
+directory. The database runs in WAL mode, so API readers are not blocked by
+a writer, and writes are immediate transactions, so several processes may
+share it.
+
+- Registry entries are rows of ``entries`` keyed by (kind, id), with the
+  filename, category and content hash indexed. The registry classes keep
+  using their in-memory dicts; :class:`CatalogStore` loads and saves them,
+  writing only the entries that changed.
+- Runs are summarized in ``runs``, refreshed from the run files by
+  :meth:`Catalog.sync_runs`, which only rereads files whose fingerprint
+  changed. Listing runs is then one indexed query.
+- Evaluation results are stored in ``evaluations``, keyed by the content
+  hashes of the batch and labels files they were computed from.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from saed.core.utils.files import file_fingerprint
+from saed.core.utils.traces import read_trace_file
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    filename TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '',
+    file_hash TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_filename ON entries (kind, filename);
+CREATE INDEX IF NOT EXISTS idx_entries_category ON entries (kind, category);
+CREATE INDEX IF NOT EXISTS idx_entries_hash ON entries (kind, file_hash);
+CREATE TABLE IF NOT EXISTS versions (
+    kind TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    filename TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    valid INTEGER NOT NULL DEFAULT 1,
+    run_id TEXT NOT NULL DEFAULT '',
+    table_id TEXT NOT NULL DEFAULT '',
+    mode TEXT NOT NULL DEFAULT '',
+    prompt_type TEXT NOT NULL DEFAULT '',
+    column_count INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL DEFAULT '',
+    evaluation TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs (status);
+CREATE INDEX IF NOT EXISTS idx_runs_table_id ON runs (table_id);
+CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs (created_at);
+CREATE TABLE IF NOT EXISTS evaluations (
+    batch_hash TEXT NOT NULL,
+    labels_hash TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    labels_id TEXT NOT NULL,
+    evaluated_at TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (batch_hash, labels_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_run_id ON evaluations (run_id);
+"""
+
+# Catalogs opened by this process, by resolved database path
+_catalogs: dict[Path, "Catalog"] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(db_path: Path) -> "Catalog":
+    """Get the catalog of a database file, creating the database if needed."""
+    key = db_path.resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = Catalog(db_path)
+            _catalogs[key] = catalog
+    return catalog
+
+
+def run_summary(data: dict[str, Any]) -> dict[str, Any]:
+    """Get the fields of a run listing from a run file's content.
+
+    Raises:
+        KeyError: If the run has no ``run_id`` or ``created_at``
+    """
+    config = data.get("config", {})
+    return {
+        "run_id": data["run_id"],
+        "table_id": config.get("table_id", ""),
+        "mode": config.get("mode", "single"),
+        "prompt_type": config.get("prompt_type", "cot"),
+        "column_count": len(config.get("columns", [])),
+        "status": data.get("status", "unknown"),
+        "created_at": data["created_at"],
+        "evaluation": data.get("evaluation") or None,
+    }
+
+
+class Catalog:
+    """SQLite database of registry entries, run summaries and evaluations.
+
+    All methods block on SQLite; call them off the event loop in async code.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._stores: dict[str, CatalogStore] = {}
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            # Persistent: readers no longer wait for writers, nor writers for readers
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")  # Durable enough in WAL mode
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _use(self, conn: sqlite3.Connection | None) -> Iterator[sqlite3.Connection]:
+        if conn is not None:
+            yield conn
+        else:
+            with self._connect() as conn:
+                yield conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in an immediate (write-locked) transaction.
+
+        Other writers wait until it ends; readers see the previous state.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def store(self, kind: str) -> "CatalogStore":
+        """Get the store persisting the registry entries of ``kind``."""
+        with _catalogs_lock:
+            store = self._stores.get(kind)
+            if store is None:
+                store = CatalogStore(self, kind)
+                self._stores[kind] = store
+        return store
+
+    # Registry entries
+
+    def version(self, kind: str, conn: sqlite3.Connection | None = None) -> int:
+        """Get the version of the entries of ``kind``, increased by every write."""
+        with self._use(conn) as conn:
+            row = conn.execute("SELECT version FROM versions WHERE kind = ?", (kind,)).fetchone()
+        return row["version"] if row else 0
+
+    def load_entries(self, kind: str, conn: sqlite3.Connection | None = None) -> dict[str, str]:
+        """Get the serialized entries of ``kind`` by ID."""
+        with self._use(conn) as conn:
+            rows = conn.execute("SELECT id, data FROM entries WHERE kind = ?", (kind,))
+            return {row["id"]: row["data"] for row in rows}
+
+    def write_entries(
+        self,
+        conn: sqlite3.Connection,
+        kind: str,
+        upserts: list[tuple[str, str, str, str, str]],
+        deletes: list[str],
+    ) -> int:
+        """Insert, replace and delete entries of ``kind`` in a transaction.
+
+        Args:
+            conn: Connection of the transaction
+            kind: Registry the entries belong to
+            upserts: (id, filename, category, file_hash, data) of new or changed entries
+            deletes: IDs of removed entries
+
+        Returns:
+            The new version of the entries
+        """
+        conn.executemany(
+            "INSERT OR REPLACE INTO entries (kind, id, filename, category, file_hash, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(kind, *row) for row in upserts],
+        )
+        conn.executemany(
+            "DELETE FROM entries WHERE kind = ? AND id = ?", [(kind, id_) for id_ in deletes]
+        )
+        conn.execute(
+            "INSERT INTO versions (kind, version) VALUES (?, 1) "
+            "ON CONFLICT (kind) DO UPDATE SET version = version + 1",
+            (kind,),
+        )
+        return self.version(kind, conn)
+
+    def get_entry(self, kind: str, id_: str) -> dict[str, Any] | None:
+        """Get an entry of ``kind`` by ID."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM entries WHERE kind = ? AND id = ?", (kind, id_)
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def find_entries(
+        self,
+        kind: str,
+        filename: str | None = None,
+        category: str | None = None,
+        file_hash: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get the entries of ``kind`` matching all given fields, through the indexes."""
+        query = "SELECT data FROM entries WHERE kind = ?"
+        params: list[Any] = [kind]
+        for column, value in (("filename", filename), ("category", category), ("file_hash", file_hash)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+        with self._connect() as conn:
+            return [json.loads(row["data"]) for row in conn.execute(query + " ORDER BY id", params)]
+
+    # Runs
+
+    def sync_runs(self, runs_dir: Path) -> int:
+        """Update the run summaries from the run files of ``runs_dir``.
+
+        Only new files and files whose fingerprint changed are read; rows of
+        deleted files are removed. Files that cannot be read are recorded as
+        invalid, so they are not reread until they change.
+
+        Returns:
+            Number of files read
+        """
+        files = {f.name: f for f in runs_dir.glob("*.json")} if runs_dir.exists() else {}
+        with self._connect() as conn:
+            known = {
+                row["filename"]: row["fingerprint"]
+                for row in conn.execute("SELECT filename, fingerprint FROM runs")
+            }
+
+        rows = []
+        for name, path in files.items():
+            try:
+                fingerprint = file_fingerprint(path)
+            except FileNotFoundError:
+                continue
+            if known.get(name) != fingerprint:
+                rows.append(self._run_row(path, fingerprint))
+        removed = [(name,) for name in known.keys() - files.keys()]
+        if not rows and not removed:
+            return 0
+
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO runs (filename, fingerprint, valid, run_id, table_id, "
+                "mode, prompt_type, column_count, status, created_at, evaluation) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany("DELETE FROM runs WHERE filename = ?", removed)
+        logger.debug(f"Synced runs: {len(rows)} read, {len(removed)} removed")
+        return len(rows)
+
+    @staticmethod
+    def _run_row(path: Path, fingerprint: str) -> tuple:
+        try:
+            summary = run_summary(read_trace_file(path, expand=False))
+            datetime.fromisoformat(summary["created_at"])
+        except Exception as e:
+            logger.debug(f"Skipping unreadable run file {path.name}: {e}")
+            return (path.name, fingerprint, 0, "", "", "", "", 0, "", "", None)
+        evaluation = summary["evaluation"]
+        return (
+            path.name,
+            fingerprint,
+            1,
+            summary["run_id"],
+            summary["table_id"],
+            summary["mode"],
+            summary["prompt_type"],
+            summary["column_count"],
+            summary["status"],
+            summary["created_at"],
+            json.dumps(evaluation) if evaluation is not None else None,
+        )
+
+    def list_runs(
+        self, status: str | None = None, table_id: str | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """List the summaries of the valid runs, latest run file name first.
+
+        Args:
+            status: Only runs with this status
+            table_id: Only runs of this table
+            limit: Maximum number of runs
+        """
+        query = (
+            "SELECT run_id, table_id, mode, prompt_type, column_count, status, created_at, "
+            "evaluation FROM runs WHERE valid = 1"
+        )
+        params: list[Any] = []
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        if table_id is not None:
+            query += " AND table_id = ?"
+            params.append(table_id)
+        query += " ORDER BY filename DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        runs = []
+        for row in rows:
+            summary = dict(row)
+            if summary["evaluation"] is not None:
+                summary["evaluation"] = json.loads(summary["evaluation"])
+            runs.append(summary)
+        return runs
+
+    # Evaluations
+
+    def record_evaluation(self, batch_hash: str, labels_hash: str, result: dict[str, Any]) -> None:
+        """Store the evaluation of a batch file against a labels file.
+
+        Args:
+            batch_hash: Content hash of the batch file
+            labels_hash: Content hash of the labels file
+            result: Evaluation result (with ``run_id``, ``labels_id`` and ``evaluated_at``)
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO evaluations "
+                "(batch_hash, labels_hash, run_id, labels_id, evaluated_at, result) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    batch_hash,
+                    labels_hash,
+                    result.get("run_id", ""),
+                    result.get("labels_id", ""),
+                    result.get("evaluated_at", ""),
+                    json.dumps(result, ensure_ascii=False),
+                ),
+            )
+
+    def find_evaluation(self, batch_hash: str, labels_hash: str) -> dict[str, Any] | None:
+        """Get the stored evaluation of a batch file against a labels file."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT result FROM evaluations WHERE batch_hash = ? AND labels_hash = ?",
+                (batch_hash, labels_hash),
+            ).fetchone()
+        return json.loads(row["result"]) if row else None
+
+    def list_evaluations(self, run_id: str | None = None) -> list[dict[str, Any]]:
+        """List the stored evaluations, latest first, without their per-column results."""
+        query = "SELECT result FROM evaluations"
+        params: list[Any] = []
+        if run_id is not None:
+            query += " WHERE run_id = ?"
+            params.append(run_id)
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY evaluated_at DESC", params).fetchall()
+        evaluations = []
+        for row in rows:
+            result = json.loads(row["result"])
+            result.pop("columns", None)
+            evaluations.append(result)
+        return evaluations
+
+
+class CatalogStore:
+    """Persists the entries of one registry as catalog rows.
+
+    Implements the store interface of :class:`SharedRegistry` (like
+    :class:`RegistryFile`): the registry reloads when the entries' version
+    changed, and a save writes only the entries that differ from those last
+    loaded or saved.
+    """
+
+    def __init__(self, catalog: Catalog, kind: str) -> None:
+        self.catalog = catalog
+        self.kind = kind
+        self.thread_lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None  # Connection of the held transaction
+        self._version: int | None = None  # Version when last loaded or saved
+        self._saved: dict[str, str] = {}  # Serialized entries when last loaded or saved
+
+    def __str__(self) -> str:
+        return f"{self.catalog.db_path} ({self.kind})"
+
+    def changed(self) -> bool:
+        """Whether the entries changed since they were last loaded or saved here."""
+        return self.catalog.version(self.kind, self._conn) != self._version
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the catalog's write lock (an immediate transaction).
+
+        Re-entrant within a thread; the transaction is committed when the
+        outermost holder exits and rolled back on error.
+        """
+        with self.thread_lock:
+            if self._conn is not None:
+                yield
+                return
+            try:
+                with self.catalog.transaction() as conn:
+                    self._conn = conn
+                    try:
+                        yield
+                    finally:
+                        self._conn = None
+            except BaseException:
+                self._version = None  # Rolled back: reload on next refresh
+                raise
+
+    def load(self, registry: Any) -> None:
+        """Replace the registry's entries with those of the catalog.
+
+        Entries that cannot be parsed are skipped with a warning.
+        """
+        with self.thread_lock:
+            self._version = self.catalog.version(self.kind, self._conn)
+            rows = self.catalog.load_entries(self.kind, self._conn)
+            entries = {}
+            for id_, data in rows.items():
+                try:
+                    entries[id_] = registry._entry_type.from_dict(json.loads(data))
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Skipping invalid {self.kind} entry {id_} in {self}: {e}")
+            registry._set_entries(entries)
+            self._saved = rows
+            logger.debug(f"Loaded {self} with {len(entries)} entries")
+
+    def save(self, registry: Any) -> None:
+        """Write the registry's new, changed and removed entries."""
+        current = {
+            id_: json.dumps(entry.to_dict(), ensure_ascii=False, sort_keys=True)
+            for id_, entry in registry._entries().items()
+        }
+        with self.locked():
+            upserts = [
+                (
+                    id_,
+                    getattr(entry, "filename", ""),
+                    getattr(entry, "category", ""),
+                    getattr(entry, "file_hash", ""),
+                    current[id_],
+                )
+                for id_, entry in registry._entries().items()
+                if self._saved.get(id_) != current[id_]
+            ]
+            deletes = [id_ for id_ in self._saved if id_ not in current]
+            if upserts or deletes:
+                previous = self.catalog.version(self.kind, self._conn)
+                version = self.catalog.write_entries(self._conn, self.kind, upserts, deletes)
+                # Entries written by others since the last load are still to be loaded
+                if previous == self._version:
+                    self._version = version
+            self._saved = current
+        logger.debug(f"Saved {self}: {len(upserts)} written, {len(deletes)} deleted")
@@ -8,7 +8,12 @@ from saed.core.config.settings import (
     PathsConfig,
     ProviderName,
     ProvidersConfig,
+    QueueConfig,
+    StorageConfig,
+    clear_config_cache,
     get_absolute_path,
+    get_catalog_path,
+    get_config,
     get_config_path,
     get_provider_config,
     get_provider_model,
@@ -25,8 +30,13 @@ __all__ = [
     "PathsConfig",
     "ProvidersConfig",
     "ProviderName",
+    "QueueConfig",
+    "StorageConfig",
     "SUPPORTED_PROVIDERS",
+    "clear_config_cache",
     "get_absolute_path",
+    "get_catalog_path",
+    "get_config",
     "get_config_path",
     "get_provider_config",
     "get_provider_model",
@@ -1,6 +1,7 @@
 """Configuration management for SAED."""
 
 import json
+import threading
 from pathlib import Path
 from typing import Literal
 
@@ -27,11 +28,25 @@ SUPPORTED_PROVIDERS: list[ProviderName] = [
     "litellm",
 ]
 
+# Providers that accept a list of endpoints, and their single-endpoint field
+ENDPOINT_FIELDS: dict[ProviderName, str] = {
+    "ollama": "base_url",
+    "litellm": "api_base",
+}
+
+
+class EndpointConfig(BaseModel):
+    """One server of a provider with several inference endpoints."""
+
+    url: str
+    weight: float = 1.0  # Relative share of requests
+
 
 class OllamaConfig(BaseModel):
     """Ollama LLM configuration."""
 
     base_url: str = "http://localhost:11434"
+    endpoints: list[EndpointConfig] = Field(default_factory=list)  # Replaces base_url if set
     models: list[str] = Field(default_factory=list)
     default_model: str = ""
 
@@ -74,6 +89,7 @@ class LiteLLMConfig(BaseModel):
 
     api_key: str = ""
     api_base: str = ""
+    endpoints: list[EndpointConfig] = Field(default_factory=list)  # Replaces api_base if set
     models: list[str] = Field(default_factory=list)
     default_model: str = ""
 
@@ -94,6 +110,11 @@ class LLMConfig(BaseModel):
 
     active_provider: ProviderName = "ollama"
     providers: ProvidersConfig = Field(default_factory=ProvidersConfig)
+    endpoint_max_failures: int = 3  # Consecutive failures before an endpoint is ejected
+    endpoint_ejection_seconds: float = 30.0  # Time before an ejected endpoint is probed
+    fallback_providers: list[ProviderName] = Field(default_factory=list)  # Tried in order
+    hedge_requests: bool = False  # Duplicate requests slower than p95 to the next provider
+    hedge_min_samples: int = 20  # Latencies observed per model before hedging starts
 
 
 class EDMOptions(BaseModel):
@@ -102,6 +123,25 @@ class EDMOptions(BaseModel):
     classes_per_agent: int = 30
     agents_per_class: int = 3
     consensus_threshold: float = 0.8
+    seed: int = 0  # Seed of the class-to-agent assignment (same seed, same prompts)
+    token_budget: int | None = None  # Prompt tokens per agent; replaces classes_per_agent
+
+
+class CandidateOptions(BaseModel):
+    """How candidate ontology classes are rendered in prompts."""
+
+    rendering: Literal["name", "described"] = "name"  # "described" adds label and comment
+    comment_chars: int = 160  # Comments are truncated to this length
+    max_chars: int = 6000  # Budget of the rendered candidate list per prompt
+
+
+class SamplingOptions(BaseModel):
+    """How the rows of the table preview in prompts are sampled."""
+
+    strategy: Literal["head", "random", "stratified", "distinct", "non_null"] = "head"
+    seed: int = 0  # Seed of the "random" and "stratified" strategies
+    projected: bool = False  # Only send the target column and the key columns
+    key_columns: int = 2  # Leading columns kept in a projected preview
 
 
 class DefaultsConfig(BaseModel):
@@ -112,6 +152,8 @@ class DefaultsConfig(BaseModel):
     max_depth: int = 3
     k: int = 5
     edm_options: EDMOptions = Field(default_factory=EDMOptions)
+    candidates: CandidateOptions = Field(default_factory=CandidateOptions)
+    sampling: SamplingOptions = Field(default_factory=SamplingOptions)
 
 
 class PathsConfig(BaseModel):
@@ -122,6 +164,28 @@ class PathsConfig(BaseModel):
     runs: str = "data/runs"
     labels: str = "data/labels"
     batches: str = "data/batches"
+    catalog: str = "data/catalog.sqlite3"  # Used when storage.catalog is "sqlite"
+
+
+class QueueConfig(BaseModel):
+    """Run queue and worker pool options for the API server."""
+
+    workers: int = 2  # Runs executed concurrently by the API process
+    provider_concurrency: dict[str, int] = Field(default_factory=dict)  # provider -> max runs
+    default_provider_concurrency: int = 2
+    max_queued: int = 100  # Further submissions are rejected with 429
+    lease_seconds: float = 60.0  # Running jobs without a heartbeat this long are requeued
+
+
+class StorageConfig(BaseModel):
+    """Storage options for run and batch result files and registered tables."""
+
+    trace_interning: bool = True  # Store repeated prompt fragments once per file
+    trace_compression: Literal["none", "gzip", "zstd"] = "none"
+    # Columnar copy written next to each registered CSV ("csv" writes none)
+    table_format: Literal["csv", "parquet", "arrow"] = "csv"
+    # Where registry entries, run summaries and evaluations are kept
+    catalog: Literal["json", "sqlite"] = "json"
 
 
 class Config(BaseModel):
@@ -130,6 +194,8 @@ class Config(BaseModel):
     llm: LLMConfig = Field(default_factory=LLMConfig)
     defaults: DefaultsConfig = Field(default_factory=DefaultsConfig)
     paths: PathsConfig = Field(default_factory=PathsConfig)
+    storage: StorageConfig = Field(default_factory=StorageConfig)
+    queue: QueueConfig = Field(default_factory=QueueConfig)
 
 
 def get_config_path() -> Path:
@@ -224,16 +290,62 @@ def _migrate_old_config(data: dict) -> dict:
     return data
 
 
-def load_config() -> Config:
-    """Load configuration from JSON file."""
+# Validated config of the process, with the stamp of the file it was read from
+_config_cache: tuple[tuple, Config] | None = None
+_config_lock = threading.Lock()
+
+
+def _config_stamp(config_path: Path) -> tuple:
+    """Identify the state of the config file: path, mtime and size (None if missing)."""
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        return (config_path, None)
+    return (config_path, stat.st_mtime_ns, stat.st_size)
+
+
+def get_config() -> Config:
+    """Get the process-wide configuration, shared by all callers.
+
+    The file is read, migrated and validated again only when its mtime or
+    size changed (or :func:`save_config` was called), so this costs one
+    ``stat`` per call. The returned object must not be modified; use
+    :func:`load_config` for a private copy.
+    """
+    global _config_cache
     config_path = get_config_path()
-    if config_path.exists():
-        with open(config_path) as f:
-            data = json.load(f)
-        # Migrate old format if needed
-        data = _migrate_old_config(data)
-        return Config(**data)
-    return Config()
+    stamp = _config_stamp(config_path)
+    cache = _config_cache
+    if cache is not None and cache[0] == stamp:
+        return cache[1]
+
+    with _config_lock:
+        if stamp[1] is not None:
+            with open(config_path) as f:
+                data = json.load(f)
+            # Migrate old format if needed
+            data = _migrate_old_config(data)
+            config = Config(**data)
+        else:
+            config = Config()
+        _config_cache = (stamp, config)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Make the next :func:`get_config` read the config file again."""
+    global _config_cache
+    with _config_lock:
+        _config_cache = None
+
+
+def load_config() -> Config:
+    """Load configuration from JSON file.
+
+    Returns a private copy of the cached configuration (see
+    :func:`get_config`), which the caller may modify.
+    """
+    return get_config().model_copy(deep=True)
 
 
 def save_config(config: Config) -> None:
@@ -242,6 +354,8 @@ def save_config(config: Config) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
     with open(config_path, "w") as f:
         json.dump(config.model_dump(), f, indent=2)
+    # The rewrite may keep the mtime within its resolution and the size
+    clear_config_cache()
 
 
 def get_absolute_path(relative_path: str) -> Path:
@@ -249,6 +363,15 @@ def get_absolute_path(relative_path: str) -> Path:
     return get_project_root() / relative_path
 
 
+def get_catalog_path(config: Config | None = None) -> Path | None:
+    """Get the SQLite catalog path, or None if registries are JSON files."""
+    if config is None:
+        config = get_config()
+    if config.storage.catalog != "sqlite":
+        return None
+    return get_absolute_path(config.paths.catalog)
+
+
 def get_provider_config(provider: ProviderName, config: Config | None = None) -> BaseModel:
     """Get configuration for a specific provider."""
     if config is None:
@@ -266,6 +389,25 @@ def get_provider_model(provider: ProviderName, config: Config | None = None) ->
     return models[0] if models else ""
 
 
+def get_provider_endpoints(
+    provider: ProviderName, config: Config | None = None
+) -> list[EndpointConfig]:
+    """Get the inference endpoints of a provider.
+
+    Returns:
+        The configured ``endpoints``, else the single ``base_url``/``api_base``
+        (empty for providers without a configurable endpoint)
+    """
+    field = ENDPOINT_FIELDS.get(provider)
+    if field is None:
+        return []
+    provider_config = get_provider_config(provider, config)
+    if provider_config.endpoints:
+        return list(provider_config.endpoints)
+    url = getattr(provider_config, field)
+    return [EndpointConfig(url=url)] if url else []
+
+
 def is_provider_configured(provider: ProviderName, config: Config | None = None) -> bool:
     """Check if a provider has required parameters configured."""
     if config is None:
@@ -285,6 +427,8 @@ def is_provider_configured(provider: ProviderName, config: Config | None = None)
 
     for field in required_fields.get(provider, []):
         value = getattr(provider_config, field, "")
+        if field == ENDPOINT_FIELDS.get(provider) and provider_config.endpoints:
+            continue
         if not value:
             return False
 
@@ -1,5 +1,11 @@
 """Evaluation metrics for semantic annotation."""
 
+from saed.core.evaluator.engine import (
+    Evaluation,
+    MatchCounts,
+    evaluate_columns,
+    precision_recall_f1,
+)
 from saed.core.evaluator.metrics import (
     flatten_list_to_set,
     node_level_f1_precision_recall,
@@ -7,7 +13,11 @@ from saed.core.evaluator.metrics import (
 )
 
 __all__ = [
+    "Evaluation",
+    "MatchCounts",
+    "evaluate_columns",
     "flatten_list_to_set",
     "node_level_f1_precision_recall",
     "path_level_f1_precision_recall",
+    "precision_recall_f1",
 ]
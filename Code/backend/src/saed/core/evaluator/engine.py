@@ -0,0 +1,280 @@
+"""Vectorized evaluation of predicted against ground-truth class paths.
+
+Class names and paths are interned to integer IDs, and each column's
+predictions and ground truth become packed ``column * n + id`` keys. After
+one :func:`numpy.unique` per side, true positives are the keys present on
+both sides, and per-column TP/FP/FN counts are :func:`numpy.bincount` of the
+keys' columns, for paths, nodes and nodes per depth level in the same pass.
+Micro, macro, per-level and per-table metrics are then reductions of these
+counts.
+"""
+
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+Path = Sequence[str]
+
+
+class Interner:
+    """Maps hashable keys (class names, paths) to consecutive integer IDs."""
+
+    def __init__(self) -> None:
+        self._ids: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def intern(self, key: Hashable) -> int:
+        """Get the ID of a key, assigning the next one if it is new."""
+        return self._ids.setdefault(key, len(self._ids))
+
+    def keys(self) -> list[Hashable]:
+        """Get the keys in ID order."""
+        return list(self._ids)
+
+
+def precision_recall_f1(
+    tp: np.ndarray, fp: np.ndarray, fn: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute precision, recall and F1 elementwise, 0.0 where undefined."""
+    tp, fp, fn = (np.asarray(a, dtype=np.float64) for a in (tp, fp, fn))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+        recall = np.where(tp + fn > 0, tp / (tp + fn), 0.0)
+        f1 = np.where(
+            precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0
+        )
+    return precision, recall, f1
+
+
+SUMMARY_NAMES = (
+    "macro_precision",
+    "macro_recall",
+    "macro_f1",
+    "micro_precision",
+    "micro_recall",
+    "micro_f1",
+)
+
+
+def _summary_dict(values: Iterable[float]) -> dict[str, float]:
+    return {name: round(float(value), 4) for name, value in zip(SUMMARY_NAMES, values, strict=True)}
+
+
+@dataclass
+class MatchCounts:
+    """True positive, false positive and false negative counts per column."""
+
+    tp: np.ndarray
+    fp: np.ndarray
+    fn: np.ndarray
+
+    def scores(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the precision, recall and F1 of each column."""
+        return precision_recall_f1(self.tp, self.fp, self.fn)
+
+    def summary(
+        self, mask: np.ndarray | None = None
+    ) -> tuple[float, float, float, float, float, float]:
+        """Get macro and micro precision, recall and F1 over the columns.
+
+        Args:
+            mask: Columns to include (all if None)
+
+        Returns:
+            Tuple of (macro_precision, macro_recall, macro_f1,
+                      micro_precision, micro_recall, micro_f1)
+        """
+        groups = np.zeros(len(self.tp), dtype=np.int64)
+        if mask is not None:
+            groups[~mask] = 1  # Excluded columns form a second group
+        return tuple(float(value) for value in self.grouped_summary(groups, 2)[0])
+
+    def summary_dict(self, mask: np.ndarray | None = None) -> dict[str, float]:
+        """Get :meth:`summary` as a dict of values rounded to 4 decimals."""
+        return _summary_dict(self.summary(mask))
+
+    def grouped_summary(self, groups: np.ndarray, n_groups: int) -> np.ndarray:
+        """Get :meth:`summary` of each group of columns at once.
+
+        Args:
+            groups: Group of each column, in ``range(n_groups)``
+            n_groups: Number of groups
+
+        Returns:
+            Array of shape ``[n_groups, 6]``, all 0.0 for empty groups
+        """
+
+        def sums(values: np.ndarray) -> np.ndarray:
+            return np.bincount(groups, weights=values, minlength=n_groups)
+
+        sizes = np.maximum(np.bincount(groups, minlength=n_groups), 1)
+        macro = [sums(scores) / sizes for scores in self.scores()]
+        micro = precision_recall_f1(sums(self.tp), sums(self.fp), sums(self.fn))
+        return np.column_stack([*macro, *micro])
+
+
+def _match(
+    groups: tuple[np.ndarray, np.ndarray], ids: tuple[np.ndarray, np.ndarray], n_groups: int, n_ids: int
+) -> MatchCounts:
+    """Count the IDs present in both the predictions and the ground truth of each group.
+
+    Args:
+        groups: Group (column, or column x level) of each predicted and ground-truth ID
+        ids: Predicted and ground-truth IDs (duplicates within a group allowed)
+        n_groups: Number of groups
+        n_ids: Number of distinct IDs
+    """
+    n_ids = max(n_ids, 1)
+    pred, gt = (np.unique(g * n_ids + i) for g, i in zip(groups, ids, strict=True))
+    both = np.intersect1d(pred, gt, assume_unique=True)
+    tp, n_pred, n_gt = (np.bincount(k // n_ids, minlength=n_groups) for k in (both, pred, gt))
+    return MatchCounts(tp=tp, fp=n_pred - tp, fn=n_gt - tp)
+
+
+@dataclass
+class Evaluation:
+    """Match counts of a set of evaluated columns.
+
+    Attributes:
+        path: Counts of whole paths per column
+        node: Counts of classes (nodes of any path) per column
+        level: Counts of classes at each depth per column, as
+            ``[n_columns, n_levels]`` arrays (depth 0 is the first class)
+        table_ids: Table of each column
+    """
+
+    path: MatchCounts
+    node: MatchCounts
+    level: MatchCounts
+    table_ids: list[str]
+
+    def __len__(self) -> int:
+        return len(self.table_ids)
+
+    def column_metrics(self) -> list[dict[str, float]]:
+        """Get the path- and node-level metrics of each column, rounded to 4 decimals.
+
+        Returns:
+            Dicts with path_precision, path_recall, path_f1,
+            node_precision, node_recall, node_f1
+        """
+        names, values = [], []
+        for level, counts in (("path", self.path), ("node", self.node)):
+            for name, scores in zip(("precision", "recall", "f1"), counts.scores(), strict=True):
+                names.append(f"{level}_{name}")
+                values.append([round(value, 4) for value in scores.tolist()])
+        return [dict(zip(names, row, strict=True)) for row in zip(*values, strict=True)]
+
+    def metrics(self, mask: np.ndarray | None = None) -> dict[str, dict[str, float]]:
+        """Get the path- and node-level macro and micro metrics.
+
+        Args:
+            mask: Columns to include (all if None)
+        """
+        return {
+            "path_level": self.path.summary_dict(mask),
+            "node_level": self.node.summary_dict(mask),
+        }
+
+    def level_metrics(self) -> list[dict[str, float]]:
+        """Get the node-level metrics of each depth.
+
+        The macro average of a depth is over the columns with a predicted or
+        ground-truth class at that depth.
+        """
+        results = []
+        for depth in range(self.level.tp.shape[1]):
+            counts = MatchCounts(
+                self.level.tp[:, depth], self.level.fp[:, depth], self.level.fn[:, depth]
+            )
+            mask = (counts.tp + counts.fp + counts.fn) > 0
+            results.append({"level": depth, "columns": int(mask.sum()), **counts.summary_dict(mask)})
+        return results
+
+    def table_metrics(self) -> dict[str, dict]:
+        """Get the path- and node-level metrics of each table's columns."""
+        tables = Interner()
+        groups = np.fromiter(
+            (tables.intern(table_id) for table_id in self.table_ids), dtype=np.int64, count=len(self)
+        )
+        sizes = np.bincount(groups, minlength=len(tables))
+        path = self.path.grouped_summary(groups, len(tables))
+        node = self.node.grouped_summary(groups, len(tables))
+        return {
+            table_id: {
+                "columns": int(sizes[group]),
+                "path_level": _summary_dict(path[group]),
+                "node_level": _summary_dict(node[group]),
+            }
+            for group, table_id in enumerate(tables.keys())
+        }
+
+
+def evaluate_columns(
+    columns: Iterable[tuple[Sequence[Path], Sequence[Path]]],
+    table_ids: Sequence[str] | None = None,
+) -> Evaluation:
+    """Count the matches of predicted and ground-truth paths of many columns.
+
+    Paths match if all their classes match in order, nodes if their class
+    names match anywhere in the column's paths, and levels if they match at
+    the same depth. Repeated paths or classes count once.
+
+    Args:
+        columns: (pred_paths, gt_paths) of each column
+        table_ids: Table of each column, for :meth:`Evaluation.table_metrics`
+
+    Returns:
+        The per-column counts
+    """
+    paths = Interner()
+    # Per side (0: predictions, 1: ground truth): path IDs and their column
+    path_ids: tuple[list[int], list[int]] = ([], [])
+    path_columns: tuple[list[int], list[int]] = ([], [])
+
+    n_columns = 0
+    for column, sides in enumerate(columns):
+        n_columns += 1
+        for side, side_paths in enumerate(sides):
+            path_ids[side].extend(paths.intern(tuple(path)) for path in side_paths)
+            path_columns[side].extend([column] * len(side_paths))
+
+    # Classes of each distinct path, flattened: path p has classes
+    # node_table[offsets[p]:offsets[p + 1]], at depths depth_table[...]
+    nodes = Interner()
+    distinct_paths = paths.keys()
+    lengths = np.fromiter(map(len, distinct_paths), dtype=np.int64, count=len(distinct_paths))
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    node_table = np.fromiter(
+        (nodes.intern(name) for path in distinct_paths for name in path),
+        dtype=np.int64,
+        count=int(offsets[-1]),
+    )
+    depth_table = np.arange(len(node_table)) - np.repeat(offsets[:-1], lengths)
+
+    path_ids = tuple(np.asarray(ids, dtype=np.int64) for ids in path_ids)
+    path_columns = tuple(np.asarray(c, dtype=np.int64) for c in path_columns)
+    node_ids, node_columns, node_depths = [], [], []
+    for ids, path_cols in zip(path_ids, path_columns, strict=True):
+        # Expand each path occurrence into its classes
+        counts = lengths[ids]
+        starts = np.repeat(offsets[ids] - np.cumsum(counts) + counts, counts)
+        positions = starts + np.arange(counts.sum())
+        node_ids.append(node_table[positions])
+        node_depths.append(depth_table[positions])
+        node_columns.append(np.repeat(path_cols, counts))
+
+    n_levels = int(lengths.max()) if len(lengths) else 0
+    level_groups = tuple(c * n_levels + d for c, d in zip(node_columns, node_depths, strict=True))
+
+    level = _match(level_groups, node_ids, n_columns * n_levels, len(nodes))
+    shape = (n_columns, n_levels)
+    return Evaluation(
+        path=_match(path_columns, path_ids, n_columns, len(paths)),
+        node=_match(node_columns, node_ids, n_columns, len(nodes)),
+        level=MatchCounts(level.tp.reshape(shape), level.fp.reshape(shape), level.fn.reshape(shape)),
+        table_ids=list(table_ids) if table_ids is not None else [""] * n_columns,
+    )
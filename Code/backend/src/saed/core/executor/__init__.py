@@ -1,12 +1,21 @@
 """Executor module for running semantic annotation tasks."""
 
+from saed.core.executor.checkpoint import (
+    RunCheckpoint,
+    checkpoint_path,
+    selection_from_dict,
+    selection_to_dict,
+)
 from saed.core.executor.run_executor import (
     BFSStepDetail,
+    CancellationToken,
     ColumnResultDetail,
     DetailedSelector,
     LLMRequestDetail,
     LLMResponseDetail,
+    RunCancelled,
     RunExecutor,
+    SelectionResult,
 )
 
 __all__ = [
@@ -16,4 +25,11 @@ __all__ = [
     "BFSStepDetail",
     "LLMRequestDetail",
     "LLMResponseDetail",
+    "SelectionResult",
+    "CancellationToken",
+    "RunCancelled",
+    "RunCheckpoint",
+    "checkpoint_path",
+    "selection_to_dict",
+    "selection_from_dict",
 ]
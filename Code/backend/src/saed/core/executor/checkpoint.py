@@ -0,0 +1,222 @@
+"""Append-only checkpoints for resuming interrupted runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from saed.core.executor.run_executor import (
+    AgentResultDetail,
+    EDMResultDetail,
+    LLMRequestDetail,
+    LLMResponseDetail,
+    SelectionResult,
+    VoteSummaryDetail,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _request_to_dict(request: LLMRequestDetail | None) -> dict[str, Any] | None:
+    if request is None:
+        return None
+    return {
+        "prompt": request.prompt,
+        "model": request.model,
+        "timestamp": request.timestamp.isoformat(),
+    }
+
+
+def _request_from_dict(data: dict[str, Any] | None) -> LLMRequestDetail | None:
+    if data is None:
+        return None
+    return LLMRequestDetail(
+        prompt=data["prompt"],
+        model=data["model"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+def _response_to_dict(response: LLMResponseDetail | None) -> dict[str, Any] | None:
+    if response is None:
+        return None
+    return dict(vars(response))
+
+
+def _response_from_dict(data: dict[str, Any] | None) -> LLMResponseDetail | None:
+    if data is None:
+        return None
+    return LLMResponseDetail(**data)
+
+
+def selection_to_dict(result: SelectionResult) -> dict[str, Any]:
+    """Serialize a selection result, including its LLM trace."""
+    data: dict[str, Any] = {
+        "selected": result.selected,
+        "status": result.status,
+        "error": result.error,
+        "llm_request": _request_to_dict(result.llm_request),
+        "llm_response": _response_to_dict(result.llm_response),
+        "edm_result": None,
+    }
+    if result.edm_result:
+        edm = result.edm_result
+        data["edm_result"] = {
+            "consensus_threshold": edm.consensus_threshold,
+            "total_agents": edm.total_agents,
+            "seed": edm.seed,
+            "votes_summary": [dict(vars(v)) for v in edm.votes_summary],
+            "agents": [
+                {
+                    "agent_id": a.agent_id,
+                    "assigned_classes": a.assigned_classes,
+                    "llm_request": _request_to_dict(a.llm_request),
+                    "llm_response": _response_to_dict(a.llm_response),
+                    "voted_classes": a.voted_classes,
+                    "status": a.status,
+                    "error": a.error,
+                }
+                for a in edm.agents
+            ],
+        }
+    return data
+
+
+def selection_from_dict(data: dict[str, Any]) -> SelectionResult:
+    """Restore a selection result written by :func:`selection_to_dict`."""
+    edm_result = None
+    if data.get("edm_result"):
+        edm = data["edm_result"]
+        edm_result = EDMResultDetail(
+            consensus_threshold=edm["consensus_threshold"],
+            total_agents=edm["total_agents"],
+            votes_summary=[VoteSummaryDetail(**v) for v in edm["votes_summary"]],
+            agents=[
+                AgentResultDetail(
+                    agent_id=a["agent_id"],
+                    assigned_classes=a["assigned_classes"],
+                    llm_request=_request_from_dict(a.get("llm_request")),
+                    llm_response=_response_from_dict(a.get("llm_response")),
+                    voted_classes=a.get("voted_classes", []),
+                    status=a.get("status", "success"),
+                    error=a.get("error"),
+                )
+                for a in edm["agents"]
+            ],
+            seed=edm.get("seed"),
+        )
+    return SelectionResult(
+        selected=data["selected"],
+        status=data.get("status", "completed"),
+        error=data.get("error"),
+        llm_request=_request_from_dict(data.get("llm_request")),
+        llm_response=_response_from_dict(data.get("llm_response")),
+        edm_result=edm_result,
+    )
+
+
+def checkpoint_path(runs_dir: Path, run_id: str) -> Path:
+    """Get the checkpoint file of a run whose results are written to ``runs_dir``."""
+    return runs_dir / "checkpoints" / f"{run_id}.jsonl"
+
+
+class RunCheckpoint:
+    """Progress log of a run, written one JSON line per finished unit of work.
+
+    Three record types are appended as the run progresses:
+
+    - ``header``: the run parameters, written once when the run starts
+    - ``selection``: a successful BFS selection, keyed by column and parent class
+    - ``column``: a fully completed column result
+
+    Failed selections are not recorded, so resuming retries them while every
+    selection that already cost tokens is replayed from the log. A truncated
+    last line (process killed mid-write) is cut off on load, so the records
+    appended by the resumed run start on a line of their own.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.header: dict[str, Any] | None = None
+        self._selections: dict[str, dict[str, SelectionResult]] = {}
+        self._columns: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        complete = 0  # End of the last newline-terminated line
+        with open(self.path, "rb") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.endswith(b"\n"):
+                    logger.warning(f"Dropping truncated checkpoint line {line_no} in {self.path}")
+                    break
+                complete += len(line)
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning(f"Ignoring corrupt checkpoint line {line_no} in {self.path}")
+                    continue
+                kind = record.get("type")
+                if kind == "header":
+                    self.header = record["data"]
+                elif kind == "selection":
+                    self._selections.setdefault(record["key"], {})[record["parent"]] = (
+                        selection_from_dict(record["result"])
+                    )
+                elif kind == "column":
+                    self._columns[record["key"]] = record["result"]
+        if complete < self.path.stat().st_size:
+            with open(self.path, "r+b") as f:
+                f.truncate(complete)
+        logger.info(
+            f"Loaded checkpoint {self.path.name}: {len(self._columns)} columns, "
+            f"{sum(len(s) for s in self._selections.values())} selections"
+        )
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+    def write_header(self, data: dict[str, Any]) -> None:
+        """Record the run parameters (only the first header is kept)."""
+        if self.header is None:
+            self.header = data
+            self._append({"type": "header", "data": data})
+
+    def selections(self, key: str) -> dict[str, SelectionResult]:
+        """Get the recorded selections of a column, keyed by parent class URL.
+
+        The returned dict is the executor's selection cache for the column.
+        """
+        return self._selections.setdefault(key, {})
+
+    def record_selection(self, key: str, parent_url: str, result: SelectionResult) -> None:
+        """Persist a selection as soon as it is made."""
+        if result.status == "failed":
+            return
+        self._selections.setdefault(key, {})[parent_url] = result
+        self._append({
+            "type": "selection",
+            "key": key,
+            "parent": parent_url,
+            "result": selection_to_dict(result),
+        })
+
+    def completed_column(self, key: str) -> dict[str, Any] | None:
+        """Get the stored result of a column that already completed."""
+        return self._columns.get(key)
+
+    def record_column(self, key: str, result: dict[str, Any]) -> None:
+        """Persist a column result; only completed columns are skipped on resume."""
+        if result.get("status") != "completed":
+            return
+        self._columns[key] = result
+        self._append({"type": "column", "key": key, "result": result})
+
+    def remove(self) -> None:
+        """Delete the checkpoint once the run finished."""
+        self.path.unlink(missing_ok=True)
@@ -3,16 +3,38 @@
 from __future__ import annotations
 
 import asyncio
-import random
+import contextlib
+import logging
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable
 
-from saed.core.config.settings import Config, EDMOptions, load_config
-from saed.core.llm import LLM
+from saed.core.config.settings import (
+    CandidateOptions,
+    Config,
+    EDMOptions,
+    ProviderName,
+    get_provider_model,
+    is_provider_configured,
+    load_config,
+)
+from saed.core.llm import LLM, LLMResult
+from saed.core.llm.latency import latency_tracker
 from saed.core.llm.parser import extract_answer, extract_reasoning, parse_class_list
+from saed.core.llm.tokens import get_token_counter
+from saed.core.ontology.rendering import CandidateRenderer, get_candidate_renderer
+from saed.core.selector.assignment import (
+    assign_classes_to_agents,
+    num_edm_agents,
+    pack_classes_by_tokens,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -35,6 +57,21 @@ class LLMResponseDetail:
     input_tokens: int | None = None
     output_tokens: int | None = None
     total_tokens: int | None = None
+    provider: str | None = None  # Provider that answered (fallback/hedge may differ)
+
+
+@dataclass
+class LLMBackend:
+    """One provider of a selector's fallback chain."""
+
+    provider: ProviderName
+    model: str
+    client: Any  # SemanticAnnotationClient (or anything with generate/agenerate)
+
+    @property
+    def key(self) -> str:
+        """Key of the backend's latency statistics."""
+        return f"{self.provider}/{self.model}"
 
 
 @dataclass
@@ -69,6 +106,7 @@ class EDMResultDetail:
     total_agents: int
     votes_summary: list[VoteSummaryDetail] = field(default_factory=list)
     agents: list[AgentResultDetail] = field(default_factory=list)
+    seed: int | None = None  # Seed of the class-to-agent assignment
 
 
 @dataclass
@@ -113,6 +151,58 @@ class ColumnResultDetail:
     error: str | None = None
 
 
+class RunCancelled(Exception):
+    """Raised by the executor when its run was cancelled.
+
+    Attributes:
+        partial: Result of the column that was interrupted, if any
+    """
+
+    def __init__(self, partial: ColumnResultDetail | None = None) -> None:
+        super().__init__("Run cancelled")
+        self.partial = partial
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag shared by a run and its executor.
+
+    The executor checks it before every LLM request and between BFS steps, and
+    backoff sleeps between retries return early when it is set. A request that
+    is already in flight on a worker thread is allowed to finish, so tokens
+    spent on it still reach the checkpoint.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise :class:`RunCancelled` if cancellation was requested."""
+        if self._event.is_set():
+            raise RunCancelled()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to ``timeout`` seconds, returning True early if cancelled."""
+        return self._event.wait(timeout)
+
+    async def wait_async(self, timeout: float, poll_interval: float = 0.05) -> bool:
+        """Async :meth:`wait`: the flag is polled without blocking the event loop."""
+        deadline = time.monotonic() + timeout
+        while not self._event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(poll_interval, remaining))
+        return True
+
+
 class DetailedSelector:
     """Selector that returns detailed information about LLM interactions."""
 
@@ -123,11 +213,13 @@ class DetailedSelector:
         prompt_type: str = "cot",
         edm_options: EDMOptions | None = None,
         max_retries: int = 3,
+        cancel_token: CancellationToken | None = None,
     ) -> None:
         self.config = config or load_config()
         self.mode = mode
         self.prompt_type = prompt_type
         self.max_retries = max_retries
+        self.cancel_token = cancel_token
 
         # EDM options
         if edm_options:
@@ -135,19 +227,33 @@ class DetailedSelector:
         else:
             self.edm_options = self.config.defaults.edm_options
 
-        # Initialize LLM
-        self.llm = LLM(
-            config=self.config,
-            mode=mode,
-            prompt_type=prompt_type,
-        )
+        # Initialize LLMs: the active provider, then the configured fallbacks
+        self.hedge_requests = self.config.llm.hedge_requests
+        self.backends: list[LLMBackend] = []
+        chain = [self.config.llm.active_provider, *self.config.llm.fallback_providers]
+        for provider in dict.fromkeys(chain):
+            if self.backends and not is_provider_configured(provider, self.config):
+                logger.warning(f"Skipping fallback provider {provider}: not configured")
+                continue
+            self.backends.append(LLMBackend(
+                provider=provider,
+                model=get_provider_model(provider, self.config),
+                client=LLM(
+                    config=self.config,
+                    provider=provider,
+                    mode=mode,
+                    prompt_type=prompt_type,
+                ),
+            ))
+        self.llm = self.backends[0].client
 
         # Get model name for tracing
-        from saed.core.config.settings import get_provider_model
+        self.model_name = self.backends[0].model
+        self.count_tokens = get_token_counter(self.backends[0].provider, self.model_name)
 
-        self.model_name = get_provider_model(
-            self.config.llm.active_provider, self.config
-        )
+        # Set by the executor when candidates are rendered with label/comment
+        self.candidate_renderer: CandidateRenderer | None = None
+        self.candidate_max_chars = self.config.defaults.candidates.max_chars
 
     def _build_prompt(self, data: dict[str, Any]) -> str:
         """Build the complete prompt string for tracing."""
@@ -159,10 +265,190 @@ class DetailedSelector:
             f"Candidates: {data['current_level_ontology_classes']}"
         )
 
+    def _format_candidates(self, candidates: list[str]) -> str:
+        """Render candidates for the prompt (names, or descriptions if enabled)."""
+        if self.candidate_renderer is None:
+            return ", ".join(candidates)
+        return self.candidate_renderer.render(candidates, self.candidate_max_chars)
+
+    def _plan_agents(
+        self,
+        table_name: str,
+        table_in_markdown: str,
+        column_name: str,
+        candidates: list[str],
+    ) -> list[list[str]]:
+        """Split the candidates of an EDM step among agents.
+
+        Without ``edm_options.token_budget`` the agent count follows
+        ``classes_per_agent``. With a budget, candidates are packed into as few
+        agents as fit it next to the rest of the prompt (template, table
+        preview), so long-context models get fewer, fuller agents and no
+        prompt exceeds a small model's context.
+        """
+        options = self.edm_options
+        if options.token_budget is None:
+            num_agents = num_edm_agents(
+                len(candidates), options.classes_per_agent, options.agents_per_class
+            )
+            return assign_classes_to_agents(
+                candidates, num_agents, options.agents_per_class, options.seed
+            )
+
+        base_prompt = self.llm.prompt.format(
+            table_name=table_name,
+            table_in_markdown=table_in_markdown,
+            column_name=column_name,
+            current_level_ontology_classes="",
+        )
+        capacity = options.token_budget - self.count_tokens(base_prompt)
+        if capacity <= 0:
+            logger.warning(
+                f"Prompt for column {column_name} exceeds the EDM token budget "
+                f"({options.token_budget}) without candidates; one class per agent"
+            )
+        return pack_classes_by_tokens(
+            candidates,
+            options.agents_per_class,
+            capacity,
+            lambda name: self.count_tokens(self._format_candidates([name])),
+            options.seed,
+        )
+
+    def _check_cancelled(self) -> None:
+        if self.cancel_token:
+            self.cancel_token.raise_if_cancelled()
+
+    def _build_response(
+        self, backend: LLMBackend, llm_result: LLMResult, latency_ms: int
+    ) -> LLMResponseDetail:
+        raw_response = llm_result.content
+        reasoning = None
+        if self.prompt_type == "cot":
+            reasoning = extract_reasoning(raw_response)
+        return LLMResponseDetail(
+            raw=raw_response,
+            reasoning=reasoning,
+            answer=extract_answer(raw_response) or "",
+            latency_ms=latency_ms,
+            input_tokens=llm_result.input_tokens,
+            output_tokens=llm_result.output_tokens,
+            total_tokens=llm_result.total_tokens,
+            provider=backend.provider,
+        )
+
+    def _hedge_delay(self, index: int) -> float | None:
+        """Seconds to wait for backend ``index`` before hedging, None to not hedge."""
+        if not self.hedge_requests or index + 1 >= len(self.backends):
+            return None
+        p95 = latency_tracker.percentile(
+            self.backends[index].key, 0.95, self.config.llm.hedge_min_samples
+        )
+        return p95 / 1000 if p95 is not None else None
+
+    def _generate(self, backend: LLMBackend, data: dict[str, Any]) -> LLMResponseDetail:
+        start_time = time.time()
+        llm_result = backend.client.generate(data)
+        latency_ms = int((time.time() - start_time) * 1000)
+        latency_tracker.record(backend.key, latency_ms)
+        return self._build_response(backend, llm_result, latency_ms)
+
+    async def _agenerate(self, backend: LLMBackend, data: dict[str, Any]) -> LLMResponseDetail:
+        start_time = time.time()
+        llm_result = await backend.client.agenerate(data)
+        latency_ms = int((time.time() - start_time) * 1000)
+        latency_tracker.record(backend.key, latency_ms)
+        return self._build_response(backend, llm_result, latency_ms)
+
+    def _generate_hedged(
+        self, index: int, data: dict[str, Any], delay: float
+    ) -> LLMResponseDetail:
+        """Call backend ``index``; past ``delay`` also ask the next one.
+
+        The first response with an ``<answer>`` wins; the slower request is
+        abandoned (its thread finishes in the background).
+        """
+        pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            pending = {pool.submit(self._generate, self.backends[index], data)}
+            done, pending = wait_futures(pending, timeout=delay)
+            if not done:
+                logger.info(
+                    f"Hedging request to {self.backends[index].key} "
+                    f"after {delay:.1f}s with {self.backends[index + 1].key}"
+                )
+                pending.add(pool.submit(self._generate, self.backends[index + 1], data))
+            return self._first_answer(done, pending)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _first_answer(
+        self, done: set[Future], pending: set[Future]
+    ) -> LLMResponseDetail:
+        fallback: LLMResponseDetail | None = None
+        error: BaseException | None = None
+        while True:
+            for future in done:
+                if future.exception() is not None:
+                    error = error or future.exception()
+                elif future.result().answer:
+                    return future.result()
+                else:
+                    fallback = fallback or future.result()
+            if not pending:
+                break
+            done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+        if fallback is not None:
+            return fallback
+        raise error
+
+    async def _agenerate_hedged(
+        self, index: int, data: dict[str, Any], delay: float
+    ) -> LLMResponseDetail:
+        """Async version of :meth:`_generate_hedged`; the slower request is cancelled."""
+        pending = {asyncio.ensure_future(self._agenerate(self.backends[index], data))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                logger.info(
+                    f"Hedging request to {self.backends[index].key} "
+                    f"after {delay:.1f}s with {self.backends[index + 1].key}"
+                )
+                pending.add(asyncio.ensure_future(self._agenerate(self.backends[index + 1], data)))
+
+            fallback: LLMResponseDetail | None = None
+            error: BaseException | None = None
+            while True:
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                    elif task.result().answer:
+                        return task.result()
+                    else:
+                        fallback = fallback or task.result()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if fallback is not None:
+                return fallback
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
     def _call_llm_with_retry(
         self, data: dict[str, Any]
     ) -> tuple[LLMRequestDetail, LLMResponseDetail]:
-        """Call LLM with retry logic and return detailed request/response."""
+        """Call LLM with retry logic and return detailed request/response.
+
+        Each attempt walks the fallback chain: a failing provider hands the
+        request to the next one immediately, and only when every provider
+        failed does the attempt back off. With hedging enabled, a request
+        slower than the p95 latency of its model is duplicated to the next
+        provider.
+        """
         prompt = self._build_prompt(data)
         request = LLMRequestDetail(
             prompt=prompt,
@@ -172,33 +458,31 @@ class DetailedSelector:
 
         last_error = None
         for attempt in range(self.max_retries):
-            try:
-                start_time = time.time()
-                llm_result = self.llm.generate(data)
-                latency_ms = int((time.time() - start_time) * 1000)
-
-                raw_response = llm_result.content
-                answer = extract_answer(raw_response) or ""
-                reasoning = None
-                if self.prompt_type == "cot":
-                    reasoning = extract_reasoning(raw_response)
-
-                response = LLMResponseDetail(
-                    raw=raw_response,
-                    reasoning=reasoning,
-                    answer=answer,
-                    latency_ms=latency_ms,
-                    input_tokens=llm_result.input_tokens,
-                    output_tokens=llm_result.output_tokens,
-                    total_tokens=llm_result.total_tokens,
-                )
-                return request, response
+            for index, backend in enumerate(self.backends):
+                self._check_cancelled()
+                try:
+                    delay = self._hedge_delay(index)
+                    if delay is None:
+                        response = self._generate(backend, data)
+                    else:
+                        response = self._generate_hedged(index, data, delay)
+                    request.model = next(
+                        b.model for b in self.backends if b.provider == response.provider
+                    )
+                    return request, response
 
-            except Exception as e:
-                last_error = str(e)
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
+                except Exception as e:
+                    last_error = str(e)
+                    if index + 1 < len(self.backends):
+                        logger.warning(f"{backend.provider} failed ({e}), falling back")
+
+            if attempt < self.max_retries - 1:
+                # Exponential backoff: 1s, 2s, 4s (cut short by cancellation)
+                if self.cancel_token:
+                    self.cancel_token.wait(2**attempt)
+                else:
                     time.sleep(2**attempt)
+                self._check_cancelled()
 
         # All retries failed
         response = LLMResponseDetail(
@@ -221,33 +505,31 @@ class DetailedSelector:
 
         last_error = None
         for attempt in range(self.max_retries):
-            try:
-                start_time = time.time()
-                llm_result = await self.llm.agenerate(data)
-                latency_ms = int((time.time() - start_time) * 1000)
-
-                raw_response = llm_result.content
-                answer = extract_answer(raw_response) or ""
-                reasoning = None
-                if self.prompt_type == "cot":
-                    reasoning = extract_reasoning(raw_response)
-
-                response = LLMResponseDetail(
-                    raw=raw_response,
-                    reasoning=reasoning,
-                    answer=answer,
-                    latency_ms=latency_ms,
-                    input_tokens=llm_result.input_tokens,
-                    output_tokens=llm_result.output_tokens,
-                    total_tokens=llm_result.total_tokens,
-                )
-                return request, response
+            for index, backend in enumerate(self.backends):
+                self._check_cancelled()
+                try:
+                    delay = self._hedge_delay(index)
+                    if delay is None:
+                        response = await self._agenerate(backend, data)
+                    else:
+                        response = await self._agenerate_hedged(index, data, delay)
+                    request.model = next(
+                        b.model for b in self.backends if b.provider == response.provider
+                    )
+                    return request, response
 
-            except Exception as e:
-                last_error = str(e)
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
+                except Exception as e:
+                    last_error = str(e)
+                    if index + 1 < len(self.backends):
+                        logger.warning(f"{backend.provider} failed ({e}), falling back")
+
+            if attempt < self.max_retries - 1:
+                # Exponential backoff: 1s, 2s, 4s (cut short by cancellation)
+                if self.cancel_token:
+                    await self.cancel_token.wait_async(2**attempt)
+                else:
                     await asyncio.sleep(2**attempt)
+                self._check_cancelled()
 
         # All retries failed
         response = LLMResponseDetail(
@@ -272,7 +554,7 @@ class DetailedSelector:
             "table_name": table_name,
             "table_in_markdown": table_in_markdown,
             "column_name": column_name,
-            "current_level_ontology_classes": ", ".join(candidates),
+            "current_level_ontology_classes": self._format_candidates(candidates),
         }
 
         try:
@@ -296,6 +578,8 @@ class DetailedSelector:
                 llm_response=response,
             )
 
+        except RunCancelled:
+            raise
         except Exception as e:
             return SelectionResult(
                 selected=[],
@@ -318,7 +602,7 @@ class DetailedSelector:
             "table_name": table_name,
             "table_in_markdown": table_in_markdown,
             "column_name": column_name,
-            "current_level_ontology_classes": ", ".join(candidates),
+            "current_level_ontology_classes": self._format_candidates(candidates),
         }
 
         try:
@@ -342,6 +626,8 @@ class DetailedSelector:
                 llm_response=response,
             )
 
+        except RunCancelled:
+            raise
         except Exception as e:
             return SelectionResult(
                 selected=[],
@@ -360,20 +646,12 @@ class DetailedSelector:
         if not candidates:
             return SelectionResult(selected=[], status="completed")
 
-        # Calculate number of agents
-        avg_classes_per_agent = self.edm_options.classes_per_agent
-        avg_agents_per_class = self.edm_options.agents_per_class
         consensus_threshold = self.edm_options.consensus_threshold
 
-        num_classes = len(candidates)
-        num_agents = max(
-            avg_agents_per_class,
-            (num_classes * avg_agents_per_class) // avg_classes_per_agent + 1,
-        )
-
         # Assign classes to agents
-        agents_assignments = self._assign_classes_to_agents(
-            candidates, num_agents, avg_agents_per_class
+        seed = self.edm_options.seed
+        agents_assignments = self._plan_agents(
+            table_name, table_in_markdown, column_name, candidates
         )
 
         # Count how many agents saw each class
@@ -404,7 +682,7 @@ class DetailedSelector:
                 "table_name": table_name,
                 "table_in_markdown": table_in_markdown,
                 "column_name": column_name,
-                "current_level_ontology_classes": ", ".join(agent_classes),
+                "current_level_ontology_classes": self._format_candidates(agent_classes),
             }
 
             try:
@@ -423,6 +701,8 @@ class DetailedSelector:
                     agent_result.status = "success"
                     agent_result.voted_classes = []
 
+            except RunCancelled:
+                raise
             except Exception as e:
                 agent_result.status = "failed"
                 agent_result.error = str(e)
@@ -462,6 +742,7 @@ class DetailedSelector:
             total_agents=len(agents_assignments),
             votes_summary=votes_summary,
             agents=agent_results,
+            seed=seed,
         )
 
         # Determine status
@@ -489,20 +770,12 @@ class DetailedSelector:
         if not candidates:
             return SelectionResult(selected=[], status="completed")
 
-        # Calculate number of agents
-        avg_classes_per_agent = self.edm_options.classes_per_agent
-        avg_agents_per_class = self.edm_options.agents_per_class
         consensus_threshold = self.edm_options.consensus_threshold
 
-        num_classes = len(candidates)
-        num_agents = max(
-            avg_agents_per_class,
-            (num_classes * avg_agents_per_class) // avg_classes_per_agent + 1,
-        )
-
         # Assign classes to agents
-        agents_assignments = self._assign_classes_to_agents(
-            candidates, num_agents, avg_agents_per_class
+        seed = self.edm_options.seed
+        agents_assignments = self._plan_agents(
+            table_name, table_in_markdown, column_name, candidates
         )
 
         # Count how many agents saw each class
@@ -533,7 +806,7 @@ class DetailedSelector:
                 "table_name": table_name,
                 "table_in_markdown": table_in_markdown,
                 "column_name": column_name,
-                "current_level_ontology_classes": ", ".join(agent_classes),
+                "current_level_ontology_classes": self._format_candidates(agent_classes),
             }
 
             try:
@@ -552,6 +825,8 @@ class DetailedSelector:
                     agent_result.status = "success"
                     agent_result.voted_classes = []
 
+            except RunCancelled:
+                raise
             except Exception as e:
                 agent_result.status = "failed"
                 agent_result.error = str(e)
@@ -591,6 +866,7 @@ class DetailedSelector:
             total_agents=len(agents_assignments),
             votes_summary=votes_summary,
             agents=agent_results,
+            seed=seed,
         )
 
         # Determine status
@@ -607,28 +883,6 @@ class DetailedSelector:
             edm_result=edm_result,
         )
 
-    def _assign_classes_to_agents(
-        self,
-        classes: list[str],
-        num_agents: int,
-        avg_agents_per_class: int,
-    ) -> list[list[str]]:
-        """Assign classes to agents for EDM."""
-        agents_assignments: list[list[str]] = [[] for _ in range(num_agents)]
-
-        for class_ in classes:
-            if num_agents < avg_agents_per_class:
-                assigned_agents = range(num_agents)
-            else:
-                assigned_agents = random.sample(range(num_agents), avg_agents_per_class)
-            for agent in assigned_agents:
-                agents_assignments[agent].append(class_)
-
-        if not agents_assignments:
-            agents_assignments = [classes]
-
-        return agents_assignments
-
     def select(
         self,
         table_name: str,
@@ -667,6 +921,7 @@ class DetailedSelector:
 # Type for SSE callback (sync and async)
 SSECallback = Callable[[str, dict[str, Any]], None]
 AsyncSSECallback = Callable[[str, dict[str, Any]], Any]  # Returns coroutine
+SelectionCallback = Callable[[str, SelectionResult], None]  # (parent_url, result)
 
 
 class RunExecutor:
@@ -682,23 +937,37 @@ class RunExecutor:
         k: int = 5,
         sse_callback: SSECallback | None = None,
         async_sse_callback: AsyncSSECallback | None = None,
+        cancel_token: CancellationToken | None = None,
+        candidate_options: CandidateOptions | None = None,
     ) -> None:
         self.config = config or load_config()
         self.mode = mode
         self.prompt_type = prompt_type
         self.edm_options = edm_options
+        self.candidate_options = candidate_options or self.config.defaults.candidates
         self.max_depth = max_depth
         self.k = k
         self.sse_callback = sse_callback
         self.async_sse_callback = async_sse_callback
+        self.cancel_token = cancel_token
 
         self.selector = DetailedSelector(
             config=self.config,
             mode=mode,
             prompt_type=prompt_type,
             edm_options=edm_options,
+            cancel_token=cancel_token,
         )
 
+    def _prepare_candidates(self, ontology_dag: Any) -> None:
+        """Point the selector's candidate rendering at the column's ontology."""
+        options = self.candidate_options
+        if options.rendering == "described":
+            self.selector.candidate_renderer = get_candidate_renderer(
+                ontology_dag, options.comment_chars
+            )
+            self.selector.candidate_max_chars = options.max_chars
+
     def _emit_event(self, event_type: str, data: dict[str, Any]) -> None:
         """Emit an SSE event if callback is registered."""
         if self.sse_callback:
@@ -716,18 +985,35 @@ class RunExecutor:
         column_name: str,
         ontology_dag: Any,  # OntologyDAG type
         run_id: str = "",
+        selection_cache: dict[str, SelectionResult] | None = None,
+        on_selection: SelectionCallback | None = None,
     ) -> ColumnResultDetail:
-        """Execute BFS annotation for a single column."""
+        """Execute BFS annotation for a single column.
+
+        Args:
+            table_name: Table name used in prompts
+            table_markdown: Sample rows rendered as markdown
+            column_name: Column to annotate
+            ontology_dag: Ontology to traverse
+            run_id: Run ID included in emitted events
+            selection_cache: Selections already made for this column (e.g. restored
+                from a checkpoint), keyed by parent class URL; reused without LLM calls
+            on_selection: Called with each new selection as soon as it is made
+        """
         from collections import deque
 
         steps: list[BFSStepDetail] = []
         final_paths: list[list[str]] = []
-        selection_cache: dict[str, SelectionResult] = {}  # parent_url → SelectionResult
+        if selection_cache is None:
+            selection_cache = {}  # parent_url → SelectionResult
+        self._prepare_candidates(ontology_dag)
 
         # BFS queue: (level, parent_url, path_so_far)
         queue = deque([(0, ontology_dag.root, [])])
 
         while queue:
+            if self.cancel_token and self.cancel_token.cancelled:
+                raise RunCancelled(self._cancelled_column(column_name, steps, final_paths))
             level, parent_url, current_path = queue.popleft()
 
             # Get parent name
@@ -757,13 +1043,19 @@ class RunExecutor:
             if parent_url in selection_cache:
                 result = selection_cache[parent_url]
             else:
-                result = self.selector.select(
-                    table_name=table_name,
-                    table_in_markdown=table_markdown,
-                    column_name=column_name,
-                    candidates=candidates,
-                )
+                try:
+                    result = self.selector.select(
+                        table_name=table_name,
+                        table_in_markdown=table_markdown,
+                        column_name=column_name,
+                        candidates=candidates,
+                    )
+                except RunCancelled as e:
+                    e.partial = self._cancelled_column(column_name, steps, final_paths)
+                    raise
                 selection_cache[parent_url] = result
+                if on_selection:
+                    on_selection(parent_url, result)
 
             # Build step detail
             step = BFSStepDetail(
@@ -845,18 +1137,35 @@ class RunExecutor:
         column_name: str,
         ontology_dag: Any,  # OntologyDAG type
         run_id: str = "",
+        selection_cache: dict[str, SelectionResult] | None = None,
+        on_selection: SelectionCallback | None = None,
     ) -> ColumnResultDetail:
-        """Async version: Execute BFS annotation for a single column."""
+        """Async version: Execute BFS annotation for a single column.
+
+        Args:
+            table_name: Table name used in prompts
+            table_markdown: Sample rows rendered as markdown
+            column_name: Column to annotate
+            ontology_dag: Ontology to traverse
+            run_id: Run ID included in emitted events
+            selection_cache: Selections already made for this column (e.g. restored
+                from a checkpoint), keyed by parent class URL; reused without LLM calls
+            on_selection: Called with each new selection as soon as it is made
+        """
         from collections import deque
 
         steps: list[BFSStepDetail] = []
         final_paths: list[list[str]] = []
-        selection_cache: dict[str, SelectionResult] = {}  # parent_url → SelectionResult
+        if selection_cache is None:
+            selection_cache = {}  # parent_url → SelectionResult
+        self._prepare_candidates(ontology_dag)
 
         # BFS queue: (level, parent_url, path_so_far)
         queue = deque([(0, ontology_dag.root, [])])
 
         while queue:
+            if self.cancel_token and self.cancel_token.cancelled:
+                raise RunCancelled(self._cancelled_column(column_name, steps, final_paths))
             level, parent_url, current_path = queue.popleft()
 
             # Get parent name
@@ -886,13 +1195,19 @@ class RunExecutor:
             if parent_url in selection_cache:
                 result = selection_cache[parent_url]
             else:
-                result = await self.selector.select_async(
-                    table_name=table_name,
-                    table_in_markdown=table_markdown,
-                    column_name=column_name,
-                    candidates=candidates,
-                )
+                try:
+                    result = await self.selector.select_async(
+                        table_name=table_name,
+                        table_in_markdown=table_markdown,
+                        column_name=column_name,
+                        candidates=candidates,
+                    )
+                except RunCancelled as e:
+                    e.partial = self._cancelled_column(column_name, steps, final_paths)
+                    raise
                 selection_cache[parent_url] = result
+                if on_selection:
+                    on_selection(parent_url, result)
 
             # Build step detail
             step = BFSStepDetail(
@@ -967,6 +1282,18 @@ class RunExecutor:
             error=error,
         )
 
+    def _cancelled_column(
+        self, column_name: str, steps: list[BFSStepDetail], final_paths: list[list[str]]
+    ) -> ColumnResultDetail:
+        """Build the partial result of a column interrupted by cancellation."""
+        return ColumnResultDetail(
+            column_name=column_name,
+            status="cancelled",
+            steps=list(steps),
+            final_paths=list(final_paths) or [[]],
+            error="Run cancelled",
+        )
+
     def _step_to_dict(self, step: BFSStepDetail) -> dict[str, Any]:
         """Convert BFSStepDetail to dictionary for SSE."""
         result: dict[str, Any] = {
@@ -994,12 +1321,14 @@ class RunExecutor:
                 "input_tokens": step.llm_response.input_tokens,
                 "output_tokens": step.llm_response.output_tokens,
                 "total_tokens": step.llm_response.total_tokens,
+                "provider": step.llm_response.provider,
             }
 
         if step.edm_result:
             result["edm_result"] = {
                 "consensus_threshold": step.edm_result.consensus_threshold,
                 "total_agents": step.edm_result.total_agents,
+                "seed": step.edm_result.seed,
                 "votes_summary": [
                     {
                         "class_name": v.class_name,
@@ -1034,6 +1363,7 @@ class RunExecutor:
                                 "input_tokens": a.llm_response.input_tokens,
                                 "output_tokens": a.llm_response.output_tokens,
                                 "total_tokens": a.llm_response.total_tokens,
+                                "provider": a.llm_response.provider,
                             }
                             if a.llm_response
                             else None
@@ -1049,11 +1379,14 @@ class RunExecutor:
 __all__ = [
     "RunExecutor",
     "DetailedSelector",
+    "CancellationToken",
+    "RunCancelled",
     "SelectionResult",
     "BFSStepDetail",
     "ColumnResultDetail",
     "LLMRequestDetail",
     "LLMResponseDetail",
+    "LLMBackend",
     "EDMResultDetail",
     "AgentResultDetail",
     "VoteSummaryDetail",
@@ -0,0 +1,5 @@
+"""Persistent job queue for annotation runs."""
+
+from saed.core.jobs.queue import Job, JobQueue
+
+__all__ = ["Job", "JobQueue"]
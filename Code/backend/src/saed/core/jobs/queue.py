@@ -0,0 +1,302 @@
+"""SQLite-backed persistent queue for annotation run jobs."""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    provider TEXT NOT NULL DEFAULT '',
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    owner TEXT,
+    heartbeat_at REAL,
+    cancel_requested INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority DESC, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_run_id ON jobs (run_id);
+"""
+
+
+@dataclass
+class Job:
+    """A queued annotation run."""
+
+    id: int
+    run_id: str
+    provider: str
+    priority: int
+    status: str  # queued, running, done, failed, cancelled
+    payload: dict[str, Any]
+    attempts: int = 0
+    error: str | None = None
+    created_at: str = ""
+    started_at: str | None = None
+    finished_at: str | None = None
+    owner: str | None = None  # "host:pid" of the process running the job
+    heartbeat_at: float | None = None  # Last lease renewal (epoch seconds)
+    cancel_requested: bool = False
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Job":
+        """Create from a database row."""
+        data = dict(row)
+        data["payload"] = json.loads(data["payload"])
+        data["cancel_requested"] = bool(data.get("cancel_requested"))
+        return cls(**data)
+
+
+def default_owner() -> str:
+    """Identify the current process as a job lease owner."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """Durable priority queue of run jobs shared by all API processes.
+
+    A claimed job is leased to its owner process, which renews the lease with
+    :meth:`heartbeat` while the job runs. Jobs whose lease expired (owner
+    crashed or was killed) are put back with :meth:`requeue_stale`; jobs of
+    live sibling processes are left alone. Claims happen in an immediate
+    transaction, so several worker processes may share one database file.
+
+    All methods block on SQLite; call them off the event loop in async code.
+    """
+
+    def __init__(self, db_path: Path, owner: str | None = None) -> None:
+        self.db_path = db_path
+        self.owner = owner or default_owner()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "cancel_requested" not in columns:
+                conn.execute(
+                    "ALTER TABLE jobs ADD COLUMN cancel_requested INTEGER NOT NULL DEFAULT 0"
+                )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(
+        self,
+        run_id: str,
+        payload: dict[str, Any],
+        provider: str = "",
+        priority: int = 0,
+    ) -> Job:
+        """Add a job to the queue.
+
+        Args:
+            run_id: Run the job executes
+            payload: JSON-serializable run request
+            provider: LLM provider the run uses (for concurrency quotas)
+            priority: Higher values are claimed first
+
+        Returns:
+            The queued job
+        """
+        created_at = datetime.now().isoformat()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (run_id, provider, priority, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (run_id, provider, priority, json.dumps(payload, default=str), created_at),
+            )
+            job_id = cursor.lastrowid
+        logger.debug(f"Queued job {job_id} for run {run_id} (priority {priority})")
+        return Job(
+            id=job_id,
+            run_id=run_id,
+            provider=provider,
+            priority=priority,
+            status="queued",
+            payload=payload,
+            created_at=created_at,
+        )
+
+    def claim(self, exclude_providers: set[str] | None = None) -> Job | None:
+        """Atomically take the highest-priority queued job.
+
+        Args:
+            exclude_providers: Providers whose concurrency quota is exhausted
+
+        Returns:
+            The claimed job (now ``running``), or None if nothing is eligible
+        """
+        excluded = sorted(exclude_providers or ())
+        placeholders = ", ".join("?" for _ in excluded)
+        provider_filter = f"AND provider NOT IN ({placeholders})" if excluded else ""
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    f"SELECT * FROM jobs WHERE status = 'queued' {provider_filter} "
+                    "ORDER BY priority DESC, id ASC LIMIT 1",
+                    excluded,
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                started_at = datetime.now().isoformat()
+                heartbeat_at = time.time()
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, "
+                    "started_at = ?, owner = ?, heartbeat_at = ? WHERE id = ?",
+                    (started_at, self.owner, heartbeat_at, row["id"]),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        job = Job.from_row(row)
+        job.status = "running"
+        job.attempts += 1
+        job.started_at = started_at
+        job.owner = self.owner
+        job.heartbeat_at = heartbeat_at
+        return job
+
+    def heartbeat(self, job_ids: list[int]) -> list[str]:
+        """Renew the leases of jobs this process is running.
+
+        Returns:
+            Run IDs of those jobs for which cancellation was requested
+        """
+        if not job_ids:
+            return []
+        placeholders = ", ".join("?" for _ in job_ids)
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = 'running' "
+                f"AND id IN ({placeholders})",
+                (time.time(), self.owner, *job_ids),
+            )
+            rows = conn.execute(
+                f"SELECT run_id FROM jobs WHERE cancel_requested = 1 AND status = 'running' "
+                f"AND id IN ({placeholders})",
+                job_ids,
+            ).fetchall()
+        return [row["run_id"] for row in rows]
+
+    def request_cancel(self, run_id: str) -> int:
+        """Flag the running jobs of a run for cancellation.
+
+        The owning process sees the flag on its next :meth:`heartbeat`, so this
+        works whichever API process executes the run.
+
+        Returns:
+            Number of running jobs flagged
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE run_id = ? AND status = 'running'",
+                (run_id,),
+            )
+            return cursor.rowcount
+
+    def finish(self, job_id: int, status: str = "done", error: str | None = None) -> None:
+        """Mark a claimed job as finished (done, failed or cancelled)."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, error, datetime.now().isoformat(), job_id),
+            )
+
+    def release(self, job_id: int) -> None:
+        """Return a claimed job to the queue (e.g. when the worker shuts down)."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, owner = NULL, "
+                "heartbeat_at = NULL WHERE id = ?",
+                (job_id,),
+            )
+
+    def discard(self, run_id: str) -> int:
+        """Cancel queued (not yet running) jobs of a run.
+
+        Returns:
+            Number of jobs cancelled
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? "
+                "WHERE run_id = ? AND status = 'queued'",
+                (datetime.now().isoformat(), run_id),
+            )
+            return cursor.rowcount
+
+    def requeue_stale(self, lease_seconds: float) -> list[str]:
+        """Put running jobs whose lease expired back into the queue.
+
+        Jobs of processes that still renew their lease are not touched, so it
+        is safe to call this from every process sharing the database.
+
+        Args:
+            lease_seconds: Age after which an unrenewed lease counts as dead
+
+        Returns:
+            Run IDs of the requeued jobs
+        """
+        cutoff = time.time() - lease_seconds
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    "SELECT id, run_id, owner FROM jobs WHERE status = 'running' "
+                    "AND (heartbeat_at IS NULL OR heartbeat_at < ?)",
+                    (cutoff,),
+                ).fetchall()
+                conn.executemany(
+                    "UPDATE jobs SET status = 'queued', started_at = NULL, owner = NULL, "
+                    "heartbeat_at = NULL WHERE id = ?",
+                    [(row["id"],) for row in rows],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        for row in rows:
+            logger.info(f"Requeued job {row['id']} (run {row['run_id']}) from {row['owner']}")
+        return [row["run_id"] for row in rows]
+
+    def get_latest(self, run_id: str) -> Job | None:
+        """Get the most recent job of a run."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE run_id = ? ORDER BY id DESC LIMIT 1", (run_id,)
+            ).fetchone()
+        return Job.from_row(row) if row else None
+
+    def count(self, status: str = "queued") -> int:
+        """Count jobs with the given status."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()
+        return row[0]
@@ -1,6 +1,7 @@
 """Labels module for managing ground truth label files."""
 
 from saed.core.labels.loader import (
+    LabelsIndex,
     load_labels_file,
     parse_labels_to_paths,
     paths_to_string,
@@ -10,6 +11,7 @@ from saed.core.labels.registry import LabelsEntry, LabelsRegistry
 
 __all__ = [
     "LabelsEntry",
+    "LabelsIndex",
     "LabelsRegistry",
     "load_labels_file",
     "parse_labels_to_paths",
@@ -1,6 +1,8 @@
 """Labels file loading and parsing utilities."""
 
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 
@@ -29,6 +31,27 @@ def load_labels_file(file_path: Path) -> pd.DataFrame:
     return pd.read_csv(file_path)
 
 
+# Class columns of a labels row: (level 1, level 2) of the first and second class
+CLASS_COLUMNS = (
+    "class1_level1_name",
+    "class1_level2_name",
+    "class2_level1_name",
+    "class2_level2_name",
+)
+
+
+def _parse_paths(c1_l1: Any, c1_l2: Any, c2_l1: Any, c2_l2: Any) -> list[list[str]]:
+    """Parse the class columns of a labels row into paths ("-" or NaN for none)."""
+    paths = []
+    for level1, level2 in ((c1_l1, c1_l2), (c2_l1, c2_l2)):
+        if pd.notna(level1) and str(level1) != "-":
+            path = [str(level1)]
+            if pd.notna(level2) and str(level2) != "-":
+                path.append(str(level2))
+            paths.append(path)
+    return paths
+
+
 def parse_labels_to_paths(row: pd.Series) -> list[list[str]]:
     """Parse a labels row into ground truth paths.
 
@@ -39,33 +62,102 @@ def parse_labels_to_paths(row: pd.Series) -> list[list[str]]:
         List of paths, where each path is a list of class names.
         E.g., [["TemporalEntity", "Interval"], ["Measurement", "PowerUnit"]]
     """
-    paths = []
+    return _parse_paths(*(row.get(column, "-") for column in CLASS_COLUMNS))
 
-    # Parse first class path
-    c1_l1 = row.get("class1_level1_name", "-")
-    c1_l2 = row.get("class1_level2_name", "-")
 
-    if pd.notna(c1_l1) and str(c1_l1) != "-":
-        path = [str(c1_l1)]
-        if pd.notna(c1_l2) and str(c1_l2) != "-":
-            path.append(str(c1_l2))
-        paths.append(path)
+@dataclass
+class LabelsIndex:
+    """Ground truth paths of a labels file, indexed by column.
 
-    # Parse second class path
-    c2_l1 = row.get("class2_level1_name", "-")
-    c2_l2 = row.get("class2_level2_name", "-")
+    Every row is parsed once. ``by_id`` and ``by_name`` map
+    ``(table_id, column_id)`` and ``(table_id, column_name)`` to the first
+    row (in file order) with that key, so a lookup is a dict access instead
+    of a scan of the labels.
 
-    if pd.notna(c2_l1) and str(c2_l1) != "-":
-        path = [str(c2_l1)]
-        if pd.notna(c2_l2) and str(c2_l2) != "-":
-            path.append(str(c2_l2))
-        paths.append(path)
+    Attributes:
+        paths: Ground truth paths of each row
+        by_id: Row of each (table_id, column_id)
+        by_name: Row of each (table_id, column_name)
+    """
 
-    return paths
+    paths: list[list[list[str]]] = field(default_factory=list)
+    by_id: dict[tuple[Any, Any], int] = field(default_factory=dict)
+    by_name: dict[tuple[Any, Any], int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @classmethod
+    def from_dataframe(cls, df_labels: pd.DataFrame) -> "LabelsIndex":
+        """Build the index of a labels DataFrame (see :func:`load_labels_file`)."""
+
+        def values(column: str, default: Any) -> list[Any]:
+            if column in df_labels.columns:
+                return df_labels[column].tolist()
+            return [default] * len(df_labels)
+
+        index = cls(
+            paths=[
+                _parse_paths(*levels)
+                for levels in zip(*(values(c, "-") for c in CLASS_COLUMNS), strict=True)
+            ]
+        )
+        keys = zip(
+            df_labels["table_id"].tolist(),
+            values("column_id", None),
+            values("column_name", None),
+            strict=True,
+        )
+        for row, (table_id, column_id, column_name) in enumerate(keys):
+            if column_id is not None:
+                index.by_id.setdefault((table_id, column_id), row)
+            if column_name is not None:
+                index.by_name.setdefault((table_id, column_name), row)
+        return index
+
+    def match(
+        self, table_id: str, column_id: int | None = None, column_name: str | None = None
+    ) -> list[list[str]] | None:
+        """Get the paths of the first row of the table matching the column's ID or name.
+
+        Args:
+            table_id: Table ID (filename)
+            column_id: Column index (0-based)
+            column_name: Column name
+
+        Returns:
+            Copy of the ground truth paths, or None if no row matches
+        """
+        rows = [
+            row
+            for row in (
+                self.by_id.get((table_id, column_id)),
+                self.by_name.get((table_id, column_name)),
+            )
+            if row is not None
+        ]
+        return self._paths(min(rows)) if rows else None
+
+    def get(
+        self, table_id: str, column_id: int | None = None, column_name: str | None = None
+    ) -> list[list[str]] | None:
+        """Get the paths of the column, matched by ID first and by name second.
+
+        Returns:
+            Copy of the ground truth paths, or None if not found
+        """
+        for key, rows in (((table_id, column_id), self.by_id), ((table_id, column_name), self.by_name)):
+            if key[1] is not None and (row := rows.get(key)) is not None:
+                return self._paths(row)
+        return None
+
+    def _paths(self, row: int) -> list[list[str]]:
+        # Copied: indexes are cached and shared between evaluations
+        return [list(path) for path in self.paths[row]]
 
 
 def get_labels_for_column(
-    df_labels: pd.DataFrame,
+    df_labels: "pd.DataFrame | LabelsIndex",
     table_id: str,
     column_id: int | None = None,
     column_name: str | None = None,
@@ -73,7 +165,8 @@ def get_labels_for_column(
     """Get ground truth paths for a specific column.
 
     Args:
-        df_labels: Labels DataFrame
+        df_labels: Labels DataFrame, or its index (build it once with
+            :meth:`LabelsIndex.from_dataframe` when looking up many columns)
         table_id: Table ID (filename)
         column_id: Column index (0-based)
         column_name: Column name (used if column_id not found)
@@ -81,21 +174,9 @@ def get_labels_for_column(
     Returns:
         List of ground truth paths or None if not found
     """
-    # Try matching by table_id and column_id first
-    if column_id is not None:
-        mask = (df_labels["table_id"] == table_id) & (df_labels["column_id"] == column_id)
-        matches = df_labels[mask]
-        if not matches.empty:
-            return parse_labels_to_paths(matches.iloc[0])
-
-    # Try matching by table_id and column_name
-    if column_name is not None:
-        mask = (df_labels["table_id"] == table_id) & (df_labels["column_name"] == column_name)
-        matches = df_labels[mask]
-        if not matches.empty:
-            return parse_labels_to_paths(matches.iloc[0])
-
-    return None
+    if isinstance(df_labels, pd.DataFrame):
+        df_labels = LabelsIndex.from_dataframe(df_labels)
+    return df_labels.get(table_id, column_id, column_name)
 
 
 def paths_to_string(paths: list[list[str]], path_sep: str = "|", level_sep: str = "/") -> str:
@@ -1,17 +1,29 @@
 """Labels registry for managing ground truth label files."""
 
-import hashlib
-import json
 import logging
+import threading
 import uuid
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import ClassVar
 
 import pandas as pd
 
+from saed.core.catalog import get_catalog
+from saed.core.labels.loader import LabelsIndex, load_labels_file
+from saed.core.utils.files import compute_file_hash, file_fingerprint
+from saed.core.utils.registry_store import SharedRegistry
+
 logger = logging.getLogger(__name__)
 
+# Parsed labels files kept in memory, by content hash
+MAX_CACHED_INDEXES = 8
+
+_index_cache: OrderedDict[str, LabelsIndex] = OrderedDict()
+_index_cache_lock = threading.Lock()
+
 
 @dataclass
 class LabelsEntry:
@@ -24,6 +36,7 @@ class LabelsEntry:
     total_tables: int = 0
     total_columns: int = 0
     file_hash: str = ""
+    file_stat: str = ""  # size:mtime_ns:inode when file_hash was verified
     created_at: str = ""
 
     def to_dict(self) -> dict:
@@ -37,43 +50,39 @@ class LabelsEntry:
 
 
 @dataclass
-class LabelsRegistry:
-    """Registry for managing ground truth label files."""
+class LabelsRegistry(SharedRegistry):
+    """Registry for managing ground truth label files.
+
+    Shared per labels directory within a process; see :class:`SharedRegistry`.
+    """
+
+    _entry_type: ClassVar[type] = LabelsEntry
+    _entries_field: ClassVar[str] = "labels"
 
     labels: dict[str, LabelsEntry] = field(default_factory=dict)
     _registry_path: Path | None = field(default=None, repr=False)
     _labels_dir: Path | None = field(default=None, repr=False)
 
     @classmethod
-    def load(cls, labels_dir: Path) -> "LabelsRegistry":
-        """Load registry from JSON file or create new one."""
-        registry_path = labels_dir / "registry.json"
-        registry = cls(_registry_path=registry_path, _labels_dir=labels_dir)
-
-        if registry_path.exists():
-            try:
-                with open(registry_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                for entry_data in data.get("labels", []):
-                    entry = LabelsEntry.from_dict(entry_data)
-                    registry.labels[entry.id] = entry
-                logger.debug(f"Loaded labels registry with {len(registry.labels)} entries")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to load labels registry: {e}, creating new one")
-
-        return registry
+    def load(cls, labels_dir: Path, catalog: Path | None = None) -> "LabelsRegistry":
+        """Get the registry of a directory, loading it from its JSON file.
 
-    def save(self) -> None:
-        """Save registry to JSON file."""
-        if self._registry_path is None:
-            raise ValueError("Registry path not set")
+        The registry is kept in memory and only reloaded when its file (or
+        its catalog entries) changed.
 
-        data = {"labels": [entry.to_dict() for entry in self.labels.values()]}
+        Args:
+            labels_dir: Directory of the labels files and the registry file
+            catalog: SQLite catalog to store the entries in instead of the file
+        """
+        store = get_catalog(catalog).store("labels") if catalog else None
+        return cls._shared(labels_dir / "registry.json", store, _labels_dir=labels_dir)
 
-        with open(self._registry_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _load_data(self, data: dict) -> None:
+        entries = [LabelsEntry.from_dict(entry_data) for entry_data in data.get("labels", [])]
+        self.labels = {entry.id: entry for entry in entries}
 
-        logger.debug(f"Saved labels registry with {len(self.labels)} entries")
+    def _dump_data(self) -> dict:
+        return {"labels": [entry.to_dict() for entry in self.labels.values()]}
 
     def generate_id(self) -> str:
         """Generate a short unique ID for the labels file."""
@@ -84,11 +93,7 @@ class LabelsRegistry:
 
     def compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA256 hash of file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return f"sha256:{sha256.hexdigest()[:16]}"
+        return compute_file_hash(file_path)
 
     def _compute_stats(self, file_path: Path) -> tuple[int, int]:
         """Compute stats from labels file.
@@ -111,6 +116,7 @@ class LabelsRegistry:
         name: str = "",
         description: str = "",
         custom_id: str | None = None,
+        file_hash: str | None = None,
     ) -> LabelsEntry:
         """Register a new labels file.
 
@@ -119,6 +125,7 @@ class LabelsRegistry:
             name: Display name
             description: Description
             custom_id: Optional custom ID
+            file_hash: Content hash, if already computed (e.g. while uploading)
 
         Returns:
             The created LabelsEntry
@@ -130,30 +137,35 @@ class LabelsRegistry:
         if not file_path.exists():
             raise FileNotFoundError(f"Labels file not found: {filename}")
 
-        # Generate or use custom ID
-        id_ = custom_id if custom_id else self.generate_id()
-
-        # Compute file hash and stats
-        file_hash = self.compute_file_hash(file_path)
+        # Compute file hash and stats; fingerprint first, so a concurrent
+        # change is seen on the next lookup
+        file_stat = file_fingerprint(file_path)
+        if file_hash is None:
+            file_hash = self.compute_file_hash(file_path)
         total_tables, total_columns = self._compute_stats(file_path)
 
         # Use filename as name if not provided
         if not name:
             name = filename.replace(".csv", "").replace("_", " ").title()
 
-        entry = LabelsEntry(
-            id=id_,
-            filename=filename,
-            name=name,
-            description=description,
-            total_tables=total_tables,
-            total_columns=total_columns,
-            file_hash=file_hash,
-            created_at=datetime.now().isoformat(),
-        )
-
-        self.labels[id_] = entry
-        self.save()
+        with self._transaction():
+            # Generate or use custom ID
+            id_ = custom_id if custom_id else self.generate_id()
+
+            entry = LabelsEntry(
+                id=id_,
+                filename=filename,
+                name=name,
+                description=description,
+                total_tables=total_tables,
+                total_columns=total_columns,
+                file_hash=file_hash,
+                file_stat=file_stat,
+                created_at=datetime.now().isoformat(),
+            )
+
+            self.labels[id_] = entry
+            self.save()
 
         logger.info(f"Registered labels: {id_} -> {filename}")
         return entry
@@ -167,12 +179,13 @@ class LabelsRegistry:
         Returns:
             True if removed, False if not found
         """
-        if id_ in self.labels:
+        with self._transaction():
+            if id_ not in self.labels:
+                return False
             del self.labels[id_]
             self.save()
-            logger.info(f"Unregistered labels: {id_}")
-            return True
-        return False
+        logger.info(f"Unregistered labels: {id_}")
+        return True
 
     def get(self, id_: str) -> LabelsEntry | None:
         """Get labels entry by ID."""
@@ -180,10 +193,8 @@ class LabelsRegistry:
 
     def get_by_filename(self, filename: str) -> LabelsEntry | None:
         """Get labels entry by filename."""
-        for entry in self.labels.values():
-            if entry.filename == filename:
-                return entry
-        return None
+        entries = self._lookup("filename", filename)
+        return entries[0] if entries else None
 
     def list_all(self) -> list[LabelsEntry]:
         """List all registered labels."""
@@ -218,6 +229,64 @@ class LabelsRegistry:
 
         return None
 
+    def get_index(self, file_path: Path, file_hash: str | None = None) -> LabelsIndex:
+        """Get the ground truth index of a labels file.
+
+        Indexes are cached by content hash, so repeated evaluations against
+        the same labels parse the file once. The hash of a registered file
+        comes from its entry while the file's fingerprint is unchanged, so
+        a cache hit does not read the file.
+
+        Args:
+            file_path: Labels file
+            file_hash: Content hash of the file, if already computed
+
+        Returns:
+            The shared (read-only) index
+        """
+        if file_hash is None:
+            file_hash = self.current_file_hash(file_path)
+        with _index_cache_lock:
+            index = _index_cache.get(file_hash)
+            if index is not None:
+                _index_cache.move_to_end(file_hash)
+                return index
+
+        index = LabelsIndex.from_dataframe(load_labels_file(file_path))
+        logger.debug(f"Indexed {len(index)} labels of {file_path.name}")
+        with _index_cache_lock:
+            _index_cache[file_hash] = index
+            while len(_index_cache) > MAX_CACHED_INDEXES:
+                _index_cache.popitem(last=False)
+        return index
+
+    def current_file_hash(self, file_path: Path) -> str:
+        """Get the content hash of a labels file, hashing it only if it changed.
+
+        Registered files whose fingerprint matches their entry use the stored
+        hash; a registered file that changed gets its entry updated.
+        """
+        entry = None
+        if self._labels_dir is not None and file_path.parent.resolve() == self._labels_dir.resolve():
+            entry = self.get_by_filename(file_path.name)
+        if entry is None:
+            return self.compute_file_hash(file_path)
+
+        file_stat = file_fingerprint(file_path)
+        if entry.file_stat and file_stat == entry.file_stat:
+            return entry.file_hash
+
+        file_hash = self.compute_file_hash(file_path)
+        with self._transaction():
+            entry = self.labels.get(entry.id)
+            if entry is not None:
+                if file_hash != entry.file_hash:
+                    entry.total_tables, entry.total_columns = self._compute_stats(file_path)
+                entry.file_hash = file_hash
+                entry.file_stat = file_stat
+                self.save()
+        return file_hash
+
     def sync_with_directory(self) -> dict[str, list[str]]:
         """Sync registry with actual files in directory.
 
@@ -227,6 +296,10 @@ class LabelsRegistry:
         if self._labels_dir is None:
             raise ValueError("Labels directory not set")
 
+        with self._transaction():
+            return self._sync_with_directory()
+
+    def _sync_with_directory(self) -> dict[str, list[str]]:
         result = {"added": [], "removed": []}
 
         # Get all CSV files (excluding registry.json)
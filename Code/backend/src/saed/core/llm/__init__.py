@@ -1,5 +1,6 @@
 """LLM module for semantic annotation."""
 
+from saed.core.llm.balancer import EndpointPool, get_endpoint_pool
 from saed.core.llm.client import LLM, LLMResult, SemanticAnnotationClient, create_llm
 from saed.core.llm.parser import extract_answer, parse_class_list
 
@@ -8,6 +9,8 @@ __all__ = [
     "SemanticAnnotationClient",
     "LLM",
     "LLMResult",
+    "EndpointPool",
+    "get_endpoint_pool",
     "extract_answer",
     "parse_class_list",
 ]
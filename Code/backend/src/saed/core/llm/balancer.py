@@ -0,0 +1,156 @@
+"""Load balancing across the inference endpoints of one provider."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from saed.core.config.settings import Config, ProviderName, get_provider_endpoints
+
+logger = logging.getLogger(__name__)
+
+# Health probe of one endpoint URL, returns whether it is healthy
+EndpointProbe = Callable[[str], Awaitable[bool]]
+
+
+@dataclass
+class Endpoint:
+    """An endpoint and its balancing state."""
+
+    url: str
+    weight: float = 1.0
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float | None = None  # Monotonic time of the next probe
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until is not None
+
+
+class EndpointPool:
+    """Least-outstanding-requests balancer with passive health tracking.
+
+    Each request goes to the healthy endpoint with the fewest in-flight
+    requests relative to its weight. An endpoint is ejected after
+    ``max_failures`` consecutive failed requests; once ``ejection_seconds``
+    passed, :meth:`probe` health-checks it and re-admits it if healthy. If
+    every endpoint is ejected, requests still go to the one ejected first
+    rather than failing outright.
+
+    The pool is thread-safe; clients of the same provider share one pool (see
+    :func:`get_endpoint_pool`) so in-flight counts cover the whole process.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[tuple[str, float]],
+        max_failures: int = 3,
+        ejection_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("EndpointPool needs at least one endpoint")
+        self.endpoints = [Endpoint(url, max(weight, 1e-6)) for url, weight in endpoints]
+        self.max_failures = max(1, max_failures)
+        self.ejection_seconds = ejection_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Endpoint:
+        """Pick an endpoint for a request and count it as in flight."""
+        with self._lock:
+            candidates = [e for e in self.endpoints if not e.ejected]
+            if candidates:
+                endpoint = min(candidates, key=lambda e: (e.outstanding + 1) / e.weight)
+            else:
+                endpoint = min(self.endpoints, key=lambda e: e.ejected_until)
+            endpoint.outstanding += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, success: bool) -> None:
+        """Finish a request and update the endpoint's health."""
+        with self._lock:
+            endpoint.outstanding -= 1
+            if success:
+                endpoint.consecutive_failures = 0
+                if endpoint.ejected:
+                    logger.info(f"Endpoint {endpoint.url} answered again, re-admitting")
+                    endpoint.ejected_until = None
+                return
+            endpoint.consecutive_failures += 1
+            if not endpoint.ejected and endpoint.consecutive_failures >= self.max_failures:
+                endpoint.ejected_until = self._clock() + self.ejection_seconds
+                logger.warning(
+                    f"Ejecting endpoint {endpoint.url} after "
+                    f"{endpoint.consecutive_failures} consecutive failures"
+                )
+
+    @contextmanager
+    def lease(self) -> Iterator[Endpoint]:
+        """Acquire an endpoint for the duration of one request.
+
+        The request counts as failed if the block raises.
+        """
+        endpoint = self.acquire()
+        try:
+            yield endpoint
+        except BaseException:
+            self.release(endpoint, success=False)
+            raise
+        self.release(endpoint, success=True)
+
+    def due_for_probe(self) -> list[Endpoint]:
+        """Get the ejected endpoints whose ejection period is over."""
+        now = self._clock()
+        with self._lock:
+            return [e for e in self.endpoints if e.ejected and e.ejected_until <= now]
+
+    async def probe(self, check: EndpointProbe) -> None:
+        """Health-check ejected endpoints that are due and re-admit healthy ones."""
+        for endpoint in self.due_for_probe():
+            try:
+                healthy = await check(endpoint.url)
+            except Exception as e:
+                logger.debug(f"Probe of {endpoint.url} failed: {e}")
+                healthy = False
+            with self._lock:
+                if healthy:
+                    logger.info(f"Endpoint {endpoint.url} is healthy again, re-admitting")
+                    endpoint.ejected_until = None
+                    endpoint.consecutive_failures = 0
+                else:
+                    endpoint.ejected_until = self._clock() + self.ejection_seconds
+
+
+_pools: dict[tuple, EndpointPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_endpoint_pool(provider: ProviderName, config: Config) -> EndpointPool | None:
+    """Get the process-wide pool for a provider with several endpoints.
+
+    Returns:
+        The shared pool, or None if the provider has at most one endpoint
+    """
+    endpoints = get_provider_endpoints(provider, config)
+    if len(endpoints) < 2:
+        return None
+    key = (
+        provider,
+        tuple((e.url, e.weight) for e in endpoints),
+        config.llm.endpoint_max_failures,
+        config.llm.endpoint_ejection_seconds,
+    )
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = EndpointPool(
+                [(e.url, e.weight) for e in endpoints],
+                max_failures=config.llm.endpoint_max_failures,
+                ejection_seconds=config.llm.endpoint_ejection_seconds,
+            )
+        return _pools[key]
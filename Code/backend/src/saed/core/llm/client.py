@@ -1,5 +1,8 @@
 """LLM client for semantic annotation."""
 
+import asyncio
+import functools
+import logging
 import os
 import warnings
 from dataclasses import dataclass
@@ -15,23 +18,6 @@ class LLMResult:
     output_tokens: int | None = None
     total_tokens: int | None = None
 
-from langchain_ollama.llms import OllamaLLM
-from langchain_openai import AzureChatOpenAI, ChatOpenAI
-
-try:
-    from langchain_litellm import ChatLiteLLM  # type: ignore
-except ImportError:  # pragma: no cover - fallback for environments without langchain-lintellm
-    from langchain_community.chat_models import ChatLiteLLM  # type: ignore
-    try:
-        from langchain_core._api.deprecation import LangChainDeprecationWarning
-    except Exception:
-        LangChainDeprecationWarning = DeprecationWarning  # type: ignore[assignment]
-    warnings.filterwarnings(
-        "ignore",
-        category=LangChainDeprecationWarning,
-        message=r".*ChatLiteLLM.*deprecated.*",
-    )
-
 from saed.core.config.settings import (
     Config,
     ProviderName,
@@ -39,7 +25,10 @@ from saed.core.config.settings import (
     get_provider_model,
     load_config,
 )
-from saed.core.llm.prompts import cot_prompt, direct_prompt, edm_cot_prompt, edm_prompt
+from saed.core.llm.balancer import EndpointPool, get_endpoint_pool
+from saed.core.llm.providers import ProviderRegistry
+
+logger = logging.getLogger(__name__)
 
 # Suppress pydantic v1 warnings on Python 3.14+
 warnings.filterwarnings(
@@ -49,11 +38,37 @@ warnings.filterwarnings(
 )
 
 
+# Provider SDKs (langchain_openai, langchain_ollama, litellm, ...) take seconds
+# to import, so each is imported by create_llm when its provider is selected,
+# and the prompt templates (langchain_core) by the first client, not with
+# this module.
+
+
+@functools.cache
+def _chat_litellm() -> type:
+    """Import ChatLiteLLM, from langchain-litellm or else langchain-community."""
+    try:
+        from langchain_litellm import ChatLiteLLM  # type: ignore
+    except ImportError:  # pragma: no cover - fallback for environments without langchain-lintellm
+        from langchain_community.chat_models import ChatLiteLLM  # type: ignore
+        try:
+            from langchain_core._api.deprecation import LangChainDeprecationWarning
+        except Exception:
+            LangChainDeprecationWarning = DeprecationWarning  # type: ignore[assignment]
+        warnings.filterwarnings(
+            "ignore",
+            category=LangChainDeprecationWarning,
+            message=r".*ChatLiteLLM.*deprecated.*",
+        )
+    return ChatLiteLLM
+
+
 def create_llm(
     provider: ProviderName,
     model: str,
     config: Config,
     temperature: float = 0.0,
+    endpoint: str | None = None,
 ):
     """Create a LangChain LLM instance.
 
@@ -62,6 +77,8 @@ def create_llm(
         model: Model name
         config: Configuration object
         temperature: Temperature for generation (default 0.0)
+        endpoint: Server URL overriding ``base_url``/``api_base`` (ollama and
+            litellm only; used for multi-endpoint providers)
 
     Returns:
         LangChain LLM instance
@@ -72,13 +89,17 @@ def create_llm(
     provider_config = get_provider_config(provider, config)
 
     if provider == "ollama":
+        from langchain_ollama.llms import OllamaLLM
+
         return OllamaLLM(
-            base_url=provider_config.base_url,
+            base_url=endpoint or provider_config.base_url,
             model=model,
             temperature=temperature,
         )
 
     elif provider == "azure_openai":
+        from langchain_openai import AzureChatOpenAI
+
         return AzureChatOpenAI(
             azure_endpoint=provider_config.endpoint,
             azure_deployment=model,  # Azure 中通常叫 Deployment Name
@@ -89,6 +110,8 @@ def create_llm(
         )
 
     elif provider == "openai":
+        from langchain_openai import ChatOpenAI
+
         kwargs = {
             "api_key": provider_config.api_key,
             "model": model,
@@ -109,7 +132,7 @@ def create_llm(
             )
         except ImportError:
             os.environ["ANTHROPIC_API_KEY"] = provider_config.api_key
-            return ChatLiteLLM(
+            return _chat_litellm()(
                 model=f"anthropic/{model}",
                 temperature=temperature,
             )
@@ -125,7 +148,7 @@ def create_llm(
             )
         except ImportError:
             os.environ["GEMINI_API_KEY"] = provider_config.api_key
-            return ChatLiteLLM(
+            return _chat_litellm()(
                 model=f"gemini/{model}",
                 temperature=temperature,
             )
@@ -135,7 +158,8 @@ def create_llm(
         if "gpt-5" in model and temperature != 1:
             temperature = 1.0
 
-        if not provider_config.api_base and "/" not in model:
+        api_base = endpoint or provider_config.api_base
+        if not api_base and "/" not in model:
             if model.startswith("azure-"):
                 model = f"azure/{model.removeprefix('azure-')}"
             elif model.startswith("gpt-"):
@@ -146,14 +170,14 @@ def create_llm(
             "temperature": temperature,
         }
 
-        if provider_config.api_base:
-            kwargs["api_base"] = provider_config.api_base
+        if api_base:
+            kwargs["api_base"] = api_base
             kwargs["custom_llm_provider"] = "openai"
 
         if provider_config.api_key:
             kwargs["api_key"] = provider_config.api_key
 
-        return ChatLiteLLM(**kwargs)
+        return _chat_litellm()(**kwargs)
 
     else:
         raise ValueError(
@@ -192,14 +216,61 @@ class SemanticAnnotationClient:
         self._init_llm()
         self._init_prompt()
         self.chain = self.prompt | self.llm
+        self._endpoint_chains = {url: self.prompt | llm for url, llm in self._endpoint_llms.items()}
 
     def _init_llm(self) -> None:
-        """Initialize the LLM backend based on configuration."""
+        """Initialize the LLM backend based on configuration.
+
+        Providers with several endpoints get one LLM per endpoint; requests
+        are spread across them by the shared :class:`EndpointPool`.
+        """
         model = get_provider_model(self.provider, self.config)
-        self.llm = create_llm(self.provider, model, self.config, temperature=0.0)
+        self.endpoint_pool: EndpointPool | None = get_endpoint_pool(self.provider, self.config)
+        self._endpoint_llms = {}
+        if self.endpoint_pool is not None:
+            self._endpoint_llms = {
+                e.url: create_llm(self.provider, model, self.config, temperature=0.0, endpoint=e.url)
+                for e in self.endpoint_pool.endpoints
+            }
+            self.llm = next(iter(self._endpoint_llms.values()))
+        else:
+            self.llm = create_llm(self.provider, model, self.config, temperature=0.0)
+
+    async def _probe_endpoints(self) -> None:
+        """Health-check ejected endpoints that are due for re-admission."""
+        registry = ProviderRegistry(self.config)
+
+        async def check(url: str) -> bool:
+            return (await registry.check_endpoint(self.provider, url)).success
+
+        await self.endpoint_pool.probe(check)
+
+    def _invoke(self, inputs: dict[str, Any]) -> Any:
+        """Invoke the chain, on the least loaded endpoint if there are several."""
+        if self.endpoint_pool is None:
+            return self.chain.invoke(inputs)
+        if self.endpoint_pool.due_for_probe():
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self._probe_endpoints())
+        with self.endpoint_pool.lease() as endpoint:
+            return self._endpoint_chains[endpoint.url].invoke(inputs)
+
+    async def _ainvoke(self, inputs: dict[str, Any]) -> Any:
+        """Async version of :meth:`_invoke`."""
+        if self.endpoint_pool is None:
+            return await self.chain.ainvoke(inputs)
+        if self.endpoint_pool.due_for_probe():
+            await self._probe_endpoints()
+        with self.endpoint_pool.lease() as endpoint:
+            return await self._endpoint_chains[endpoint.url].ainvoke(inputs)
 
     def _init_prompt(self) -> None:
         """Initialize the prompt based on experiment mode and prompt type."""
+        # Imported with the first client: the templates load langchain_core
+        from saed.core.llm.prompts import cot_prompt, direct_prompt, edm_cot_prompt, edm_prompt
+
         if self.mode == "edm":
             if self.prompt_type == "cot":
                 self.prompt = edm_cot_prompt
@@ -249,7 +320,7 @@ class SemanticAnnotationClient:
         Returns:
             LLMResult with content and token usage information.
         """
-        result = self.chain.invoke({
+        result = self._invoke({
             "table_name": data["table_name"],
             "table_in_markdown": data["table_in_markdown"],
             "column_name": data["column_name"],
@@ -286,7 +357,7 @@ class SemanticAnnotationClient:
         Returns:
             LLMResult with content and token usage information.
         """
-        result = await self.chain.ainvoke({
+        result = await self._ainvoke({
             "table_name": data["table_name"],
             "table_in_markdown": data["table_in_markdown"],
             "column_name": data["column_name"],
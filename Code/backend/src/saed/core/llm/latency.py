@@ -0,0 +1,41 @@
+"""Observed LLM latencies, used to decide when to hedge a slow request."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """Rolling window of response latencies per model.
+
+    Thread-safe; the module-level :data:`latency_tracker` is shared by all
+    selectors of the process so every run contributes to the estimate.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = window
+        self._samples: dict[str, deque[int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, latency_ms: int) -> None:
+        """Record the latency of a successful request."""
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(latency_ms)
+
+    def percentile(self, key: str, q: float = 0.95, min_samples: int = 20) -> float | None:
+        """Get the ``q`` quantile of the recorded latencies in milliseconds.
+
+        Returns:
+            The quantile (nearest rank), or None with fewer than ``min_samples``
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        rank = max(1, math.ceil(q * len(samples)))
+        return float(samples[rank - 1])
+
+
+latency_tracker = LatencyTracker()
@@ -1,15 +1,18 @@
 """LLM Provider Registry and Health Check."""
 
+import asyncio
 from dataclasses import dataclass
 from typing import Literal
 
 import httpx
 
 from saed.core.config.settings import (
+    ENDPOINT_FIELDS,
     SUPPORTED_PROVIDERS,
     Config,
     ProviderName,
     get_provider_config,
+    get_provider_endpoints,
     is_provider_configured,
     load_config,
 )
@@ -131,9 +134,23 @@ class ProviderRegistry:
                 self._status_cache[provider] = "not_configured"
         return results
 
-    async def _do_health_check(self, provider: ProviderName) -> HealthCheckResult:
+    async def check_endpoint(self, provider: ProviderName, url: str) -> HealthCheckResult:
+        """Check health of one endpoint of a multi-endpoint provider."""
+        field = ENDPOINT_FIELDS[provider]
+        config = get_provider_config(provider, self.config).model_copy(update={field: url})
+        try:
+            return await self._do_health_check(provider, config)
+        except Exception as e:
+            return HealthCheckResult(success=False, message=f"Health check failed: {str(e)}")
+
+    async def _do_health_check(
+        self, provider: ProviderName, config=None
+    ) -> HealthCheckResult:
         """Perform the actual health check for a provider."""
-        config = get_provider_config(provider, self.config)
+        endpoints = get_provider_endpoints(provider, self.config)
+        if config is None and len(endpoints) > 1:
+            return await self._check_endpoints(provider, [e.url for e in endpoints])
+        config = config or get_provider_config(provider, self.config)
 
         if provider == "ollama":
             return await self._check_ollama(config)
@@ -153,6 +170,17 @@ class ProviderRegistry:
                 message=f"Unknown provider: {provider}",
             )
 
+    async def _check_endpoints(self, provider: ProviderName, urls: list[str]) -> HealthCheckResult:
+        """Check every endpoint; the provider is usable if any endpoint is."""
+        results = await asyncio.gather(*(self.check_endpoint(provider, url) for url in urls))
+        healthy = [r for r in results if r.success]
+        latencies = [r.latency_ms for r in healthy if r.latency_ms is not None]
+        return HealthCheckResult(
+            success=bool(healthy),
+            message=f"{len(healthy)}/{len(urls)} {provider} endpoints healthy",
+            latency_ms=min(latencies) if latencies else None,
+        )
+
     async def _check_ollama(self, config) -> HealthCheckResult:
         """Check Ollama health by listing models."""
         base_url = config.base_url.rstrip("/")
@@ -0,0 +1,53 @@
+"""Prompt token estimation for packing prompts into a token budget."""
+
+import logging
+import math
+from collections.abc import Callable
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Optional dependency: saed[tokens]
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+TokenCounter = Callable[[str], int]
+
+# Providers serving OpenAI models, whose tokenizers tiktoken implements
+_TIKTOKEN_PROVIDERS = frozenset({"openai", "azure_openai", "litellm"})
+
+# Conservative for tokenizers we cannot load: English text averages about four
+# characters per token, numbers and markdown tables noticeably fewer
+CHARS_PER_TOKEN = 3
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` from its length (rounded up)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _tiktoken_encoding(model: str):
+    name = model.rsplit("/", 1)[-1].removeprefix("azure-")
+    try:
+        return tiktoken.encoding_for_model(name)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+@lru_cache(maxsize=32)
+def get_token_counter(provider: str, model: str) -> TokenCounter:
+    """Get a token counter for a provider's model.
+
+    OpenAI-family models are counted exactly with tiktoken when it is
+    installed (and its encoding files are available); every other model falls
+    back to :func:`estimate_tokens`.
+    """
+    if tiktoken is not None and provider in _TIKTOKEN_PROVIDERS:
+        try:
+            encoding = _tiktoken_encoding(model)
+        except Exception as e:  # Encoding files are downloaded on first use
+            logger.warning(f"tiktoken unavailable for {model} ({e}), estimating tokens")
+        else:
+            return lambda text: len(encoding.encode(text, disallowed_special=()))
+    return estimate_tokens
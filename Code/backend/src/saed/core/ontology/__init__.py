@@ -2,10 +2,12 @@ from saed.core.ontology.cache import CachedNode, CachedTree, OntologyCache, get_
 from saed.core.ontology.classes import OntologyClass
 from saed.core.ontology.dag import OntologyDAG
 from saed.core.ontology.registry import OntologyEntry, OntologyRegistry
+from saed.core.ontology.rendering import CandidateRenderer, get_candidate_renderer
 from saed.core.ontology.validator import ValidationResult, validate_ontology, validate_ontology_file
 
 __all__ = [
     "CachedNode",
+    "CandidateRenderer",
     "CachedTree",
     "OntologyCache",
     "OntologyClass",
@@ -14,6 +16,7 @@ __all__ = [
     "OntologyRegistry",
     "ValidationResult",
     "get_cache_dir",
+    "get_candidate_renderer",
     "validate_ontology",
     "validate_ontology_file",
 ]
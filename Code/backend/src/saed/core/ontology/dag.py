@@ -4,12 +4,12 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
-import owlready2
-from owlready2 import Thing
-
 from saed.core.config.settings import get_project_root
 from saed.core.ontology.classes import OntologyClass
 
+# IRI of owl:Thing, the virtual root of ontologies with several root classes
+OWL_THING_IRI = "http://www.w3.org/2002/07/owl#Thing"
+
 
 class OntologyDAG:
     """Represents the ontology as a Directed Acyclic Graph (DAG).
@@ -56,6 +56,10 @@ class OntologyDAG:
         if rdf_file_path is not None:
             self.rdf_file_path = rdf_file_path
 
+        # Imported on first parse: owlready2 is slow to import and only
+        # needed to read RDF files, not to use cached trees
+        import owlready2
+
         onto = owlready2.get_ontology(self.rdf_file_path).load()
 
         for cls in onto.classes():
@@ -104,7 +108,7 @@ class OntologyDAG:
             self.root = root_candidates[0]
         elif len(root_candidates) > 1:
             # Multiple roots - use owl:Thing as virtual root
-            self.root = Thing.iri
+            self.root = OWL_THING_IRI
             # Add root candidates as children of Thing
             self.edges_subclassof[self.root] = root_candidates
             # Add virtual Thing node
@@ -116,7 +120,7 @@ class OntologyDAG:
             )
         else:
             # No root candidates - owl:Thing is the root
-            self.root = Thing.iri
+            self.root = OWL_THING_IRI
             # Add virtual Thing node if not present
             if self.root not in self.nodes:
                 self.nodes[self.root] = OntologyClass(
@@ -1,12 +1,15 @@
 """Ontology registry for managing ID-file mappings and metadata."""
 
-import hashlib
-import json
 import logging
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import ClassVar
+
+from saed.core.catalog import get_catalog
+from saed.core.utils.files import compute_file_hash, file_fingerprint, hash_files
+from saed.core.utils.registry_store import SharedRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,7 @@ class OntologyEntry:
     class_count: int = 0
     max_depth: int = 0
     file_hash: str = ""
+    file_stat: str = ""  # size:mtime_ns:inode when file_hash was verified
     cached_at: str = ""
 
     def to_dict(self) -> dict:
@@ -33,44 +37,41 @@ class OntologyEntry:
 
 
 @dataclass
-class OntologyRegistry:
-    """Registry for managing ontologies."""
+class OntologyRegistry(SharedRegistry):
+    """Registry for managing ontologies.
+
+    Shared per ontologies directory within a process; see :class:`SharedRegistry`.
+    """
+
+    _entry_type: ClassVar[type] = OntologyEntry
+    _entries_field: ClassVar[str] = "ontologies"
 
     ontologies: dict[str, OntologyEntry] = field(default_factory=dict)
     _registry_path: Path | None = field(default=None, repr=False)
     _ontologies_dir: Path | None = field(default=None, repr=False)
 
     @classmethod
-    def load(cls, ontologies_dir: Path) -> "OntologyRegistry":
-        """Load registry from JSON file or create new one."""
-        registry_path = ontologies_dir / "registry.json"
-        registry = cls(_registry_path=registry_path, _ontologies_dir=ontologies_dir)
-
-        if registry_path.exists():
-            try:
-                with open(registry_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                for id_, entry_data in data.get("ontologies", {}).items():
-                    registry.ontologies[id_] = OntologyEntry.from_dict(entry_data)
-                logger.debug(f"Loaded registry with {len(registry.ontologies)} entries")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to load registry: {e}, creating new one")
-
-        return registry
-
-    def save(self) -> None:
-        """Save registry to JSON file."""
-        if self._registry_path is None:
-            raise ValueError("Registry path not set")
-
-        data = {
-            "ontologies": {id_: entry.to_dict() for id_, entry in self.ontologies.items()}
-        }
+    def load(cls, ontologies_dir: Path, catalog: Path | None = None) -> "OntologyRegistry":
+        """Get the registry of a directory, loading it from its JSON file.
+
+        The registry is kept in memory and only reloaded when its file (or
+        its catalog entries) changed.
+
+        Args:
+            ontologies_dir: Directory of the ontologies files and the registry file
+            catalog: SQLite catalog to store the entries in instead of the file
+        """
+        store = get_catalog(catalog).store("ontologies") if catalog else None
+        return cls._shared(ontologies_dir / "registry.json", store, _ontologies_dir=ontologies_dir)
 
-        with open(self._registry_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _load_data(self, data: dict) -> None:
+        self.ontologies = {
+            id_: OntologyEntry.from_dict(entry_data)
+            for id_, entry_data in data.get("ontologies", {}).items()
+        }
 
-        logger.debug(f"Saved registry with {len(self.ontologies)} entries")
+    def _dump_data(self) -> dict:
+        return {"ontologies": {id_: entry.to_dict() for id_, entry in self.ontologies.items()}}
 
     def generate_id(self) -> str:
         """Generate a short unique ID for the ontology.
@@ -89,11 +90,7 @@ class OntologyRegistry:
 
     def compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA256 hash of file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return f"sha256:{sha256.hexdigest()[:16]}"
+        return compute_file_hash(file_path)
 
     def register(
         self,
@@ -101,6 +98,7 @@ class OntologyRegistry:
         class_count: int = 0,
         max_depth: int = 0,
         custom_id: str | None = None,
+        file_hash: str | None = None,
     ) -> OntologyEntry:
         """Register a new ontology.
 
@@ -109,10 +107,27 @@ class OntologyRegistry:
             class_count: Number of classes
             max_depth: Maximum tree depth
             custom_id: Optional custom ID (otherwise auto-generated)
+            file_hash: Content hash, if already computed (e.g. while uploading)
 
         Returns:
             The created OntologyEntry
         """
+        with self._transaction():
+            entry = self._create_entry(filename, class_count, max_depth, custom_id, file_hash)
+            self.save()
+
+        logger.info(f"Registered ontology: {entry.id} -> {filename}")
+        return entry
+
+    def _create_entry(
+        self,
+        filename: str,
+        class_count: int = 0,
+        max_depth: int = 0,
+        custom_id: str | None = None,
+        file_hash: str | None = None,
+    ) -> OntologyEntry:
+        """Create and add the entry of an ontology without saving the registry."""
         if self._ontologies_dir is None:
             raise ValueError("Ontologies directory not set")
 
@@ -123,8 +138,10 @@ class OntologyRegistry:
         # Generate or use custom ID
         id_ = custom_id if custom_id else self.generate_id()
 
-        # Compute file hash
-        file_hash = self.compute_file_hash(file_path)
+        # Fingerprint before hashing, so a concurrent change is seen next sync
+        file_stat = file_fingerprint(file_path)
+        if file_hash is None:
+            file_hash = self.compute_file_hash(file_path)
 
         entry = OntologyEntry(
             id=id_,
@@ -132,13 +149,11 @@ class OntologyRegistry:
             class_count=class_count,
             max_depth=max_depth,
             file_hash=file_hash,
+            file_stat=file_stat,
             cached_at=datetime.now().isoformat(),
         )
 
         self.ontologies[id_] = entry
-        self.save()
-
-        logger.info(f"Registered ontology: {id_} -> {filename}")
         return entry
 
     def unregister(self, id_: str) -> bool:
@@ -150,12 +165,13 @@ class OntologyRegistry:
         Returns:
             True if removed, False if not found
         """
-        if id_ in self.ontologies:
+        with self._transaction():
+            if id_ not in self.ontologies:
+                return False
             del self.ontologies[id_]
             self.save()
-            logger.info(f"Unregistered ontology: {id_}")
-            return True
-        return False
+        logger.info(f"Unregistered ontology: {id_}")
+        return True
 
     def get(self, id_: str) -> OntologyEntry | None:
         """Get ontology entry by ID."""
@@ -163,10 +179,8 @@ class OntologyRegistry:
 
     def get_by_filename(self, filename: str) -> OntologyEntry | None:
         """Get ontology entry by filename."""
-        for entry in self.ontologies.values():
-            if entry.filename == filename:
-                return entry
-        return None
+        entries = self._lookup("filename", filename)
+        return entries[0] if entries else None
 
     def list_all(self) -> list[OntologyEntry]:
         """List all registered ontologies."""
@@ -188,29 +202,37 @@ class OntologyRegistry:
         Returns:
             Updated entry or None if not found
         """
-        entry = self.ontologies.get(id_)
-        if entry is None:
-            return None
-
-        if class_count is not None:
-            entry.class_count = class_count
-        if max_depth is not None:
-            entry.max_depth = max_depth
-
-        # Update file hash if file changed
-        if self._ontologies_dir:
-            file_path = self._ontologies_dir / entry.filename
-            if file_path.exists():
-                new_hash = self.compute_file_hash(file_path)
-                if new_hash != entry.file_hash:
-                    entry.file_hash = new_hash
-                    entry.cached_at = datetime.now().isoformat()
-
-        self.save()
+        with self._transaction():
+            entry = self.ontologies.get(id_)
+            if entry is None:
+                return None
+
+            if class_count is not None:
+                entry.class_count = class_count
+            if max_depth is not None:
+                entry.max_depth = max_depth
+
+            # Update file hash if file changed
+            if self._ontologies_dir:
+                file_path = self._ontologies_dir / entry.filename
+                if file_path.exists():
+                    file_stat = file_fingerprint(file_path)
+                    if file_stat != entry.file_stat:
+                        new_hash = self.compute_file_hash(file_path)
+                        entry.file_stat = file_stat
+                        if new_hash != entry.file_hash:
+                            entry.file_hash = new_hash
+                            entry.cached_at = datetime.now().isoformat()
+
+            self.save()
         return entry
 
     def is_cache_valid(self, id_: str) -> bool:
-        """Check if cached data is still valid based on file hash.
+        """Check if cached data is still valid.
+
+        An unchanged fingerprint (size, mtime, inode) is trusted; otherwise
+        the file is hashed, and if only its stats changed (e.g. it was
+        touched or copied), the new fingerprint is stored.
 
         Args:
             id_: Ontology ID
@@ -226,42 +248,83 @@ class OntologyRegistry:
         if not file_path.exists():
             return False
 
-        current_hash = self.compute_file_hash(file_path)
-        return current_hash == entry.file_hash
+        file_stat = file_fingerprint(file_path)
+        if entry.file_stat and file_stat == entry.file_stat:
+            return True
+        if self.compute_file_hash(file_path) != entry.file_hash:
+            return False
+        with self._transaction():
+            entry = self.ontologies.get(id_)
+            if entry is not None:
+                entry.file_stat = file_stat
+                self.save()
+        return True
 
     def sync_with_directory(self) -> dict[str, list[str]]:
         """Sync registry with actual files in directory.
 
+        Only new files and files whose fingerprint changed are hashed, in a
+        thread pool, and the registry is saved once at the end. Entries of
+        changed files are reported as updated but keep their old hash until
+        their cache is rebuilt.
+
         Returns:
             Dict with 'added', 'removed', and 'updated' lists
         """
         if self._ontologies_dir is None:
             raise ValueError("Ontologies directory not set")
 
+        with self._transaction():
+            return self._sync_with_directory()
+
+    def _sync_with_directory(self) -> dict[str, list[str]]:
         result = {"added": [], "removed": [], "updated": []}
 
         # Get all ontology files
-        existing_files = set()
+        existing_files: dict[str, Path] = {}
         for ext in ("*.rdf", "*.owl"):
             for file in self._ontologies_dir.glob(ext):
-                existing_files.add(file.name)
+                existing_files[file.name] = file
 
         # Check for removed files
-        registered_files = {e.filename for e in self.ontologies.values()}
-        for filename in registered_files - existing_files:
-            entry = self.get_by_filename(filename)
-            if entry:
-                self.unregister(entry.id)
-                result["removed"].append(entry.id)
+        registered = {e.filename: e for e in self.ontologies.values()}
+        for filename in registered.keys() - existing_files.keys():
+            entry = registered[filename]
+            del self.ontologies[entry.id]
+            logger.info(f"Unregistered ontology: {entry.id}")
+            result["removed"].append(entry.id)
+
+        # Only new files and files whose stats changed need hashing
+        new_files = existing_files.keys() - registered.keys()
+        changed = [
+            entry
+            for filename, entry in registered.items()
+            if filename in existing_files
+            and file_fingerprint(existing_files[filename]) != entry.file_stat
+        ]
+        hashes = hash_files(
+            [existing_files[f] for f in new_files]
+            + [existing_files[e.filename] for e in changed]
+        )
 
         # Check for new files
-        for filename in existing_files - registered_files:
-            entry = self.register(filename)
+        for filename in new_files:
+            entry = self._create_entry(filename, file_hash=hashes.get(existing_files[filename]))
+            logger.info(f"Registered ontology: {entry.id} -> {filename}")
             result["added"].append(entry.id)
 
         # Check for updated files (hash changed)
-        for entry in list(self.ontologies.values()):
-            if not self.is_cache_valid(entry.id):
+        stats_refreshed = False
+        for entry in changed:
+            path = existing_files[entry.filename]
+            if path not in hashes:
+                continue
+            if hashes[path] == entry.file_hash:
+                entry.file_stat = file_fingerprint(path)
+                stats_refreshed = True
+            else:
                 result["updated"].append(entry.id)
 
+        if stats_refreshed or result["added"] or result["removed"]:
+            self.save()
         return result
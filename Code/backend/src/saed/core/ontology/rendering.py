@@ -0,0 +1,85 @@
+"""Rendering of candidate ontology classes with their labels and comments."""
+
+import threading
+from weakref import WeakKeyDictionary
+
+from saed.core.ontology.classes import OntologyClass
+from saed.core.ontology.dag import OntologyDAG
+
+# Comments shorter than this after budgeting are dropped rather than truncated
+MIN_COMMENT_CHARS = 16
+
+ELLIPSIS = "…"
+
+
+def _truncate(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[: max(limit - len(ELLIPSIS), 0)].rstrip() + ELLIPSIS
+
+
+class CandidateRenderer:
+    """Pre-rendered descriptions of every class of an ontology.
+
+    A candidate is rendered as ``- Name (label): comment``; the label is
+    omitted when it only repeats the name. Descriptions are computed once per
+    ontology (see :func:`get_candidate_renderer`); :meth:`render` only joins
+    and, if needed, shortens them to the prompt budget.
+    """
+
+    def __init__(self, dag: OntologyDAG, comment_chars: int = 160) -> None:
+        self.heads: dict[str, str] = {}
+        self.comments: dict[str, str] = {}
+        for node in dag.nodes.values():
+            if node.name:
+                self.heads[node.name] = self._head(node)
+                if node.comment:
+                    self.comments[node.name] = _truncate(node.comment, comment_chars)
+
+    @staticmethod
+    def _head(node: OntologyClass) -> str:
+        label = (node.label or "").strip()
+        if label and label.replace(" ", "").lower() != node.name.lower():
+            return f"{node.name} ({label})"
+        return node.name
+
+    def render(self, names: list[str], max_chars: int) -> str:
+        """Render candidates, one per line, within ``max_chars`` if possible.
+
+        Comments are shortened evenly until the list fits; if even that is not
+        enough they are dropped, and finally labels too. Names are never cut,
+        since the model must answer with them.
+        """
+        heads = [f"- {self.heads.get(name, name)}" for name in names]
+        comments = [self.comments.get(name) for name in names]
+
+        full = [f"{h}: {c}" if c else h for h, c in zip(heads, comments, strict=True)]
+        text = "\n".join(full)
+        if len(text) <= max_chars:
+            return text
+
+        described = sum(1 for c in comments if c)
+        spare = max_chars - len("\n".join(heads)) - 2 * described
+        per_comment = spare // described if described else 0
+        if per_comment >= MIN_COMMENT_CHARS:
+            return "\n".join(
+                f"{h}: {_truncate(c, per_comment)}" if c else h
+                for h, c in zip(heads, comments, strict=True)
+            )
+        if len("\n".join(heads)) <= max_chars:
+            return "\n".join(heads)
+        return "\n".join(f"- {name}" for name in names)
+
+
+_renderers: WeakKeyDictionary = WeakKeyDictionary()
+_renderers_lock = threading.Lock()
+
+
+def get_candidate_renderer(dag: OntologyDAG, comment_chars: int = 160) -> CandidateRenderer:
+    """Get the renderer of an ontology, built on first use and cached with the DAG."""
+    with _renderers_lock:
+        by_limit = _renderers.setdefault(dag, {})
+        if comment_chars not in by_limit:
+            by_limit[comment_chars] = CandidateRenderer(dag, comment_chars)
+        return by_limit[comment_chars]
@@ -3,8 +3,6 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import owlready2
-
 
 @dataclass
 class ValidationResult:
@@ -55,7 +53,9 @@ def validate_ontology(file_path: Path | str) -> ValidationResult:
             f"Unexpected file extension: {path.suffix}. Expected .rdf, .owl, or .xml"
         )
 
-    # Try to load the ontology
+    # Try to load the ontology (owlready2 is slow to import, so only here)
+    import owlready2
+
     try:
         onto = owlready2.get_ontology(str(path)).load()
     except Exception as e:
@@ -0,0 +1,105 @@
+"""Deterministic assignment of candidate classes to EDM agents."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Callable
+
+# Tokens of the ", " joining class names in a prompt
+SEPARATOR_TOKENS = 1
+
+
+def num_edm_agents(num_classes: int, classes_per_agent: int, agents_per_class: int) -> int:
+    """Number of agents for an EDM step with ``num_classes`` candidates."""
+    return max(
+        agents_per_class,
+        (num_classes * agents_per_class) // classes_per_agent + 1,
+    )
+
+
+def assign_classes_to_agents(
+    classes: list[str],
+    num_agents: int,
+    agents_per_class: int,
+    seed: int = 0,
+) -> list[list[str]]:
+    """Assign every class to ``agents_per_class`` distinct agents.
+
+    The classes are shuffled with a generator seeded by ``seed`` and the
+    candidate list, and the resulting sequence, with each class repeated
+    ``agents_per_class`` times in a row, is dealt round-robin to the agents
+    starting at a seeded offset. Consecutive copies land on consecutive agents,
+    so the agents of a class are distinct, and round-robin dealing keeps the
+    number of classes per agent within one of each other.
+
+    With fewer agents than ``agents_per_class`` every agent sees every class.
+    Each agent's classes keep the candidate order, so prompts are stable.
+
+    Args:
+        classes: Candidate class names
+        num_agents: Number of agents
+        agents_per_class: Agents that vote on each class
+        seed: Seed of the assignment; the same seed and candidates always
+            produce the same assignment
+
+    Returns:
+        Class lists, one per agent
+    """
+    if num_agents <= 0:
+        return [list(classes)]
+    copies = min(agents_per_class, num_agents)
+
+    rng = random.Random(f"{seed}:{'|'.join(classes)}")
+    order = list(range(len(classes)))
+    rng.shuffle(order)
+    offset = rng.randrange(num_agents)
+
+    assigned: list[list[int]] = [[] for _ in range(num_agents)]
+    slot = offset
+    for index in order:
+        for _ in range(copies):
+            assigned[slot % num_agents].append(index)
+            slot += 1
+
+    return [[classes[i] for i in sorted(indices)] for indices in assigned]
+
+
+def pack_classes_by_tokens(
+    classes: list[str],
+    agents_per_class: int,
+    capacity: int,
+    count_tokens: Callable[[str], int],
+    seed: int = 0,
+) -> list[list[str]]:
+    """Assign classes to as few agents as fit a per-prompt token capacity.
+
+    Starts from the agent count the total class tokens need and adds agents
+    until every agent's class list fits ``capacity``, using the balanced
+    assignment of :func:`assign_classes_to_agents`. A single class larger
+    than the capacity cannot be split; it ends up alone with its agent.
+
+    Args:
+        classes: Candidate class names
+        agents_per_class: Agents that vote on each class
+        capacity: Tokens available for the class list of one prompt
+        count_tokens: Token counter of the model
+        seed: Seed of the assignment
+
+    Returns:
+        Class lists, one per agent
+    """
+    costs = {c: count_tokens(c) + SEPARATOR_TOKENS for c in classes}
+    max_agents = max(agents_per_class, len(classes) * agents_per_class)
+    if capacity <= 0:
+        num_agents = max_agents
+    else:
+        total = sum(costs.values()) * agents_per_class
+        num_agents = min(max_agents, max(agents_per_class, math.ceil(total / capacity)))
+
+    while True:
+        assignment = assign_classes_to_agents(classes, num_agents, agents_per_class, seed)
+        loads = [sum(costs[c] for c in agent_classes) for agent_classes in assignment]
+        if num_agents >= max_agents or max(loads) <= capacity:
+            return assignment
+        num_agents += 1
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import random
 from collections import defaultdict
 from typing import Protocol
 
 from saed.core.config.settings import Config, EDMOptions, load_config
 from saed.core.llm import LLM
 from saed.core.llm.parser import extract_answer, parse_class_list
+from saed.core.selector.assignment import assign_classes_to_agents, num_edm_agents
 
 
 class Selector(Protocol):
@@ -114,14 +114,10 @@ class EnsembleSelector(BaseSelector):
         avg_agents_per_class = self.edm_options.agents_per_class
         consensus_threshold_ratio = self.edm_options.consensus_threshold
 
-        num_classes = len(classes)
-        num_agents = max(
-            avg_agents_per_class,
-            (num_classes * avg_agents_per_class) // avg_classes_per_agent + 1,
-        )
+        num_agents = num_edm_agents(len(classes), avg_classes_per_agent, avg_agents_per_class)
 
-        agents_assignments = self._assign_classes_to_agents(
-            classes, num_agents, avg_agents_per_class
+        agents_assignments = assign_classes_to_agents(
+            classes, num_agents, avg_agents_per_class, self.edm_options.seed
         )
 
         agents_that_saw_class = defaultdict(int)
@@ -145,27 +141,6 @@ class EnsembleSelector(BaseSelector):
             return "-"
         return ", ".join(selected_classes)
 
-    def _assign_classes_to_agents(
-        self,
-        classes: list[str],
-        num_agents: int,
-        avg_agents_per_class: int,
-    ) -> list[list[str]]:
-        agents_assignments: list[list[str]] = [[] for _ in range(num_agents)]
-
-        for class_ in classes:
-            if num_agents < avg_agents_per_class:
-                assigned_agents = range(num_agents)
-            else:
-                assigned_agents = random.sample(range(num_agents), avg_agents_per_class)
-            for agent in assigned_agents:
-                agents_assignments[agent].append(class_)
-
-        if not agents_assignments:
-            agents_assignments = [classes]
-
-        return agents_assignments
-
     def _collect_votes(
         self,
         agents_assignments: list[list[str]],
@@ -1,15 +1,28 @@
 """Table utilities and registry."""
 
+from saed.core.table.columnar import materialize_table, read_table
 from saed.core.table.loader import load_labels, load_table, load_table_list, load_tables
 from saed.core.table.registry import TableEntry, TableRegistry
+from saed.core.table.rendering import clear_table_markdown_cache, render_table_markdown
+from saed.core.table.row_index import build_row_index, read_row_window
+from saed.core.table.sampling import SAMPLING_STRATEGIES, reservoir_sample, sample_table
 from saed.core.table.transform import dataframe_to_markdown
 
 __all__ = [
+    "SAMPLING_STRATEGIES",
     "TableEntry",
     "TableRegistry",
+    "build_row_index",
+    "clear_table_markdown_cache",
     "dataframe_to_markdown",
     "load_labels",
     "load_table",
     "load_table_list",
     "load_tables",
+    "materialize_table",
+    "read_row_window",
+    "read_table",
+    "render_table_markdown",
+    "reservoir_sample",
+    "sample_table",
 ]
@@ -0,0 +1,219 @@
+"""Columnar (Parquet / Arrow IPC) copies of CSV tables for fast partial reads.
+
+A copy lives in a ``.columnar`` directory next to its CSV and records the
+CSV's fingerprint (size, mtime, inode) in its schema metadata. Readers only
+use a copy whose fingerprint still matches the CSV, and fall back to parsing
+the CSV otherwise, so the CSV stays the source of truth.
+"""
+
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal
+
+import pandas as pd
+
+from saed.core.utils.files import file_fingerprint
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # Optional dependency: saed[columnar]
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+TableFormat = Literal["csv", "parquet", "arrow"]
+
+COLUMNAR_SUFFIXES = {"arrow": ".arrow", "parquet": ".parquet"}
+
+FINGERPRINT_KEY = b"saed.source_fingerprint"
+
+
+def columnar_available() -> bool:
+    """Whether pyarrow is installed."""
+    return pa is not None
+
+
+def columnar_path(table_path: Path, table_format: str) -> Path:
+    """Get the path of a table's columnar copy in ``table_format``."""
+    suffix = COLUMNAR_SUFFIXES[table_format]
+    return table_path.parent / ".columnar" / f"{table_path.name}{suffix}"
+
+
+def materialize_table(table_path: Path, table_format: TableFormat) -> Path | None:
+    """Write a columnar copy of a CSV table.
+
+    The CSV is converted in record batches, so memory stays bounded. Types
+    are inferred by pyarrow from the first block, except that dates, times
+    and timestamps are kept as text, as pandas reads them from the CSV, so
+    previews show the values as written. A column whose later values do not
+    fit the inferred type fails the conversion.
+
+    Returns:
+        The path of the copy, or None if the format is "csv", pyarrow is
+        missing or the conversion failed (readers then use the CSV)
+    """
+    if table_format == "csv":
+        return None
+    if pa is None:
+        logger.warning(
+            f"Table format {table_format!r} requires the optional 'pyarrow' package "
+            "(pip install 'saed[columnar]'), keeping CSV only"
+        )
+        return None
+
+    target = columnar_path(table_path, table_format)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(target.name + ".tmp")
+    fingerprint = file_fingerprint(table_path)
+
+    try:
+        reader = _open_csv(table_path)
+        schema = reader.schema.with_metadata({FINGERPRINT_KEY: fingerprint.encode()})
+        if table_format == "parquet":
+            writer = pq.ParquetWriter(tmp_path, schema)
+        else:
+            writer = pa_ipc.new_file(tmp_path, schema)
+        with writer:
+            for batch in reader:
+                writer.write_batch(pa.RecordBatch.from_arrays(batch.columns, schema=schema))
+        tmp_path.replace(target)
+    except (pa.ArrowException, OSError) as e:
+        logger.warning(f"Failed to write {table_format} copy of {table_path.name}: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return None
+
+    logger.debug(f"Materialized {table_path.name} as {table_format}")
+    return target
+
+
+def _open_csv(table_path: Path) -> "pa_csv.CSVStreamingReader":
+    """Open a streaming CSV reader that keeps temporal columns as text.
+
+    Empty and NA-like strings are read as nulls, as pandas does.
+    """
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+    inferred = pa_csv.open_csv(table_path, convert_options=convert_options).schema
+    temporal = {f.name: pa.string() for f in inferred if pa.types.is_temporal(f.type)}
+    convert_options.column_types = temporal
+    return pa_csv.open_csv(table_path, convert_options=convert_options)
+
+
+def remove_columnar(table_path: Path) -> None:
+    """Delete the columnar copies of a table."""
+    for table_format in COLUMNAR_SUFFIXES:
+        columnar_path(table_path, table_format).unlink(missing_ok=True)
+
+
+def _source_fingerprint(path: Path) -> str | None:
+    if path.suffix == ".parquet":
+        metadata = pq.read_schema(path).metadata
+    else:
+        with pa.memory_map(str(path)) as source:
+            metadata = pa_ipc.open_file(source).schema.metadata
+    value = (metadata or {}).get(FINGERPRINT_KEY)
+    return value.decode() if value else None
+
+
+def find_columnar(table_path: Path) -> Path | None:
+    """Get an up-to-date columnar copy of a table, if there is one."""
+    if pa is None:
+        return None
+    fingerprint = None
+    for table_format in COLUMNAR_SUFFIXES:
+        path = columnar_path(table_path, table_format)
+        if not path.exists():
+            continue
+        fingerprint = fingerprint or file_fingerprint(table_path)
+        try:
+            if _source_fingerprint(path) == fingerprint:
+                return path
+        except (pa.ArrowException, OSError) as e:
+            logger.debug(f"Ignoring unreadable columnar copy {path}: {e}")
+    return None
+
+
+def _read_columnar(
+    path: Path, columns: list[str] | None = None, nrows: int | None = None
+) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        parquet = pq.ParquetFile(path, memory_map=True)
+        if nrows is None:
+            return parquet.read(columns=columns).to_pandas()
+        # The first batch holds the first rows; later row groups stay unread
+        batch = next(parquet.iter_batches(batch_size=max(nrows, 1), columns=columns), None)
+        if batch is None:
+            empty = parquet.schema_arrow.empty_table()
+            return (empty if columns is None else empty.select(columns)).to_pandas()
+        return batch.slice(0, nrows).to_pandas()
+
+    # Arrow IPC is memory-mapped: selecting and slicing touch only the pages read
+    with pa.memory_map(str(path)) as source:
+        table = pa_ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        if nrows is not None:
+            table = table.slice(0, nrows)
+        return table.to_pandas()
+
+
+def _columnar_names(path: Path) -> list[str]:
+    if path.suffix == ".parquet":
+        return pq.read_schema(path).names
+    with pa.memory_map(str(path)) as source:
+        return pa_ipc.open_file(source).schema.names
+
+
+def read_table(
+    table_path: Path, columns: list[str] | None = None, nrows: int | None = None
+) -> pd.DataFrame:
+    """Read a table, or only some of its columns or first rows.
+
+    Uses the table's columnar copy when it is up to date, which reads only
+    the requested columns and rows; parses the CSV otherwise.
+
+    Args:
+        table_path: Path of the CSV file
+        columns: Columns to read (all if None), returned in table order
+        nrows: Number of leading rows to read (all if None)
+    """
+    copy = find_columnar(table_path)
+    if copy is not None:
+        if columns is not None:
+            header = set(columns)
+            columns = [c for c in _columnar_names(copy) if c in header]
+        return _read_columnar(copy, columns, nrows)
+    return pd.read_csv(table_path, usecols=columns, nrows=nrows)
+
+
+def iter_table_chunks(
+    table_path: Path, columns: list[str] | None, chunk_rows: int
+) -> Iterator[pd.DataFrame]:
+    """Stream a table in chunks of about ``chunk_rows`` rows.
+
+    Reads record batches of the columnar copy when it is up to date and CSV
+    chunks otherwise.
+    """
+    copy = find_columnar(table_path)
+    if copy is None:
+        yield from pd.read_csv(table_path, usecols=columns, chunksize=chunk_rows)
+        return
+
+    if columns is not None:
+        header = set(columns)
+        columns = [c for c in _columnar_names(copy) if c in header]
+    if copy.suffix == ".parquet":
+        parquet = pq.ParquetFile(copy, memory_map=True)
+        for batch in parquet.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    with pa.memory_map(str(copy)) as source:
+        table = pa_ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        for batch in table.to_batches(max_chunksize=chunk_rows):
+            yield batch.to_pandas()
@@ -4,7 +4,8 @@ from pathlib import Path
 
 import pandas as pd
 
-from saed.core.config.settings import Config, get_absolute_path, load_config
+from saed.core.config.settings import Config, get_absolute_path, get_config
+from saed.core.table.columnar import read_table
 
 
 def get_tables_dir(config: Config | None = None) -> Path:
@@ -17,7 +18,7 @@ def get_tables_dir(config: Config | None = None) -> Path:
         Path to the tables directory.
     """
     if config is None:
-        config = load_config()
+        config = get_config()
     return get_absolute_path(config.paths.tables)
 
 
@@ -31,7 +32,7 @@ def get_labels_dir(config: Config | None = None) -> Path:
         Path to the labels directory.
     """
     if config is None:
-        config = load_config()
+        config = get_config()
     return get_absolute_path(config.paths.labels)
 
 
@@ -52,11 +53,12 @@ def load_table_list(config: Config | None = None) -> pd.DataFrame:
     return pd.DataFrame(columns=["table_id", "table_name"])
 
 
-def load_tables(config: Config | None = None) -> dict[str, pd.DataFrame]:
+def load_tables(config: Config | None = None, nrows: int | None = None) -> dict[str, pd.DataFrame]:
     """Load all tables into a dictionary.
 
     Args:
         config: Optional configuration. If not provided, loads from file.
+        nrows: Number of leading rows to load per table (all if None).
 
     Returns:
         Dictionary mapping table_id to DataFrame.
@@ -67,7 +69,7 @@ def load_tables(config: Config | None = None) -> dict[str, pd.DataFrame]:
     for table_id in table_list["table_id"]:
         table_file = tables_path / table_id
         if table_file.exists():
-            tables[table_id] = pd.read_csv(table_file)
+            tables[table_id] = read_table(table_file, nrows=nrows)
     return tables
 
 
@@ -92,12 +94,22 @@ def load_labels(config: Config | None = None) -> pd.DataFrame:
     ])
 
 
-def load_table(table_id: str, config: Config | None = None) -> pd.DataFrame:
+def load_table(
+    table_id: str,
+    config: Config | None = None,
+    columns: list[str] | None = None,
+    nrows: int | None = None,
+) -> pd.DataFrame:
     """Load a single table by ID.
 
+    Reads only the requested columns and rows from the table's columnar copy
+    when it has an up-to-date one, and from the CSV otherwise.
+
     Args:
         table_id: The ID of the table to load.
         config: Optional configuration. If not provided, loads from file.
+        columns: Columns to load (all if None).
+        nrows: Number of leading rows to load (all if None).
 
     Returns:
         DataFrame with the table data.
@@ -109,4 +121,4 @@ def load_table(table_id: str, config: Config | None = None) -> pd.DataFrame:
     table_file = tables_path / table_id
     if not table_file.exists():
         raise FileNotFoundError(f"Table not found: {table_id}")
-    return pd.read_csv(table_file)
+    return read_table(table_file, columns, nrows)
@@ -0,0 +1,169 @@
+"""Streaming profiling of CSV tables: shape and per-column statistics."""
+
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Rows parsed at a time; memory stays bounded by the chunk, not the file
+CHUNK_ROWS = 100_000
+
+# Hashes kept by the distinct-count sketch; the estimate is exact below this
+SKETCH_SIZE = 1024
+
+# Example values kept per column, and their maximum length
+SAMPLE_VALUES = 5
+SAMPLE_CHARS = 80
+
+_INTEGER = r"[+-]?\d+"
+_BOOLEANS = frozenset({"true", "false"})
+
+
+@dataclass
+class ColumnStats:
+    """Statistics of one table column."""
+
+    dtype: str = "empty"  # integer, float, boolean, datetime, string or empty
+    null_ratio: float = 0.0
+    distinct_count: int = 0  # Exact up to SKETCH_SIZE, estimated above
+    sample_values: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class TableProfile:
+    """Shape and column statistics of a table."""
+
+    columns: list[str]
+    row_count: int
+    column_stats: dict[str, ColumnStats]
+
+
+class DistinctSketch:
+    """K-minimum-values estimate of the number of distinct values.
+
+    Keeps the ``size`` smallest 64-bit hashes seen; with ``n`` distinct
+    values they are spread uniformly, so the largest kept hash ``h`` gives
+    ``n ~ (size - 1) / (h / 2**64)``. Below ``size`` distinct values the
+    count is exact.
+    """
+
+    def __init__(self, size: int = SKETCH_SIZE) -> None:
+        self.size = size
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def update(self, values: pd.Series) -> None:
+        """Add the (non-null) values of a chunk."""
+        if values.empty:
+            return
+        hashed = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        merged = np.unique(np.concatenate([self.hashes, hashed]))
+        self.hashes = merged[: self.size]
+
+    def estimate(self) -> int:
+        """Estimated number of distinct values."""
+        if len(self.hashes) < self.size:
+            return len(self.hashes)
+        return int(round((self.size - 1) / (float(self.hashes[-1]) / 2.0**64)))
+
+
+class _ColumnProfiler:
+    """Accumulates the statistics of one column over chunks of strings."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.non_null = 0
+        self.integers = 0
+        self.numbers = 0
+        self.booleans = 0
+        self.datetimes = 0
+        self.sketch = DistinctSketch()
+        self.samples: list[str] = []
+
+    def update(self, values: pd.Series) -> None:
+        self.rows += len(values)
+        values = values.dropna()
+        if values.empty:
+            return
+        self.non_null += len(values)
+        self.sketch.update(values)
+
+        stripped = values.str.strip()
+        self.integers += int(stripped.str.fullmatch(_INTEGER).sum())
+        numeric = pd.to_numeric(stripped, errors="coerce").notna()
+        self.numbers += int(numeric.sum())
+        self.booleans += int(stripped.str.lower().isin(_BOOLEANS).sum())
+        # Dates are only worth parsing while every value so far was one
+        if self.datetimes == self.non_null - len(values) and not numeric.all():
+            parsed = pd.to_datetime(stripped, errors="coerce", format="ISO8601")
+            self.datetimes += int(parsed.notna().sum())
+
+        if len(self.samples) < SAMPLE_VALUES:
+            for value in values.drop_duplicates().head(SAMPLE_VALUES):
+                value = value[:SAMPLE_CHARS]
+                if value not in self.samples and len(self.samples) < SAMPLE_VALUES:
+                    self.samples.append(value)
+
+    def stats(self) -> ColumnStats:
+        if not self.non_null:
+            dtype = "empty"
+        elif self.booleans == self.non_null:
+            dtype = "boolean"
+        elif self.integers == self.non_null:
+            dtype = "integer"
+        elif self.numbers == self.non_null:
+            dtype = "float"
+        elif self.datetimes == self.non_null:
+            dtype = "datetime"
+        else:
+            dtype = "string"
+        return ColumnStats(
+            dtype=dtype,
+            null_ratio=round(1 - self.non_null / self.rows, 4) if self.rows else 0.0,
+            distinct_count=self.sketch.estimate(),
+            sample_values=self.samples,
+        )
+
+
+def profile_csv(file_path: Path, chunk_rows: int = CHUNK_ROWS) -> TableProfile:
+    """Profile a CSV file in one streaming pass.
+
+    The file is parsed in chunks of ``chunk_rows`` rows with every cell read
+    as a string, so memory does not depend on the file size and types are
+    inferred the same way in every chunk.
+
+    Raises:
+        ValueError: If the file is not a valid CSV (pandas parser errors
+            derive from ValueError)
+    """
+    reader = pd.read_csv(file_path, dtype=str, chunksize=chunk_rows)
+    columns: list[str] | None = None
+    profilers: list[_ColumnProfiler] = []
+    row_count = 0
+
+    with reader:
+        for chunk in reader:
+            if columns is None:
+                columns = chunk.columns.tolist()
+                profilers = [_ColumnProfiler() for _ in columns]
+            row_count += len(chunk)
+            for position, profiler in enumerate(profilers):
+                profiler.update(chunk.iloc[:, position])
+
+    if columns is None:  # Header only
+        columns = pd.read_csv(file_path, nrows=0).columns.tolist()
+        profilers = [_ColumnProfiler() for _ in columns]
+
+    logger.debug(f"Profiled {file_path.name}: {row_count} rows, {len(columns)} columns")
+    return TableProfile(
+        columns=columns,
+        row_count=row_count,
+        column_stats={c: p.stats() for c, p in zip(columns, profilers, strict=True)},
+    )
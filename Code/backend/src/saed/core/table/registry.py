@@ -1,15 +1,28 @@
 """Table registry for managing ID-file mappings and metadata."""
 
-import hashlib
-import json
 import logging
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
+from saed.core.catalog import get_catalog
+from saed.core.table.columnar import (
+    TableFormat,
+    columnar_available,
+    find_columnar,
+    materialize_table,
+    remove_columnar,
+)
+from saed.core.table.profile import TableProfile, profile_csv
+from saed.core.table.row_index import build_row_index, load_row_index, save_row_index
+from saed.core.utils.files import compute_file_hash, file_fingerprint, hash_files
+from saed.core.utils.registry_store import SharedRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +37,9 @@ class TableEntry:
     row_count: int = 0
     column_count: int = 0
     file_hash: str = ""
+    file_stat: str = ""  # size:mtime_ns:inode when file_hash was verified
     category: str = "default"
+    column_stats: dict[str, dict] = field(default_factory=dict)  # Column -> ColumnStats
     created_at: str = ""
     updated_at: str = ""
 
@@ -39,46 +54,52 @@ class TableEntry:
 
 
 @dataclass
-class TableRegistry:
-    """Registry for managing tables."""
+class TableRegistry(SharedRegistry):
+    """Registry for managing tables.
+
+    Shared per tables directory within a process; see :class:`SharedRegistry`.
+    """
+
+    _entry_type: ClassVar[type] = TableEntry
+    _entries_field: ClassVar[str] = "tables"
 
     tables: dict[str, TableEntry] = field(default_factory=dict)
     _registry_path: Path | None = field(default=None, repr=False)
     _tables_dir: Path | None = field(default=None, repr=False)
+    _table_format: TableFormat = field(default="csv", repr=False)
 
     @classmethod
-    def load(cls, tables_dir: Path) -> "TableRegistry":
-        """Load registry from JSON file or create new one."""
-        registry_path = tables_dir / "registry.json"
-        registry = cls(_registry_path=registry_path, _tables_dir=tables_dir)
+    def load(
+        cls, tables_dir: Path, table_format: TableFormat = "csv", catalog: Path | None = None
+    ) -> "TableRegistry":
+        """Get the registry of a directory, loading it from its JSON file.
 
-        if registry_path.exists():
-            try:
-                with open(registry_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                for id_, entry_data in data.get("tables", {}).items():
-                    registry.tables[id_] = TableEntry.from_dict(entry_data)
-                logger.debug(f"Loaded table registry with {len(registry.tables)} entries")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to load table registry: {e}, creating new one")
+        The registry is kept in memory and only reloaded when its file (or
+        its catalog entries) changed.
 
+        Args:
+            tables_dir: Directory of the tables and the registry file
+            table_format: Columnar copy to write for registered tables
+                ("parquet", "arrow" or "csv" for none)
+            catalog: SQLite catalog to store the entries in instead of the file
+        """
+        store = get_catalog(catalog).store("tables") if catalog else None
+        registry = cls._shared(tables_dir / "registry.json", store, _tables_dir=tables_dir)
+        registry._table_format = table_format
         return registry
 
-    def save(self) -> None:
-        """Save registry to JSON file."""
-        if self._registry_path is None:
-            raise ValueError("Registry path not set")
+    def _load_data(self, data: dict) -> None:
+        self.tables = {
+            id_: TableEntry.from_dict(entry_data)
+            for id_, entry_data in data.get("tables", {}).items()
+        }
 
-        data = {
+    def _dump_data(self) -> dict:
+        return {
             "tables": {id_: entry.to_dict() for id_, entry in self.tables.items()},
             "version": "1.0",
         }
 
-        with open(self._registry_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        logger.debug(f"Saved table registry with {len(self.tables)} entries")
-
     def generate_id(self) -> str:
         """Generate a short unique ID for the table."""
         short_id = uuid.uuid4().hex[:8]
@@ -88,16 +109,41 @@ class TableRegistry:
 
     def compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA256 hash of file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return f"sha256:{sha256.hexdigest()[:16]}"
+        return compute_file_hash(file_path)
 
-    def _extract_metadata(self, file_path: Path) -> tuple[list[str], int]:
-        """Extract columns and row count from CSV file."""
-        df = pd.read_csv(file_path)
-        return df.columns.tolist(), len(df)
+    def _extract_metadata(self, file_path: Path) -> TableProfile:
+        """Profile the columns, row count and column statistics of a CSV file."""
+        return profile_csv(file_path)
+
+    def row_index_path(self, entry: TableEntry) -> Path:
+        """Get the path of a table's row index (content-addressed by file hash)."""
+        if self._tables_dir is None:
+            raise ValueError("Tables directory not set")
+        return self._tables_dir / ".row_index" / f"{entry.file_hash.split(':')[-1]}.npy"
+
+    def get_row_index(self, entry: TableEntry) -> np.ndarray:
+        """Get the row index of a table, building it if it is missing."""
+        index_path = self.row_index_path(entry)
+        index = load_row_index(index_path)
+        if index is None:
+            index = self._build_row_index(entry)
+        return index
+
+    def _build_row_index(self, entry: TableEntry) -> np.ndarray:
+        file_path = self._get_file_path(entry.filename, entry.category)
+        index = build_row_index(file_path)
+        try:
+            save_row_index(index, self.row_index_path(entry))
+        except OSError as e:
+            logger.warning(f"Failed to save row index of {entry.id}: {e}")
+        return index
+
+    def _materialize(self, entry: TableEntry) -> None:
+        """Write the columnar copy of a table, if a columnar format is configured."""
+        if self._table_format != "csv":
+            materialize_table(
+                self._get_file_path(entry.filename, entry.category), self._table_format
+            )
 
     def _get_file_path(self, filename: str, category: str) -> Path:
         """Get full file path for a table."""
@@ -114,6 +160,8 @@ class TableRegistry:
         name: str | None = None,
         category: str = "default",
         custom_id: str | None = None,
+        file_hash: str | None = None,
+        profile: TableProfile | None = None,
     ) -> TableEntry:
         """Register a new table.
 
@@ -122,10 +170,30 @@ class TableRegistry:
             name: Human-readable name (defaults to filename stem)
             category: Subdirectory category (real, synthetic, etc.)
             custom_id: Optional custom ID
+            file_hash: Content hash, if already computed (e.g. while uploading)
+            profile: Profile of the file, if already computed (e.g. to
+                validate an upload before it replaced anything)
 
         Returns:
             The created TableEntry
         """
+        with self._transaction():
+            entry = self._create_entry(filename, name, category, custom_id, file_hash, profile)
+            self.save()
+
+        logger.info(f"Registered table: {entry.id} -> {filename} ({category})")
+        return entry
+
+    def _create_entry(
+        self,
+        filename: str,
+        name: str | None = None,
+        category: str = "default",
+        custom_id: str | None = None,
+        file_hash: str | None = None,
+        profile: TableProfile | None = None,
+    ) -> TableEntry:
+        """Create and add the entry of a table without saving the registry."""
         file_path = self._get_file_path(filename, category)
         if not file_path.exists():
             raise FileNotFoundError(f"Table file not found: {file_path}")
@@ -133,11 +201,14 @@ class TableRegistry:
         # Generate or use custom ID
         id_ = custom_id if custom_id else self.generate_id()
 
-        # Extract metadata from CSV
-        columns, row_count = self._extract_metadata(file_path)
+        # Fingerprint before hashing, so a concurrent change is seen next sync
+        file_stat = file_fingerprint(file_path)
+        if file_hash is None:
+            file_hash = self.compute_file_hash(file_path)
 
-        # Compute file hash
-        file_hash = self.compute_file_hash(file_path)
+        # Profile the CSV in one streaming pass
+        if profile is None:
+            profile = self._extract_metadata(file_path)
 
         now = datetime.now().isoformat()
 
@@ -145,29 +216,32 @@ class TableRegistry:
             id=id_,
             filename=filename,
             name=name or file_path.stem,
-            columns=columns,
-            row_count=row_count,
-            column_count=len(columns),
+            columns=profile.columns,
+            row_count=profile.row_count,
+            column_count=len(profile.columns),
             file_hash=file_hash,
+            file_stat=file_stat,
             category=category,
+            column_stats={c: s.to_dict() for c, s in profile.column_stats.items()},
             created_at=now,
             updated_at=now,
         )
 
         self.tables[id_] = entry
-        self.save()
-
-        logger.info(f"Registered table: {id_} -> {filename} ({category})")
+        self._build_row_index(entry)
+        self._materialize(entry)
         return entry
 
     def unregister(self, id_: str) -> bool:
         """Unregister a table."""
-        if id_ in self.tables:
-            del self.tables[id_]
+        with self._transaction():
+            if id_ not in self.tables:
+                return False
+            entry = self.tables.pop(id_)
+            remove_columnar(self._get_file_path(entry.filename, entry.category))
             self.save()
-            logger.info(f"Unregistered table: {id_}")
-            return True
-        return False
+        logger.info(f"Unregistered table: {id_}")
+        return True
 
     def get(self, id_: str) -> TableEntry | None:
         """Get table entry by ID."""
@@ -175,8 +249,8 @@ class TableRegistry:
 
     def get_by_filename(self, filename: str, category: str | None = None) -> TableEntry | None:
         """Get table entry by filename."""
-        for entry in self.tables.values():
-            if entry.filename == filename and (category is None or entry.category == category):
+        for entry in self._lookup("filename", filename):
+            if category is None or entry.category == category:
                 return entry
         return None
 
@@ -184,36 +258,65 @@ class TableRegistry:
         """List all registered tables, optionally filtered by category."""
         if category is None:
             return list(self.tables.values())
-        return [e for e in self.tables.values() if e.category == category]
+        return list(self._lookup("category", category))
 
     def update(self, id_: str, **kwargs) -> TableEntry | None:
         """Update table metadata."""
-        entry = self.tables.get(id_)
-        if entry is None:
-            return None
+        with self._transaction():
+            entry = self.tables.get(id_)
+            if entry is None:
+                return None
 
-        for key, value in kwargs.items():
-            if hasattr(entry, key) and value is not None:
-                setattr(entry, key, value)
+            for key, value in kwargs.items():
+                if hasattr(entry, key) and value is not None:
+                    setattr(entry, key, value)
 
-        entry.updated_at = datetime.now().isoformat()
+            entry.updated_at = datetime.now().isoformat()
 
-        # Re-extract metadata if file changed
-        file_path = self._get_file_path(entry.filename, entry.category)
-        if file_path.exists():
-            new_hash = self.compute_file_hash(file_path)
-            if new_hash != entry.file_hash:
-                entry.file_hash = new_hash
-                columns, row_count = self._extract_metadata(file_path)
-                entry.columns = columns
-                entry.row_count = row_count
-                entry.column_count = len(columns)
-
-        self.save()
+            # Re-extract metadata if file changed
+            file_path = self._get_file_path(entry.filename, entry.category)
+            if file_path.exists():
+                self._refresh(entry, file_path)
+
+            self.save()
         return entry
 
+    def _refresh(self, entry: TableEntry, file_path: Path, file_hash: str | None = None) -> bool:
+        """Bring an entry up to date with its file.
+
+        The file is only hashed if its fingerprint changed, and only
+        re-profiled if its hash changed.
+
+        Returns:
+            True if the content changed
+        """
+        file_stat = file_fingerprint(file_path)
+        if file_stat == entry.file_stat:
+            return False
+        if file_hash is None:
+            file_hash = self.compute_file_hash(file_path)
+        entry.file_stat = file_stat
+        if file_hash == entry.file_hash:
+            return False
+
+        entry.file_hash = file_hash
+        profile = self._extract_metadata(file_path)
+        entry.columns = profile.columns
+        entry.row_count = profile.row_count
+        entry.column_count = len(profile.columns)
+        entry.column_stats = {c: s.to_dict() for c, s in profile.column_stats.items()}
+        entry.updated_at = datetime.now().isoformat()
+        self._build_row_index(entry)
+        self._materialize(entry)
+        return True
+
     def is_cache_valid(self, id_: str) -> bool:
-        """Check if cached data is still valid based on file hash."""
+        """Check if cached data is still valid.
+
+        An unchanged fingerprint (size, mtime, inode) is trusted; otherwise
+        the file is hashed, and if only its stats changed (e.g. it was
+        touched or copied), the new fingerprint is stored.
+        """
         entry = self.tables.get(id_)
         if entry is None:
             return False
@@ -222,8 +325,17 @@ class TableRegistry:
         if not file_path.exists():
             return False
 
-        current_hash = self.compute_file_hash(file_path)
-        return current_hash == entry.file_hash
+        file_stat = file_fingerprint(file_path)
+        if entry.file_stat and file_stat == entry.file_stat:
+            return True
+        if self.compute_file_hash(file_path) != entry.file_hash:
+            return False
+        with self._transaction():
+            entry = self.tables.get(id_)
+            if entry is not None:
+                entry.file_stat = file_stat
+                self.save()
+        return True
 
     def _get_name_from_table_list(self, filename: str, category: str) -> str | None:
         """Try to get table name from table_list.csv."""
@@ -256,6 +368,8 @@ class TableRegistry:
         """Sync registry with actual files in directory.
 
         Scans both root directory and subdirectories (real, synthetic, etc.)
+        Only new files and files whose fingerprint changed are hashed, in a
+        thread pool, and the registry is saved once at the end.
 
         Returns:
             Dict with 'added', 'removed', and 'updated' lists
@@ -263,6 +377,10 @@ class TableRegistry:
         if self._tables_dir is None:
             raise ValueError("Tables directory not set")
 
+        with self._transaction():
+            return self._sync_with_directory()
+
+    def _sync_with_directory(self) -> dict[str, list[str]]:
         # Ensure base directory exists to avoid runtime errors
         self._tables_dir.mkdir(parents=True, exist_ok=True)
 
@@ -283,36 +401,59 @@ class TableRegistry:
                     if file.name != "table_list.csv":
                         existing_files[(file.name, subdir.name)] = file
 
-        # Build set of registered (filename, category) pairs
-        registered_pairs = {(e.filename, e.category) for e in self.tables.values()}
+        registered = {(e.filename, e.category): e for e in self.tables.values()}
 
         # Check for removed files
-        for pair in registered_pairs - set(existing_files.keys()):
-            filename, category = pair
-            entry = self.get_by_filename(filename, category)
-            if entry:
-                self.unregister(entry.id)
-                result["removed"].append(entry.id)
+        for pair in registered.keys() - existing_files.keys():
+            entry = registered[pair]
+            del self.tables[entry.id]
+            remove_columnar(self._get_file_path(entry.filename, entry.category))
+            logger.info(f"Unregistered table: {entry.id}")
+            result["removed"].append(entry.id)
+
+        # Only new files and files whose stats changed need hashing
+        new_pairs = existing_files.keys() - registered.keys()
+        changed = [
+            entry
+            for pair, entry in registered.items()
+            if pair in existing_files
+            and file_fingerprint(existing_files[pair]) != entry.file_stat
+        ]
+        hashes = hash_files(
+            [existing_files[pair] for pair in new_pairs]
+            + [existing_files[(e.filename, e.category)] for e in changed]
+        )
 
         # Check for new files
-        for pair in set(existing_files.keys()) - registered_pairs:
+        for pair in new_pairs:
             filename, category = pair
+            path = existing_files[pair]
             # Try to get name from table_list.csv
             name = self._get_name_from_table_list(filename, category)
             try:
-                entry = self.register(
+                entry = self._create_entry(
                     filename=filename,
                     name=name,
                     category=category,
+                    file_hash=hashes.get(path),
                 )
+                logger.info(f"Registered table: {entry.id} -> {filename} ({category})")
                 result["added"].append(entry.id)
             except Exception as e:
                 logger.warning(f"Failed to register {filename}: {e}")
 
         # Check for updated files (hash changed)
-        for entry in list(self.tables.values()):
-            if not self.is_cache_valid(entry.id):
-                self.update(entry.id)
+        for entry in changed:
+            path = existing_files[(entry.filename, entry.category)]
+            if path in hashes and self._refresh(entry, path, hashes[path]):
                 result["updated"].append(entry.id)
 
+        # Write missing or stale copies, e.g. after the table format was changed
+        if self._table_format != "csv" and columnar_available():
+            for entry in self.tables.values():
+                if find_columnar(self._get_file_path(entry.filename, entry.category)) is None:
+                    self._materialize(entry)
+
+        if changed or any(result.values()):
+            self.save()
         return result
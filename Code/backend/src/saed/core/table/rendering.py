@@ -0,0 +1,104 @@
+"""Markdown rendering of table previews for prompts, cached per table version."""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from saed.core.table.sampling import (
+    is_column_strategy,
+    projected_columns,
+    read_columns,
+    sample_table,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rendered previews kept in memory; each is only a few rows of markdown
+MAX_CACHED_PREVIEWS = 256
+
+_cache: OrderedDict[tuple, str] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _table_version(table_path: Path, file_hash: str) -> str:
+    """Key of the table's current content.
+
+    The registry hash identifies the content when known; otherwise the file's
+    size and modification time stand in for it.
+    """
+    if file_hash:
+        return file_hash
+    stat = table_path.stat()
+    return f"{table_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def render_table_markdown(
+    table_path: Path,
+    k: int = 5,
+    strategy: str = "head",
+    file_hash: str = "",
+    column: str | None = None,
+    seed: int = 0,
+    projected: bool = False,
+    key_columns: int = 2,
+) -> str:
+    """Render the ``k`` row preview of a table sent to the LLM.
+
+    Only the rows of the preview are kept in memory (see
+    :func:`~saed.core.table.sampling.sample_table`), and the result is cached
+    per table version and sampling parameters, so repeated runs on the same
+    table skip the file. The target ``column`` only takes part in the cache
+    key when the strategy or the projection depends on it, so columns of the
+    same table share one head preview.
+
+    Args:
+        table_path: Path of the CSV file
+        k: Number of rows in the preview
+        strategy: Row sampling strategy (see ``SAMPLING_STRATEGIES``)
+        file_hash: Registry hash of the file (``TableEntry.file_hash``); when
+            empty the file's size and mtime identify its version
+        column: Column being annotated
+        seed: Seed of the random strategies
+        projected: Only include ``column`` and the first ``key_columns``
+            other columns
+        key_columns: Number of key columns of a projected preview
+
+    Returns:
+        The preview as a markdown table
+    """
+    column_aware = is_column_strategy(strategy)
+    if (column_aware or projected) and column is None:
+        raise ValueError("Column-aware and projected previews need a target column")
+    key = (
+        _table_version(table_path, file_hash),
+        k,
+        strategy,
+        column if column_aware or projected else None,
+        seed if strategy in ("random", "stratified") else None,
+        key_columns if projected else None,
+    )
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    columns = None
+    if projected:
+        columns = projected_columns(read_columns(table_path), column, key_columns)
+    sample = sample_table(table_path, k, strategy, column=column, seed=seed, columns=columns)
+    markdown = sample.to_markdown(index=False)
+    logger.debug(f"Rendered {k} row preview of {table_path.name} ({strategy})")
+
+    with _cache_lock:
+        _cache[key] = markdown
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_PREVIEWS:
+            _cache.popitem(last=False)
+    return markdown
+
+
+def clear_table_markdown_cache() -> None:
+    """Drop all cached previews."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,107 @@
+"""Row-offset index of CSV files for reading row windows with one seek."""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# A byte offset is recorded every this many data rows
+ROW_INDEX_STRIDE = 1000
+
+
+def build_row_index(file_path: Path, stride: int = ROW_INDEX_STRIDE) -> np.ndarray:
+    """Scan a CSV file for the byte offsets of every ``stride``-th data row.
+
+    Rows are delimited by newlines outside double quotes, so quoted values
+    spanning several lines are handled. Element ``i`` is the offset of data
+    row ``i * stride`` (the header is not a data row).
+
+    Returns:
+        The offsets as an int64 array
+    """
+    offsets: list[int] = []
+    position = 0
+    row = -1  # The header ends first
+    open_quotes = False
+    with open(file_path, "rb") as f:
+        for line in f:
+            position += len(line)
+            if line.count(b'"') % 2:
+                open_quotes = not open_quotes
+            if open_quotes or not line.strip():
+                continue  # Inside a quoted value, or a blank line pandas skips
+            row += 1
+            if row % stride == 0:
+                offsets.append(position)
+    # The last offset points past the final row if the row count is a multiple of stride
+    if offsets and offsets[-1] >= position:
+        offsets.pop()
+    return np.asarray(offsets, dtype=np.int64)
+
+
+def save_row_index(index: np.ndarray, index_path: Path) -> None:
+    """Persist a row index."""
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, index)
+    tmp_path.replace(index_path)
+
+
+def load_row_index(index_path: Path) -> np.ndarray | None:
+    """Load a persisted row index, or None if there is none."""
+    try:
+        return np.load(index_path)
+    except (OSError, ValueError):
+        return None
+
+
+def read_row_window(
+    file_path: Path,
+    columns: list[str],
+    offset: int,
+    limit: int,
+    index: np.ndarray | None = None,
+    stride: int = ROW_INDEX_STRIDE,
+) -> pd.DataFrame:
+    """Read ``limit`` data rows starting at row ``offset``.
+
+    With a row index the file is entered at the closest indexed row before
+    ``offset``, so at most ``stride`` rows are parsed before the window
+    however deep it is; without one all rows before the window are parsed.
+    Rows are skipped after parsing, so blank lines and quoted newlines do
+    not shift the window.
+
+    Args:
+        file_path: Path of the CSV file
+        columns: Header of the file
+        offset: First data row of the window (0-based)
+        limit: Number of rows
+        index: Row index of the file (see :func:`build_row_index`)
+        stride: Stride of the index
+
+    Returns:
+        The rows of the window (fewer past the end of the file)
+    """
+    offset = max(offset, 0)
+    if limit <= 0:
+        return pd.DataFrame(columns=columns)
+
+    if index is None or len(index) == 0:
+        # No index: parse from the first data row
+        frame = pd.read_csv(file_path, nrows=offset + limit)
+        return frame.iloc[offset:].reset_index(drop=True)
+
+    # Closest indexed row before the window (the last one past the index's end)
+    block = min(offset // stride, len(index) - 1)
+    skip = offset - block * stride
+    with open(file_path, "rb") as f:
+        f.seek(int(index[block]))
+        try:
+            frame = pd.read_csv(f, header=None, names=columns, nrows=skip + limit)
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame(columns=columns)
+    return frame.iloc[skip:].reset_index(drop=True)
@@ -0,0 +1,215 @@
+"""Row sampling of table previews, streamed over the table in one pass."""
+
+import heapq
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from saed.core.table.columnar import iter_table_chunks, read_table
+
+logger = logging.getLogger(__name__)
+
+# Strategies and whether they depend on the target column
+SAMPLING_STRATEGIES = {
+    "head": False,  # First k rows
+    "random": False,  # Uniform sample of k rows (seeded reservoir)
+    "stratified": True,  # Rows of k distinct target values, frequent values more likely
+    "distinct": True,  # First row of each new target value, in file order
+    "non_null": True,  # First rows whose target value is not null
+}
+
+# Rows parsed at a time when a strategy has to look past the first k rows
+CHUNK_ROWS = 50_000
+
+# Column of the random keys while sampling
+_KEY = "__sample_key__"
+
+# Stratum of null target values
+_NULL = object()
+
+
+def is_column_strategy(strategy: str) -> bool:
+    """Whether a strategy samples differently for every target column."""
+    if strategy not in SAMPLING_STRATEGIES:
+        raise ValueError(f"Unknown sampling strategy: {strategy}")
+    return SAMPLING_STRATEGIES[strategy]
+
+
+def read_columns(table_path: Path) -> list[str]:
+    """Read the header of a CSV file."""
+    return pd.read_csv(table_path, nrows=0).columns.tolist()
+
+
+def projected_columns(columns: list[str], column: str, key_columns: int = 2) -> list[str]:
+    """Columns of a projected preview: the target column and the leading key columns.
+
+    The leading columns of a table usually identify its rows (IDs, names,
+    timestamps), which is the context the target column needs; the remaining
+    columns are left out to save prompt tokens. Table order is kept.
+    """
+    keys = [c for c in columns if c != column][: max(key_columns, 0)]
+    return [c for c in columns if c == column or c in keys]
+
+
+def _chunks(table_path: Path, usecols: list[str] | None) -> Iterator[pd.DataFrame]:
+    """Stream the table in chunks, with each row's position in the file."""
+    start = 0
+    for chunk in iter_table_chunks(table_path, usecols, CHUNK_ROWS):
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+
+def reservoir_sample(chunks: Iterator[pd.DataFrame], k: int, seed: int = 0) -> pd.DataFrame:
+    """Uniformly sample ``k`` rows of a chunked table in one pass.
+
+    Every row gets a random key from a generator seeded with ``seed``, and the
+    ``k`` rows with the smallest keys are kept (bottom-k sampling, equivalent
+    to a reservoir), so memory stays at ``k`` rows however large the table.
+    The same seed always selects the same rows, independent of chunking.
+    """
+    rng = np.random.default_rng(seed)
+    kept: pd.DataFrame | None = None
+    for chunk in chunks:
+        keys = pd.Series(rng.random(len(chunk)), index=chunk.index)
+        candidates = chunk.assign(**{_KEY: keys})
+        if kept is not None:
+            candidates = pd.concat([kept, candidates])
+        kept = candidates.nsmallest(k, _KEY)
+    if kept is None:
+        return pd.DataFrame()
+    return kept.drop(columns=_KEY).sort_index()
+
+
+def stratified_sample(
+    chunks: Iterator[pd.DataFrame], column: str, k: int, seed: int = 0
+) -> pd.DataFrame:
+    """Sample one row from each of ``k`` distinct values of ``column`` in one pass.
+
+    Rows get seeded random keys as in :func:`reservoir_sample`; the sample is
+    the ``k`` smallest keys with distinct values (nulls form one stratum).
+    Frequent values are therefore more likely to be represented, but no value
+    twice. At most ``k`` strata are kept in memory: a stratum that is evicted
+    can only come back with a smaller key, which is handled as a new entry.
+    """
+    rng = np.random.default_rng(seed)
+    best: dict[object, tuple[float, int]] = {}  # Stratum -> (key, position)
+    heap: list[tuple[float, int]] = []  # Max-heap of (-key, position) of the kept rows
+    strata: dict[int, object] = {}  # Position -> stratum of the kept rows
+    rows: dict[int, pd.Series] = {}
+
+    def threshold() -> float:
+        return -heap[0][0] if len(heap) >= k else np.inf
+
+    for chunk in chunks:
+        keys = rng.random(len(chunk))
+        values = chunk[column].astype(object).where(chunk[column].notna(), _NULL)
+        # Only rows below the current threshold or of a kept stratum can enter
+        mask = (keys < threshold()) | values.isin(list(best)).to_numpy()
+        for key, stratum, position in zip(
+            keys[mask], values[mask], chunk.index[mask], strict=True
+        ):
+            if stratum in best:
+                old_key, old_position = best[stratum]
+                if key >= old_key:
+                    continue
+                heap.remove((-old_key, old_position))
+                heapq.heapify(heap)
+                del strata[old_position], rows[old_position]
+            elif key >= threshold():
+                continue
+            elif len(heap) >= k:
+                _, evicted = heapq.heappop(heap)
+                del best[strata.pop(evicted)], rows[evicted]
+            best[stratum] = (key, position)
+            heapq.heappush(heap, (-key, position))
+            strata[position] = stratum
+            rows[position] = chunk.loc[position]
+
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame([rows[p] for p in sorted(rows)])
+
+
+def _first_rows(
+    chunks: Iterator[pd.DataFrame], column: str, k: int, distinct: bool
+) -> pd.DataFrame:
+    """Prefer rows with a non-null (and, if ``distinct``, unseen) target value.
+
+    Reading stops as soon as ``k`` preferred rows are found. If the table has
+    fewer, the sample is completed with its first other rows.
+    """
+    preferred: list[pd.DataFrame] = []
+    found = 0
+    head: pd.DataFrame | None = None
+    seen: set = set()
+    for chunk in chunks:
+        if head is None:
+            head = chunk.head(k)
+        mask = chunk[column].notna()
+        if distinct:
+            mask &= ~chunk[column].duplicated() & ~chunk[column].isin(seen)
+        selected = chunk[mask].head(k - found)
+        if distinct:
+            seen.update(selected[column])
+        preferred.append(selected)
+        found += len(selected)
+        if found >= k:
+            break
+
+    if head is None:
+        return pd.DataFrame()
+    sample = pd.concat(preferred) if preferred else head.head(0)
+    if len(sample) < k:
+        filler = head.drop(index=sample.index, errors="ignore").head(k - len(sample))
+        sample = pd.concat([sample, filler])
+    return sample.sort_index()
+
+
+def sample_table(
+    table_path: Path,
+    k: int = 5,
+    strategy: str = "head",
+    column: str | None = None,
+    seed: int = 0,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Sample ``k`` rows of a CSV file without loading it.
+
+    Rows are read from the table's columnar copy when it has an up-to-date
+    one (see :mod:`saed.core.table.columnar`), so only the needed columns
+    and, for ``head``, rows are touched.
+
+    Args:
+        table_path: Path of the CSV file
+        k: Number of rows
+        strategy: One of :data:`SAMPLING_STRATEGIES`
+        column: Target column, required by the column-aware strategies
+        seed: Seed of the random strategies
+        columns: Columns to read (all if None)
+
+    Returns:
+        The sampled rows in file order
+    """
+    if is_column_strategy(strategy) and column is None:
+        raise ValueError(f"Sampling strategy {strategy!r} needs a target column")
+    k = max(k, 0)
+
+    if strategy == "head" or k == 0:
+        return read_table(table_path, columns, nrows=k)
+
+    chunks = _chunks(table_path, columns)
+    if strategy == "random":
+        sample = reservoir_sample(chunks, k, seed)
+    elif strategy == "stratified":
+        sample = stratified_sample(chunks, column, k, seed)
+    else:
+        sample = _first_rows(chunks, column, k, distinct=strategy == "distinct")
+
+    if sample.empty:
+        return read_table(table_path, columns, nrows=0)
+    logger.debug(f"Sampled {len(sample)} rows of {table_path.name} ({strategy})")
+    return sample
@@ -17,13 +17,12 @@ def dataframe_to_markdown(df: pd.DataFrame, k: int = 5) -> str:
         A Markdown-formatted string representation of the table.
     """
     subset = df.head(k)
-    headers = "| " + " | ".join(subset.columns) + " |"
+    headers = "| " + " | ".join(map(str, subset.columns)) + " |"
     sep = "| " + " | ".join(["---"] * len(subset.columns)) + " |"
 
-    rows = []
-    for _, row in subset.iterrows():
-        row_str = "| " + " | ".join(map(str, row.values)) + " |"
-        rows.append(row_str)
+    # Convert all cells in one step instead of building a Series per row
+    cells = subset.to_numpy(dtype=str)
+    rows = ["| " + " | ".join(row) + " |" for row in cells]
 
     md_table = headers + "\n" + sep + "\n" + "\n".join(rows)
     return md_table
@@ -1,5 +1,11 @@
 """Utility modules for SAED."""
 
+from saed.core.utils.files import (
+    compute_file_hash,
+    file_fingerprint,
+    format_file_hash,
+    hash_files,
+)
 from saed.core.utils.paths import (
     get_backend_root,
     get_config_dir,
@@ -7,11 +13,32 @@ from saed.core.utils.paths import (
     get_output_dir,
     get_project_root,
 )
+from saed.core.utils.registry_store import RegistryFile, SharedRegistry
+from saed.core.utils.traces import (
+    TraceCodecError,
+    decode_trace_bytes,
+    expand_trace,
+    intern_trace,
+    read_trace_file,
+    write_trace_file,
+)
 
 __all__ = [
+    "compute_file_hash",
+    "file_fingerprint",
+    "format_file_hash",
+    "hash_files",
     "get_backend_root",
     "get_config_dir",
     "get_data_dir",
     "get_output_dir",
     "get_project_root",
+    "RegistryFile",
+    "SharedRegistry",
+    "TraceCodecError",
+    "decode_trace_bytes",
+    "expand_trace",
+    "intern_trace",
+    "read_trace_file",
+    "write_trace_file",
 ]
@@ -0,0 +1,61 @@
+"""File content hashes and cheap change detection for the registries."""
+
+import hashlib
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Read size when hashing; large reads keep hashing I/O bound
+HASH_CHUNK_BYTES = 1 << 20
+
+# Files hashed concurrently in bulk syncs; hashlib releases the GIL on large
+# buffers, so threads hash in parallel
+MAX_HASH_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+def format_file_hash(sha256: "hashlib._Hash") -> str:
+    """Format a SHA256 digest of a file's content as a registry file hash."""
+    return f"sha256:{sha256.hexdigest()[:16]}"
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """Compute the (shortened) SHA256 hash of a file's content."""
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            sha256.update(chunk)
+    return format_file_hash(sha256)
+
+
+def file_fingerprint(file_path: Path) -> str:
+    """Get the ``size:mtime_ns:inode`` fingerprint of a file.
+
+    An unchanged fingerprint means the file was not modified (or replaced)
+    since it was taken, so its content hash does not have to be recomputed.
+    A changed fingerprint does not imply changed content; see
+    :func:`compute_file_hash` for the second tier.
+    """
+    stat = file_path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}"
+
+
+def hash_files(paths: Iterable[Path], max_workers: int = MAX_HASH_WORKERS) -> dict[Path, str]:
+    """Hash many files in a thread pool.
+
+    Returns:
+        Content hash per path; files that cannot be read are left out
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return {p: compute_file_hash(p) for p in paths if p.exists()}
+
+    def safe_hash(path: Path) -> str | None:
+        try:
+            return compute_file_hash(path)
+        except OSError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        hashes = dict(zip(paths, pool.map(safe_hash, paths), strict=True))
+    return {p: h for p, h in hashes.items() if h is not None}
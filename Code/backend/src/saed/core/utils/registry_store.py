@@ -0,0 +1,256 @@
+"""Shared in-memory registries with atomic, locked JSON persistence.
+
+Each registry directory has one registry object per process, kept in memory
+and reloaded only when its ``registry.json`` changed on disk (another
+process, e.g. a CLI run next to the API, wrote it). Mutations are
+read-modify-write transactions under an exclusive file lock, so concurrent
+writers no longer overwrite each other's entries, and files are replaced
+atomically, so readers never see a partial file.
+
+The JSON file is one store of a registry's entries; the SQLite catalog
+(:class:`saed.core.catalog.CatalogStore`) is the other, with the same
+interface.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ClassVar, Self
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+class RegistryFile:
+    """A registry JSON file with atomic writes, locking and change detection."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock_path = path.with_name(path.name + ".lock")
+        self.thread_lock = threading.RLock()
+        self._depth = 0
+        self._lock_file = None
+        self._stamp: tuple[int, int, int] | None = None  # Stat when last read or written
+
+    def __str__(self) -> str:
+        return str(self.path)
+
+    def _stat(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def changed(self) -> bool:
+        """Whether the file changed since it was last read or written here."""
+        return self._stat() != self._stamp
+
+    def read(self) -> dict[str, Any] | None:
+        """Read the file, or None if it does not exist.
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        # Stat first: a write racing the read leaves a stale stamp and is reread
+        self._stamp = self._stat()
+        if self._stamp is None:
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def write(self, data: dict[str, Any]) -> None:
+        """Atomically replace the file with ``data``."""
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._stamp = self._stat()
+
+    def load(self, registry: "SharedRegistry") -> None:
+        """Replace the registry's entries with those of the file.
+
+        A missing file loads no entries; an invalid one too, with a warning.
+        """
+        with self.thread_lock:
+            try:
+                data = self.read()
+            except (json.JSONDecodeError, KeyError) as e:
+                logger.warning(f"Failed to load {self.path}: {e}, creating new one")
+                data = None
+            try:
+                registry._load_data(data or {})
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Failed to load {self.path}: {e}, creating new one")
+                registry._load_data({})
+            logger.debug(f"Loaded {self.path} with {len(registry._entries())} entries")
+
+    def save(self, registry: "SharedRegistry") -> None:
+        """Write the registry's entries to the file."""
+        with self.locked():
+            self.write(registry._dump_data())
+        logger.debug(f"Saved {self.path} with {len(registry._entries())} entries")
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the file exclusively: against other threads and other processes.
+
+        Re-entrant within a thread; the file lock is taken by the outermost
+        holder only.
+        """
+        with self.thread_lock:
+            if self._depth == 0:
+                self._acquire()
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._release()
+
+    def _acquire(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_file = open(self.lock_path, "a+b")  # noqa: SIM115
+        if fcntl is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        else:
+            self._lock_file.seek(0)
+            msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _release(self) -> None:
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            else:
+                self._lock_file.seek(0)
+                msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+class SharedRegistry:
+    """Base of the registries: one instance per store, persisted by the store.
+
+    The store is the registry's :class:`RegistryFile` unless another one
+    (a catalog store) is given. Subclasses name their entry type and entries
+    dict (:attr:`_entry_type`, :attr:`_entries_field`), convert the entries
+    from and to the file's JSON layout (:meth:`_load_data`, :meth:`_dump_data`)
+    and wrap every mutation in :meth:`_transaction`.
+    """
+
+    _instances: ClassVar[dict[tuple[type, Any], "SharedRegistry"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    _entry_type: ClassVar[type]  # Entry dataclass, with to_dict() and from_dict()
+    _entries_field: ClassVar[str]  # Name of the entries-by-ID dict
+
+    _registry_path: Path | None
+
+    def __post_init__(self) -> None:
+        self._store = RegistryFile(self._registry_path) if self._registry_path else None
+        self._indexes: dict[str, dict[Any, list[Any]]] = {}
+
+    @classmethod
+    def _shared(cls, registry_path: Path, store: Any = None, **fields: Any) -> Self:
+        """Get the shared registry of a file or store, reloaded if it changed.
+
+        Args:
+            registry_path: JSON file of the registry
+            store: Store to persist to instead of the JSON file
+            **fields: Fields of a new registry
+        """
+        key = (cls, store if store is not None else registry_path.resolve())
+        with cls._instances_lock:
+            registry = cls._instances.get(key)
+            if registry is None:
+                registry = cls(_registry_path=registry_path, **fields)
+                if store is not None:
+                    registry._store = store
+                cls._instances[key] = registry
+        registry.refresh()
+        return registry
+
+    def _entries(self) -> dict[str, Any]:
+        """The entries by ID."""
+        return getattr(self, self._entries_field)
+
+    def _set_entries(self, entries: dict[str, Any]) -> None:
+        """Replace the entries by ID."""
+        setattr(self, self._entries_field, entries)
+
+    def _load_data(self, data: dict[str, Any]) -> None:
+        """Replace the entries with those of the file's content."""
+        raise NotImplementedError
+
+    def _dump_data(self) -> dict[str, Any]:
+        """Get the file's content for the current entries."""
+        raise NotImplementedError
+
+    def refresh(self) -> None:
+        """Reload the entries if they changed in the store."""
+        if self._store is None:
+            return
+        with self._store.thread_lock:
+            if not self._store.changed():
+                return
+            self._store.load(self)
+            self._indexes.clear()
+
+    def save(self) -> None:
+        """Save the registry to its store."""
+        if self._store is None:
+            raise ValueError("Registry path not set")
+        with self._store.locked():
+            self._store.save(self)
+            self._indexes.clear()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run a read-modify-write of the registry.
+
+        The store is locked and reloaded if another process changed it, so
+        the mutation applies to the latest entries and its save loses none.
+        """
+        if self._store is None:  # Not persisted
+            yield
+            return
+        with self._store.locked():
+            self.refresh()
+            try:
+                yield
+            finally:
+                self._indexes.clear()
+
+    def replace_entries(self, other: Self) -> int:
+        """Replace all entries with those of another registry, e.g. to move stores.
+
+        Returns:
+            Number of entries copied
+        """
+        with self._transaction():
+            self._set_entries(dict(other._entries()))
+            self.save()
+        return len(self._entries())
+
+    def _lookup(self, field_name: str, value: Any) -> list[Any]:
+        """Get the entries whose ``field_name`` equals ``value``, through an index."""
+        index = self._indexes.get(field_name)
+        if index is None:
+            index = {}
+            for entry in self._entries().values():
+                index.setdefault(getattr(entry, field_name), []).append(entry)
+            self._indexes[field_name] = index
+        return index.get(value, [])
@@ -0,0 +1,224 @@
+"""Compact storage for run and batch trace files.
+
+Run and batch results repeat the same prompt fragments many times: every
+``llm_request.prompt`` of a column embeds the same table preview, and EDM
+agents repeat it once per agent. Trace files therefore intern prompt lines
+into a per-file ``trace_fragments`` table and store prompts as lists of
+fragment ids and literal lines. Files may additionally be gzip or zstd
+compressed; readers detect the encoding from the file content, so the
+``.json`` file names (and every glob over them) stay unchanged.
+"""
+
+import gzip
+import io
+import json
+import logging
+from pathlib import Path
+from typing import Any, Literal
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency: saed[zstd]
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+TraceCompression = Literal["none", "gzip", "zstd"]
+
+FRAGMENTS_KEY = "trace_fragments"
+
+# Lines shorter than this are cheaper to store inline than as a reference
+MIN_FRAGMENT_LENGTH = 24
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class TraceCodecError(ValueError):
+    """Raised when a trace file uses an encoding this installation cannot handle."""
+
+
+def _require_zstandard() -> Any:
+    if zstandard is None:
+        raise TraceCodecError(
+            "zstd trace compression requires the optional 'zstandard' package "
+            "(pip install 'saed[zstd]')"
+        )
+    return zstandard
+
+
+def intern_trace(data: dict[str, Any]) -> dict[str, Any]:
+    """Intern repeated prompt lines of a run or batch result.
+
+    Args:
+        data: Run or batch result as written by the runners
+
+    Returns:
+        New dictionary where each ``llm_request.prompt`` is a list of
+        fragment ids (int) and literal lines (str), plus a ``trace_fragments``
+        table. Already interned input is returned unchanged.
+    """
+    if FRAGMENTS_KEY in data:
+        return data
+
+    fragments: list[str] = []
+    index: dict[str, int] = {}
+
+    def encode_prompt(prompt: str) -> list[int | str]:
+        parts: list[int | str] = []
+        for line in prompt.split("\n"):
+            if len(line) < MIN_FRAGMENT_LENGTH:
+                parts.append(line)
+                continue
+            fragment_id = index.get(line)
+            if fragment_id is None:
+                fragment_id = len(fragments)
+                index[line] = fragment_id
+                fragments.append(line)
+            parts.append(fragment_id)
+        return parts
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                if (
+                    key == "llm_request"
+                    and isinstance(item, dict)
+                    and isinstance(item.get("prompt"), str)
+                ):
+                    result[key] = {**item, "prompt": encode_prompt(item["prompt"])}
+                else:
+                    result[key] = walk(item)
+            return result
+        if isinstance(value, list):
+            return [walk(item) for item in value]
+        return value
+
+    encoded = walk(data)
+    encoded[FRAGMENTS_KEY] = fragments
+    return encoded
+
+
+def expand_trace(data: dict[str, Any]) -> dict[str, Any]:
+    """Restore full prompt strings in an interned run or batch result.
+
+    Args:
+        data: Result dictionary, interned or not
+
+    Returns:
+        Dictionary with plain ``llm_request.prompt`` strings. Input without a
+        ``trace_fragments`` table is returned unchanged.
+    """
+    if FRAGMENTS_KEY not in data:
+        return data
+
+    fragments: list[str] = data[FRAGMENTS_KEY]
+
+    def decode_prompt(parts: list[int | str]) -> str:
+        return "\n".join(fragments[p] if isinstance(p, int) else p for p in parts)
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                if (
+                    key == "llm_request"
+                    and isinstance(item, dict)
+                    and isinstance(item.get("prompt"), list)
+                ):
+                    result[key] = {**item, "prompt": decode_prompt(item["prompt"])}
+                else:
+                    result[key] = walk(item)
+            return result
+        if isinstance(value, list):
+            return [walk(item) for item in value]
+        return value
+
+    decoded = {k: v for k, v in data.items() if k != FRAGMENTS_KEY}
+    return walk(decoded)
+
+
+def write_trace_file(
+    file_path: Path,
+    data: dict[str, Any],
+    intern: bool = True,
+    compression: TraceCompression = "none",
+) -> None:
+    """Write a run or batch result to disk.
+
+    Args:
+        file_path: Destination path (keeps its ``.json`` name when compressed)
+        data: Result dictionary with plain prompts
+        intern: Whether to intern repeated prompt fragments
+        compression: "none", "gzip" or "zstd"
+    """
+    if intern:
+        data = intern_trace(data)
+
+    if compression == "none":
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+        return
+
+    payload = json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+    if compression == "gzip":
+        payload = gzip.compress(payload, compresslevel=6)
+    elif compression == "zstd":
+        payload = _require_zstandard().ZstdCompressor(level=10).compress(payload)
+    else:
+        raise ValueError(f"Unsupported trace compression: {compression}")
+
+    with open(file_path, "wb") as f:
+        f.write(payload)
+
+
+def decode_trace_bytes(raw: bytes, expand: bool = True) -> dict[str, Any]:
+    """Decode the content of a run or batch result file.
+
+    Plain, gzip- and zstd-compressed content is detected from its first bytes,
+    so legacy uncompressed results decode unchanged.
+
+    Args:
+        raw: File content
+        expand: Whether to restore interned prompts (skip for metadata-only reads)
+
+    Returns:
+        Parsed result dictionary
+
+    Raises:
+        TraceCodecError: If the content is zstd-compressed and zstandard is missing
+        json.JSONDecodeError: If the (decompressed) content is not valid JSON
+    """
+    if raw.startswith(_GZIP_MAGIC):
+        raw = gzip.decompress(raw)
+    elif raw.startswith(_ZSTD_MAGIC):
+        reader = _require_zstandard().ZstdDecompressor().stream_reader(io.BytesIO(raw))
+        raw = reader.read()
+
+    data = json.loads(raw)
+    if expand and isinstance(data, dict):
+        data = expand_trace(data)
+    return data
+
+
+def read_trace_file(file_path: Path, expand: bool = True) -> dict[str, Any]:
+    """Read a run or batch result written by :func:`write_trace_file`.
+
+    Args:
+        file_path: Path to the result file
+        expand: Whether to restore interned prompts (skip for metadata-only reads)
+
+    Returns:
+        Parsed result dictionary
+
+    Raises:
+        TraceCodecError: If the file is zstd-compressed and zstandard is missing
+        json.JSONDecodeError: If the (decompressed) content is not valid JSON
+    """
+    with open(file_path, "rb") as f:
+        raw = f.read()
+
+    data = decode_trace_bytes(raw, expand=expand)
+    logger.debug(f"Loaded trace file: {file_path}")
+    return data
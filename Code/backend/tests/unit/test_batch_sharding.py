@@ -0,0 +1,153 @@
+"""Tests for sharding batch experiments and merging shard results."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from saed.cli.batch import (
+    SHARDS_DIR,
+    cmd_merge,
+    merge_shards,
+    parse_shard,
+    partition_units,
+    select_shard,
+)
+from saed.core.utils.traces import read_trace_file, write_trace_file
+
+PLAN = [["28.csv", ["Energy", "Power"]], ["29.csv", ["Temperature"]], ["30.csv", ["A", "B", "C"]]]
+CONFIG = {
+    "ontology_id": "BEO.rdf",
+    "ontology_registry_id": "beo",
+    "mode": "single",
+    "prompt_type": "cot",
+    "max_depth": 3,
+    "k": 5,
+    "edm_options": None,
+    "provider": "ollama",
+    "model": "m",
+}
+
+
+def column_result(name: str, status: str = "completed") -> dict:
+    return {"column_name": name, "status": status, "steps": [], "final_paths": []}
+
+
+def make_shard(index: int, count: int, tables: list[tuple[str, list[dict]]], status: str) -> dict:
+    entries = [
+        {
+            "table_id": filename,
+            "table_registry_id": filename.removesuffix(".csv"),
+            "table_name": filename,
+            "run_file": "",
+            "columns": columns,
+            "summary": {"total_time_ms": 100 * len(columns), "total_tokens": 10 * len(columns)},
+        }
+        for filename, columns in tables
+    ]
+    return {
+        "run_id": "batch_exp",
+        "created_at": f"2025-01-0{index}T00:00:00",
+        "completed_at": f"2025-01-0{index}T01:00:00",
+        "status": status,
+        "config": CONFIG,
+        "tables": entries,
+        "summary": {
+            "total_time_ms": 100,
+            "total_tokens": 10,
+            "total_input_tokens": 6,
+            "total_output_tokens": 4,
+        },
+        "shard": {"index": index, "count": count, "plan": PLAN},
+    }
+
+
+@pytest.fixture
+def app_config():
+    return SimpleNamespace(storage=SimpleNamespace(trace_interning=False, trace_compression="none"))
+
+
+class TestPartition:
+    """Test cases for shard parsing and partitioning."""
+
+    @pytest.mark.parametrize("value", ["0/2", "3/2", "1", "a/b", "1/0"])
+    def test_invalid_shard(self, value):
+        """Test that malformed or out-of-range shards are rejected."""
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+    def test_partition_is_balanced_and_deterministic(self):
+        """Test that units are spread by cost the same way on every call."""
+        costs = [8, 7, 6, 5, 4, 3, 2, 1]
+        assignment = partition_units(costs, 2)
+        assert assignment == partition_units(costs, 2)
+        loads = [sum(c for c, s in zip(costs, assignment, strict=True) if s == shard) for shard in range(2)]
+        assert loads == [18, 18]
+
+    def test_shards_cover_every_unit_once(self):
+        """Test that the shards of a plan are disjoint and complete."""
+        plan = [(table, columns) for table, columns in PLAN]
+        widths = {"28.csv": 4, "29.csv": 2, "30.csv": 6}
+        units = []
+        for index in (1, 2, 3):
+            for table, columns in select_shard(plan, widths, 5, (index, 3)):
+                units.extend((table, column) for column in columns)
+        assert sorted(units) == sorted((t, c) for t, cols in plan for c in cols)
+
+
+class TestMergeShards:
+    """Test cases for merge_shards."""
+
+    def write_shards(self, tmp_path, shards: list[dict]) -> list:
+        paths = []
+        tmp_path.mkdir(exist_ok=True)
+        for shard in shards:
+            path = tmp_path / f"batch_exp.shard-{shard['shard']['index']}-of-2.json"
+            write_trace_file(path, shard, intern=False)
+            paths.append(path)
+        return paths
+
+    def test_merge_restores_plan_order(self, tmp_path, app_config):
+        """Test that tables split across shards are merged in plan order."""
+        shard_1 = make_shard(1, 2, [
+            ("28.csv", [column_result("Power")]),
+            ("30.csv", [column_result("A"), column_result("C")]),
+        ], "completed")
+        shard_2 = make_shard(2, 2, [
+            ("28.csv", [column_result("Energy")]),
+            ("29.csv", [column_result("Temperature", "failed")]),
+            ("30.csv", [column_result("B")]),
+        ], "partial")
+        paths = self.write_shards(tmp_path, [shard_2, shard_1])
+
+        result = merge_shards(paths, tmp_path, app_config)
+
+        assert [t["table_id"] for t in result["tables"]] == ["28.csv", "29.csv", "30.csv"]
+        assert [c["column_name"] for c in result["tables"][0]["columns"]] == ["Energy", "Power"]
+        assert result["status"] == "partial"
+        assert result["summary"]["completed_tables"] == 2
+        assert result["summary"]["completed_columns"] == 5
+        assert result["summary"]["total_tokens"] == 20
+        assert result["created_at"] == "2025-01-01T00:00:00"
+        assert read_trace_file(tmp_path / "batch_exp.json") == result
+        table_file = read_trace_file(tmp_path / "run_exp_28.json")
+        assert table_file["status"] == "completed"
+
+    def test_missing_shard_is_rejected(self, tmp_path, app_config):
+        """Test that merging an incomplete set of shards fails."""
+        paths = self.write_shards(tmp_path, [make_shard(1, 2, [], "completed")])
+        with pytest.raises(ValueError, match="Expected shards"):
+            merge_shards(paths, tmp_path, app_config)
+
+    def test_merge_from_shards_dir(self, tmp_path, app_config):
+        """Test that shards written to shards/ are merged into the run directory."""
+        paths = self.write_shards(tmp_path / SHARDS_DIR, [
+            make_shard(1, 2, [("28.csv", [column_result("Power")])], "completed"),
+            make_shard(2, 2, [("28.csv", [column_result("Energy")])], "completed"),
+        ])
+        args = SimpleNamespace(shard_files=[str(p) for p in paths], output_dir=None)
+
+        with patch("saed.cli.batch.load_config", return_value=app_config):
+            cmd_merge(args)
+
+        assert read_trace_file(tmp_path / "batch_exp.json")["summary"]["completed_columns"] == 2
@@ -0,0 +1,127 @@
+"""Tests for cooperative run cancellation."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from saed.core.config.settings import CandidateOptions
+from saed.core.executor import CancellationToken, DetailedSelector, RunCancelled, RunExecutor
+from saed.core.executor.run_executor import (
+    LLMBackend,
+    LLMRequestDetail,
+    LLMResponseDetail,
+    SelectionResult,
+)
+
+
+@pytest.fixture
+def dag():
+    """A chain ontology: Thing -> Device -> Meter -> SmartMeter."""
+    names = {"root": "Thing", "d": "Device", "m": "Meter", "s": "SmartMeter"}
+    return SimpleNamespace(
+        root="root",
+        nodes={url: SimpleNamespace(name=name) for url, name in names.items()},
+        edges_subclassof={"root": ["d"], "d": ["m"], "m": ["s"]},
+    )
+
+
+class CancellingSelector:
+    """Selector that picks the only candidate and cancels after ``limit`` calls."""
+
+    def __init__(self, token: CancellationToken, limit: int) -> None:
+        self.token = token
+        self.limit = limit
+        self.calls = 0
+
+    def select(self, table_name, table_in_markdown, column_name, candidates):
+        self.token.raise_if_cancelled()
+        self.calls += 1
+        if self.calls == self.limit:
+            self.token.cancel()
+        return SelectionResult(
+            selected=list(candidates),
+            llm_request=LLMRequestDetail(prompt="p", model="m"),
+            llm_response=LLMResponseDetail(raw="r"),
+        )
+
+
+def make_executor(selector, token: CancellationToken) -> RunExecutor:
+    executor = object.__new__(RunExecutor)
+    executor.selector = selector
+    executor.max_depth = 5
+    executor.sse_callback = None
+    executor.candidate_options = CandidateOptions()
+    executor.cancel_token = token
+    return executor
+
+
+SELECTOR_DATA = {
+    "table_name": "t",
+    "column_name": "c",
+    "table_in_markdown": "",
+    "current_level_ontology_classes": "A",
+}
+
+
+def make_failing_selector(token: CancellationToken, client) -> DetailedSelector:
+    """A selector with one backend (``client``) and no hedging."""
+    selector = object.__new__(DetailedSelector)
+    selector.cancel_token = token
+    selector.max_retries = 3
+    selector.model_name = "m"
+    selector.hedge_requests = False
+    selector.backends = [LLMBackend("ollama", "m", client)]
+    return selector
+
+
+class TestExecutorCancellation:
+    """Test cases for cancelling execute_column."""
+
+    def test_stops_between_steps_with_partial_result(self, dag):
+        """Test that no selection starts after cancellation and finished steps are kept."""
+        token = CancellationToken()
+        selector = CancellingSelector(token, limit=2)
+
+        with pytest.raises(RunCancelled) as excinfo:
+            make_executor(selector, token).execute_column(
+                table_name="t", table_markdown="", column_name="power", ontology_dag=dag
+            )
+
+        assert selector.calls == 2
+        partial = excinfo.value.partial
+        assert partial.status == "cancelled"
+        assert [step.parent for step in partial.steps] == ["Thing", "Device"]
+
+    def test_selector_backoff_returns_early(self):
+        """Test that a retry backoff is cut short and the selection raises."""
+        token = CancellationToken()
+
+        def failing_generate(data):
+            token.cancel()
+            raise ConnectionError("provider down")
+
+        selector = make_failing_selector(token, SimpleNamespace(generate=failing_generate))
+
+        start = time.monotonic()
+        with pytest.raises(RunCancelled):
+            selector._call_llm_with_retry(SELECTOR_DATA)
+        assert time.monotonic() - start < 0.5
+
+    def test_async_backoff_returns_early(self):
+        """Test that a cancel during the async retry backoff ends it early."""
+        token = CancellationToken()
+
+        async def failing_agenerate(data):
+            raise ConnectionError("provider down")
+
+        selector = make_failing_selector(token, SimpleNamespace(agenerate=failing_agenerate))
+        timer = threading.Timer(0.1, token.cancel)
+
+        start = time.monotonic()
+        timer.start()
+        with pytest.raises(RunCancelled):
+            asyncio.run(selector._call_llm_with_retry_async(SELECTOR_DATA))
+        assert time.monotonic() - start < 0.5
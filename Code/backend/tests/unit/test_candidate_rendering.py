@@ -0,0 +1,56 @@
+"""Tests for rendering candidate classes with labels and comments."""
+
+import pytest
+
+from saed.core.ontology.classes import OntologyClass
+from saed.core.ontology.dag import OntologyDAG
+from saed.core.ontology.rendering import CandidateRenderer, get_candidate_renderer
+
+
+@pytest.fixture
+def dag():
+    """An ontology with labelled and commented classes."""
+    dag = OntologyDAG()
+    dag.nodes = {
+        "m": OntologyClass(url="m", name="ElectricMeter", label="Electric meter",
+                           comment="A device that measures the amount of electric energy used."),
+        "t": OntologyClass(url="t", name="TemperatureSensor", label="Thermometer",
+                           comment="Measures air or water temperature in a zone."),
+        "p": OntologyClass(url="p", name="Pump"),
+    }
+    return dag
+
+
+class TestCandidateRenderer:
+    """Test cases for CandidateRenderer."""
+
+    def test_renders_label_and_comment(self, dag):
+        """Test that labels differing from the name and comments are included."""
+        text = CandidateRenderer(dag).render(["TemperatureSensor", "ElectricMeter", "Pump"], 1000)
+        assert text.splitlines() == [
+            "- TemperatureSensor (Thermometer): Measures air or water temperature in a zone.",
+            "- ElectricMeter: A device that measures the amount of electric energy used.",
+            "- Pump",
+        ]
+
+    def test_comments_shrink_to_budget(self, dag):
+        """Test that comments are shortened evenly to fit the budget."""
+        names = ["TemperatureSensor", "ElectricMeter"]
+        text = CandidateRenderer(dag).render(names, 110)
+        assert len(text) <= 110
+        assert all(line.endswith("…") for line in text.splitlines())
+
+    def test_names_survive_tiny_budget(self, dag):
+        """Test that names are kept even when nothing else fits."""
+        text = CandidateRenderer(dag).render(["TemperatureSensor", "ElectricMeter"], 10)
+        assert text == "- TemperatureSensor\n- ElectricMeter"
+
+    def test_comment_chars_limit(self, dag):
+        """Test that comments are truncated when the renderer is built."""
+        renderer = CandidateRenderer(dag, comment_chars=20)
+        assert len(renderer.comments["ElectricMeter"]) == 20
+
+    def test_renderer_cached_per_ontology(self, dag):
+        """Test that descriptions are computed once per ontology."""
+        assert get_candidate_renderer(dag) is get_candidate_renderer(dag)
+        assert get_candidate_renderer(dag) is not get_candidate_renderer(OntologyDAG())
@@ -0,0 +1,167 @@
+"""Tests for the SQLite catalog backend."""
+
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from saed.core.catalog import Catalog, get_catalog
+from saed.core.ontology.registry import OntologyRegistry
+from saed.core.table.registry import TableRegistry
+
+
+@pytest.fixture
+def ontologies_dir(tmp_path):
+    """An ontologies directory with 20 ontology files."""
+    directory = tmp_path / "ontologies"
+    directory.mkdir()
+    for i in range(20):
+        (directory / f"o{i}.rdf").write_text(f"<rdf id='{i}'/>")
+    return directory
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a catalog database."""
+    return tmp_path / "catalog.sqlite3"
+
+
+def other_process(ontologies_dir, db_path):
+    """A catalog registry that shares nothing with the loaded one, as in another process."""
+    registry = OntologyRegistry(
+        _registry_path=ontologies_dir / "registry.json", _ontologies_dir=ontologies_dir
+    )
+    registry._store = Catalog(db_path).store("ontologies")
+    registry.refresh()
+    return registry
+
+
+def write_run(runs_dir, run_id, status="completed", table_id="t.csv"):
+    """Write a minimal run file."""
+    data = {
+        "run_id": run_id,
+        "status": status,
+        "created_at": "2024-01-01T12:00:00",
+        "config": {"table_id": table_id, "mode": "single", "columns": ["a", "b"]},
+    }
+    (runs_dir / f"{run_id}.json").write_text(json.dumps(data))
+
+
+class TestCatalogRegistry:
+    """Test cases for registries stored in the catalog."""
+
+    def test_entries_are_stored_in_catalog(self, ontologies_dir, db_path):
+        """Test that a catalog registry writes rows instead of registry.json."""
+        entry = OntologyRegistry.load(ontologies_dir, db_path).register("o1.rdf")
+
+        assert not (ontologies_dir / "registry.json").exists()
+        assert get_catalog(db_path).get_entry("ontologies", entry.id)["filename"] == "o1.rdf"
+
+    def test_reload_when_catalog_changes(self, ontologies_dir, db_path):
+        """Test that entries written by another process are seen on the next load."""
+        registry = OntologyRegistry.load(ontologies_dir, db_path)
+        entry = other_process(ontologies_dir, db_path).register("o2.rdf")
+
+        assert OntologyRegistry.load(ontologies_dir, db_path) is registry
+        assert registry.get(entry.id) is not None
+
+    def test_concurrent_writers_keep_all_entries(self, ontologies_dir, db_path):
+        """Test that interleaved registrations of separate instances lose nothing."""
+        writers = [other_process(ontologies_dir, db_path) for _ in range(4)]
+
+        def register(i):
+            return writers[i % 4].register(f"o{i}.rdf").id
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            ids = list(pool.map(register, range(20)))
+
+        stored = get_catalog(db_path).find_entries("ontologies")
+        assert {entry["id"] for entry in stored} == set(ids)
+
+    def test_unregister_deletes_row(self, ontologies_dir, db_path):
+        """Test that removed entries are deleted from the catalog."""
+        registry = OntologyRegistry.load(ontologies_dir, db_path)
+        keep = registry.register("o1.rdf")
+        drop = registry.register("o2.rdf")
+        registry.unregister(drop.id)
+
+        catalog = get_catalog(db_path)
+        assert catalog.get_entry("ontologies", drop.id) is None
+        assert catalog.get_entry("ontologies", keep.id) is not None
+
+    def test_find_entries_by_filename_and_category(self, tmp_path, db_path):
+        """Test the indexed entry queries."""
+        tables_dir = tmp_path / "tables"
+        (tables_dir / "sales").mkdir(parents=True)
+        (tables_dir / "a.csv").write_text("x\n1\n")
+        (tables_dir / "sales" / "a.csv").write_text("y\n2\n")
+        TableRegistry.load(tables_dir, catalog=db_path).sync_with_directory()
+
+        catalog = get_catalog(db_path)
+        assert len(catalog.find_entries("tables", filename="a.csv")) == 2
+        [entry] = catalog.find_entries("tables", filename="a.csv", category="sales")
+        assert entry["columns"] == ["y"]
+
+    def test_replace_entries_keeps_ids(self, ontologies_dir, db_path):
+        """Test migrating a JSON registry to the catalog."""
+        source = OntologyRegistry.load(ontologies_dir)
+        entry = source.register("o3.rdf")
+
+        target = OntologyRegistry.load(ontologies_dir, db_path)
+        assert target.replace_entries(source) == 1
+        assert other_process(ontologies_dir, db_path).get(entry.id).filename == "o3.rdf"
+
+    def test_wal_mode(self, db_path):
+        """Test that the database uses write-ahead logging."""
+        get_catalog(db_path)
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestCatalogRuns:
+    """Test cases for run summaries."""
+
+    def test_sync_reads_only_changed_files(self, tmp_path, db_path):
+        """Test that unchanged run files are not reread."""
+        catalog = get_catalog(db_path)
+        write_run(tmp_path, "run_1")
+        write_run(tmp_path, "run_2", status="failed")
+
+        assert catalog.sync_runs(tmp_path) == 2
+        assert catalog.sync_runs(tmp_path) == 0
+        assert [r["run_id"] for r in catalog.list_runs()] == ["run_2", "run_1"]
+        assert [r["run_id"] for r in catalog.list_runs(status="failed")] == ["run_2"]
+        assert catalog.list_runs()[0]["column_count"] == 2
+
+    def test_sync_drops_deleted_and_invalid_files(self, tmp_path, db_path):
+        """Test that deleted files are removed and unreadable ones not listed."""
+        catalog = get_catalog(db_path)
+        write_run(tmp_path, "run_1")
+        write_run(tmp_path, "run_2")
+        (tmp_path / "broken.json").write_text("{not json")
+        catalog.sync_runs(tmp_path)
+
+        (tmp_path / "run_1.json").unlink()
+        catalog.sync_runs(tmp_path)
+        assert [r["run_id"] for r in catalog.list_runs()] == ["run_2"]
+
+
+class TestCatalogEvaluations:
+    """Test cases for stored evaluations."""
+
+    def test_record_and_find(self, db_path):
+        """Test that results are found by batch and labels hashes."""
+        catalog = get_catalog(db_path)
+        result = {
+            "run_id": "batch_1",
+            "labels_id": "gt.csv",
+            "evaluated_at": "2024-01-01T12:00:00",
+            "columns": [{"column_name": "a"}],
+        }
+        catalog.record_evaluation("sha256:b", "sha256:l", result)
+
+        assert catalog.find_evaluation("sha256:b", "sha256:l") == result
+        assert catalog.find_evaluation("sha256:b", "sha256:other") is None
+        [listed] = catalog.list_evaluations(run_id="batch_1")
+        assert "columns" not in listed
@@ -0,0 +1,154 @@
+"""Tests for run checkpoints and resuming column execution."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from saed.core.config.settings import CandidateOptions
+from saed.core.executor import RunCheckpoint, RunExecutor, SelectionResult
+from saed.core.executor.checkpoint import selection_from_dict, selection_to_dict
+from saed.core.executor.run_executor import (
+    AgentResultDetail,
+    EDMResultDetail,
+    LLMRequestDetail,
+    LLMResponseDetail,
+    VoteSummaryDetail,
+)
+
+
+def make_selection(selected: list[str], status: str = "completed") -> SelectionResult:
+    return SelectionResult(
+        selected=selected,
+        status=status,
+        llm_request=LLMRequestDetail(prompt="p", model="m"),
+        llm_response=LLMResponseDetail(raw="r", answer=", ".join(selected), total_tokens=7),
+    )
+
+
+class FakeSelector:
+    """Selector returning fixed answers and counting calls."""
+
+    def __init__(self, answers: dict[tuple[str, ...], list[str]]) -> None:
+        self.answers = answers
+        self.calls = 0
+
+    def select(self, table_name, table_in_markdown, column_name, candidates):
+        self.calls += 1
+        return make_selection(self.answers.get(tuple(candidates), []))
+
+
+@pytest.fixture
+def dag():
+    """A three-level ontology: Thing -> {Device, Property} -> Device -> {Meter}."""
+    names = {"root": "Thing", "d": "Device", "p": "Property", "m": "Meter"}
+    return SimpleNamespace(
+        root="root",
+        nodes={url: SimpleNamespace(name=name) for url, name in names.items()},
+        edges_subclassof={"root": ["d", "p"], "d": ["m"]},
+    )
+
+
+def make_executor(selector: FakeSelector) -> RunExecutor:
+    executor = object.__new__(RunExecutor)
+    executor.selector = selector
+    executor.max_depth = 3
+    executor.sse_callback = None
+    executor.candidate_options = CandidateOptions()
+    executor.cancel_token = None
+    return executor
+
+
+class TestSelectionSerialization:
+    """Test cases for selection_to_dict / selection_from_dict."""
+
+    def test_edm_round_trip(self):
+        """Test that EDM results survive serialization."""
+        agent = AgentResultDetail(
+            agent_id=1,
+            assigned_classes=["Device"],
+            llm_request=LLMRequestDetail(prompt="p", model="m"),
+            llm_response=LLMResponseDetail(raw="Device", answer="Device"),
+            voted_classes=["Device"],
+        )
+        result = SelectionResult(
+            selected=["Device"],
+            edm_result=EDMResultDetail(
+                consensus_threshold=0.8,
+                total_agents=1,
+                votes_summary=[VoteSummaryDetail("Device", 1, 1, 1.0, True)],
+                agents=[agent],
+            ),
+        )
+        assert selection_from_dict(selection_to_dict(result)) == result
+
+
+class TestRunCheckpoint:
+    """Test cases for RunCheckpoint."""
+
+    def test_reload_restores_progress(self, tmp_path):
+        """Test that selections and completed columns are reloaded."""
+        path = tmp_path / "checkpoints" / "run_1.jsonl"
+        checkpoint = RunCheckpoint(path)
+        checkpoint.write_header({"mode": "single"})
+        checkpoint.record_selection("power", "root", make_selection(["Device"]))
+        checkpoint.record_selection("power", "d", make_selection([], status="failed"))
+        checkpoint.record_column("power", {"status": "completed", "steps": []})
+        checkpoint.record_column("energy", {"status": "partial", "steps": []})
+
+        reloaded = RunCheckpoint(path)
+        assert reloaded.header == {"mode": "single"}
+        assert list(reloaded.selections("power")) == ["root"]
+        assert reloaded.completed_column("power") is not None
+        assert reloaded.completed_column("energy") is None
+
+    def test_truncated_line_is_ignored(self, tmp_path):
+        """Test that a partially written last record does not break loading."""
+        path = tmp_path / "run_1.jsonl"
+        checkpoint = RunCheckpoint(path)
+        checkpoint.record_selection("power", "root", make_selection(["Device"]))
+        with open(path, "a") as f:
+            f.write('{"type": "selection", "key": "po')
+
+        assert list(RunCheckpoint(path).selections("power")) == ["root"]
+
+    def test_append_after_truncated_line(self, tmp_path):
+        """Test that records written after resuming a torn file are not lost."""
+        path = tmp_path / "run_1.jsonl"
+        path.write_text('{"type": "header", "da')
+
+        resumed = RunCheckpoint(path)
+        assert resumed.header is None
+        resumed.write_header({"mode": "single"})
+        resumed.record_column("z", {"status": "completed", "steps": []})
+
+        reloaded = RunCheckpoint(path)
+        assert reloaded.header == {"mode": "single"}
+        assert reloaded.completed_column("z") is not None
+
+
+class TestResumeColumn:
+    """Test cases for resuming execute_column from a checkpoint."""
+
+    def test_recorded_selections_skip_llm_calls(self, tmp_path, dag):
+        """Test that a resumed column only calls the LLM for missing steps."""
+        answers = {("Device", "Property"): ["Device"], ("Meter",): ["Meter"]}
+        path = tmp_path / "run_1.jsonl"
+
+        first = RunCheckpoint(path)
+        first.record_selection("power", "root", make_selection(["Device"]))
+
+        selector = FakeSelector(answers)
+        checkpoint = RunCheckpoint(path)
+        result = make_executor(selector).execute_column(
+            table_name="t",
+            table_markdown="",
+            column_name="power",
+            ontology_dag=dag,
+            selection_cache=checkpoint.selections("power"),
+            on_selection=lambda parent, sel: checkpoint.record_selection("power", parent, sel),
+        )
+
+        assert selector.calls == 1
+        assert result.final_paths == [["Device", "Meter"]]
+        assert len(result.steps) == 2
+        assert set(RunCheckpoint(path).selections("power")) == {"root", "d"}
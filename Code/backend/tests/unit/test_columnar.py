@@ -0,0 +1,115 @@
+"""Tests for columnar table copies and partial table reads."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from saed.core.table.columnar import (
+    columnar_path,
+    find_columnar,
+    iter_table_chunks,
+    materialize_table,
+    read_table,
+)
+from saed.core.table.registry import TableRegistry
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """A CSV with integer, float, string, date and partly null columns."""
+    path = tmp_path / "t.csv"
+    pd.DataFrame(
+        {
+            "Id": range(30),
+            "Score": [i / 4 for i in range(30)],
+            "Name": [f"name {i}" for i in range(30)],
+            "Date": [f"2024-01-{i % 28 + 1:02d}" for i in range(30)],
+            "Note": [None if i % 3 else f"note {i}" for i in range(30)],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+class TestCsvFallback:
+    """Test cases for reads without a columnar copy."""
+
+    def test_read_table_projects_columns_and_rows(self, csv_path):
+        """Test that columns and leading rows are read from the CSV."""
+        df = read_table(csv_path, ["Name", "Id"], nrows=3)
+        assert df.columns.tolist() == ["Id", "Name"]
+        assert df["Id"].tolist() == [0, 1, 2]
+
+    def test_iter_table_chunks(self, csv_path):
+        """Test that chunks cover the table in order."""
+        chunks = list(iter_table_chunks(csv_path, ["Id"], chunk_rows=8))
+        assert [len(c) for c in chunks] == [8, 8, 8, 6]
+        assert pd.concat(chunks)["Id"].tolist() == list(range(30))
+
+    def test_csv_format_writes_no_copy(self, csv_path):
+        """Test that the csv table format materializes nothing."""
+        assert materialize_table(csv_path, "csv") is None
+        assert find_columnar(csv_path) is None
+
+
+@pytest.mark.parametrize("table_format", ["parquet", "arrow"])
+class TestColumnarCopy:
+    """Test cases for Parquet and Arrow IPC copies."""
+
+    @pytest.fixture(autouse=True)
+    def _require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_reads_match_csv(self, csv_path, table_format):
+        """Test that full, projected and head reads equal the CSV reads."""
+        path = materialize_table(csv_path, table_format)
+        assert path == columnar_path(csv_path, table_format)
+        assert find_columnar(csv_path) == path
+
+        expected = pd.read_csv(csv_path)
+        pd.testing.assert_frame_equal(read_table(csv_path), expected, check_dtype=False)
+        pd.testing.assert_frame_equal(
+            read_table(csv_path, ["Note"], nrows=4),
+            expected[["Note"]].head(4),
+            check_dtype=False,
+        )
+        assert read_table(csv_path, nrows=0).columns.tolist() == expected.columns.tolist()
+
+    def test_dates_stay_text(self, csv_path, table_format):
+        """Test that date-like values are not converted to timestamps."""
+        materialize_table(csv_path, table_format)
+        assert read_table(csv_path, ["Date"], nrows=1)["Date"].iloc[0] == "2024-01-01"
+
+    def test_chunks_match_csv(self, csv_path, table_format):
+        """Test that chunked reads of the copy cover the table in order."""
+        materialize_table(csv_path, table_format)
+        chunks = list(iter_table_chunks(csv_path, ["Name"], chunk_rows=8))
+        assert all(len(c) <= 8 for c in chunks)
+        assert pd.concat(chunks)["Name"].tolist() == [f"name {i}" for i in range(30)]
+
+    def test_stale_copy_is_ignored(self, csv_path, table_format):
+        """Test that a copy is not used once the CSV changed."""
+        materialize_table(csv_path, table_format)
+        pd.DataFrame({"Id": [7]}).to_csv(csv_path, index=False)
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert find_columnar(csv_path) is None
+        assert read_table(csv_path)["Id"].tolist() == [7]
+
+    def test_registry_materializes_and_removes(self, csv_path, table_format):
+        """Test that registration writes the copy and unregistration deletes it."""
+        registry = TableRegistry.load(csv_path.parent, table_format)
+        entry = registry.register(csv_path.name)
+        assert find_columnar(csv_path) == columnar_path(csv_path, table_format)
+
+        registry.unregister(entry.id)
+        assert not columnar_path(csv_path, table_format).exists()
+
+    def test_sync_writes_missing_copies(self, csv_path, table_format):
+        """Test that switching the table format materializes existing tables."""
+        TableRegistry.load(csv_path.parent).sync_with_directory()
+        assert find_columnar(csv_path) is None
+
+        TableRegistry.load(csv_path.parent, table_format).sync_with_directory()
+        assert find_columnar(csv_path) == columnar_path(csv_path, table_format)
@@ -0,0 +1,64 @@
+"""Tests for the process-level config cache."""
+
+import json
+import os
+
+import pytest
+
+from saed.core.config import settings
+from saed.core.config.settings import Config, get_config, load_config, save_config
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    """A config file location in a temporary directory."""
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(settings, "get_config_path", lambda: path)
+    settings.clear_config_cache()
+    yield path
+    settings.clear_config_cache()
+
+
+def write_config(path, runs_dir):
+    """Write a config file with the given runs path."""
+    path.write_text(json.dumps({"paths": {"runs": runs_dir}}))
+
+
+class TestConfigCache:
+    """Test cases for get_config / load_config caching."""
+
+    def test_file_is_read_once(self, config_path, monkeypatch):
+        """Test that repeated loads of an unchanged file do not reparse it."""
+        write_config(config_path, "data/runs_a")
+        assert get_config().paths.runs == "data/runs_a"
+
+        monkeypatch.setattr(settings, "_migrate_old_config", lambda data: pytest.fail("reread"))
+        assert get_config() is get_config()
+        assert load_config().paths.runs == "data/runs_a"
+
+    def test_reload_on_file_change(self, config_path):
+        """Test that a modified file is revalidated."""
+        write_config(config_path, "data/runs_a")
+        assert get_config().paths.runs == "data/runs_a"
+
+        write_config(config_path, "data/runs_bb")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert get_config().paths.runs == "data/runs_bb"
+
+    def test_load_config_returns_private_copy(self, config_path):
+        """Test that modifying a loaded config does not affect other callers."""
+        config = load_config()
+        config.llm.active_provider = "openai"
+        config.paths.runs = "elsewhere"
+
+        assert get_config().paths.runs == Config().paths.runs
+        assert load_config().llm.active_provider == Config().llm.active_provider
+
+    def test_save_invalidates(self, config_path):
+        """Test that a saved config is returned by the next load."""
+        config = load_config()
+        config.paths.runs = "data/saved"
+        save_config(config)
+
+        assert get_config().paths.runs == "data/saved"
@@ -0,0 +1,46 @@
+"""Tests for seeded EDM class-to-agent assignment."""
+
+from collections import Counter
+
+import pytest
+
+from saed.core.selector.assignment import assign_classes_to_agents, num_edm_agents
+
+CLASSES = [f"Class{i}" for i in range(47)]
+
+
+class TestAssignClassesToAgents:
+    """Test cases for assign_classes_to_agents."""
+
+    @pytest.mark.parametrize(("num_classes", "per_agent", "per_class"), [
+        (47, 30, 3), (10, 4, 3), (6, 30, 3), (100, 7, 5), (1, 30, 3),
+    ])
+    def test_coverage_and_balance(self, num_classes, per_agent, per_class):
+        """Test that each class gets distinct agents and loads differ by at most one."""
+        classes = CLASSES[:num_classes] if num_classes <= 47 else [f"C{i}" for i in range(num_classes)]
+        num_agents = num_edm_agents(len(classes), per_agent, per_class)
+
+        assignment = assign_classes_to_agents(classes, num_agents, per_class, seed=7)
+
+        assert len(assignment) == num_agents
+        for agent_classes in assignment:
+            assert len(agent_classes) == len(set(agent_classes))
+        counts = Counter(c for agent_classes in assignment for c in agent_classes)
+        assert counts == {c: per_class for c in classes}
+        loads = [len(agent_classes) for agent_classes in assignment]
+        assert max(loads) - min(loads) <= 1
+
+    def test_same_seed_same_assignment(self):
+        """Test that assignments are reproducible and depend on the seed."""
+        first = assign_classes_to_agents(CLASSES, 5, 3, seed=1)
+        assert assign_classes_to_agents(CLASSES, 5, 3, seed=1) == first
+        assert assign_classes_to_agents(CLASSES, 5, 3, seed=2) != first
+
+    def test_candidate_order_kept(self):
+        """Test that each agent lists its classes in candidate order."""
+        for agent_classes in assign_classes_to_agents(CLASSES, 5, 3, seed=3):
+            assert agent_classes == sorted(agent_classes, key=CLASSES.index)
+
+    def test_fewer_agents_than_copies(self):
+        """Test that every agent sees every class when agents are scarce."""
+        assert assign_classes_to_agents(["A", "B"], 2, 3) == [["A", "B"], ["A", "B"]]
@@ -0,0 +1,95 @@
+"""Tests for balancing requests across provider endpoints."""
+
+import asyncio
+
+import pytest
+
+from saed.core.config.settings import Config, EndpointConfig
+from saed.core.llm.balancer import EndpointPool, get_endpoint_pool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestEndpointPool:
+    """Test cases for EndpointPool."""
+
+    def test_least_outstanding_respects_weights(self):
+        """Test that in-flight requests are spread in proportion to weight."""
+        pool = EndpointPool([("http://a", 1.0), ("http://b", 2.0)])
+        picked = [pool.acquire().url for _ in range(6)]
+        assert picked.count("http://a") == 2
+        assert picked.count("http://b") == 4
+
+    def test_released_endpoint_is_reused(self):
+        """Test that finished requests free up their endpoint."""
+        pool = EndpointPool([("http://a", 1.0), ("http://b", 1.0)])
+        first = pool.acquire()
+        pool.acquire()
+        pool.release(first, success=True)
+        assert pool.acquire() is first
+
+    def test_failing_endpoint_is_ejected(self, clock):
+        """Test that consecutive failures take an endpoint out of rotation."""
+        pool = EndpointPool([("http://a", 1.0), ("http://b", 1.0)], max_failures=2, clock=clock)
+        bad = pool.endpoints[0]
+        for _ in range(2):
+            with pytest.raises(ConnectionError), pool.lease():
+                raise ConnectionError
+        assert bad.ejected
+        assert {pool.acquire().url for _ in range(3)} == {"http://b"}
+
+    def test_all_ejected_still_serves(self, clock):
+        """Test that requests go to the earliest ejected endpoint if none is healthy."""
+        pool = EndpointPool([("http://a", 1.0), ("http://b", 1.0)], max_failures=1, clock=clock)
+        pool.release(pool.acquire(), success=False)
+        clock.now = 5.0
+        pool.release(pool.acquire(), success=False)
+        assert pool.acquire().url == "http://a"
+
+    def test_probe_readmits_healthy_endpoint(self, clock):
+        """Test that due endpoints are health-checked and re-admitted."""
+        pool = EndpointPool([("http://a", 1.0), ("http://b", 1.0)], max_failures=1,
+                            ejection_seconds=10.0, clock=clock)
+        pool.release(pool.acquire(), success=False)
+        assert pool.due_for_probe() == []
+
+        clock.now = 11.0
+        checked = []
+
+        async def check(url: str) -> bool:
+            checked.append(url)
+            return True
+
+        asyncio.run(pool.probe(check))
+        assert checked == ["http://a"]
+        assert not pool.endpoints[0].ejected
+
+
+class TestGetEndpointPool:
+    """Test cases for get_endpoint_pool."""
+
+    def test_single_endpoint_has_no_pool(self):
+        """Test that providers with one endpoint are not balanced."""
+        assert get_endpoint_pool("ollama", Config()) is None
+
+    def test_pool_is_shared(self):
+        """Test that clients of the same endpoints share one pool."""
+        config = Config()
+        config.llm.providers.ollama.endpoints = [
+            EndpointConfig(url="http://gpu1:11434"),
+            EndpointConfig(url="http://gpu2:11434", weight=2.0),
+        ]
+        pool = get_endpoint_pool("ollama", config)
+        assert pool is get_endpoint_pool("ollama", config)
+        assert [e.url for e in pool.endpoints] == ["http://gpu1:11434", "http://gpu2:11434"]
@@ -0,0 +1,112 @@
+"""Tests for the vectorized evaluation engine."""
+
+import random
+
+import numpy as np
+import pytest
+
+from saed.core.evaluator import (
+    evaluate_columns,
+    node_level_f1_precision_recall,
+    path_level_f1_precision_recall,
+)
+
+
+def set_metrics(pred: set, gt: set) -> tuple[float, float, float]:
+    """Precision, recall and F1 of two sets, computed directly."""
+    tp = len(pred & gt)
+    precision = tp / len(pred) if pred else 0.0
+    recall = tp / len(gt) if gt else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+@pytest.fixture
+def columns():
+    """Random predicted and ground-truth paths of 300 columns."""
+    rng = random.Random(0)
+    names = [f"C{i}" for i in range(12)]
+
+    def paths():
+        return [
+            [rng.choice(names) for _ in range(rng.randint(1, 4))] for _ in range(rng.randint(0, 3))
+        ]
+
+    return [(paths(), paths()) for _ in range(300)]
+
+
+class TestEvaluateColumns:
+    """Test cases for evaluate_columns."""
+
+    def test_column_metrics_match_set_operations(self, columns):
+        """Test per-column metrics against tuple and node sets."""
+        metrics = evaluate_columns(columns).column_metrics()
+
+        for (pred, gt), column in zip(columns, metrics, strict=True):
+            path = set_metrics({tuple(p) for p in pred}, {tuple(p) for p in gt})
+            node = set_metrics({n for p in pred for n in p}, {n for p in gt for n in p})
+            assert column["path_precision"] == round(path[0], 4)
+            assert column["path_f1"] == round(path[2], 4)
+            assert column["node_recall"] == round(node[1], 4)
+            assert column["node_f1"] == round(node[2], 4)
+
+    def test_macro_and_micro(self):
+        """Test the aggregates on a small hand-checked example."""
+        columns = [
+            ([["A", "B"]], [["A", "B"]]),  # Exact match
+            ([["A", "C"], ["D"]], [["A", "B"]]),  # No path match, node A
+        ]
+        macro_p, macro_r, macro_f1, micro_p, micro_r, micro_f1 = (
+            path_level_f1_precision_recall([{"pred_paths": p, "gt_paths": g} for p, g in columns])
+        )
+
+        assert (macro_p, macro_r, macro_f1) == (0.5, 0.5, 0.5)
+        assert micro_p == pytest.approx(1 / 3)
+        assert micro_r == 0.5
+        assert micro_f1 == pytest.approx(0.4)
+        node = node_level_f1_precision_recall(
+            [{"pred_paths": p, "gt_paths": g} for p, g in columns]
+        )
+        assert node[3] == pytest.approx(3 / 5)  # Micro precision: A, B, A of A, C, D, A, B
+
+    def test_duplicates_count_once(self):
+        """Test that repeated paths and classes are not counted twice."""
+        evaluation = evaluate_columns([([["A"], ["A"]], [["A"]])])
+
+        assert evaluation.path.fp.tolist() == [0]
+        assert evaluation.node.tp.tolist() == [1]
+
+    def test_level_metrics(self):
+        """Test that classes match per depth."""
+        evaluation = evaluate_columns([([["A", "B"]], [["A", "C", "D"]])])
+
+        levels = evaluation.level_metrics()
+        assert [level["micro_f1"] for level in levels] == [1.0, 0.0, 0.0]
+        assert [level["columns"] for level in levels] == [1, 1, 1]
+
+    def test_table_metrics(self):
+        """Test the breakdown by table."""
+        evaluation = evaluate_columns(
+            [([["A"]], [["A"]]), ([["B"]], [["C"]]), ([["D"]], [["D"]])],
+            table_ids=["t1", "t2", "t1"],
+        )
+
+        tables = evaluation.table_metrics()
+        assert tables["t1"]["columns"] == 2
+        assert tables["t1"]["path_level"]["macro_f1"] == 1.0
+        assert tables["t2"]["node_level"]["micro_recall"] == 0.0
+
+    def test_mask(self, columns):
+        """Test that a mask evaluates a subset like evaluating it alone."""
+        mask = np.arange(len(columns)) % 3 == 0
+        subset = [column for column, keep in zip(columns, mask, strict=True) if keep]
+
+        assert evaluate_columns(columns).metrics(mask) == evaluate_columns(subset).metrics()
+
+    def test_empty(self):
+        """Test that no columns give zero metrics."""
+        evaluation = evaluate_columns([])
+
+        assert evaluation.path.summary() == (0.0,) * 6
+        assert evaluation.column_metrics() == []
+        assert evaluation.level_metrics() == []
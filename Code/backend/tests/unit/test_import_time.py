@@ -0,0 +1,60 @@
+"""Import-time regression tests for the CLI and API entry points.
+
+Each entry point is imported in a fresh interpreter, which must not load a
+provider SDK or owlready2: they take seconds to import and are imported when
+an LLM is created or an ontology parsed. Checking the loaded modules instead
+of timing the import keeps the tests deterministic on loaded machines.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import saed
+
+# Modules that take seconds to import and are only needed by some commands
+HEAVY_MODULES = [
+    "langchain_community",
+    "langchain_core",
+    "langchain_litellm",
+    "langchain_ollama",
+    "langchain_openai",
+    "litellm",
+    "openai",
+    "owlready2",
+]
+
+SCRIPT = """
+import json, sys
+import {module}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def import_in_subprocess(module: str) -> list[str]:
+    """Import a module in a fresh interpreter and report the modules it loaded."""
+    src_dir = Path(saed.__file__).resolve().parent.parent
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(src_dir), os.environ.get("PYTHONPATH", "")])}
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+        timeout=60,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", ["saed.cli.eval", "saed.api.main", "saed.cli.run", "saed.cli.batch"])
+class TestImportTime:
+    """Test cases for the import cost of the entry points."""
+
+    def test_no_heavy_modules(self, module):
+        """Test that importing the entry point loads no provider SDK nor owlready2."""
+        loaded = set(import_in_subprocess(module))
+        assert [m for m in HEAVY_MODULES if m in loaded] == []
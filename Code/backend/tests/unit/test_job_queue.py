@@ -0,0 +1,120 @@
+"""Tests for the persistent run queue and worker pool."""
+
+import asyncio
+
+import pytest
+
+from saed.api.workers import RunWorkerPool
+from saed.core.jobs import JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Create a queue backed by a temporary database."""
+    return JobQueue(tmp_path / "jobs.sqlite3")
+
+
+class TestJobQueue:
+    """Test cases for JobQueue."""
+
+    def test_claims_by_priority_then_age(self, queue):
+        """Test that higher priority jobs are claimed first, FIFO within a priority."""
+        queue.enqueue("run_a", {}, priority=0)
+        queue.enqueue("run_b", {}, priority=5)
+        queue.enqueue("run_c", {}, priority=0)
+
+        claimed = [queue.claim().run_id for _ in range(3)]
+        assert claimed == ["run_b", "run_a", "run_c"]
+        assert queue.claim() is None
+
+    def test_excluded_providers_are_skipped(self, queue):
+        """Test that jobs of saturated providers stay queued."""
+        queue.enqueue("run_a", {}, provider="ollama")
+        queue.enqueue("run_b", {}, provider="openai")
+
+        job = queue.claim(exclude_providers={"ollama"})
+        assert job.run_id == "run_b"
+        assert queue.count("queued") == 1
+
+    def test_only_stale_leases_are_requeued(self, tmp_path, queue):
+        """Test that live jobs of other processes are not requeued."""
+        queue.enqueue("run_a", {"k": 5})
+        queue.claim()
+
+        sibling = JobQueue(tmp_path / "jobs.sqlite3", owner="other-host:1")
+        assert sibling.requeue_stale(lease_seconds=60) == []
+
+        # Owner died: its lease is older than the (zero) lease period
+        assert sibling.requeue_stale(lease_seconds=0) == ["run_a"]
+        job = sibling.claim()
+        assert job.payload == {"k": 5}
+        assert job.attempts == 2
+        assert job.owner == "other-host:1"
+
+    def test_cancel_request_reaches_owner_heartbeat(self, tmp_path, queue):
+        """Test that a cancellation flagged by another process is reported to the owner."""
+        queue.enqueue("run_a", {})
+        job = queue.claim()
+        assert queue.heartbeat([job.id]) == []
+
+        sibling = JobQueue(tmp_path / "jobs.sqlite3", owner="other-host:1")
+        assert sibling.request_cancel("run_a") == 1
+        assert queue.heartbeat([job.id]) == ["run_a"]
+
+    def test_discard_only_affects_queued_jobs(self, queue):
+        """Test that discarding a run cancels its queued jobs."""
+        queue.enqueue("run_a", {})
+        assert queue.discard("run_a") == 1
+        assert queue.get_latest("run_a").status == "cancelled"
+        assert queue.claim() is None
+
+
+class TestRunWorkerPool:
+    """Test cases for RunWorkerPool."""
+
+    def test_provider_quota_limits_concurrency(self, queue):
+        """Test that no more than the quota of jobs run per provider."""
+        for i in range(4):
+            queue.enqueue(f"run_{i}", {}, provider="ollama")
+
+        peak = 0
+        active = 0
+
+        async def handler(job):
+            nonlocal peak, active
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+
+        async def scenario():
+            pool = RunWorkerPool(
+                queue, handler, workers=4, default_provider_limit=2, poll_interval=0.01
+            )
+            pool.start()
+            while queue.count("done") < 4:
+                await asyncio.sleep(0.01)
+            await pool.stop()
+
+        asyncio.run(scenario())
+        assert peak == 2
+
+    def test_failed_run_marks_job_failed(self, queue):
+        """Test that the run status returned by the handler reaches the queue."""
+        queue.enqueue("run_ok", {})
+        queue.enqueue("run_bad", {})
+
+        async def handler(job):
+            return "failed" if job.run_id == "run_bad" else "completed"
+
+        async def scenario():
+            pool = RunWorkerPool(queue, handler, workers=1, poll_interval=0.01)
+            pool.start()
+            while queue.count("queued"):
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            await pool.stop()
+
+        asyncio.run(scenario())
+        assert queue.get_latest("run_ok").status == "done"
+        assert queue.get_latest("run_bad").status == "failed"
@@ -0,0 +1,96 @@
+"""Tests for the ground truth labels index."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from saed.core.labels import LabelsIndex, LabelsRegistry, load_labels_file
+from saed.core.labels.loader import get_labels_for_column
+
+LABELS_CSV = """table_id,column_id,column_name,class1_level1_name,class1_level2_name,class2_level1_name,class2_level2_name
+1.csv,0,date,TemporalEntity,Interval,-,-
+1.csv,1,power,Measurement,PowerUnit,Quantity,-
+1.csv,1,power,Duplicate,-,-,-
+2.csv,0,power,-,-,-,-
+2.csv,,name,Agent,,-,-
+"""
+
+
+@pytest.fixture
+def labels_path(tmp_path):
+    """A labels CSV file."""
+    path = tmp_path / "labels.csv"
+    path.write_text(LABELS_CSV)
+    return path
+
+
+@pytest.fixture
+def index(labels_path):
+    """The index of the labels file."""
+    return LabelsIndex.from_dataframe(load_labels_file(labels_path))
+
+
+class TestLabelsIndex:
+    """Test cases for LabelsIndex."""
+
+    def test_match_by_id_or_name(self, index):
+        """Test that a column matches by index or by name."""
+        assert index.match("1.csv", 0, "other") == [["TemporalEntity", "Interval"]]
+        assert index.match("1.csv", 5, "date") == [["TemporalEntity", "Interval"]]
+        assert index.match("2.csv", 7, "name") == [["Agent"]]
+        assert index.match("3.csv", 0, "date") is None
+
+    def test_match_takes_first_row(self, index):
+        """Test that the first matching row in file order wins, as the mask lookup did."""
+        assert index.match("1.csv", 1, "power") == [["Measurement", "PowerUnit"], ["Quantity"]]
+        # ID matches row 1, name matches row 0: row 0 comes first
+        assert index.match("1.csv", 1, "date") == [["TemporalEntity", "Interval"]]
+
+    def test_get_prefers_id(self, index):
+        """Test get_labels_for_column's lookup by ID before name."""
+        assert index.get("1.csv", 1, "date") == [["Measurement", "PowerUnit"], ["Quantity"]]
+        assert index.get("1.csv", None, "date") == [["TemporalEntity", "Interval"]]
+        assert index.get("2.csv", 0) == []
+
+    def test_same_as_dataframe_lookup(self, labels_path, index):
+        """Test that get_labels_for_column gives the same result for a DataFrame."""
+        df = pd.read_csv(labels_path)
+        for key in [("1.csv", 1, "date"), ("2.csv", 3, "name"), ("2.csv", 3, "x")]:
+            assert get_labels_for_column(df, *key) == index.get(*key)
+
+    def test_results_are_copies(self, index):
+        """Test that changing returned paths leaves the shared index intact."""
+        index.match("1.csv", 0)[0].append("Changed")
+
+        assert index.match("1.csv", 0) == [["TemporalEntity", "Interval"]]
+
+
+class TestLabelsRegistryIndex:
+    """Test cases for the index cache of LabelsRegistry."""
+
+    def test_cached_by_content(self, labels_path):
+        """Test that the index is reused until the file's content changes."""
+        registry = LabelsRegistry.load(labels_path.parent)
+        first = registry.get_index(labels_path)
+
+        assert registry.get_index(labels_path) is first
+
+        labels_path.write_text(LABELS_CSV + "3.csv,0,x,Thing,-,-,-\n")
+        changed = registry.get_index(labels_path)
+        assert changed is not first
+        assert changed.match("3.csv", 0) == [["Thing"]]
+
+    def test_registered_file_is_not_rehashed(self, labels_path):
+        """Test that an unchanged registered file is looked up without hashing it."""
+        registry = LabelsRegistry.load(labels_path.parent)
+        entry = registry.register(labels_path.name)
+        first = registry.get_index(labels_path)
+
+        with patch("saed.core.labels.registry.compute_file_hash") as compute_hash:
+            assert registry.get_index(labels_path) is first
+        compute_hash.assert_not_called()
+
+        labels_path.write_text(LABELS_CSV + "3.csv,0,x,Thing,-,-,-\n")
+        assert registry.get_index(labels_path).match("3.csv", 0) == [["Thing"]]
+        assert registry.get(entry.id).total_columns == 6
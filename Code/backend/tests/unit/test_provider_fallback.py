@@ -0,0 +1,135 @@
+"""Tests for provider fallback and hedged LLM requests."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from saed.core.executor import DetailedSelector
+from saed.core.executor.run_executor import LLMBackend
+from saed.core.llm import LLMResult
+from saed.core.llm.latency import LatencyTracker, latency_tracker
+
+DATA = {
+    "table_name": "t",
+    "column_name": "c",
+    "table_in_markdown": "",
+    "current_level_ontology_classes": "Device, Property",
+}
+
+
+class FakeClient:
+    """Client answering after ``delay`` seconds, or raising ``error``."""
+
+    def __init__(self, answer: str = "Device", delay: float = 0.0, error: Exception | None = None):
+        self.answer = answer
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def generate(self, data):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return LLMResult(content=f"<answer>{self.answer}</answer>")
+
+    async def agenerate(self, data):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return LLMResult(content=f"<answer>{self.answer}</answer>")
+
+
+def make_selector(*clients: FakeClient, hedge: bool = False) -> DetailedSelector:
+    selector = object.__new__(DetailedSelector)
+    selector.config = SimpleNamespace(llm=SimpleNamespace(hedge_min_samples=5))
+    selector.cancel_token = None
+    selector.max_retries = 1
+    selector.prompt_type = "direct"
+    selector.hedge_requests = hedge
+    selector.backends = [
+        LLMBackend(f"p{i}", f"m{i}-{id(client)}", client) for i, client in enumerate(clients)
+    ]
+    selector.model_name = selector.backends[0].model
+    return selector
+
+
+class TestLatencyTracker:
+    """Test cases for LatencyTracker."""
+
+    def test_percentile_needs_samples(self):
+        """Test that no estimate is given before enough samples."""
+        tracker = LatencyTracker()
+        for ms in range(1, 5):
+            tracker.record("m", ms)
+        assert tracker.percentile("m", min_samples=5) is None
+        tracker.record("m", 100)
+        assert tracker.percentile("m", 0.95, min_samples=5) == 100.0
+        assert tracker.percentile("m", 0.5, min_samples=5) == 3.0
+
+
+class TestFallbackChain:
+    """Test cases for falling back to the next provider."""
+
+    def test_failing_provider_falls_back(self):
+        """Test that the next provider answers and is recorded in the trace."""
+        down = FakeClient(error=ConnectionError("down"))
+        backup = FakeClient(answer="Property")
+        selector = make_selector(down, backup)
+
+        request, response = selector._call_llm_with_retry(DATA)
+
+        assert response.answer == "Property"
+        assert response.provider == "p1"
+        assert request.model == selector.backends[1].model
+
+    def test_async_failing_provider_falls_back(self):
+        """Test the fallback chain of the async path."""
+        selector = make_selector(FakeClient(error=ConnectionError("down")), FakeClient())
+        _, response = asyncio.run(selector._call_llm_with_retry_async(DATA))
+        assert response.provider == "p1"
+
+
+class TestHedging:
+    """Test cases for hedging slow requests."""
+
+    @pytest.fixture
+    def slow_primary(self):
+        return FakeClient(answer="Device", delay=0.5)
+
+    def warm_up(self, selector: DetailedSelector) -> None:
+        for _ in range(5):
+            latency_tracker.record(selector.backends[0].key, 10)
+
+    def test_slow_request_is_hedged(self, slow_primary):
+        """Test that a request past p95 is answered by the next provider."""
+        hedge = FakeClient(answer="Property")
+        selector = make_selector(slow_primary, hedge, hedge=True)
+        self.warm_up(selector)
+
+        _, response = selector._call_llm_with_retry(DATA)
+
+        assert response.provider == "p1"
+        assert response.answer == "Property"
+
+    def test_async_slow_request_is_hedged(self, slow_primary):
+        """Test that the async path hedges and cancels the slow request."""
+        selector = make_selector(slow_primary, FakeClient(answer="Property"), hedge=True)
+        self.warm_up(selector)
+
+        start = time.monotonic()
+        _, response = asyncio.run(selector._call_llm_with_retry_async(DATA))
+
+        assert response.provider == "p1"
+        assert time.monotonic() - start < 0.4
+
+    def test_no_hedge_without_history(self, slow_primary):
+        """Test that models without latency history are not hedged."""
+        hedge = FakeClient()
+        selector = make_selector(slow_primary, hedge, hedge=True)
+        _, response = selector._call_llm_with_retry(DATA)
+        assert response.provider == "p0"
+        assert hedge.calls == 0
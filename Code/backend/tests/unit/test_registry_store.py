@@ -0,0 +1,97 @@
+"""Tests for the shared, locked registry persistence."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from saed.core.ontology.registry import OntologyRegistry
+from saed.core.table.registry import TableRegistry
+
+
+@pytest.fixture
+def ontologies_dir(tmp_path):
+    """An ontologies directory with 20 ontology files."""
+    for i in range(20):
+        (tmp_path / f"o{i}.rdf").write_text(f"<rdf id='{i}'/>")
+    return tmp_path
+
+
+def other_process(ontologies_dir):
+    """A registry of the same directory that is not the shared one, as in another process."""
+    registry = OntologyRegistry(
+        _registry_path=ontologies_dir / "registry.json", _ontologies_dir=ontologies_dir
+    )
+    registry.refresh()
+    return registry
+
+
+class TestSharedRegistry:
+    """Test cases for SharedRegistry."""
+
+    def test_load_is_shared(self, ontologies_dir):
+        """Test that loading a directory twice gives the same registry."""
+        assert OntologyRegistry.load(ontologies_dir) is OntologyRegistry.load(ontologies_dir)
+
+    def test_reload_when_file_changes(self, ontologies_dir):
+        """Test that entries written by another process are seen on the next load."""
+        registry = OntologyRegistry.load(ontologies_dir)
+        entry = other_process(ontologies_dir).register("o1.rdf")
+
+        assert OntologyRegistry.load(ontologies_dir) is registry
+        assert registry.get(entry.id) is not None
+
+    def test_concurrent_writers_keep_all_entries(self, ontologies_dir):
+        """Test that interleaved registrations of separate instances lose nothing."""
+        writers = [other_process(ontologies_dir) for _ in range(4)]
+
+        def register(i):
+            return writers[i % 4].register(f"o{i}.rdf").id
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            ids = list(pool.map(register, range(20)))
+
+        data = json.loads((ontologies_dir / "registry.json").read_text())
+        assert set(data["ontologies"]) == set(ids)
+
+    def test_write_is_atomic(self, ontologies_dir):
+        """Test that saving leaves no temporary file behind."""
+        OntologyRegistry.load(ontologies_dir).register("o0.rdf")
+        assert not list(ontologies_dir.glob(".registry.json.*"))
+
+    def test_corrupt_file_starts_empty(self, ontologies_dir):
+        """Test that an unreadable registry file is replaced on the next save."""
+        (ontologies_dir / "registry.json").write_text("{not json")
+        registry = OntologyRegistry.load(ontologies_dir)
+        assert registry.list_all() == []
+
+        registry.register("o0.rdf")
+        assert len(json.loads((ontologies_dir / "registry.json").read_text())["ontologies"]) == 1
+
+
+class TestIndexes:
+    """Test cases for the filename and category indexes."""
+
+    def test_filename_index_follows_mutations(self, ontologies_dir):
+        """Test that lookups by filename see registrations and removals."""
+        registry = OntologyRegistry.load(ontologies_dir)
+        assert registry.get_by_filename("o3.rdf") is None
+
+        entry = registry.register("o3.rdf")
+        assert registry.get_by_filename("o3.rdf") is entry
+
+        registry.unregister(entry.id)
+        assert registry.get_by_filename("o3.rdf") is None
+
+    def test_table_category_index(self, tmp_path):
+        """Test that tables are looked up by filename and category."""
+        for category in ("real", "synthetic"):
+            (tmp_path / category).mkdir()
+            (tmp_path / category / "t.csv").write_text("a\n1\n")
+        registry = TableRegistry.load(tmp_path)
+        registry.sync_with_directory()
+
+        assert [e.category for e in registry.list_all(category="real")] == ["real"]
+        assert registry.get_by_filename("t.csv", category="synthetic").category == "synthetic"
+        registry.update(registry.get_by_filename("t.csv", "real").id, category="synthetic")
+        assert registry.list_all(category="real") == []
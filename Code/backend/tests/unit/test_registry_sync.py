@@ -0,0 +1,108 @@
+"""Tests for fingerprint-based change detection of the registries."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from saed.core.ontology.registry import OntologyRegistry
+from saed.core.table import registry as table_registry_module
+from saed.core.table.registry import TableRegistry
+from saed.core.utils.files import compute_file_hash, file_fingerprint, hash_files
+
+
+@pytest.fixture
+def tables_dir(tmp_path):
+    """A tables directory with two CSV files."""
+    tables = tmp_path / "tables"
+    tables.mkdir()
+    (tables / "a.csv").write_text("x,y\n1,2\n")
+    (tables / "b.csv").write_text("z\n3\n4\n")
+    return tables
+
+
+def touch(path, delta_ns=1_000_000_000):
+    """Move a file's mtime without changing its content."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + delta_ns))
+
+
+class TestFiles:
+    """Test cases for the file hashing helpers."""
+
+    def test_hash_files_matches_sequential(self, tables_dir):
+        """Test that parallel hashing gives the sequential hashes."""
+        paths = sorted(tables_dir.glob("*.csv"))
+        assert hash_files(paths) == {p: compute_file_hash(p) for p in paths}
+
+    def test_fingerprint_changes_on_touch(self, tables_dir):
+        """Test that the fingerprint follows the modification time."""
+        path = tables_dir / "a.csv"
+        before = file_fingerprint(path)
+        touch(path)
+        assert file_fingerprint(path) != before
+
+
+class TestTableRegistrySync:
+    """Test cases for TableRegistry.sync_with_directory."""
+
+    def test_unchanged_files_are_not_hashed(self, tables_dir):
+        """Test that a second sync only stats the files."""
+        TableRegistry.load(tables_dir).sync_with_directory()
+
+        registry = TableRegistry.load(tables_dir)
+        with patch.object(table_registry_module, "hash_files", wraps=hash_files) as hashed:
+            result = registry.sync_with_directory()
+        assert result == {"added": [], "removed": [], "updated": []}
+        assert hashed.call_args.args[0] == []
+
+    def test_touched_file_is_not_updated(self, tables_dir):
+        """Test that a changed fingerprint with the same content only refreshes stats."""
+        TableRegistry.load(tables_dir).sync_with_directory()
+        touch(tables_dir / "a.csv")
+
+        result = TableRegistry.load(tables_dir).sync_with_directory()
+        assert result["updated"] == []
+        entry = TableRegistry.load(tables_dir).get_by_filename("a.csv")
+        assert entry.file_stat == file_fingerprint(tables_dir / "a.csv")
+
+    def test_modified_file_is_updated(self, tables_dir):
+        """Test that changed content is re-hashed and re-profiled."""
+        TableRegistry.load(tables_dir).sync_with_directory()
+        (tables_dir / "a.csv").write_text("x,y,w\n1,2,3\n5,6,7\n")
+
+        result = TableRegistry.load(tables_dir).sync_with_directory()
+        entry = TableRegistry.load(tables_dir).get_by_filename("a.csv")
+        assert result["updated"] == [entry.id]
+        assert entry.columns == ["x", "y", "w"] and entry.row_count == 2
+
+    def test_legacy_entries_get_fingerprints(self, tables_dir):
+        """Test that entries saved without fingerprints are verified by hash once."""
+        registry = TableRegistry.load(tables_dir)
+        registry.sync_with_directory()
+        for entry in registry.tables.values():
+            entry.file_stat = ""
+        registry.save()
+
+        result = TableRegistry.load(tables_dir).sync_with_directory()
+        assert result["updated"] == []
+        assert all(e.file_stat for e in TableRegistry.load(tables_dir).tables.values())
+
+
+class TestOntologyRegistry:
+    """Test cases for OntologyRegistry change detection."""
+
+    def test_is_cache_valid_two_tier(self, tmp_path):
+        """Test that touching keeps the cache valid and editing invalidates it."""
+        path = tmp_path / "o.rdf"
+        path.write_text("<rdf/>")
+        registry = OntologyRegistry.load(tmp_path)
+        entry = registry.register("o.rdf")
+
+        touch(path)
+        assert registry.is_cache_valid(entry.id)
+        assert entry.file_stat == file_fingerprint(path)
+
+        path.write_text("<rdf></rdf>")
+        assert not registry.is_cache_valid(entry.id)
+        assert registry.sync_with_directory()["updated"] == [entry.id]
@@ -0,0 +1,83 @@
+"""Tests for the row-offset index and row window reads."""
+
+import pandas as pd
+import pytest
+
+from saed.core.table.registry import TableRegistry
+from saed.core.table.row_index import build_row_index, read_row_window
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """A CSV of 25 rows, one of them with a quoted multi-line value."""
+    path = tmp_path / "t.csv"
+    notes = [f"note {i}" for i in range(25)]
+    notes[7] = "first line\nsecond line"
+    pd.DataFrame({"Id": range(25), "Note": notes}).to_csv(path, index=False)
+    return path
+
+
+class TestBuildRowIndex:
+    """Test cases for build_row_index."""
+
+    def test_offsets_start_indexed_rows(self, csv_path):
+        """Test that every offset is the start of an indexed data row."""
+        index = build_row_index(csv_path, stride=10)
+        assert len(index) == 3
+        content = csv_path.read_bytes()
+        for block, position in enumerate(index):
+            assert content[position:].startswith(f"{block * 10},".encode())
+
+    def test_no_offset_past_the_end(self, tmp_path):
+        """Test that a row count divisible by the stride adds no trailing offset."""
+        path = tmp_path / "even.csv"
+        pd.DataFrame({"a": range(20)}).to_csv(path, index=False)
+        assert len(build_row_index(path, stride=10)) == 2
+
+
+class TestReadRowWindow:
+    """Test cases for read_row_window."""
+
+    @pytest.mark.parametrize("offset", [0, 5, 9, 10, 18, 24])
+    def test_matches_full_read(self, csv_path, offset):
+        """Test that indexed windows equal slices of the full table."""
+        full = pd.read_csv(csv_path)
+        index = build_row_index(csv_path, stride=10)
+        window = read_row_window(csv_path, full.columns.tolist(), offset, 4, index, stride=10)
+        expected = full.iloc[offset : offset + 4].reset_index(drop=True)
+        pd.testing.assert_frame_equal(window, expected)
+
+    def test_without_index(self, csv_path):
+        """Test that windows are read without an index too."""
+        window = read_row_window(csv_path, ["Id", "Note"], 6, 3)
+        assert window["Id"].tolist() == [6, 7, 8]
+        assert window["Note"][1] == "first line\nsecond line"
+
+    def test_past_the_end(self, csv_path):
+        """Test that a window past the last row is empty."""
+        index = build_row_index(csv_path, stride=10)
+        assert read_row_window(csv_path, ["Id", "Note"], 40, 5, index, stride=10).empty
+        assert read_row_window(csv_path, ["Id", "Note"], 40, 5).empty
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_blank_lines_do_not_shift_window(self, tmp_path, indexed):
+        """Test that the window counts data rows, not physical lines."""
+        path = tmp_path / "blank.csv"
+        path.write_text('a,b\n1,x\n\n2,"y\nz"\n3,z\n\n4,w\n')
+        index = build_row_index(path, stride=2) if indexed else None
+
+        window = read_row_window(path, ["a", "b"], 2, 5, index, stride=2)
+        assert window["a"].tolist() == [3, 4]
+        assert read_row_window(path, ["a", "b"], 1, 1, index, stride=2)["b"][0] == "y\nz"
+        assert read_row_window(path, ["a", "b"], 4, 5, index, stride=2).empty
+
+
+class TestRegistryRowIndex:
+    """Test cases for the row index kept by the table registry."""
+
+    def test_built_on_registration(self, csv_path):
+        """Test that registering a table persists its row index."""
+        registry = TableRegistry.load(csv_path.parent)
+        entry = registry.register(csv_path.name)
+        assert registry.row_index_path(entry).exists()
+        assert len(registry.get_row_index(entry)) == 1
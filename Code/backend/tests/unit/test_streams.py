@@ -0,0 +1,156 @@
+"""Tests for the SSE broadcast hub."""
+
+import asyncio
+
+from saed.api.streams import RunStreamHub, ThreadSafeEventBridge, parse_last_event_id
+
+
+def drain(subscriber) -> list:
+    """Collect all buffered messages without waiting."""
+
+    async def collect():
+        messages = []
+        while True:
+            message = await subscriber.get(timeout=0.01)
+            if message is None:
+                return messages
+            messages.append(message)
+
+    return asyncio.run(collect())
+
+
+class TestRunStreamHub:
+    """Test cases for RunStreamHub."""
+
+    def test_broadcast_serializes_once(self):
+        """Test that all subscribers receive the same serialized message."""
+        hub = RunStreamHub()
+        first = hub.subscribe("run_1")
+        second = hub.subscribe("run_1")
+        hub.publish("run_1", "step", {"level": 0})
+
+        (a,) = drain(first)
+        (b,) = drain(second)
+        assert a is b
+        assert a.text.startswith("id: 1\nevent: step\n")
+
+    def test_slow_client_buffer_is_bounded(self):
+        """Test that step events are dropped before terminal events."""
+        hub = RunStreamHub(max_client_buffer=3)
+        subscriber = hub.subscribe("run_1")
+        for level in range(10):
+            hub.publish("run_1", "step", {"level": level})
+        hub.publish("run_1", "run_complete", {"status": "completed"})
+
+        messages = drain(subscriber)
+        assert len(messages) == 3
+        assert messages[-1].event == "run_complete"
+        assert subscriber.dropped == 8
+
+    def test_replay_from_last_event_id(self):
+        """Test that reconnecting clients receive only missed events."""
+        hub = RunStreamHub()
+        for name in ("run_start", "column_start", "step", "step"):
+            hub.publish("run_1", name, {})
+
+        subscriber = hub.subscribe("run_1", last_event_id=2)
+        assert [m.id for m in drain(subscriber)] == [3, 4]
+
+    def test_finished_run_is_forgotten(self):
+        """Test that channels are released after the last client leaves."""
+        hub = RunStreamHub()
+        subscriber = hub.subscribe("run_1")
+        hub.publish("run_1", "run_complete", {})
+        assert hub.has_subscribers("run_1")
+        hub.unsubscribe("run_1", subscriber)
+        assert not hub.has_subscribers("run_1")
+        assert "run_1" not in hub._channels
+
+    def test_close_without_terminal_event(self):
+        """Test that an interrupted run ends its clients' streams and is forgotten."""
+        hub = RunStreamHub()
+        subscriber = hub.subscribe("run_1")
+        hub.publish("run_1", "step", {})
+        hub.close("run_1", "Run interrupted")
+
+        messages = drain(subscriber)
+        assert messages[-1].event == "error"
+        assert '"recoverable": true' in messages[-1].text
+        hub.unsubscribe("run_1", subscriber)
+        assert "run_1" not in hub._channels
+
+    def test_close_after_terminal_event_is_noop(self):
+        """Test that closing a finished run publishes nothing."""
+        hub = RunStreamHub()
+        subscriber = hub.subscribe("run_1")
+        hub.publish("run_1", "run_complete", {})
+        hub.close("run_1", "Run interrupted")
+
+        assert [m.event for m in drain(subscriber)] == ["run_complete"]
+
+
+class TestThreadSafeEventBridge:
+    """Test cases for ThreadSafeEventBridge."""
+
+    def test_events_from_worker_thread_reach_subscribers(self):
+        """Test that a worker thread can publish into the loop's hub."""
+        hub = RunStreamHub()
+
+        async def scenario():
+            subscriber = hub.subscribe("run_1")
+            bridge = ThreadSafeEventBridge(hub, "run_1")
+
+            def worker():
+                for level in range(5):
+                    bridge("step", {"level": level})
+                bridge("run_complete", {})
+
+            await asyncio.to_thread(worker)
+            received = []
+            while not received or not received[-1].is_terminal:
+                message = await subscriber.get(timeout=1.0)
+                assert message is not None
+                received.append(message)
+            return received
+
+        received = asyncio.run(scenario())
+        assert [m.id for m in received] == [1, 2, 3, 4, 5, 6]
+
+    def test_payload_captured_at_call_time(self):
+        """Test that mutating a payload after the call does not change the event."""
+        hub = RunStreamHub()
+
+        async def scenario():
+            subscriber = hub.subscribe("run_1")
+            bridge = ThreadSafeEventBridge(hub, "run_1")
+
+            def worker():
+                data = {"level": 0}
+                bridge("step", data)
+                data["level"] = 99
+
+            await asyncio.to_thread(worker)
+            return await subscriber.get(timeout=1.0)
+
+        message = asyncio.run(scenario())
+        assert '"level": 0' in message.text
+
+    def test_closed_bridge_drops_late_events(self):
+        """Test that events after close do not reopen the run's stream."""
+        hub = RunStreamHub()
+
+        async def scenario():
+            bridge = ThreadSafeEventBridge(hub, "run_1")
+            bridge.close()
+            await asyncio.to_thread(bridge, "step", {})
+            await asyncio.sleep(0)
+
+        asyncio.run(scenario())
+        assert "run_1" not in hub._channels
+
+
+def test_parse_last_event_id():
+    """Test parsing of the Last-Event-ID header."""
+    assert parse_last_event_id("12") == 12
+    assert parse_last_event_id("") is None
+    assert parse_last_event_id("abc") is None
@@ -0,0 +1,91 @@
+"""Tests for the streaming CSV profiler."""
+
+import pandas as pd
+import pytest
+
+from saed.core.table.profile import DistinctSketch, profile_csv
+from saed.core.table.registry import TableRegistry
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """A CSV with one column of each inferred type."""
+    path = tmp_path / "sensors.csv"
+    path.write_text(
+        "Id,Energy,Active,Time,Room,Empty\n"
+        "1,1.5,true,2024-01-01T00:00:00,A,\n"
+        "2,,false,2024-01-01T01:00:00,B,\n"
+        "3,2.5,true,2024-01-01T02:00:00,A,\n"
+        "4,3,false,2024-01-01T03:00:00,C,\n"
+    )
+    return path
+
+
+class TestProfileCsv:
+    """Test cases for profile_csv."""
+
+    def test_shape(self, csv_path):
+        """Test that columns and rows match a full pandas read."""
+        df = pd.read_csv(csv_path)
+        profile = profile_csv(csv_path, chunk_rows=3)
+        assert profile.columns == df.columns.tolist()
+        assert profile.row_count == len(df)
+
+    def test_column_stats(self, csv_path):
+        """Test the inferred types, null ratios and distinct counts."""
+        stats = profile_csv(csv_path, chunk_rows=3).column_stats
+        assert {c: s.dtype for c, s in stats.items()} == {
+            "Id": "integer",
+            "Energy": "float",
+            "Active": "boolean",
+            "Time": "datetime",
+            "Room": "string",
+            "Empty": "empty",
+        }
+        assert stats["Energy"].null_ratio == 0.25
+        assert stats["Room"].distinct_count == 3
+        assert stats["Room"].sample_values == ["A", "B", "C"]
+
+    def test_header_only(self, tmp_path):
+        """Test that a CSV without rows has its columns and no rows."""
+        path = tmp_path / "empty.csv"
+        path.write_text("a,b\n")
+        profile = profile_csv(path)
+        assert profile.columns == ["a", "b"] and profile.row_count == 0
+
+    def test_invalid_csv(self, tmp_path):
+        """Test that unparsable files raise ValueError."""
+        path = tmp_path / "bad.csv"
+        path.write_text("")
+        with pytest.raises(ValueError):
+            profile_csv(path)
+
+
+class TestDistinctSketch:
+    """Test cases for DistinctSketch."""
+
+    def test_exact_below_size(self):
+        """Test that small cardinalities are counted exactly."""
+        sketch = DistinctSketch(size=64)
+        sketch.update(pd.Series([str(i % 10) for i in range(100)]))
+        assert sketch.estimate() == 10
+
+    def test_estimate_above_size(self):
+        """Test that large cardinalities are estimated within a few percent."""
+        sketch = DistinctSketch(size=1024)
+        for start in range(0, 50_000, 10_000):
+            sketch.update(pd.Series([str(i) for i in range(start, start + 10_000)]))
+        assert abs(sketch.estimate() - 50_000) / 50_000 < 0.1
+
+
+class TestRegistryProfile:
+    """Test cases for the profile stored in table entries."""
+
+    def test_register_stores_column_stats(self, csv_path):
+        """Test that registering a table stores its column statistics."""
+        registry = TableRegistry.load(csv_path.parent)
+        entry = registry.register(csv_path.name)
+        assert entry.row_count == 4 and entry.column_count == 6
+        assert entry.column_stats["Energy"]["dtype"] == "float"
+        reloaded = TableRegistry.load(csv_path.parent).get(entry.id)
+        assert reloaded.column_stats == entry.column_stats
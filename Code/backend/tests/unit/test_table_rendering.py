@@ -0,0 +1,91 @@
+"""Tests for the cached table preview rendering."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from saed.core.table import (
+    clear_table_markdown_cache,
+    dataframe_to_markdown,
+    render_table_markdown,
+    rendering,
+    sampling,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty preview cache."""
+    clear_table_markdown_cache()
+    yield
+    clear_table_markdown_cache()
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    """A CSV file with more rows than the preview."""
+    path = tmp_path / "28.csv"
+    pd.DataFrame({"Energy": range(100), "Room": [f"R{i}" for i in range(100)]}).to_csv(
+        path, index=False
+    )
+    return path
+
+
+class TestRenderTableMarkdown:
+    """Test cases for render_table_markdown."""
+
+    def test_matches_head_preview(self, table_path):
+        """Test that the preview equals the first k rows of the full table."""
+        expected = pd.read_csv(table_path).head(3).to_markdown(index=False)
+        assert render_table_markdown(table_path, 3) == expected
+
+    def test_reads_only_k_rows(self, table_path):
+        """Test that the CSV is not parsed beyond the preview."""
+        with patch.object(sampling.pd, "read_csv", wraps=pd.read_csv) as read_csv:
+            render_table_markdown(table_path, 5)
+        assert read_csv.call_args.kwargs["nrows"] == 5
+
+    def test_cached_per_hash_and_k(self, table_path):
+        """Test that the file is read once per table version and k."""
+        with patch.object(rendering, "sample_table", wraps=rendering.sample_table) as read:
+            render_table_markdown(table_path, 5, file_hash="sha256:a")
+            render_table_markdown(table_path, 5, file_hash="sha256:a")
+            render_table_markdown(table_path, 3, file_hash="sha256:a")
+            render_table_markdown(table_path, 5, file_hash="sha256:b")
+        assert read.call_count == 3
+
+    def test_changed_file_without_hash_is_reread(self, table_path):
+        """Test that an unregistered file is keyed by its size and mtime."""
+        first = render_table_markdown(table_path, 2)
+        pd.DataFrame({"Energy": [7]}).to_csv(table_path, index=False)
+        assert render_table_markdown(table_path, 2) != first
+
+    def test_unknown_strategy(self, table_path):
+        """Test that unknown sampling strategies are rejected."""
+        with pytest.raises(ValueError, match="Unknown sampling strategy"):
+            render_table_markdown(table_path, 5, strategy="best")
+
+    def test_projected_preview(self, tmp_path):
+        """Test that a projected preview keeps the target and key columns."""
+        path = tmp_path / "wide.csv"
+        pd.DataFrame({"Id": [1], "Name": ["a"], "X": [2], "Energy": [3]}).to_csv(path, index=False)
+        header = render_table_markdown(path, 1, column="Energy", projected=True).splitlines()[0]
+        assert "Energy" in header and "Id" in header and "Name" in header
+        assert "X" not in header
+
+    def test_head_preview_shared_by_columns(self, table_path):
+        """Test that columns share the head preview of their table."""
+        with patch.object(rendering, "sample_table", wraps=rendering.sample_table) as read:
+            render_table_markdown(table_path, 5, column="Energy")
+            render_table_markdown(table_path, 5, column="Room")
+        assert read.call_count == 1
+
+
+class TestDataframeToMarkdown:
+    """Test cases for dataframe_to_markdown."""
+
+    def test_renders_rows(self):
+        """Test the header, separator and cell rows."""
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        assert dataframe_to_markdown(df, k=2) == "| a | b |\n| --- | --- |\n| 1 | x |\n| 2 | y |"
@@ -0,0 +1,88 @@
+"""Tests for the row sampling strategies of table previews."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from saed.core.table import sampling
+from saed.core.table.sampling import projected_columns, reservoir_sample, sample_table
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    """A sorted CSV whose first rows have no target value."""
+    path = tmp_path / "sorted.csv"
+    energy = [None] * 10 + [1.5, 1.5, 2.5, 2.5, 3.5] * 4
+    pd.DataFrame({"Id": range(30), "Energy": energy}).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Stream tables in chunks of a few rows."""
+    monkeypatch.setattr(sampling, "CHUNK_ROWS", 4)
+
+
+class TestSampleTable:
+    """Test cases for sample_table."""
+
+    def test_head(self, table_path):
+        """Test that the head strategy returns the first rows."""
+        assert sample_table(table_path, 3)["Id"].tolist() == [0, 1, 2]
+
+    def test_non_null_skips_nulls(self, table_path, small_chunks):
+        """Test that rows without a target value are skipped."""
+        sample = sample_table(table_path, 3, "non_null", column="Energy")
+        assert sample["Id"].tolist() == [10, 11, 12]
+
+    def test_distinct_values_first(self, table_path, small_chunks):
+        """Test that each new target value is shown before repeats."""
+        sample = sample_table(table_path, 5, "distinct", column="Energy")
+        # Only three distinct values: filled up with the first other rows
+        assert sample["Id"].tolist() == [0, 1, 10, 12, 14]
+
+    def test_stratified_distinct_values(self, table_path, small_chunks):
+        """Test that every sampled row has a different target value."""
+        sample = sample_table(table_path, 3, "stratified", column="Energy", seed=3)
+        assert sample["Energy"].nunique(dropna=False) == 3
+        assert sample["Id"].is_monotonic_increasing
+
+    def test_random_is_seeded(self, table_path, small_chunks):
+        """Test that the random sample depends only on the seed."""
+        first = sample_table(table_path, 4, "random", seed=1)["Id"].tolist()
+        assert sample_table(table_path, 4, "random", seed=1)["Id"].tolist() == first
+        assert first == sorted(first) and len(set(first)) == 4
+
+    def test_column_strategy_needs_column(self, table_path):
+        """Test that column-aware strategies require the target column."""
+        with pytest.raises(ValueError, match="needs a target column"):
+            sample_table(table_path, 3, "distinct")
+
+
+class TestReservoirSample:
+    """Test cases for reservoir_sample."""
+
+    def test_independent_of_chunking(self):
+        """Test that chunk boundaries do not change the sample."""
+        df = pd.DataFrame({"v": range(100)})
+        whole = reservoir_sample(iter([df]), 10, seed=7)
+        chunked = reservoir_sample((df.iloc[i : i + 12] for i in range(0, 100, 12)), 10, seed=7)
+        assert whole["v"].tolist() == chunked["v"].tolist()
+
+    def test_uniform(self):
+        """Test that every row is about equally likely to be sampled."""
+        df = pd.DataFrame({"v": range(10)})
+        counts = np.zeros(10)
+        for seed in range(2000):
+            counts[reservoir_sample(iter([df]), 3, seed)["v"]] += 1
+        assert counts.min() > 500 and counts.max() < 700
+
+
+class TestProjectedColumns:
+    """Test cases for projected_columns."""
+
+    def test_keeps_target_and_leading_columns(self):
+        """Test that the target and the first key columns are kept in table order."""
+        columns = ["Id", "Time", "A", "B", "Energy"]
+        assert projected_columns(columns, "Energy", 2) == ["Id", "Time", "Energy"]
+        assert projected_columns(columns, "Id", 1) == ["Id", "Time"]
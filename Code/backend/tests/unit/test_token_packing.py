@@ -0,0 +1,76 @@
+"""Tests for token estimation and token-budget EDM agent packing."""
+
+from types import SimpleNamespace
+
+from saed.core.config.settings import EDMOptions
+from saed.core.executor import DetailedSelector
+from saed.core.llm.prompts import edm_prompt
+from saed.core.llm.tokens import estimate_tokens, get_token_counter
+from saed.core.selector.assignment import pack_classes_by_tokens
+
+CLASSES = [f"Class{i}" for i in range(40)]
+
+
+def count_chars(text: str) -> int:
+    return len(text)
+
+
+class TestTokenCounter:
+    """Test cases for token estimation."""
+
+    def test_estimate_rounds_up(self):
+        """Test that the heuristic never underestimates partial tokens."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 2
+
+    def test_local_models_use_estimate(self):
+        """Test that non-OpenAI providers get the heuristic counter."""
+        assert get_token_counter("ollama", "llama3") is estimate_tokens
+
+
+class TestPackClassesByTokens:
+    """Test cases for pack_classes_by_tokens."""
+
+    def test_every_agent_fits_capacity(self):
+        """Test that no agent's class list exceeds the capacity."""
+        assignment = pack_classes_by_tokens(CLASSES, 3, 60, count_chars, seed=1)
+        for agent_classes in assignment:
+            assert sum(len(c) + 1 for c in agent_classes) <= 60
+        assert all(sum(c in a for a in assignment) == 3 for c in CLASSES)
+
+    def test_larger_budget_needs_fewer_agents(self):
+        """Test that long-context budgets produce fewer, fuller agents."""
+        small = pack_classes_by_tokens(CLASSES, 3, 60, count_chars)
+        large = pack_classes_by_tokens(CLASSES, 3, 600, count_chars)
+        assert len(large) < len(small)
+        assert len(large) == 3
+
+    def test_no_capacity_gives_one_class_per_agent(self):
+        """Test that a budget used up by the table still covers every class."""
+        assignment = pack_classes_by_tokens(CLASSES[:4], 3, 0, count_chars)
+        assert len(assignment) == 12
+        assert all(len(agent_classes) == 1 for agent_classes in assignment)
+
+
+class TestPlanAgents:
+    """Test cases for DetailedSelector._plan_agents."""
+
+    def make_selector(self, **options) -> DetailedSelector:
+        selector = object.__new__(DetailedSelector)
+        selector.edm_options = EDMOptions(**options)
+        selector.llm = SimpleNamespace(prompt=edm_prompt)
+        selector.count_tokens = estimate_tokens
+        selector.candidate_renderer = None
+        return selector
+
+    def test_without_budget_uses_classes_per_agent(self):
+        """Test that the fixed classes_per_agent planning is the default."""
+        selector = self.make_selector(classes_per_agent=10, agents_per_class=3)
+        assert len(selector._plan_agents("t", "", "c", CLASSES)) == 13
+
+    def test_budget_accounts_for_table(self):
+        """Test that a larger table preview leaves room for fewer classes per agent."""
+        selector = self.make_selector(agents_per_class=3, token_budget=700)
+        small_table = selector._plan_agents("t", "| a |", "c", CLASSES)
+        large_table = selector._plan_agents("t", "| a |\n" * 100, "c", CLASSES)
+        assert len(large_table) > len(small_table)
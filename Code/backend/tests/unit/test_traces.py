@@ -0,0 +1,123 @@
+"""Tests for interned and compressed trace storage."""
+
+import json
+
+import pytest
+
+from saed.core.utils import traces
+from saed.core.utils.traces import (
+    FRAGMENTS_KEY,
+    TraceCodecError,
+    decode_trace_bytes,
+    expand_trace,
+    intern_trace,
+    read_trace_file,
+    write_trace_file,
+)
+
+TABLE_MARKDOWN = "| timestamp | power_kw |\n|---|---|\n| 2024-01-01 00:00 | 12.5 |"
+
+
+def make_prompt(candidates: str) -> str:
+    return (
+        "Table: meter\n"
+        "Column: power_kw\n"
+        f"Table Preview:\n{TABLE_MARKDOWN}\n"
+        f"Candidates: {candidates}"
+    )
+
+
+@pytest.fixture
+def run_data():
+    """A run result with repeated prompts in single and EDM steps."""
+    agents = [
+        {
+            "agent_id": i,
+            "llm_request": {"prompt": make_prompt("Device, Property"), "model": "m"},
+        }
+        for i in range(1, 4)
+    ]
+    return {
+        "run_id": "run_1",
+        "columns": [
+            {
+                "column_name": "power_kw",
+                "steps": [
+                    {"llm_request": {"prompt": make_prompt("Device"), "model": "m"}},
+                    {"edm_result": {"agents": agents}, "llm_request": None},
+                ],
+            }
+        ],
+    }
+
+
+class TestTraceInterning:
+    """Test cases for prompt fragment interning."""
+
+    def test_round_trip(self, run_data):
+        """Test that interning and expanding restores the original data."""
+        encoded = intern_trace(run_data)
+        assert FRAGMENTS_KEY in encoded
+        assert expand_trace(encoded) == run_data
+
+    def test_repeated_lines_stored_once(self, run_data):
+        """Test that table markdown lines appear once in the fragment table."""
+        encoded = intern_trace(run_data)
+        fragments = encoded[FRAGMENTS_KEY]
+        assert len(fragments) == len(set(fragments))
+        assert "| 2024-01-01 00:00 | 12.5 |" in fragments
+        step_prompt = encoded["columns"][0]["steps"][0]["llm_request"]["prompt"]
+        assert isinstance(step_prompt, list)
+
+    def test_does_not_mutate_input(self, run_data):
+        """Test that interning returns a new structure."""
+        original = json.dumps(run_data, sort_keys=True)
+        intern_trace(run_data)
+        assert json.dumps(run_data, sort_keys=True) == original
+
+    def test_plain_data_unchanged_by_expand(self, run_data):
+        """Test that expanding non-interned data is a no-op."""
+        assert expand_trace(run_data) is run_data
+
+
+class TestTraceFiles:
+    """Test cases for reading and writing trace files."""
+
+    @pytest.mark.parametrize("compression", ["none", "gzip"])
+    def test_write_read_round_trip(self, tmp_path, run_data, compression):
+        """Test that written files load back to the original data."""
+        path = tmp_path / "run_1.json"
+        write_trace_file(path, run_data, compression=compression)
+        assert read_trace_file(path) == run_data
+
+    def test_zstd_round_trip(self, tmp_path, run_data):
+        """Test that zstd-compressed files load back to the original data."""
+        pytest.importorskip("zstandard")
+        path = tmp_path / "run_1.json"
+        write_trace_file(path, run_data, compression="zstd")
+        assert path.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+        assert read_trace_file(path) == run_data
+        assert decode_trace_bytes(path.read_bytes()) == run_data
+
+    def test_zstd_without_package_raises_codec_error(self, tmp_path, run_data, monkeypatch):
+        """Test that a missing zstandard package produces a clear error."""
+        pytest.importorskip("zstandard")
+        path = tmp_path / "run_1.json"
+        write_trace_file(path, run_data, compression="zstd")
+        monkeypatch.setattr(traces, "zstandard", None)
+        with pytest.raises(TraceCodecError, match="zstandard"):
+            read_trace_file(path)
+
+    def test_reads_legacy_json(self, tmp_path, run_data):
+        """Test that plain JSON written by older versions still loads."""
+        path = tmp_path / "legacy.json"
+        path.write_text(json.dumps(run_data))
+        assert read_trace_file(path) == run_data
+
+    def test_gzip_is_smaller(self, tmp_path, run_data):
+        """Test that compressed output is smaller than plain output."""
+        plain = tmp_path / "plain.json"
+        packed = tmp_path / "packed.json"
+        write_trace_file(plain, run_data, intern=False)
+        write_trace_file(packed, run_data, compression="gzip")
+        assert packed.stat().st_size < plain.stat().st_size
@@ -0,0 +1,120 @@
+"""Tests for streamed, validated uploads."""
+
+import asyncio
+import io
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from saed.api.routes.tables import upload_table
+from saed.api.uploads import (
+    CsvHeaderValidator,
+    UploadError,
+    XmlValidator,
+    stage_upload,
+)
+from saed.core.table import TableRegistry
+from saed.core.utils.files import compute_file_hash
+
+
+def _upload(content: bytes, filename: str = "t.csv") -> UploadFile:
+    return UploadFile(io.BytesIO(content), filename=filename)
+
+
+def _feed(validator, content: bytes, chunk: int) -> None:
+    for start in range(0, len(content), chunk):
+        validator.feed(content[start : start + chunk])
+    validator.close()
+
+
+class TestCsvHeaderValidator:
+    """Test cases for CsvHeaderValidator."""
+
+    @pytest.mark.parametrize("chunk", [1, 3, 1024])
+    def test_header_split_across_chunks(self, chunk):
+        """Test that the header is found however the content is chunked."""
+        validator = CsvHeaderValidator()
+        _feed(validator, b'\n"multi\nline",b\n1,2\n', chunk)
+        assert validator.columns == ["multi\nline", "b"]
+
+    def test_header_without_newline(self):
+        """Test that a header-only file without a trailing newline is accepted."""
+        validator = CsvHeaderValidator()
+        _feed(validator, b"\xef\xbb\xbfa,b", 2)
+        assert validator.columns == ["a", "b"]
+
+    def test_required_columns(self):
+        """Test that missing required columns are rejected."""
+        validator = CsvHeaderValidator(required_columns=["table_id", "column_id"])
+        with pytest.raises(UploadError, match="column_id"):
+            _feed(validator, b"table_id,name\nt1,x\n", 64)
+
+    @pytest.mark.parametrize("content", [b"", b"\n\n", b"\xff\xfe,\n"])
+    def test_invalid_header(self, content):
+        """Test that empty and non-UTF-8 content is rejected."""
+        with pytest.raises(UploadError):
+            _feed(CsvHeaderValidator(), content, 64)
+
+
+class TestXmlValidator:
+    """Test cases for XmlValidator."""
+
+    def test_well_formed(self):
+        """Test that a well-formed document passes in small chunks."""
+        _feed(XmlValidator(), b'<?xml version="1.0"?><rdf><c a="1"/></rdf>', 5)
+
+    @pytest.mark.parametrize("content", [b"<rdf><c></rdf>", b"<rdf>", b"not xml"])
+    def test_malformed(self, content):
+        """Test that malformed and truncated documents are rejected."""
+        with pytest.raises(UploadError, match="Malformed XML"):
+            _feed(XmlValidator(), content, 5)
+
+
+class TestStageUpload:
+    """Test cases for stage_upload."""
+
+    def test_commit_moves_upload_into_place(self, tmp_path):
+        """Test that the staged file is hashed and moved to its target on commit."""
+        content = b"a,b\n" + b"1,2\n" * 1000
+        target = tmp_path / "t.csv"
+        staged = asyncio.run(
+            stage_upload(_upload(content), target, CsvHeaderValidator(), chunk_bytes=100)
+        )
+        assert not target.exists()
+        assert staged.size == len(content)
+
+        staged.commit()
+        assert target.read_bytes() == content
+        assert staged.file_hash == compute_file_hash(target)
+        assert not any((tmp_path / ".uploads").iterdir())
+
+    def test_invalid_upload_keeps_existing_file(self, tmp_path):
+        """Test that a rejected upload leaves no file behind and replaces nothing."""
+        target = tmp_path / "t.csv"
+        target.write_bytes(b"old,content\n")
+        with pytest.raises(UploadError):
+            asyncio.run(stage_upload(_upload(b"\n\n"), target, CsvHeaderValidator()))
+
+        assert target.read_bytes() == b"old,content\n"
+        assert not any((tmp_path / ".uploads").iterdir())
+
+
+class TestUploadTable:
+    """Test cases for the table upload route."""
+
+    def test_invalid_rows_keep_registered_table(self, tmp_path):
+        """Test that an upload with a valid header but bad rows replaces nothing."""
+        registry = TableRegistry.load(tmp_path)
+        with (
+            patch("saed.api.routes.tables.get_tables_dir", return_value=tmp_path),
+            patch("saed.api.routes.tables.get_registry", return_value=registry),
+        ):
+            uploaded = asyncio.run(upload_table(_upload(b"a,b\n1,2\n")))
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(upload_table(_upload(b"a,b\n1,2\n1,2,3\n")))
+
+        assert exc_info.value.status_code == 400
+        assert (tmp_path / "t.csv").read_bytes() == b"a,b\n1,2\n"
+        assert registry.get(uploaded["id"]).row_count == 1
+        assert not any((tmp_path / ".uploads").iterdir())
@@ -3,7 +3,15 @@
 import { useCallback, useEffect, useMemo, useState } from "react"
 import Link from "next/link"
 import { useParams } from "next/navigation"
-import { ArrowLeft, Play, Code2, RefreshCw, AlertCircle } from "lucide-react"
+import {
+  ArrowLeft,
+  Play,
+  Code2,
+  RefreshCw,
+  AlertCircle,
+  ChevronLeft,
+  ChevronRight,
+} from "lucide-react"
 
 import { Button } from "@/components/ui/button"
 import {
@@ -38,11 +46,14 @@ function generateMarkdownPreview(columns: string[], rows: Record<string, unknown
   return [header, separator, ...dataRows].join("\n")
 }
 
+const PAGE_SIZE = 20
+
 export default function TableDetailPage() {
   const params = useParams()
   const tableId = params.tableId as string
 
   const [tableData, setTableData] = useState<TablePreview | null>(null)
+  const [offset, setOffset] = useState(0)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
 
@@ -50,14 +61,14 @@ export default function TableDetailPage() {
     try {
       setLoading(true)
       setError(null)
-      const data = await tablesApi.get(decodeURIComponent(tableId), 20)
+      const data = await tablesApi.get(decodeURIComponent(tableId), PAGE_SIZE, offset)
       setTableData(data)
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to load table")
     } finally {
       setLoading(false)
     }
-  }, [tableId])
+  }, [tableId, offset])
 
   useEffect(() => {
     if (tableId) {
@@ -70,7 +81,7 @@ export default function TableDetailPage() {
     return generateMarkdownPreview(tableData.columns, tableData.rows)
   }, [tableData])
 
-  if (loading) {
+  if (loading && !tableData) {
     return (
       <div className="space-y-6">
         <div className="flex items-center gap-4">
@@ -171,9 +182,30 @@ export default function TableDetailPage() {
           <Card>
             <CardHeader>
               <CardTitle>Data Preview</CardTitle>
-              <CardDescription>
-                Showing {tableData.rows.length} of {tableData.total_rows} rows
-              </CardDescription>
+              <div className="flex items-center justify-between">
+                <CardDescription>
+                  Showing rows {tableData.rows.length ? tableData.offset + 1 : 0}-
+                  {tableData.offset + tableData.rows.length} of {tableData.total_rows}
+                </CardDescription>
+                <div className="flex gap-2">
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    disabled={loading || offset === 0}
+                    onClick={() => setOffset(Math.max(0, offset - PAGE_SIZE))}
+                  >
+                    <ChevronLeft className="h-4 w-4" />
+                  </Button>
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    disabled={loading || offset + PAGE_SIZE >= tableData.total_rows}
+                    onClick={() => setOffset(offset + PAGE_SIZE)}
+                  >
+                    <ChevronRight className="h-4 w-4" />
+                  </Button>
+                </div>
+              </div>
             </CardHeader>
             <CardContent>
               <div className="rounded-md border overflow-auto">
@@ -60,8 +60,10 @@ async function fetchApi<T>(
 export const tablesApi = {
   list: () => fetchApi<{ tables: TableInfo[] }>("/tables").then(res => res.tables),
 
-  get: (tableId: string, limit: number = 10) =>
-    fetchApi<TablePreview>(`/tables/${encodeURIComponent(tableId)}?limit=${limit}`),
+  get: (tableId: string, limit: number = 10, offset: number = 0) =>
+    fetchApi<TablePreview>(
+      `/tables/${encodeURIComponent(tableId)}?limit=${limit}&offset=${offset}`
+    ),
 
   preview: (tableId: string, rows: number = 10) =>
     fetchApi<TablePreview>(`/tables/${encodeURIComponent(tableId)}/preview?rows=${rows}`),
@@ -27,6 +27,13 @@ export interface OntologyInfo {
 }
 
 // Table Types
+export interface ColumnStats {
+  dtype: 'integer' | 'float' | 'boolean' | 'datetime' | 'string' | 'empty'
+  null_ratio: number
+  distinct_count: number
+  sample_values: string[]
+}
+
 export interface TableInfo {
   id: string
   name: string
@@ -35,6 +42,7 @@ export interface TableInfo {
   row_count: number
   column_count?: number
   category?: string
+  column_stats?: Record<string, ColumnStats>
 }
 
 export interface TablePreview {
@@ -43,6 +51,7 @@ export interface TablePreview {
   columns: string[]
   rows: Record<string, unknown>[]
   total_rows: number
+  offset: number
 }
 
 export interface TableData {
@@ -68,6 +77,8 @@ export interface EDMOptions {
   classes_per_agent: number
   agents_per_class: number
   consensus_threshold: number
+  seed?: number
+  token_budget?: number | null
 }
 
 export interface RunConfig {
@@ -99,6 +110,7 @@ export interface LLMResponse {
   input_tokens?: number // Input tokens used
   output_tokens?: number // Output tokens generated
   total_tokens?: number // Total tokens used
+  provider?: string // Provider that answered (may be a fallback)
 }
 
 // ============== EDM (Ensemble Decision Making) Types ==============
@@ -126,6 +138,7 @@ export interface EDMResult {
   total_agents: number
   votes_summary: VoteSummary[] // Summary for each class that got votes
   agents: AgentResult[] // Detailed info for each agent
+  seed?: number // Seed of the class-to-agent assignment
 }
 
 // Legacy type for backwards compatibility